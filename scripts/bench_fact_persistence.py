@@ -0,0 +1,285 @@
+"""
+Benchmark fact persistence: legacy per-row commits vs. single-transaction bulk
+(with and without DatabaseManager.bulk_load SQLite tuning).
+
+Simulates a batch of games once, then persists the same drives/plays/
+participants into fresh file-backed SQLite databases with each strategy and
+reports wall time and rows per second.
+
+Usage:
+    python scripts/bench_fact_persistence.py --games 20 --max-drives 12
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from pylon.db.database import DatabaseManager
+from pylon.db.repositories import FactRepository
+from pylon.domain.athlete import Athlete, AthletePositionEnum
+from pylon.domain.playbook import (
+    Formation,
+    PersonnelPackage,
+    PlayCall,
+    PlaySideEnum,
+    PlayTypeEnum,
+)
+from pylon.domain.rules.nfl import NFLRules
+from pylon.domain.team import Team
+from pylon.engine.game_engine import GameEngine
+from pylon.state.game_state import GameState
+from sim.rng import RNG
+
+ROSTER: List[Tuple[AthletePositionEnum, int]] = [
+    (AthletePositionEnum.QB, 2),
+    (AthletePositionEnum.RB, 3),
+    (AthletePositionEnum.WR, 5),
+    (AthletePositionEnum.TE, 2),
+    (AthletePositionEnum.LT, 2),
+    (AthletePositionEnum.LG, 2),
+    (AthletePositionEnum.C, 2),
+    (AthletePositionEnum.RG, 2),
+    (AthletePositionEnum.RT, 2),
+    (AthletePositionEnum.EDGE, 3),
+    (AthletePositionEnum.DT, 3),
+    (AthletePositionEnum.LB, 4),
+    (AthletePositionEnum.CB, 4),
+    (AthletePositionEnum.FS, 2),
+    (AthletePositionEnum.SS, 2),
+    (AthletePositionEnum.K, 1),
+    (AthletePositionEnum.P, 1),
+]
+
+
+def build_team(uid: str) -> Team:
+    """Build a synthetic team with a full roster and a minimal playbook."""
+    team = Team(uid=uid, name=uid.title())
+    for position, count in ROSTER:
+        for i in range(count):
+            team.add_athlete(
+                Athlete(
+                    uid=f"{uid}-{position.value}-{i}",
+                    first_name=f"{position.value}{i}",
+                    last_name="Player",
+                    position=position,
+                )
+            )
+
+    offense_parent = Formation(
+        name="Base",
+        position_counts={
+            AthletePositionEnum.QB: 1,
+            AthletePositionEnum.RB: 1,
+            AthletePositionEnum.WR: 2,
+            AthletePositionEnum.TE: 1,
+            AthletePositionEnum.LT: 1,
+            AthletePositionEnum.LG: 1,
+            AthletePositionEnum.C: 1,
+            AthletePositionEnum.RG: 1,
+            AthletePositionEnum.RT: 1,
+        },
+    )
+    offense = Formation(
+        name="Base Tight",
+        position_counts={
+            AthletePositionEnum.QB: 1,
+            AthletePositionEnum.RB: 1,
+            AthletePositionEnum.WR: 3,
+            AthletePositionEnum.TE: 1,
+            AthletePositionEnum.LT: 1,
+            AthletePositionEnum.LG: 1,
+            AthletePositionEnum.C: 1,
+            AthletePositionEnum.RG: 1,
+            AthletePositionEnum.RT: 1,
+        },
+        parent=offense_parent,
+    )
+    defense_parent = Formation(
+        name="Nickel",
+        position_counts={
+            AthletePositionEnum.EDGE: 1,
+            AthletePositionEnum.DT: 1,
+            AthletePositionEnum.LB: 2,
+            AthletePositionEnum.CB: 2,
+        },
+    )
+    defense = Formation(
+        name="Nickel 4-2-5",
+        position_counts={
+            AthletePositionEnum.EDGE: 2,
+            AthletePositionEnum.DT: 2,
+            AthletePositionEnum.LB: 3,
+            AthletePositionEnum.CB: 2,
+            AthletePositionEnum.FS: 1,
+            AthletePositionEnum.SS: 1,
+        },
+        parent=defense_parent,
+    )
+    off_personnel = PersonnelPackage(
+        name="11 Personnel",
+        counts={
+            AthletePositionEnum.RB: 1,
+            AthletePositionEnum.WR: 3,
+            AthletePositionEnum.TE: 1,
+        },
+    )
+    def_personnel = PersonnelPackage(
+        name="Nickel", counts=dict(defense.position_counts)
+    )
+
+    plays = [
+        ("run", PlayTypeEnum.RUN, offense, off_personnel, PlaySideEnum.OFFENSE),
+        ("pass", PlayTypeEnum.PASS, offense, off_personnel, PlaySideEnum.OFFENSE),
+        ("kickoff", PlayTypeEnum.KICKOFF, offense, off_personnel, PlaySideEnum.OFFENSE),
+        (
+            "def",
+            PlayTypeEnum.DEFENSIVE_PLAY,
+            defense,
+            def_personnel,
+            PlaySideEnum.DEFENSE,
+        ),
+        (
+            "kickoff-return",
+            PlayTypeEnum.KICKOFF_RETURN,
+            defense,
+            def_personnel,
+            PlaySideEnum.DEFENSE,
+        ),
+    ]
+    for name, play_type, formation, personnel, side in plays:
+        team.add_play_template(
+            PlayCall(
+                name=name,
+                play_type=play_type,
+                formation=formation,
+                personnel_package=personnel,
+                side=side,
+                uid=f"{uid}-{name}",
+            )
+        )
+    return team
+
+
+def simulate_games(
+    num_games: int, max_drives: int | None
+) -> List[Tuple[str, GameState]]:
+    games: List[Tuple[str, GameState]] = []
+    for rep in range(1, num_games + 1):
+        engine = GameEngine(
+            home_team=build_team("home"),
+            away_team=build_team("away"),
+            game_id=str(rep),
+            rng=RNG(seed=rep),
+            rules=NFLRules(),
+            max_drives=max_drives,
+        )
+        engine.run()
+        games.append((str(rep), engine.game_state))
+    return games
+
+
+def persist_legacy(repo: FactRepository, games: List[Tuple[str, GameState]]) -> None:
+    """Per-row path: one commit per drive batch, play, and child batch."""
+    for game_id, game_state in games:
+        if not game_state.drives:
+            continue
+        orm_drives = repo.drives.save_batch(game_state.drives, game_id)
+        for drive, orm_drive in zip(game_state.drives, orm_drives):
+            assert drive.start.pos_team is not None
+            assert drive.start.def_team is not None
+            offense_team_id = drive.start.pos_team.uid
+            defense_team_id = drive.start.def_team.uid
+            for play_number, play_record in enumerate(drive.plays, start=1):
+                orm_play = repo.plays.to_orm(
+                    play_record, game_id, orm_drive.id, play_number
+                )
+                repo.db.insert_fact_data(orm_play)
+                if play_record.off_personnel_assignments:
+                    repo.play_personnel_assignments.save_batch(
+                        orm_play.id,
+                        play_record.off_personnel_assignments,
+                        offense_team_id,
+                    )
+                if play_record.def_personnel_assignments:
+                    repo.play_personnel_assignments.save_batch(
+                        orm_play.id,
+                        play_record.def_personnel_assignments,
+                        defense_team_id,
+                    )
+                if play_record.participants:
+                    repo.play_participants.save_batch(
+                        orm_play.id, play_record.participants, offense_team_id
+                    )
+
+
+def persist_bulk(repo: FactRepository, games: List[Tuple[str, GameState]]) -> None:
+    repo.persist_facts_bulk(games)
+
+
+def persist_bulk_tuned(
+    repo: FactRepository, games: List[Tuple[str, GameState]]
+) -> None:
+    # Persist one game per transaction, as the runner's DB writer would.
+    with repo.db.bulk_load():
+        for game in games:
+            repo.persist_facts_bulk([game])
+
+
+def time_strategy(
+    name: str,
+    strategy: Callable[[FactRepository, List[Tuple[str, GameState]]], None],
+    games: List[Tuple[str, GameState]],
+    work_dir: Path,
+    num_rows: int,
+) -> float:
+    db = DatabaseManager(f"sqlite:///{work_dir / f'{name}.db'}")
+    db.init_db()
+    try:
+        start = time.perf_counter()
+        strategy(FactRepository(db), games)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+    print(f"{name:>8}: {elapsed:8.3f}s  {num_rows / elapsed:10.0f} rows/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--max-drives", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    games = simulate_games(args.games, args.max_drives)
+    plays = [play for _, gs in games for drive in gs.drives for play in drive.plays]
+    num_rows = (
+        sum(len(gs.drives) for _, gs in games)
+        + len(plays)
+        + sum(len(p.participants) for p in plays)
+        + sum(
+            len(athletes)
+            for p in plays
+            for assignments in (
+                p.off_personnel_assignments,
+                p.def_personnel_assignments,
+            )
+            for athletes in assignments.values()
+        )
+    )
+    print(f"{args.games} game(s), {len(plays)} play(s), {num_rows} fact row(s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        legacy = time_strategy("legacy", persist_legacy, games, work_dir, num_rows)
+        bulk = time_strategy("bulk", persist_bulk, games, work_dir, num_rows)
+        tuned = time_strategy("tuned", persist_bulk_tuned, games, work_dir, num_rows)
+    print(f" speedup: {legacy / bulk:8.1f}x bulk, {legacy / tuned:.1f}x tuned")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark sim.rng.RNG backends: Python's random.Random vs. block-buffered NumPy.
+
+Times the draw patterns the engine uses (random, randint, unweighted choice,
+small weighted choice and the same weights as a prebuilt alias-table
+Distribution) through the public RNG interface and reports nanoseconds per
+draw for each backend.
+
+Usage:
+    python scripts/bench_rng.py --draws 1000000 --block-size 4096
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from sim.distribution import Distribution
+from sim.rng import RNG, NumpyBlockBackend
+
+OPTIONS = ["run", "pass", "punt", "field_goal"]
+WEIGHTS = [0.45, 0.45, 0.07, 0.03]
+DISTRIBUTION = Distribution(OPTIONS, WEIGHTS)
+
+
+def workloads(rng: RNG) -> Dict[str, Callable[[], object]]:
+    return {
+        "random": rng.random,
+        "randint": lambda: rng.randint(1, 100),
+        "choice": lambda: rng.choice(OPTIONS),
+        "weighted": lambda: rng.choice(OPTIONS, weights=WEIGHTS),
+        "alias": lambda: rng.choice(DISTRIBUTION),
+    }
+
+
+def time_draws(draw: Callable[[], object], num_draws: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_draws):
+        draw()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--draws", type=int, default=1_000_000)
+    parser.add_argument("--block-size", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    python_rng = RNG(seed=args.seed, backend="python")
+    numpy_rng = RNG(seed=args.seed, backend="numpy")
+    # Swap in a backend with the requested block size behind the same RNG.
+    numpy_rng._rng = NumpyBlockBackend(args.seed, block_size=args.block_size)
+
+    print(f"{args.draws} draw(s) per workload, block size {args.block_size}")
+    print(f"{'workload':>10} {'python ns':>10} {'numpy ns':>10} {'speedup':>8}")
+    python_loads = workloads(python_rng)
+    numpy_loads = workloads(numpy_rng)
+    for name in python_loads:
+        python_s = time_draws(python_loads[name], args.draws)
+        numpy_s = time_draws(numpy_loads[name], args.draws)
+        print(
+            f"{name:>10} {python_s / args.draws * 1e9:10.1f} "
+            f"{numpy_s / args.draws * 1e9:10.1f} {python_s / numpy_s:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
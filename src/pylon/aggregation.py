@@ -0,0 +1,175 @@
+"""
+Streaming aggregate statistics for pylon simulation batches.
+
+Provides GameResultAggregator, an incremental ``sim.Aggregator`` that folds
+each replication's result into running win counts and Welford mean/variance
+accumulators, so aggregate memory is constant in the number of replications.
+
+Under an antithetic or stratified replication design it also keeps
+design-aware estimators (see ``sim.design``) so the aggregate reports
+correctly weighted estimates and standard errors.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+from sim.aggregator import Aggregator, RunningStats
+from sim.design import DesignEstimator, IndependentDesign, ReplicationDesign
+
+from .simulation import PylonSimulationResult, SimulationStatus
+
+
+logger = logging.getLogger(__name__)
+
+
+class GameResultAggregator(Aggregator[PylonSimulationResult, Dict[str, Any]]):
+    """
+    Incrementally aggregate game outcomes across replications.
+
+    Failed replications are counted but excluded from win counts and
+    score/duration statistics.
+    """
+
+    ESTIMATED_METRICS = ("home_win_pct", "home_score", "away_score", "margin")
+
+    def __init__(
+        self,
+        home_team_id: str,
+        away_team_id: str,
+        design: ReplicationDesign = IndependentDesign(),
+    ) -> None:
+        self._home_team_id = home_team_id
+        self._away_team_id = away_team_id
+        self._home_wins: int = 0
+        self._away_wins: int = 0
+        self._ties: int = 0
+        self._failed_reps: int = 0
+        self._home_score = RunningStats()
+        self._away_score = RunningStats()
+        self._margin = RunningStats()
+        self._duration = RunningStats()
+        self._design = design
+        self._estimators: Dict[str, DesignEstimator] = {
+            metric: DesignEstimator(design) for metric in self.ESTIMATED_METRICS
+        }
+
+    # ==============================
+    # Getters
+    # ==============================
+    @property
+    def completed_reps(self) -> int:
+        return self._home_score.count
+
+    @property
+    def failed_reps(self) -> int:
+        return self._failed_reps
+
+    @property
+    def home_score(self) -> RunningStats:
+        return self._home_score
+
+    @property
+    def away_score(self) -> RunningStats:
+        return self._away_score
+
+    @property
+    def margin(self) -> RunningStats:
+        """Home score minus away score."""
+        return self._margin
+
+    @property
+    def duration(self) -> RunningStats:
+        return self._duration
+
+    @property
+    def estimators(self) -> Dict[str, DesignEstimator]:
+        """Design-aware estimators keyed by metric name."""
+        return self._estimators
+
+    # ==============================
+    # Aggregator protocol
+    # ==============================
+    def update(self, result: PylonSimulationResult) -> None:
+        if result.status == SimulationStatus.FAILED.value:
+            self._failed_reps += 1
+            return
+
+        if result.winner_id is None:
+            self._ties += 1
+        elif result.winner_id == self._home_team_id:
+            self._home_wins += 1
+        elif result.winner_id == self._away_team_id:
+            self._away_wins += 1
+        else:
+            logger.warning(
+                f"Result for game {result.game_id} has unknown winner_id={result.winner_id}"
+            )
+
+        self._home_score.push(result.home_score)
+        self._away_score.push(result.away_score)
+        self._margin.push(result.home_score - result.away_score)
+        self._duration.push(result.duration_seconds)
+
+        if result.rep_number is None and self._design.transforms_draws:
+            logger.warning(
+                f"Result for game {result.game_id} has no rep_number; "
+                f"leaving it out of the {self._design.name} estimators"
+            )
+            return
+        values = {
+            "home_win_pct": float(result.winner_id == self._home_team_id),
+            "home_score": float(result.home_score),
+            "away_score": float(result.away_score),
+            "margin": float(result.home_score - result.away_score),
+        }
+        for metric, value in values.items():
+            self._estimators[metric].push(result.rep_number or 0, value)
+
+    def merge(
+        self, other: Aggregator[PylonSimulationResult, Dict[str, Any]]
+    ) -> None:
+        if not isinstance(other, GameResultAggregator):
+            raise TypeError(
+                f"Cannot merge {other.__class__.__name__} into GameResultAggregator"
+            )
+        self._home_wins += other._home_wins
+        self._away_wins += other._away_wins
+        self._ties += other._ties
+        self._failed_reps += other._failed_reps
+        self._home_score.merge(other._home_score)
+        self._away_score.merge(other._away_score)
+        self._margin.merge(other._margin)
+        self._duration.merge(other._duration)
+        for metric, estimator in self._estimators.items():
+            estimator.merge(other._estimators[metric])
+
+    def finalize(self) -> Dict[str, Any]:
+        completed = self.completed_reps
+        if completed == 0:
+            return {"failed_reps": self._failed_reps} if self._failed_reps else {}
+
+        aggregate: Dict[str, Any] = {
+            "home_wins": self._home_wins,
+            "away_wins": self._away_wins,
+            "ties": self._ties,
+            "home_win_pct": self._home_wins / completed,
+            "away_win_pct": self._away_wins / completed,
+            "avg_home_score": self._home_score.mean,
+            "avg_away_score": self._away_score.mean,
+            "avg_duration_seconds": self._duration.mean,
+            "failed_reps": self._failed_reps,
+            "completed_reps": completed,
+            "std_home_score": self._home_score.stddev,
+            "std_away_score": self._away_score.stddev,
+            "avg_margin": self._margin.mean,
+            "std_margin": self._margin.stddev,
+            "std_duration_seconds": self._duration.stddev,
+            "design": self._design.name,
+        }
+        # Design-weighted estimates and standard errors, e.g. home_win_pct_stderr.
+        for metric, estimator in self._estimators.items():
+            aggregate[f"{metric}_estimate"] = estimator.estimate
+            aggregate[f"{metric}_stderr"] = estimator.stderr
+        return aggregate
@@ -16,6 +16,8 @@ from .repositories import (
     PlayRepository,
     ExperimentRepository,
     GameRepository,
+    IdSequenceRepository,
+    RollupRepository,
     DriveRepository,
     PlayPersonnelAssignmentRepository,
     PlayParticipantRepository,
@@ -32,6 +34,10 @@ from .schema import (
     ModelInvocation,
     Experiment,
     Game,
+    IdSequence,
+    TeamFingerprint,
+    ExperimentTeamScore,
+    AthleteGameStats,
 )
 from ..domain.athlete import AthletePositionEnum
 from ..domain.playbook import PlaySideEnum, PlayTypeEnum
@@ -50,6 +56,8 @@ __all__ = [
     "PlayParticipantRepository",
     "ExperimentRepository",
     "GameRepository",
+    "IdSequenceRepository",
+    "RollupRepository",
     "Base",
     "Team",
     "Athlete",
@@ -61,6 +69,10 @@ __all__ = [
     "ModelInvocation",
     "Experiment",
     "Game",
+    "IdSequence",
+    "TeamFingerprint",
+    "ExperimentTeamScore",
+    "AthleteGameStats",
     "AthletePositionEnum",
     "PlaySideEnum",
     "PlayTypeEnum",
@@ -5,10 +5,11 @@ Handles database connections, schema initialization, and data persistence.
 Supports SQLite (development) and PostgreSQL (production).
 """
 
+from contextlib import contextmanager
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
-from sqlalchemy import create_engine, Engine, insert
+from sqlalchemy import Index, create_engine, Engine, event, insert, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -17,6 +18,25 @@ from .schema import Base
 logger = logging.getLogger(__name__)
 
 
+# Fact tables whose secondary indexes are dropped during a bulk load and
+# rebuilt once at the end, instead of being maintained row by row.
+BULK_LOAD_DEFERRED_INDEX_TABLES = (
+    "play",
+    "play_participant",
+    "play_personnel_assignment",
+)
+
+# Per-connection SQLite settings applied while a bulk load is active. WAL with
+# synchronous=NORMAL only fsyncs at checkpoints; a crash can lose the last
+# transactions but cannot corrupt the database.
+SQLITE_BULK_LOAD_PRAGMAS: Dict[str, Any] = {
+    "synchronous": "NORMAL",
+    "cache_size": -256 * 1024,  # KiB (negative) => 256 MiB page cache
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
 class DatabaseManager:
     """
     Manages database connections and persistence for Pylon simulations.
@@ -47,6 +67,7 @@ class DatabaseManager:
         self.connection_string = connection_string
         self.engine: Engine = self._create_engine(echo)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._bulk_load_active = False
 
     def _create_engine(self, echo: bool) -> Engine:
         """
@@ -71,6 +92,106 @@ class DatabaseManager:
         else:
             return create_engine(self.connection_string, echo=echo)
 
+    @property
+    def is_sqlite_file(self) -> bool:
+        """True for file-backed SQLite databases (not in-memory)."""
+        is_sqlite = self.connection_string.startswith("sqlite:")
+        return is_sqlite and not self.connection_string.startswith("sqlite:///:memory:")
+
+    @property
+    def bulk_load_active(self) -> bool:
+        return self._bulk_load_active
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["DatabaseManager"]:
+        """
+        Context manager that tunes the database for large fact loads.
+
+        While active:
+        - Secondary indexes on the play fact tables are dropped and rebuilt
+          once on exit (see BULK_LOAD_DEFERRED_INDEX_TABLES).
+        - File-backed SQLite switches to WAL journaling and every new
+          connection gets SQLITE_BULK_LOAD_PRAGMAS (synchronous=NORMAL, larger
+          page cache and mmap, in-memory temp store).
+
+        On exit the indexes are recreated, the WAL is checkpointed, the
+        original journal mode is restored, and pooled connections are
+        discarded so later sessions use the default (safe) settings again.
+        Nested calls are no-ops.
+
+        Usage:
+            with db.bulk_load():
+                fact_repo.persist_facts_bulk(games)
+        """
+        if self._bulk_load_active:
+            yield self
+            return
+
+        tune_sqlite = self.is_sqlite_file
+        original_journal_mode: str | None = None
+        if tune_sqlite:
+            original_journal_mode = self._enter_sqlite_bulk_mode()
+
+        deferred_indexes = self._drop_deferred_indexes()
+        self._bulk_load_active = True
+        logger.info(
+            f"Bulk load started (deferred {len(deferred_indexes)} index(es)"
+            f"{', SQLite tuned' if tune_sqlite else ''})."
+        )
+        try:
+            yield self
+        finally:
+            self._bulk_load_active = False
+            try:
+                self._create_indexes(deferred_indexes)
+            finally:
+                if original_journal_mode is not None:
+                    self._exit_sqlite_bulk_mode(original_journal_mode)
+            logger.info("Bulk load finished; indexes rebuilt.")
+
+    def _drop_deferred_indexes(self) -> List[Index]:
+        """Drop existing secondary indexes on the bulk-load fact tables."""
+        dropped: List[Index] = []
+        with self.engine.begin() as conn:
+            for table_name in BULK_LOAD_DEFERRED_INDEX_TABLES:
+                table = Base.metadata.tables[table_name]
+                for index in sorted(table.indexes, key=lambda idx: str(idx.name)):
+                    index.drop(conn, checkfirst=True)
+                    dropped.append(index)
+        return dropped
+
+    def _create_indexes(self, indexes: List[Index]) -> None:
+        with self.engine.begin() as conn:
+            for index in indexes:
+                index.create(conn, checkfirst=True)
+
+    def _apply_bulk_load_pragmas(self, dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in SQLITE_BULK_LOAD_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    def _enter_sqlite_bulk_mode(self) -> str:
+        """Switch to WAL and tune every new connection. Returns the old mode."""
+        # Pragmas are per connection, so drop pooled connections and tune
+        # each new one as it is opened.
+        self.engine.dispose()
+        event.listen(self.engine, "connect", self._apply_bulk_load_pragmas)
+        with self.engine.connect() as conn:
+            original = str(conn.execute(text("PRAGMA journal_mode")).scalar())
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+        return original
+
+    def _exit_sqlite_bulk_mode(self, original_journal_mode: str) -> None:
+        event.remove(self.engine, "connect", self._apply_bulk_load_pragmas)
+        self.engine.dispose()
+        with self.engine.connect() as conn:
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+            conn.execute(text(f"PRAGMA journal_mode={original_journal_mode}"))
+        self.engine.dispose()
+
     def init_db(self) -> None:
         """
         Create all tables in the database.
@@ -5,10 +5,39 @@ Repositories handle conversion between domain objects (from pylon.domain)
 and ORM objects (from schema), and provide persistence operations.
 """
 
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Dict, List
+import math
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    TypeVarTuple,
+    Unpack,
+)
 import uuid
 
+from sqlalchemy import (
+    Float,
+    Integer,
+    Select,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
 from ..domain.athlete import Athlete as DomainAthlete
 from ..domain.athlete import AthletePositionEnum
 from ..state.drive_record import DriveRecord
@@ -22,6 +51,10 @@ from .schema import Personnel as OrmPersonnel
 from .schema import PlayCall as OrmPlayCall
 from .schema import Experiment as OrmExperiment
 from .schema import Game as OrmGame
+from .schema import IdSequence as OrmIdSequence
+from .schema import TeamFingerprint as OrmTeamFingerprint
+from .schema import ExperimentTeamScore as OrmExperimentTeamScore
+from .schema import AthleteGameStats as OrmAthleteGameStats
 from .schema import Drive as OrmDrive
 from .schema import Play as OrmPlay
 from .schema import PlayPersonnelAssignment as OrmPlayPersonnelAssignment
@@ -40,6 +73,100 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+GAME_ID_SEQUENCE = "game"
+
+_Ts = TypeVarTuple("_Ts")
+
+
+def _dialect_insert(session: Session, orm_class: Any) -> Any:
+    """Return an upsert-capable INSERT for SQLite/PostgreSQL, else None."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(orm_class)
+    if dialect == "postgresql":
+        return postgresql.insert(orm_class)
+    return None
+
+
+def _upsert_increment(
+    session: Session,
+    orm_class: Any,
+    rows: List[Dict[str, Any]],
+    increment_columns: Sequence[str],
+) -> None:
+    """Insert rows, adding ``increment_columns`` onto rows whose key exists."""
+    if not rows:
+        return
+    key_columns = [column.name for column in orm_class.__table__.primary_key]
+    dialect_insert = _dialect_insert(session, orm_class)
+    if dialect_insert is not None:
+        session.execute(
+            dialect_insert.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={
+                    column: getattr(orm_class, column)
+                    + getattr(dialect_insert.excluded, column)
+                    for column in increment_columns
+                },
+            ),
+            rows,
+        )
+        return
+    for row in rows:
+        existing = session.get(orm_class, tuple(row[key] for key in key_columns))
+        if existing is None:
+            session.add(orm_class(**row))
+            continue
+        for column in increment_columns:
+            setattr(existing, column, getattr(existing, column) + row[column])
+
+
+def _fetch_rows(
+    db: DatabaseManager, statement: Select[Unpack[Tuple[Any, ...]]]
+) -> List[Dict[str, Any]]:
+    """Execute a read query and return plain dict rows."""
+    session = db.get_session()
+    try:
+        return [dict(row) for row in session.execute(statement).mappings()]
+    finally:
+        session.close()
+
+
+def _filter_experiments(
+    statement: Select[Unpack[_Ts]],
+    column: Any,
+    experiment_ids: Sequence[str] | None,
+) -> Select[Unpack[_Ts]]:
+    if experiment_ids is None:
+        return statement
+    return statement.where(column.in_(list(experiment_ids)))
+
+
+def wilson_interval(
+    successes: int, trials: int, z: float = 1.96
+) -> Tuple[float, float]:
+    """
+    Wilson score confidence interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes.
+        trials: Number of trials.
+        z: Standard normal quantile (1.96 for a 95% interval).
+
+    Returns:
+        ``(low, high)`` bounds; ``(0.0, 0.0)`` when there are no trials.
+    """
+    if trials == 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    half_width = (
+        z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    ) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
 class TeamRepository:
     """
     Repository for Team dimension data.
@@ -103,6 +230,21 @@ class TeamRepository:
         logger.info(f"Persisted {len(orm_teams)} team(s).")
         return orm_teams
 
+    def upsert_batch(self, team_outputs: List["TeamOutputPayload"]) -> List[OrmTeam]:
+        """
+        Insert or update multiple teams by UID.
+
+        Args:
+            team_outputs: List of team output payloads.
+
+        Returns:
+            List of merged ORM Team objects.
+        """
+        orm_teams = [self.to_orm(team) for team in team_outputs]
+        self.db.insert_dimension_data_or_ignore(*orm_teams)
+        logger.info(f"Upserted {len(orm_teams)} team(s).")
+        return orm_teams
+
 
 class AthleteRepository:
     """
@@ -172,6 +314,23 @@ class AthleteRepository:
         logger.info(f"Persisted {len(orm_athletes)} athlete(s).")
         return orm_athletes
 
+    def upsert_batch(
+        self, athlete_outputs: List["AthleteOutputPayload"]
+    ) -> List[OrmAthlete]:
+        """
+        Insert or update multiple athletes by UID.
+
+        Args:
+            athlete_outputs: List of athlete output payloads.
+
+        Returns:
+            List of merged ORM Athlete objects.
+        """
+        orm_athletes = [self.to_orm(athlete) for athlete in athlete_outputs]
+        self.db.insert_dimension_data_or_ignore(*orm_athletes)
+        logger.info(f"Upserted {len(orm_athletes)} athlete(s).")
+        return orm_athletes
+
 
 class TeamRosterRepository:
     """Repository for team-athlete association table persistence."""
@@ -198,6 +357,70 @@ class TeamRosterRepository:
             label="team_roster association",
         )
 
+    def replace_batch(self, team_outputs: List["TeamOutputPayload"]) -> None:
+        """Replace the stored roster of each team with its current athletes."""
+        team_ids = [team["uid"] for team in team_outputs]
+        team_roster_rows = [
+            {"team_id": team["uid"], "athlete_id": athlete["uid"]}
+            for team in team_outputs
+            for athlete in team["athletes"]
+        ]
+
+        session = self.db.get_session()
+        try:
+            with session.begin():
+                session.execute(
+                    delete(team_roster).where(team_roster.c.team_id.in_(team_ids))
+                )
+                if team_roster_rows:
+                    session.execute(insert(team_roster), team_roster_rows)
+            logger.info(
+                f"Replaced roster for {len(team_ids)} team(s) "
+                f"({len(team_roster_rows)} row(s))."
+            )
+        except Exception as e:
+            logger.error(f"Failed to replace team_roster rows: {e}")
+            raise
+        finally:
+            session.close()
+
+
+class TeamFingerprintRepository:
+    """Repository for per-team dimension content hashes."""
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        self.db = db_manager
+
+    @staticmethod
+    def compute(team_output: "TeamOutputPayload") -> str:
+        """Return a stable SHA-256 hex digest of a team output payload."""
+        canonical = json.dumps(
+            team_output, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get_many(self, team_ids: List[str]) -> Dict[str, str]:
+        """Return stored fingerprints keyed by team ID (missing teams omitted)."""
+        session = self.db.get_session()
+        try:
+            rows = session.execute(
+                select(
+                    OrmTeamFingerprint.team_id, OrmTeamFingerprint.fingerprint
+                ).where(OrmTeamFingerprint.team_id.in_(team_ids))
+            )
+            return {team_id: fingerprint for team_id, fingerprint in rows}
+        finally:
+            session.close()
+
+    def save_batch(self, fingerprints: Dict[str, str]) -> None:
+        """Insert or update fingerprints keyed by team ID."""
+        self.db.insert_dimension_data_or_ignore(
+            *(
+                OrmTeamFingerprint(team_id=team_id, fingerprint=fingerprint)
+                for team_id, fingerprint in fingerprints.items()
+            )
+        )
+
 
 class FormationRepository:
     """
@@ -514,6 +737,114 @@ class ExperimentRepository:
         )
         return orm_experiment
 
+    def update_num_reps(self, experiment_id: str, num_reps: int) -> None:
+        """
+        Record the number of replications an experiment actually ran.
+
+        Used when a stopping rule ends a run before its replication budget.
+        """
+        session = self.db.get_session()
+        try:
+            with session.begin():
+                session.execute(
+                    update(OrmExperiment)
+                    .where(OrmExperiment.id == experiment_id)
+                    .values(num_reps=num_reps)
+                )
+        except Exception as e:
+            logger.error(
+                f"Failed to update num_reps for experiment {experiment_id}: {e}"
+            )
+            raise
+        finally:
+            session.close()
+
+    # ==============================
+    # Aggregate queries
+    # ==============================
+    def drive_result_breakdown(
+        self, experiment_ids: Sequence[str] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-experiment, per-offense drive outcome breakdown.
+
+        Args:
+            experiment_ids: Experiments to include (all when None).
+
+        Returns:
+            Rows with experiment_id, team_id, result, drives, pct_of_drives,
+            avg_yards, avg_plays, and avg_time_elapsed, ordered by
+            experiment, team, and descending drive count.
+        """
+        drives = func.count(OrmDrive.id)
+        statement = (
+            select(
+                OrmGame.experiment_id,
+                OrmDrive.offense_team_id.label("team_id"),
+                OrmDrive.result,
+                drives.label("drives"),
+                (
+                    cast(drives, Float)
+                    / func.sum(drives).over(
+                        partition_by=(OrmGame.experiment_id, OrmDrive.offense_team_id)
+                    )
+                ).label("pct_of_drives"),
+                func.avg(OrmDrive.yards_gained).label("avg_yards"),
+                func.avg(OrmDrive.plays_run).label("avg_plays"),
+                func.avg(OrmDrive.time_elapsed).label("avg_time_elapsed"),
+            )
+            .join(OrmGame, OrmGame.id == OrmDrive.game_id)
+            .group_by(OrmGame.experiment_id, OrmDrive.offense_team_id, OrmDrive.result)
+            .order_by(OrmGame.experiment_id, OrmDrive.offense_team_id, drives.desc())
+        )
+        return _fetch_rows(
+            self.db,
+            _filter_experiments(statement, OrmGame.experiment_id, experiment_ids),
+        )
+
+    def yards_per_play(
+        self,
+        experiment_ids: Sequence[str] | None = None,
+        by_play_type: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-experiment, per-offense yards per play.
+
+        Args:
+            experiment_ids: Experiments to include (all when None).
+            by_play_type: Also group by play type (run, pass, punt, ...).
+
+        Returns:
+            Rows with experiment_id, team_id, (play_type,) plays, total_yards,
+            and yards_per_play.
+        """
+        group_columns: List[Any] = [
+            OrmGame.experiment_id,
+            OrmPlay.offense_team_id.label("team_id"),
+        ]
+        if by_play_type:
+            group_columns.append(OrmPlay.play_type)
+        statement = (
+            select(
+                *group_columns,
+                func.count(OrmPlay.id).label("plays"),
+                func.sum(OrmPlay.yards_gained).label("total_yards"),
+                func.avg(cast(OrmPlay.yards_gained, Float)).label("yards_per_play"),
+            )
+            .join(OrmGame, OrmGame.id == OrmPlay.game_id)
+            .group_by(*group_columns)
+            .order_by(*group_columns)
+        )
+        rows = _fetch_rows(
+            self.db,
+            _filter_experiments(statement, OrmGame.experiment_id, experiment_ids),
+        )
+        if by_play_type:
+            for row in rows:
+                if row["play_type"] is not None:
+                    row["play_type"] = row["play_type"].value
+        return rows
+
 
 class GameRepository:
     """
@@ -570,10 +901,7 @@ class GameRepository:
         Returns:
             Persisted ORM Game object.
         """
-        orm_game = OrmGame(
-            id=game_id or str(uuid.uuid4()),
-            experiment_id=experiment_id,
-            rep_number=rep_number,
+        orm_game = self.build(
             seed=seed,
             home_team_id=home_team_id,
             away_team_id=away_team_id,
@@ -582,8 +910,11 @@ class GameRepository:
             winner_id=winner_id,
             total_plays=total_plays,
             total_drives=total_drives,
-            duration_seconds=duration_seconds,
             final_quarter=final_quarter,
+            experiment_id=experiment_id,
+            rep_number=rep_number,
+            duration_seconds=duration_seconds,
+            game_id=game_id,
             status=status,
         )
         self.db.insert_dimension_data(orm_game)
@@ -592,6 +923,71 @@ class GameRepository:
         )
         return orm_game
 
+    def build(
+        self,
+        seed: int,
+        home_team_id: str,
+        away_team_id: str,
+        home_score: int,
+        away_score: int,
+        winner_id: str | None,
+        total_plays: int,
+        total_drives: int,
+        final_quarter: int,
+        experiment_id: str | None = None,
+        rep_number: int | None = None,
+        duration_seconds: float | None = None,
+        game_id: str | None = None,
+        status: str = "completed",
+    ) -> OrmGame:
+        """
+        Build an ORM Game without persisting it.
+
+        Takes the same arguments as ``create``; use with ``save_batch`` to
+        persist several games in one transaction.
+
+        Returns:
+            ORM Game object (not yet persisted).
+        """
+        return OrmGame(
+            id=game_id or str(uuid.uuid4()),
+            experiment_id=experiment_id,
+            rep_number=rep_number,
+            seed=seed,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            home_score=home_score,
+            away_score=away_score,
+            winner_id=winner_id,
+            total_plays=total_plays,
+            total_drives=total_drives,
+            duration_seconds=duration_seconds,
+            final_quarter=final_quarter,
+            status=status,
+        )
+
+    def reserve_ids(self, count: int) -> int:
+        """
+        Atomically reserve a contiguous block of numeric game ids.
+
+        The first reservation on an existing database seeds the sequence from
+        the largest numeric game id already stored.
+
+        Args:
+            count: Number of game ids to reserve.
+
+        Returns:
+            First game id of the block ``[first, first + count)``.
+        """
+        seed = (
+            select(func.coalesce(func.max(cast(OrmGame.id, Integer)), 0) + 1)
+            .where(OrmGame.id.regexp_match("^[0-9]+$"))
+            .scalar_subquery()
+        )
+        return IdSequenceRepository(self.db).reserve(
+            GAME_ID_SEQUENCE, count, initial_value=seed
+        )
+
     def save_batch(self, games: List[OrmGame]) -> None:
         """
         Batch persist multiple game results.
@@ -602,6 +998,250 @@ class GameRepository:
         self.db.insert_dimension_data(*games)
         logger.info(f"Persisted {len(games)} game(s).")
 
+    def add_batch(self, session: Session, games: List[OrmGame]) -> None:
+        """
+        Stage game results in the caller's transaction.
+
+        Rows are flushed, not committed, so facts and rollups written later in
+        the same transaction can reference them.
+
+        Args:
+            session: Session whose transaction the caller commits.
+            games: List of ORM Game objects to persist.
+        """
+        session.add_all(games)
+        session.flush()
+
+    # ==============================
+    # Aggregate queries
+    # ==============================
+    def win_pct(
+        self,
+        experiment_ids: Sequence[str] | None = None,
+        z: float = 1.96,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-experiment, per-team win percentage with a Wilson interval.
+
+        Counts are computed in SQL over completed games; only the interval
+        (one row per team) is computed in Python.
+
+        Args:
+            experiment_ids: Experiments to include (all when None).
+            z: Standard normal quantile for the interval (1.96 => 95%).
+
+        Returns:
+            Rows with experiment_id, team_id, games, wins, losses, ties,
+            win_pct, ci_low, and ci_high.
+        """
+        completed = OrmGame.status == "completed"
+        team_games = union_all(
+            select(
+                OrmGame.experiment_id,
+                OrmGame.home_team_id.label("team_id"),
+                OrmGame.winner_id,
+            ).where(completed),
+            select(
+                OrmGame.experiment_id,
+                OrmGame.away_team_id.label("team_id"),
+                OrmGame.winner_id,
+            ).where(completed),
+        ).subquery()
+
+        wins = func.sum(
+            case((team_games.c.winner_id == team_games.c.team_id, 1), else_=0)
+        )
+        ties = func.sum(case((team_games.c.winner_id.is_(None), 1), else_=0))
+        statement = (
+            select(
+                team_games.c.experiment_id,
+                team_games.c.team_id,
+                func.count().label("games"),
+                wins.label("wins"),
+                ties.label("ties"),
+            )
+            .group_by(team_games.c.experiment_id, team_games.c.team_id)
+            .order_by(team_games.c.experiment_id, team_games.c.team_id)
+        )
+        rows = _fetch_rows(
+            self.db,
+            _filter_experiments(statement, team_games.c.experiment_id, experiment_ids),
+        )
+        for row in rows:
+            games = row["games"]
+            row["losses"] = games - row["wins"] - row["ties"]
+            row["win_pct"] = row["wins"] / games if games else 0.0
+            row["ci_low"], row["ci_high"] = wilson_interval(row["wins"], games, z)
+        return rows
+
+    def score_histogram(
+        self, experiment_ids: Sequence[str] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-experiment, per-team final score distribution.
+
+        Read from the experiment_team_score rollup, so it never scans games.
+
+        Args:
+            experiment_ids: Experiments to include (all when None).
+
+        Returns:
+            Rows with experiment_id, team_id, points, games, pct, and
+            cumulative_pct, ordered by points.
+        """
+        partition = (
+            OrmExperimentTeamScore.experiment_id,
+            OrmExperimentTeamScore.team_id,
+        )
+        total = func.sum(OrmExperimentTeamScore.game_count).over(partition_by=partition)
+        running = func.sum(OrmExperimentTeamScore.game_count).over(
+            partition_by=partition, order_by=OrmExperimentTeamScore.points
+        )
+        statement = select(
+            OrmExperimentTeamScore.experiment_id,
+            OrmExperimentTeamScore.team_id,
+            OrmExperimentTeamScore.points,
+            OrmExperimentTeamScore.game_count.label("games"),
+            (cast(OrmExperimentTeamScore.game_count, Float) / total).label("pct"),
+            (cast(running, Float) / total).label("cumulative_pct"),
+        ).order_by(*partition, OrmExperimentTeamScore.points)
+        return _fetch_rows(
+            self.db,
+            _filter_experiments(
+                statement, OrmExperimentTeamScore.experiment_id, experiment_ids
+            ),
+        )
+
+    def margin_histogram(
+        self,
+        experiment_ids: Sequence[str] | None = None,
+        bin_width: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-experiment distribution of home-minus-away margin.
+
+        Args:
+            experiment_ids: Experiments to include (all when None).
+            bin_width: Width of each margin bin in points. Bins are labeled by
+                their lower edge (floor of margin / bin_width * bin_width).
+
+        Returns:
+            Rows with experiment_id, margin_bin, games, and pct.
+        """
+        if bin_width < 1:
+            raise ValueError("bin_width must be greater than 0")
+        margin = OrmGame.home_score - OrmGame.away_score
+        # Floor to the bin edge; % truncates toward zero on SQLite/PostgreSQL.
+        margin_bin = (margin - ((margin % bin_width) + bin_width) % bin_width).label(
+            "margin_bin"
+        )
+        games = func.count()
+        statement = (
+            select(
+                OrmGame.experiment_id,
+                margin_bin,
+                games.label("games"),
+                (
+                    cast(games, Float)
+                    / func.sum(games).over(partition_by=OrmGame.experiment_id)
+                ).label("pct"),
+            )
+            .where(OrmGame.status == "completed")
+            .group_by(OrmGame.experiment_id, margin_bin)
+            .order_by(OrmGame.experiment_id, margin_bin)
+        )
+        return _fetch_rows(
+            self.db,
+            _filter_experiments(statement, OrmGame.experiment_id, experiment_ids),
+        )
+
+
+class IdSequenceRepository:
+    """
+    Repository for named id sequences.
+
+    Hands out contiguous blocks of integer ids with a single atomic
+    ``UPDATE ... RETURNING``, so parallel workers and concurrent experiments
+    writing to the same database never reuse an id and never need to scan
+    the table they allocate ids for.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the IdSequenceRepository.
+
+        Args:
+            db_manager: DatabaseManager instance for persistence.
+        """
+        self.db = db_manager
+
+    def reserve(self, name: str, count: int, initial_value: Any = 1) -> int:
+        """
+        Atomically reserve ``count`` consecutive values from a sequence.
+
+        Args:
+            name: Sequence name.
+            count: Number of ids to reserve (must be positive).
+            initial_value: First value of the sequence if it does not exist
+                yet. May be a scalar SQL expression, evaluated only when the
+                sequence row is created.
+
+        Returns:
+            First id of the reserved block ``[first, first + count)``.
+        """
+        if count < 1:
+            raise ValueError("count must be greater than 0")
+
+        session = self.db.get_session()
+        try:
+            with session.begin():
+                next_value = self._increment(session, name, count)
+                if next_value is None:
+                    self._create_if_missing(session, name, initial_value)
+                    next_value = self._increment(session, name, count)
+                assert next_value is not None
+        except Exception as e:
+            logger.error(f"Failed to reserve {count} id(s) from '{name}': {e}")
+            raise
+        finally:
+            session.close()
+
+        first = next_value - count
+        logger.info(f"Reserved {name} ids {first}..{next_value - 1}")
+        return first
+
+    def peek(self, name: str) -> int | None:
+        """Return the next unreserved value of a sequence, or None if unset."""
+        session = self.db.get_session()
+        try:
+            return session.execute(
+                select(OrmIdSequence.next_value).where(OrmIdSequence.name == name)
+            ).scalar_one_or_none()
+        finally:
+            session.close()
+
+    @staticmethod
+    def _increment(session: Session, name: str, count: int) -> int | None:
+        return session.execute(
+            update(OrmIdSequence)
+            .where(OrmIdSequence.name == name)
+            .values(next_value=OrmIdSequence.next_value + count)
+            .returning(OrmIdSequence.next_value)
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _create_if_missing(session: Session, name: str, initial_value: Any) -> None:
+        values = {"name": name, "next_value": initial_value}
+        dialect_insert = _dialect_insert(session, OrmIdSequence)
+        if dialect_insert is not None:
+            session.execute(dialect_insert.values(values).on_conflict_do_nothing())
+            return
+        try:
+            with session.begin_nested():
+                session.execute(insert(OrmIdSequence).values(values))
+        except IntegrityError:
+            pass  # Created concurrently by another writer.
+
 
 class DimensionRepository:
     """
@@ -624,11 +1264,13 @@ class DimensionRepository:
         self.formations = FormationRepository(db_manager)
         self.personnel = PersonnelRepository(db_manager)
         self.play_calls = PlayCallRepository(db_manager)
+        self.fingerprints = TeamFingerprintRepository(db_manager)
 
     def persist_game_dimensions(
         self,
         home_team: "TeamOutputPayload",
         away_team: "TeamOutputPayload",
+        force: bool = False,
     ) -> None:
         """
         Persist all dimension data for a game.
@@ -640,20 +1282,50 @@ class DimensionRepository:
         - Personnel (unique personnel from all plays, deduped across both teams by UID)
         - Plays (all play templates from both teams' playbooks)
 
+        Each team's payload is fingerprinted; teams whose fingerprint matches
+        the one stored by a previous run are skipped entirely, and only changed
+        or new teams are upserted.
+
         Args:
             home_team: Home team canonical output payload.
             away_team: Away team canonical output payload.
-        """
-        logger.info("Persisting game dimension data...")
+            force: Rewrite both teams even if their fingerprints are unchanged.
+        """
+        teams_by_uid = {team["uid"]: team for team in (home_team, away_team)}
+        fingerprints = {
+            uid: self.fingerprints.compute(team) for uid, team in teams_by_uid.items()
+        }
+        stored = {} if force else self.fingerprints.get_many(list(teams_by_uid))
+        changed_teams = [
+            team
+            for uid, team in teams_by_uid.items()
+            if stored.get(uid) != fingerprints[uid]
+        ]
+        if not changed_teams:
+            logger.info("Game dimension data unchanged; skipping dimension write.")
+            return
 
+        logger.info(
+            "Persisting game dimension data for "
+            f"{', '.join(team['uid'] for team in changed_teams)}..."
+        )
+        self._persist_team_dimensions(changed_teams)
+        # Written last so an interrupted write is simply redone next run.
+        self.fingerprints.save_batch(
+            {team["uid"]: fingerprints[team["uid"]] for team in changed_teams}
+        )
+        logger.info("Game dimension data persisted successfully.")
+
+    def _persist_team_dimensions(self, teams: List["TeamOutputPayload"]) -> None:
+        """Upsert teams, rosters, formations, personnel, and play calls."""
         # Persist teams
-        self.teams.save_batch([home_team, away_team])
+        self.teams.upsert_batch(teams)
 
-        # Persist all athletes from both rosters and associate with their teams
-        all_athletes = home_team["athletes"] + away_team["athletes"]
+        # Persist all athletes from the rosters and associate with their teams
+        all_athletes = [athlete for team in teams for athlete in team["athletes"]]
         if all_athletes:
-            self.athletes.save_batch(all_athletes)
-            self.team_roster.save_batch([home_team, away_team])
+            self.athletes.upsert_batch(all_athletes)
+        self.team_roster.replace_batch(teams)
 
         # Collect all formations/personnel globally and plays per team.
         # We dedupe formations/personnel by UID before delegating to repositories.
@@ -661,8 +1333,8 @@ class DimensionRepository:
         all_personnels: Dict[str, "PersonnelOutputPayload"] = {}
         team_plays: Dict[str, List["PlayCallOutputPayload"]] = {}
 
-        # Process both teams to extract plays, formations, and personnel
-        for team in [home_team, away_team]:
+        # Process teams to extract plays, formations, and personnel
+        for team in teams:
             # Collect plays from both offensive and defensive playbooks
             playbooks = team["playbooks"]
             off_plays: List["PlayCallOutputPayload"] = playbooks["offense"]["plays"]
@@ -696,8 +1368,8 @@ class DimensionRepository:
         if all_personnels:
             self.personnel.save_batch(list(all_personnels.values()))
 
-        # Persist plays for both teams
-        for team in [home_team, away_team]:
+        # Persist plays for each team
+        for team in teams:
             plays = team_plays.get(team["uid"], [])
             if plays:
                 formation_ids = {
@@ -713,8 +1385,6 @@ class DimensionRepository:
                     personnel_ids=personnel_ids,
                 )
 
-        logger.info("Game dimension data persisted successfully.")
-
 
 class DriveRepository:
     """
@@ -733,52 +1403,69 @@ class DriveRepository:
         """
         self.db = db_manager
 
-    def to_orm(self, drive_record: DriveRecord, game_id: str) -> OrmDrive:
+    def to_row(self, drive_record: DriveRecord, game_id: str) -> Dict[str, Any]:
         """
-        Convert a DriveRecord to an ORM Drive.
+        Convert a DriveRecord to a plain column dictionary for Core inserts.
 
         Args:
             drive_record: DriveRecord object from simulation.
             game_id: Parent game ID.
 
         Returns:
-            ORM Drive object (not yet persisted).
+            Row dictionary keyed by Drive column name.
         """
         execution_data = drive_record.execution_data
         start = drive_record.start
         end = drive_record.end
 
-        orm_drive = OrmDrive(
-            game_id=game_id,
-            drive_number=int(drive_record.uid),  # Sequential drive number within game
-            offense_team_id=start.pos_team.uid if start.pos_team else None,
-            defense_team_id=start.def_team.uid if start.def_team else None,
+        return {
+            "game_id": game_id,
+            # Sequential drive number within game
+            "drive_number": int(drive_record.uid),
+            "offense_team_id": start.pos_team.uid if start.pos_team else None,
+            "defense_team_id": start.def_team.uid if start.def_team else None,
             # Start snapshot
-            start_quarter=start.clock_snapshot.quarter,
-            start_time_remaining=start.clock_snapshot.time_remaining,
-            start_down=start.possession_snapshot.down,
-            start_distance=start.possession_snapshot.distance,
-            start_yardline=start.possession_snapshot.yardline,
+            "start_quarter": start.clock_snapshot.quarter,
+            "start_time_remaining": start.clock_snapshot.time_remaining,
+            "start_down": start.possession_snapshot.down,
+            "start_distance": start.possession_snapshot.distance,
+            "start_yardline": start.possession_snapshot.yardline,
             # End snapshot
-            end_quarter=end.clock_snapshot.quarter,
-            end_time_remaining=end.clock_snapshot.time_remaining,
-            end_down=end.possession_snapshot.down,
-            end_distance=end.possession_snapshot.distance,
-            end_yardline=end.possession_snapshot.yardline,
+            "end_quarter": end.clock_snapshot.quarter,
+            "end_time_remaining": end.clock_snapshot.time_remaining,
+            "end_down": end.possession_snapshot.down,
+            "end_distance": end.possession_snapshot.distance,
+            "end_yardline": end.possession_snapshot.yardline,
             # Aggregates
-            plays_run=len(drive_record.plays),
-            yards_gained=execution_data.yards_gained,
-            time_elapsed=execution_data.time_elapsed,
+            "plays_run": len(drive_record.plays),
+            "yards_gained": execution_data.yards_gained,
+            "time_elapsed": execution_data.time_elapsed,
             # Results
-            result=execution_data.result.value if execution_data.result else "unknown",
-            scoring_type=execution_data.scoring_type.value
-            if execution_data.scoring_type
-            else None,
-            scoring_team_id=execution_data.scoring_team.uid
-            if execution_data.scoring_team
-            else None,
-        )
-        return orm_drive
+            "result": (
+                execution_data.result.value if execution_data.result else "unknown"
+            ),
+            "scoring_type": (
+                execution_data.scoring_type.value
+                if execution_data.scoring_type
+                else None
+            ),
+            "scoring_team_id": (
+                execution_data.scoring_team.uid if execution_data.scoring_team else None
+            ),
+        }
+
+    def to_orm(self, drive_record: DriveRecord, game_id: str) -> OrmDrive:
+        """
+        Convert a DriveRecord to an ORM Drive.
+
+        Args:
+            drive_record: DriveRecord object from simulation.
+            game_id: Parent game ID.
+
+        Returns:
+            ORM Drive object (not yet persisted).
+        """
+        return OrmDrive(**self.to_row(drive_record, game_id))
 
     def save(self, drive_record: DriveRecord, game_id: str) -> OrmDrive:
         """
@@ -834,11 +1521,11 @@ class PlayRepository:
         """
         self.db = db_manager
 
-    def to_orm(
+    def to_row(
         self, play_record: PlayRecord, game_id: str, drive_id: int, play_number: int
-    ) -> OrmPlay:
+    ) -> Dict[str, Any]:
         """
-        Convert a PlayRecord to an ORM Play.
+        Convert a PlayRecord to a plain column dictionary for Core inserts.
 
         Args:
             play_record: PlayRecord object from simulation.
@@ -847,44 +1534,57 @@ class PlayRepository:
             play_number: 1-based play number within drive.
 
         Returns:
-            ORM Play object (not yet persisted).
+            Row dictionary keyed by Play column name.
         """
         execution_data = play_record.execution_data
         start = play_record.start
         end = play_record.end
+        off_play_call = execution_data.off_play_call
 
-        orm_play = OrmPlay(
-            game_id=game_id,
-            drive_id=drive_id,
-            play_number=play_number,
+        return {
+            "game_id": game_id,
+            "drive_id": drive_id,
+            "play_number": play_number,
             # Call metadata
-            play_call_id=execution_data.off_play_call.uid
-            if execution_data.off_play_call
-            else None,
-            play_type=execution_data.play_type,
-            side=execution_data.off_play_call.side
-            if execution_data.off_play_call
-            else None,
-            formation_id=None,  # Can be enhanced if formation tracking is added
-            personnel_id=None,  # Can be enhanced if personnel tracking is added
+            "play_call_id": off_play_call.uid if off_play_call else None,
+            "play_type": execution_data.play_type,
+            "side": off_play_call.side if off_play_call else None,
+            "formation_id": None,  # Can be enhanced if formation tracking is added
+            "personnel_id": None,  # Can be enhanced if personnel tracking is added
             # Teams
-            offense_team_id=start.pos_team.uid if start.pos_team else None,
-            defense_team_id=start.def_team.uid if start.def_team else None,
+            "offense_team_id": start.pos_team.uid if start.pos_team else None,
+            "defense_team_id": start.def_team.uid if start.def_team else None,
             # Start snapshot
-            quarter=start.clock_snapshot.quarter,
-            time_remaining=start.clock_snapshot.time_remaining,
-            down=start.possession_snapshot.down,
-            distance=start.possession_snapshot.distance,
-            yardline_start=start.possession_snapshot.yardline,
+            "quarter": start.clock_snapshot.quarter,
+            "time_remaining": start.clock_snapshot.time_remaining,
+            "down": start.possession_snapshot.down,
+            "distance": start.possession_snapshot.distance,
+            "yardline_start": start.possession_snapshot.yardline,
             # Outcomes
-            yardline_end=end.possession_snapshot.yardline,
-            yards_gained=execution_data.yards_gained or 0,
-            possession_changed=int(execution_data.is_possession_change or False),
-            turnover=int(execution_data.is_turnover or False),
-            scoring_type=None,  # Can be populated if scoring data is tracked
-            scoring_team_id=None,  # Can be populated if scoring data is tracked
-        )
-        return orm_play
+            "yardline_end": end.possession_snapshot.yardline,
+            "yards_gained": execution_data.yards_gained or 0,
+            "possession_changed": int(execution_data.is_possession_change or False),
+            "turnover": int(execution_data.is_turnover or False),
+            "scoring_type": None,  # Can be populated if scoring data is tracked
+            "scoring_team_id": None,  # Can be populated if scoring data is tracked
+        }
+
+    def to_orm(
+        self, play_record: PlayRecord, game_id: str, drive_id: int, play_number: int
+    ) -> OrmPlay:
+        """
+        Convert a PlayRecord to an ORM Play.
+
+        Args:
+            play_record: PlayRecord object from simulation.
+            game_id: Parent game ID.
+            drive_id: Parent drive ID.
+            play_number: 1-based play number within drive.
+
+        Returns:
+            ORM Play object (not yet persisted).
+        """
+        return OrmPlay(**self.to_row(play_record, game_id, drive_id, play_number))
 
     def save(
         self, play_record: PlayRecord, game_id: str, drive_id: int, play_number: int
@@ -960,14 +1660,32 @@ class PlayPersonnelAssignmentRepository:
         Returns:
             ORM PlayPersonnelAssignment object (not yet persisted).
         """
-        orm_assignment = OrmPlayPersonnelAssignment(
-            id=str(uuid.uuid4()),
-            play_id=play_id,
-            team_id=team_id,
-            athlete_id=athlete_id,
-            position=position,
+        return OrmPlayPersonnelAssignment(
+            **self.to_row(play_id, team_id, athlete_id, position)
         )
-        return orm_assignment
+
+    def to_row(
+        self, play_id: int, team_id: str, athlete_id: str, position: AthletePositionEnum
+    ) -> Dict[str, Any]:
+        """
+        Build a PlayPersonnelAssignment column dictionary for Core inserts.
+
+        Args:
+            play_id: Play fact ID.
+            team_id: Team ID.
+            athlete_id: Athlete ID.
+            position: AthletePositionEnum.
+
+        Returns:
+            Row dictionary keyed by PlayPersonnelAssignment column name.
+        """
+        return {
+            "id": str(uuid.uuid4()),
+            "play_id": play_id,
+            "team_id": team_id,
+            "athlete_id": athlete_id,
+            "position": position,
+        }
 
     def save_batch(
         self,
@@ -1034,14 +1752,36 @@ class PlayParticipantRepository:
         Returns:
             ORM PlayParticipant object (not yet persisted).
         """
-        orm_participant = OrmPlayParticipant(
-            id=str(uuid.uuid4()),
-            play_id=play_id,
-            athlete_id=athlete_id,
-            team_id=team_id,
-            participant_type=participant_type,
+        return OrmPlayParticipant(
+            **self.to_row(play_id, athlete_id, team_id, participant_type)
         )
-        return orm_participant
+
+    def to_row(
+        self,
+        play_id: int,
+        athlete_id: str,
+        team_id: str,
+        participant_type: PlayParticipantType,
+    ) -> Dict[str, Any]:
+        """
+        Build a PlayParticipant column dictionary for Core inserts.
+
+        Args:
+            play_id: Play fact ID.
+            athlete_id: Athlete ID.
+            team_id: Team ID.
+            participant_type: PlayParticipantType enum.
+
+        Returns:
+            Row dictionary keyed by PlayParticipant column name.
+        """
+        return {
+            "id": str(uuid.uuid4()),
+            "play_id": play_id,
+            "athlete_id": athlete_id,
+            "team_id": team_id,
+            "participant_type": participant_type,
+        }
 
     def save_batch(
         self, play_id: int, participants: Dict[str, PlayParticipantType], team_id: str
@@ -1071,6 +1811,152 @@ class PlayParticipantRepository:
         return orm_participants
 
 
+class RollupRepository:
+    """
+    Repository for rollup tables maintained at write time.
+
+    - experiment_team_score: incremented as game results are written.
+    - athlete_game_stats: built from a game's play facts, in the same
+      transaction as those facts (see FactRepository.add_facts_bulk).
+    """
+
+    # Participant role -> (count column, yards column or None)
+    PARTICIPANT_STAT_COLUMNS: Dict[PlayParticipantType, Tuple[str, str | None]] = {
+        PlayParticipantType.PASSER: ("pass_attempts", "passing_yards"),
+        PlayParticipantType.RUSHER: ("rush_attempts", "rushing_yards"),
+        PlayParticipantType.RECEIVER: ("targets", "receiving_yards"),
+        PlayParticipantType.RETURNER: ("returns", "return_yards"),
+        PlayParticipantType.TACKLER: ("tackles", None),
+        PlayParticipantType.INTERCEPTOR: ("interceptions", None),
+        PlayParticipantType.KICKER: ("kicks", None),
+        PlayParticipantType.PUNTER: ("kicks", None),
+    }
+
+    STAT_COLUMNS: Tuple[str, ...] = (
+        "snaps",
+        "pass_attempts",
+        "passing_yards",
+        "rush_attempts",
+        "rushing_yards",
+        "targets",
+        "receiving_yards",
+        "returns",
+        "return_yards",
+        "tackles",
+        "interceptions",
+        "kicks",
+    )
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the RollupRepository.
+
+        Args:
+            db_manager: DatabaseManager instance for persistence.
+        """
+        self.db = db_manager
+
+    def record_team_scores(self, games: Sequence[OrmGame]) -> None:
+        """
+        Add completed experiment games to the team score distributions.
+
+        Args:
+            games: Game rows just written (failed or standalone games skipped).
+        """
+        session = self.db.get_session()
+        try:
+            with session.begin():
+                self.add_team_scores(session, games)
+        except Exception as e:
+            logger.error(f"Failed to update team score rollup: {e}")
+            raise
+        finally:
+            session.close()
+
+    def add_team_scores(self, session: Session, games: Sequence[OrmGame]) -> None:
+        """
+        Add games to the team score distributions in the caller's transaction.
+
+        The increments cannot be replayed safely, so callers write them in the
+        same transaction as the game rows they count.
+
+        Args:
+            session: Session whose transaction the caller commits.
+            games: Game rows being written (failed or standalone games skipped).
+        """
+        counts: Dict[Tuple[str, str, int], int] = {}
+        for game in games:
+            if game.experiment_id is None or game.status != "completed":
+                continue
+            for team_id, points in (
+                (game.home_team_id, game.home_score),
+                (game.away_team_id, game.away_score),
+            ):
+                key = (game.experiment_id, team_id, points)
+                counts[key] = counts.get(key, 0) + 1
+        if not counts:
+            return
+
+        rows = [
+            {
+                "experiment_id": experiment_id,
+                "team_id": team_id,
+                "points": points,
+                "game_count": game_count,
+            }
+            for (experiment_id, team_id, points), game_count in counts.items()
+        ]
+        _upsert_increment(session, OrmExperimentTeamScore, rows, ["game_count"])
+
+    def build_athlete_game_stats(
+        self,
+        plays: Dict[int, Tuple[str, int]],
+        assignment_rows: List[Dict[str, Any]],
+        participant_rows: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Fold play fact rows into per-athlete per-game stat rows.
+
+        Args:
+            plays: Play ID -> (game ID, yards gained).
+            assignment_rows: play_personnel_assignment rows for those plays.
+            participant_rows: play_participant rows for those plays.
+
+        Returns:
+            athlete_game_stats row dictionaries.
+        """
+        stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        def stat_row(
+            game_id: str, athlete_id: str, team_id: str | None
+        ) -> Dict[str, Any]:
+            row = stats.get((game_id, athlete_id))
+            if row is None:
+                row = {"game_id": game_id, "athlete_id": athlete_id, "team_id": team_id}
+                row.update({column: 0 for column in self.STAT_COLUMNS})
+                stats[(game_id, athlete_id)] = row
+            return row
+
+        for assignment in assignment_rows:
+            game_id, _ = plays[assignment["play_id"]]
+            row = stat_row(game_id, assignment["athlete_id"], assignment["team_id"])
+            row["snaps"] += 1
+
+        for participant in participant_rows:
+            athlete_id = participant["athlete_id"]
+            columns = self.PARTICIPANT_STAT_COLUMNS.get(participant["participant_type"])
+            if athlete_id is None or columns is None:
+                continue
+            game_id, yards_gained = plays[participant["play_id"]]
+            row = stat_row(game_id, athlete_id, participant["team_id"])
+            count_column, yards_column = columns
+            row[count_column] += 1
+            if yards_column is not None:
+                row[yards_column] += yards_gained
+
+        return list(stats.values())
+
+
 class FactRepository:
     """
     Facade for all fact repositories.
@@ -1090,6 +1976,7 @@ class FactRepository:
         self.plays = PlayRepository(db_manager)
         self.play_personnel_assignments = PlayPersonnelAssignmentRepository(db_manager)
         self.play_participants = PlayParticipantRepository(db_manager)
+        self.rollups = RollupRepository(db_manager)
 
     def persist_game_facts(self, game_id: str, game_state: GameState) -> None:
         """
@@ -1105,56 +1992,127 @@ class FactRepository:
             game_id: Game fact ID.
             game_state: GameState object with completed drives.
         """
-        logger.info(f"Persisting game {game_id} fact data...")
-        logger.info(f"Game has {len(game_state.drives)} drive(s)")
+        self.persist_facts_bulk([(game_id, game_state)])
 
-        # Persist drives
-        if game_state.drives:
-            orm_drives = self.drives.save_batch(game_state.drives, game_id)
+    def persist_facts_bulk(self, games: Sequence[Tuple[str, GameState]]) -> None:
+        """
+        Persist fact data for one or many games in a single transaction.
 
-            # Persist plays, personnel assignments, and participants for each drive
-            for drive_idx, (drive, orm_drive) in enumerate(
-                zip(game_state.drives, orm_drives)
-            ):
-                logger.info(
-                    f"Processing drive {drive_idx + 1}/{len(game_state.drives)} with {len(drive.plays)} play(s)"
-                )
+        See ``add_facts_bulk`` for how the rows are written.
 
-                # Get the offensive team for this drive
-                assert drive.start.pos_team is not None
-                assert drive.start.def_team is not None
-                drive_offense_team_id = drive.start.pos_team.uid
-                drive_defense_team_id = drive.start.def_team.uid
+        Args:
+            games: ``(game_id, game_state)`` pairs to persist.
+        """
+        session = self.db.get_session()
+        try:
+            with session.begin():
+                self.add_facts_bulk(session, games)
+        except Exception as e:
+            logger.error(f"Failed to bulk persist fact data: {e}")
+            raise
+        finally:
+            session.close()
+
+    def add_facts_bulk(
+        self, session: Session, games: Sequence[Tuple[str, GameState]]
+    ) -> None:
+        """
+        Write fact data for one or many games in the caller's transaction.
 
-                for play_number, play_record in enumerate(drive.plays, start=1):
-                    # Persist the play - use orm_drive.id which has the composite ID
-                    orm_play = self.plays.to_orm(
-                        play_record, game_id, orm_drive.id, play_number
-                    )
-                    self.db.insert_fact_data(orm_play)
-
-                    # Persist offensive personnel assignments
-                    if play_record.off_personnel_assignments:
-                        self.play_personnel_assignments.save_batch(
-                            orm_play.id,
-                            play_record.off_personnel_assignments,
-                            drive_offense_team_id,
-                        )
+        Rows are built as plain dictionaries and written with Core executemany
+        inserts, one statement per fact table level. Drive and play IDs are
+        recovered with ``RETURNING`` (ordered by parameter position) so child
+        rows can reference them without per-row round trips. The
+        athlete_game_stats rollup is written alongside the facts.
 
-                    # Persist defensive personnel assignments
-                    if play_record.def_personnel_assignments:
-                        self.play_personnel_assignments.save_batch(
-                            orm_play.id,
-                            play_record.def_personnel_assignments,
-                            drive_defense_team_id,
-                        )
+        Args:
+            session: Session whose transaction the caller commits.
+            games: ``(game_id, game_state)`` pairs to persist.
+        """
+        games_with_drives = [(gid, gs) for gid, gs in games if gs.drives]
+        if not games_with_drives:
+            logger.debug("No drives to persist.")
+            return
 
-                    # Persist participants
-                    if play_record.participants:
-                        self.play_participants.save_batch(
-                            orm_play.id,
-                            play_record.participants,
-                            drive_offense_team_id,
+        drives: List[DriveRecord] = []
+        drive_rows: List[Dict[str, Any]] = []
+        drive_game_ids: List[str] = []
+        for game_id, game_state in games_with_drives:
+            for drive in game_state.drives:
+                drives.append(drive)
+                drive_game_ids.append(game_id)
+                drive_rows.append(self.drives.to_row(drive, game_id))
+        drive_ids = self._insert_returning_ids(session, OrmDrive, drive_rows)
+
+        plays: List[Tuple[PlayRecord, str, str]] = []
+        play_rows: List[Dict[str, Any]] = []
+        for drive, drive_id, game_id in zip(drives, drive_ids, drive_game_ids):
+            assert drive.start.pos_team is not None
+            assert drive.start.def_team is not None
+            offense_team_id = drive.start.pos_team.uid
+            defense_team_id = drive.start.def_team.uid
+            for play_number, play_record in enumerate(drive.plays, start=1):
+                plays.append((play_record, offense_team_id, defense_team_id))
+                play_rows.append(
+                    self.plays.to_row(play_record, game_id, drive_id, play_number)
+                )
+        play_ids = self._insert_returning_ids(session, OrmPlay, play_rows)
+
+        assignment_rows: List[Dict[str, Any]] = []
+        participant_rows: List[Dict[str, Any]] = []
+        for (play_record, offense_team_id, defense_team_id), play_id in zip(
+            plays, play_ids
+        ):
+            for team_id, assignments in (
+                (offense_team_id, play_record.off_personnel_assignments),
+                (defense_team_id, play_record.def_personnel_assignments),
+            ):
+                for position, athletes in assignments.items():
+                    for athlete in athletes:
+                        assignment_rows.append(
+                            self.play_personnel_assignments.to_row(
+                                play_id, team_id, athlete.uid, position
+                            )
                         )
+            participants = play_record.participants.items()
+            for athlete_id, participant_type in participants:
+                participant_rows.append(
+                    self.play_participants.to_row(
+                        play_id, athlete_id, offense_team_id, participant_type
+                    )
+                )
+
+        if assignment_rows:
+            session.execute(insert(OrmPlayPersonnelAssignment), assignment_rows)
+        if participant_rows:
+            session.execute(insert(OrmPlayParticipant), participant_rows)
+
+        athlete_stat_rows = self.rollups.build_athlete_game_stats(
+            {
+                play_id: (row["game_id"], row["yards_gained"])
+                for play_id, row in zip(play_ids, play_rows)
+            },
+            assignment_rows,
+            participant_rows,
+        )
+        if athlete_stat_rows:
+            session.execute(insert(OrmAthleteGameStats), athlete_stat_rows)
 
-        logger.info(f"Game {game_id} fact data persisted successfully.")
+        logger.info(
+            f"Wrote facts for {len(games_with_drives)} game(s): "
+            f"{len(drive_rows)} drive(s), {len(play_rows)} play(s), "
+            f"{len(assignment_rows)} assignment(s), {len(participant_rows)} participant(s)."
+        )
+
+    @staticmethod
+    def _insert_returning_ids(
+        session: Session, orm_class: Any, rows: List[Dict[str, Any]]
+    ) -> List[int]:
+        """Executemany-insert rows and return generated IDs in row order."""
+        if not rows:
+            return []
+        result = session.execute(
+            insert(orm_class).returning(orm_class.id, sort_by_parameter_order=True),
+            rows,
+        )
+        return [row_id for (row_id,) in result]
@@ -13,6 +13,15 @@ Fact tables:
 - ModelInvocation: Captures typed user model calls, inputs, outputs, and metadata
 - Experiment: Metadata for simulation experiments (groups of game replications)
 - Game: Individual game results (one per simulation rep)
+- Drive, Play, PlayPersonnelAssignment, PlayParticipant: Per-drive/per-play facts
+
+Rollup tables (maintained at write time for dashboards):
+- ExperimentTeamScore: Per-experiment team score distributions
+- AthleteGameStats: Per-athlete per-game totals
+
+Bookkeeping tables:
+- TeamFingerprint: Content hash of each team's persisted dimension data
+- IdSequence: Named id allocators for block reservation of game ids
 """
 
 from __future__ import annotations
@@ -24,6 +33,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -354,6 +364,55 @@ class Experiment(Base):
         return f"Experiment(id={self.id}, name={self.name}, reps={self.num_reps})"
 
 
+class TeamFingerprint(Base):
+    """
+    Content hash of the dimension data last persisted for a team.
+
+    Lets dimension persistence skip teams whose roster and playbook are
+    unchanged since the previous experiment.
+
+    Attributes:
+        team_id: Reference to the team dimension.
+        fingerprint: SHA-256 hex digest of the team's canonical output payload.
+        updated_at: When the team's dimension data was last written.
+    """
+
+    __tablename__ = "team_fingerprint"
+
+    team_id: Mapped[str] = mapped_column(
+        String, ForeignKey("team.id"), primary_key=True
+    )
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
+    )
+
+    def __repr__(self) -> str:
+        return f"TeamFingerprint(team_id={self.team_id}, fingerprint={self.fingerprint[:12]})"
+
+
+class IdSequence(Base):
+    """
+    Named integer id allocator.
+
+    Each row holds the next unallocated value of one sequence (e.g. game ids).
+    Writers reserve contiguous blocks by incrementing ``next_value`` in a
+    single UPDATE, so concurrent experiments never hand out the same id.
+
+    Attributes:
+        name: Sequence name (e.g. "game").
+        next_value: First value not yet handed out.
+    """
+
+    __tablename__ = "id_sequence"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    next_value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"IdSequence(name={self.name}, next_value={self.next_value})"
+
+
 class Game(Base):
     """
     Fact: Individual game result.
@@ -381,6 +440,7 @@ class Game(Base):
     """
 
     __tablename__ = "game"
+    __table_args__ = (Index("ix_game_experiment_rep", "experiment_id", "rep_number"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)  # Game UID
     experiment_id: Mapped[str | None] = mapped_column(
@@ -446,6 +506,7 @@ class Drive(Base):
     """
 
     __tablename__ = "drive"
+    __table_args__ = (Index("ix_drive_game_drive_number", "game_id", "drive_number"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     game_id: Mapped[str] = mapped_column(String, ForeignKey("game.id"), nullable=False)
@@ -503,11 +564,23 @@ class Play(Base):
     """
 
     __tablename__ = "play"
+    __table_args__ = (
+        # Situational lookups within a game/experiment (also serves game_id).
+        Index(
+            "ix_play_game_offense_situation",
+            "game_id",
+            "offense_team_id",
+            "down",
+            "distance",
+        ),
+        # Situational lookups for a team across experiments.
+        Index("ix_play_offense_situation", "offense_team_id", "down", "distance"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     game_id: Mapped[str] = mapped_column(String, ForeignKey("game.id"), nullable=False)
     drive_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("drive.id"), nullable=False
+        Integer, ForeignKey("drive.id"), nullable=False, index=True
     )
     play_number: Mapped[int] = mapped_column(
         Integer, nullable=False
@@ -578,9 +651,12 @@ class PlayPersonnelAssignment(Base):
     """
 
     __tablename__ = "play_personnel_assignment"
+    __table_args__ = (Index("ix_play_personnel_assignment_athlete", "athlete_id"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    play_id: Mapped[int] = mapped_column(Integer, ForeignKey("play.id"), nullable=False)
+    play_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("play.id"), nullable=False, index=True
+    )
     team_id: Mapped[str] = mapped_column(String, ForeignKey("team.id"), nullable=False)
     athlete_id: Mapped[str] = mapped_column(
         String, ForeignKey("athlete.id"), nullable=False
@@ -610,9 +686,14 @@ class PlayParticipant(Base):
     """
 
     __tablename__ = "play_participant"
+    __table_args__ = (
+        Index("ix_play_participant_athlete_type", "athlete_id", "participant_type"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    play_id: Mapped[int] = mapped_column(Integer, ForeignKey("play.id"), nullable=False)
+    play_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("play.id"), nullable=False, index=True
+    )
     athlete_id: Mapped[str | None] = mapped_column(
         String, ForeignKey("athlete.id"), nullable=True
     )
@@ -636,3 +717,88 @@ class PlayParticipant(Base):
             f"participant_type={self.participant_type}"
             ")"
         )
+
+
+class ExperimentTeamScore(Base):
+    """
+    Rollup: Per-experiment team score distribution.
+
+    One row per (experiment, team, points) with the number of completed games
+    in which the team scored exactly that many points. Incremented as each
+    game result is written, so score histograms never scan the game table.
+
+    Attributes:
+        experiment_id: Reference to the experiment.
+        team_id: Reference to the team.
+        points: Final score.
+        game_count: Number of games with this final score.
+    """
+
+    __tablename__ = "experiment_team_score"
+
+    experiment_id: Mapped[str] = mapped_column(
+        String, ForeignKey("experiment.id"), primary_key=True
+    )
+    team_id: Mapped[str] = mapped_column(
+        String, ForeignKey("team.id"), primary_key=True
+    )
+    points: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            "ExperimentTeamScore("
+            f"experiment_id={self.experiment_id}, team_id={self.team_id}, "
+            f"points={self.points}, game_count={self.game_count}"
+            ")"
+        )
+
+
+class AthleteGameStats(Base):
+    """
+    Rollup: Per-athlete per-game totals.
+
+    Written in the same transaction as the game's play facts. Yards are the
+    play's ``yards_gained`` credited to the athlete's participant role.
+
+    Attributes:
+        game_id: Reference to the game.
+        athlete_id: Reference to the athlete.
+        team_id: Team the athlete was on the field for.
+        snaps: Plays on which the athlete had a personnel assignment.
+        pass_attempts / passing_yards: Plays as passer and their yards.
+        rush_attempts / rushing_yards: Plays as rusher and their yards.
+        targets / receiving_yards: Plays as receiver and their yards.
+        returns / return_yards: Plays as returner and their yards.
+        tackles: Plays as tackler.
+        interceptions: Plays as interceptor.
+        kicks: Plays as kicker or punter.
+    """
+
+    __tablename__ = "athlete_game_stats"
+    __table_args__ = (Index("ix_athlete_game_stats_athlete", "athlete_id"),)
+
+    game_id: Mapped[str] = mapped_column(
+        String, ForeignKey("game.id"), primary_key=True
+    )
+    athlete_id: Mapped[str] = mapped_column(
+        String, ForeignKey("athlete.id"), primary_key=True
+    )
+    team_id: Mapped[str | None] = mapped_column(
+        String, ForeignKey("team.id"), nullable=True
+    )
+    snaps: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pass_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    passing_yards: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rush_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rushing_yards: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    targets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    receiving_yards: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    returns: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    return_yards: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tackles: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    interceptions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    kicks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"AthleteGameStats(game_id={self.game_id}, athlete_id={self.athlete_id})"
@@ -9,6 +9,7 @@ Key components:
 - AthletePositionEnum: Enumeration of all valid football positions.
 - PositionTree: Hierarchical structure for position relationships and fallbacks.
 - Team: Football team with roster, offensive/defensive playbooks.
+- DepthChart: Roster-ordered athletes per position, maintained by Team.
 - Playbook: Collection of plays organized by side (offensive/defensive).
 - Play/PlayCall: Individual play template with formation and personnel.
 - LeagueRules: Abstract interface for league-specific game rules.
@@ -16,9 +17,10 @@ Key components:
 """
 
 from .athlete import Athlete, AthletePositionEnum, PositionTree, POSITION_TREE
-from .team import Team
+from .team import DepthChart, Team
 from .playbook import (
     Playbook,
+    PlaybookFrozenError,
     PlayCall,
     PlaySideEnum,
     PlayTypeEnum,
@@ -43,8 +45,10 @@ __all__ = [
     "POSITION_TREE",
     # Team module
     "Team",
+    "DepthChart",
     # Playbook module
     "Playbook",
+    "PlaybookFrozenError",
     "PlayCall",
     "PlaySideEnum",
     "PlayTypeEnum",
@@ -17,7 +17,8 @@ within the football hierarchy. This module provides:
   and a unique UUID. Athletes are roster members and can participate in plays.
 
 - POSITION_TREE: Pre-built singleton position hierarchy used throughout the simulation
-  for personnel validation, selection, and fallback logic.
+  for personnel validation, selection, and fallback logic. It is frozen at import,
+  so node lookups, leaf sets and fallback chains are precomputed tables.
 
 Key design:
 - Positions are bidirectional (can traverse up to generic groups or down to specifics)
@@ -28,7 +29,7 @@ Key design:
 from __future__ import annotations
 from enum import Enum
 import logging
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 import uuid
 
 
@@ -99,6 +100,10 @@ class PositionTree:
     a specific position is not available by traversing up the tree to more generic
     positions. For example, if a WR is not available, we can fallback to SKILL, then
     OFFENSE.
+
+    ``freeze()`` precomputes, for every node of the subtree, a position -> node
+    map, the set of leaf positions below it and its fallback chain, turning the
+    lookups below into dict hits. A frozen tree must not be modified.
     """
 
     def __init__(
@@ -114,6 +119,39 @@ class PositionTree:
         for child in self.children.values():
             child.parent = self
 
+        # Lookup tables filled in by freeze().
+        self._nodes: Dict[AthletePositionEnum | None, PositionTree] | None = None
+        self._leaves: Tuple[AthletePositionEnum, ...] | None = None
+        self._leaf_set: FrozenSet[AthletePositionEnum] | None = None
+        self._fallback_chain: Tuple[PositionTree, ...] | None = None
+
+    def freeze(self) -> "PositionTree":
+        """Precompute the lookup tables of this node and its descendants."""
+        for child in self.children.values():
+            child.freeze()
+
+        nodes: Dict[AthletePositionEnum | None, PositionTree] = {}
+        leaves: List[AthletePositionEnum] = []
+        if self.position is not None and self.is_leaf():
+            leaves.append(self.position)
+        # Children first, then self, so the first match wins as in a DFS.
+        for child in reversed(self.children.values()):
+            nodes.update(child._nodes or {})
+        nodes[self.position] = self
+        for child in self.children.values():
+            leaves.extend(child._leaves or ())
+
+        self._nodes = nodes
+        self._leaves = tuple(leaves)
+        self._leaf_set = frozenset(leaves)
+        self._fallback_chain = None
+        self._fallback_chain = self.fallback_chain
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._nodes is not None
+
     # ==============================
     # Tree Operations
     # ==============================
@@ -123,6 +161,8 @@ class PositionTree:
 
     def find_node(self, pos: AthletePositionEnum) -> PositionTree | None:
         """Find and return the node corresponding to the given position."""
+        if self._nodes is not None:
+            return self._nodes.get(pos)
         if self.position == pos:
             return self
         for child in self.children.values():
@@ -133,6 +173,8 @@ class PositionTree:
 
     def all_positions(self) -> List[AthletePositionEnum]:
         """Get a list of all positions in the subtree rooted at this node."""
+        if self._leaves is not None:
+            return list(self._leaves)
         if self.position is not None and self.is_leaf():
             return [self.position]
 
@@ -141,8 +183,29 @@ class PositionTree:
             positions.extend(child.all_positions())
         return positions
 
+    @property
+    def leaf_positions(self) -> FrozenSet[AthletePositionEnum]:
+        """The leaf positions of this subtree, i.e. ``all_positions()`` as a set."""
+        if self._leaf_set is not None:
+            return self._leaf_set
+        return frozenset(self.all_positions())
+
+    @property
+    def fallback_chain(self) -> Tuple[PositionTree, ...]:
+        """This node, then each ancestor up to the root (RT, T, OLINE, OFFENSE, root)."""
+        if self._fallback_chain is not None:
+            return self._fallback_chain
+        chain: List[PositionTree] = []
+        node: PositionTree | None = self
+        while node is not None:
+            chain.append(node)
+            node = node.parent
+        return tuple(chain)
+
     def contains(self, pos: AthletePositionEnum) -> bool:
         """Check if the subtree contains the specified position."""
+        if self._nodes is not None:
+            return pos in self._nodes
         if self.position == pos:
             return True
         return any(child.contains(pos) for child in self.children.values())
@@ -327,4 +390,4 @@ POSITION_TREE = PositionTree(
             },
         ),
     },
-)
+).freeze()
@@ -24,7 +24,9 @@ templates that teams use to execute game strategy. This module provides:
   - Validation on initialization (formation/personnel compatibility)
 
 - Playbook: Collection of plays, organized by side. Teams maintain offensive and
-  defensive playbooks.
+  defensive playbooks. Plays are indexed by type, name and UID as they are added;
+  ``freeze()`` makes a playbook and its plays read-only so it can be shared across
+  processes.
 
 Key design:
 - Formations and Personnel can be shared across plays and teams
@@ -37,7 +39,8 @@ Key design:
 from __future__ import annotations
 from enum import Enum
 import logging
-from typing import Dict, List, Set
+import hashlib
+from typing import Any, Dict, Iterable, List, Set, Tuple
 import uuid
 
 from .athlete import AthletePositionEnum, POSITION_TREE
@@ -58,6 +61,12 @@ class PlayCallInitializationError(Exception):
     pass
 
 
+class PlaybookFrozenError(Exception):
+    """Raised when modifying a frozen Playbook or one of its plays."""
+
+    pass
+
+
 class PlaySideEnum(Enum):
     OFFENSE = "OFFENSE"
     DEFENSE = "DEFENSE"
@@ -298,12 +307,19 @@ class PlayCall:
         self.side = side
         self.description = description
         self._tags = tags if tags else []
+        # Set once a playbook holding this play is frozen; its tag index
+        # depends on the tags staying put.
+        self._frozen = False
         self._validate()
 
     # ==============================
     # Setters
     # ==============================
     def add_tag(self, tag: str) -> None:
+        if self._frozen:
+            raise PlaybookFrozenError(
+                f"Cannot tag play '{self.name}' in a frozen playbook"
+            )
         if tag not in self._tags:
             self._tags.append(tag)
 
@@ -318,6 +334,10 @@ class PlayCall:
     def tags(self) -> List[str]:
         return self._tags
 
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
     # ==============================
     # Validators
     # ==============================
@@ -369,6 +389,12 @@ class Playbook:
     The Playbook allows for adding new plays and retrieving plays based on various
     criteria such as name, UID, tags, and play type. It serves as a repository of
     strategies and tactics that a team can employ.
+
+    Plays are indexed by type, name and UID as they are added, and lookups return
+    cached tuples, so the play-calling models can query the playbook every snap.
+    Tags can change after a play is added (``PlayCall.add_tag``), so tag lookups
+    scan the plays until the playbook is frozen. ``freeze()`` indexes the tags,
+    makes the playbook and its plays read-only and fixes its ``fingerprint``.
     """
 
     def __init__(
@@ -377,13 +403,51 @@ class Playbook:
         uid: str | None = None,
     ) -> None:
         self._uid = uid if uid else str(uuid.uuid4())
-        self._plays = plays or []
+        self._plays: List[PlayCall] = []
+        self._by_type: Dict[PlayTypeEnum, List[PlayCall]] = {}
+        self._by_name: Dict[str, List[PlayCall]] = {}
+        self._by_uid: Dict[str, PlayCall] = {}
+        self._by_tag: Dict[str, Tuple[PlayCall, ...]] | None = None
+        # Tuples handed out by the getters, dropped whenever a play is added.
+        self._views: Dict[Any, Tuple[PlayCall, ...]] = {}
+        self._frozen = False
+        self._fingerprint: str | None = None
+
+        for play in plays or []:
+            self.add_play(play)
 
     # ==============================
     # Setters
     # ==============================
     def add_play(self, play: PlayCall) -> None:
+        if self._frozen:
+            raise PlaybookFrozenError(
+                f"Cannot add play '{play.name}' to frozen playbook {self._uid}"
+            )
         self._plays.append(play)
+        self._by_type.setdefault(play.play_type, []).append(play)
+        self._by_name.setdefault(play.name, []).append(play)
+        # Keep the first play for a UID, matching a scan of the plays.
+        self._by_uid.setdefault(play.uid, play)
+        self._views.clear()
+
+    def freeze(self) -> "Playbook":
+        """
+        Make the playbook read-only and index the current play tags.
+
+        Adding plays, or tagging one of its plays, afterwards raises
+        PlaybookFrozenError. Returns the playbook so it can be frozen inline.
+        """
+        if self._frozen:
+            return self
+        by_tag: Dict[str, List[PlayCall]] = {}
+        for play in self._plays:
+            play._frozen = True
+            for tag in play.tags:
+                by_tag.setdefault(tag, []).append(play)
+        self._by_tag = {tag: tuple(plays) for tag, plays in by_tag.items()}
+        self._frozen = True
+        return self
 
     # ==============================
     # Getters
@@ -393,23 +457,57 @@ class Playbook:
         return self._uid
 
     @property
-    def plays(self) -> List[PlayCall]:
-        return self._plays.copy()
+    def frozen(self) -> bool:
+        return self._frozen
 
-    def get_by_name(self, name: str) -> List[PlayCall]:
-        return [play for play in self._plays if play.name == name]
+    @property
+    def plays(self) -> Tuple[PlayCall, ...]:
+        return self._view("plays", self._plays)
 
-    def get_by_uid(self, uid: str) -> PlayCall | None:
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of the playbook UID and its play UIDs, in order."""
+        if self._fingerprint is not None:
+            return self._fingerprint
+        digest = hashlib.sha256(self._uid.encode("utf-8"))
         for play in self._plays:
-            if play.uid == uid:
-                return play
-        return None
+            digest.update(b"\0" + play.uid.encode("utf-8"))
+        fingerprint = digest.hexdigest()
+        if self._frozen:
+            self._fingerprint = fingerprint
+        return fingerprint
 
-    def get_by_tag(self, tag: str) -> List[PlayCall]:
-        return [play for play in self._plays if tag in play.tags]
+    def get_by_name(self, name: str) -> Tuple[PlayCall, ...]:
+        return self._view(("name", name), self._by_name.get(name, ()))
 
-    def get_by_type(self, play_type: PlayTypeEnum) -> List[PlayCall]:
-        return [play for play in self._plays if play.play_type == play_type]
+    def get_by_uid(self, uid: str) -> PlayCall | None:
+        return self._by_uid.get(uid)
+
+    def get_by_tag(self, tag: str) -> Tuple[PlayCall, ...]:
+        if self._by_tag is not None:
+            return self._by_tag.get(tag, ())
+        return tuple(play for play in self._plays if tag in play.tags)
+
+    def get_by_type(self, play_type: PlayTypeEnum) -> Tuple[PlayCall, ...]:
+        return self._view(("type", play_type), self._by_type.get(play_type, ()))
+
+    def get_by_types(self, play_types: Iterable[PlayTypeEnum]) -> Tuple[PlayCall, ...]:
+        """Plays of each of ``play_types`` in turn, e.g. every RUN then every PASS."""
+        key = ("types", tuple(play_types))
+        view = self._views.get(key)
+        if view is None:
+            view = tuple(
+                play for play_type in key[1] for play in self.get_by_type(play_type)
+            )
+            self._views[key] = view
+        return view
+
+    def _view(self, key: Any, plays: Iterable[PlayCall]) -> Tuple[PlayCall, ...]:
+        view = self._views.get(key)
+        if view is None:
+            view = tuple(plays)
+            self._views[key] = view
+        return view
 
     def __len__(self) -> int:
         return len(self._plays)
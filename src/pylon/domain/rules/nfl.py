@@ -116,7 +116,7 @@ class NFLRules(LeagueRules):
         coin_toss_winner = models.get_typed(
             "coin_toss_winner",
             CoinTossWinnerModel,  # type: ignore
-        ).execute(CoinTossContext(game_state, rng))
+        ).execute(CoinTossContext(game_state, rng.stream("coin_toss_winner")))
         game_state.set_coin_toss_winner(coin_toss_winner)
 
         # Coin toss winner typically chooses to receive or defer
@@ -125,7 +125,7 @@ class NFLRules(LeagueRules):
         choice = models.get_typed(
             "kick_receive_choice",
             KickReceiveChoiceModel,  # type: ignore
-        ).execute(KickReceiveContext(game_state, rng))
+        ).execute(KickReceiveContext(game_state, rng.stream("kick_receive_choice")))
         game_state.set_coin_toss_winner_choice(choice)
         # If winner chooses to RECEIVE, the opponent kicks
         # If winner chooses to KICK, they kick
@@ -11,6 +11,7 @@ Key capabilities:
 - Add players to the team's roster
 - Add plays to the appropriate playbook (offensive or defensive)
 - Access roster and playbooks through properties
+- Look up athletes by UID or position and read the depth chart in O(1)
 
 Teams serve as the primary unit of organization in the simulation:
 - Each game involves two teams (home and away)
@@ -21,14 +22,16 @@ Teams serve as the primary unit of organization in the simulation:
 Design notes:
 - Team UIDs are auto-generated or provided explicitly for persistence/replay
 - Playbooks are lazily initialized if not provided at construction
-- Roster is mutable (can add players during setup)
+- Roster is mutable only through add_athlete, which rebuilds the UID index
+  and depth chart; the constructor copies the given list and ``roster``
+  returns a tuple, so outside changes cannot leave those indices stale
 """
 
 import logging
 import uuid
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
-from .athlete import Athlete, AthletePositionEnum
+from .athlete import Athlete, AthletePositionEnum, PositionTree, POSITION_TREE
 from .playbook import (
     Playbook,
     PlayCall,
@@ -39,6 +42,55 @@ from .playbook import (
 logger = logging.getLogger(__name__)
 
 
+class DepthChart:
+    """
+    Roster-ordered athletes for every position of the PositionTree.
+
+    Depth follows roster order: the first athlete added at a position is the
+    starter. ``at(position)`` lists the athletes playing exactly that position;
+    ``under(position)`` lists, in roster order, every athlete whose position is
+    one of the tree node's ``all_positions()``, which is the candidate pool the
+    personnel models use when walking up the tree (``under(None)`` is the
+    tree root).
+    """
+
+    def __init__(
+        self, roster: Sequence[Athlete], tree: PositionTree = POSITION_TREE
+    ) -> None:
+        self._at: Dict[AthletePositionEnum, List[Athlete]] = {}
+        self._under: Dict[AthletePositionEnum | None, List[Athlete]] = {}
+
+        # Each leaf position's ancestors, itself first, up to the root (None).
+        leaf_ancestors: Dict[AthletePositionEnum, List[AthletePositionEnum | None]] = {}
+        for leaf in tree.all_positions():
+            node = tree.find_node(leaf)
+            if node is not None:
+                leaf_ancestors[leaf] = [n.position for n in node.fallback_chain]
+
+        for athlete in roster:
+            self._at.setdefault(athlete.position, []).append(athlete)
+            for position in leaf_ancestors.get(athlete.position, ()):
+                self._under.setdefault(position, []).append(athlete)
+
+    def at(self, position: AthletePositionEnum) -> Sequence[Athlete]:
+        """Athletes whose position is exactly ``position``, in depth order."""
+        return self._at.get(position, ())
+
+    def under(self, position: AthletePositionEnum | None) -> Sequence[Athlete]:
+        """Athletes at any leaf position below the ``position`` tree node."""
+        return self._under.get(position, ())
+
+    def starter(self, position: AthletePositionEnum) -> Athlete | None:
+        athletes = self._at.get(position)
+        return athletes[0] if athletes else None
+
+    def starters(
+        self, position: AthletePositionEnum, count: int
+    ) -> Tuple[Athlete, ...]:
+        """The first ``count`` athletes at ``position`` (fewer if not enough)."""
+        return tuple(self._at.get(position, ())[:count])
+
+
 class Team:
     """
     Represents a football team with offensive and defensive playbooks
@@ -53,7 +105,7 @@ class Team:
         name: str,
         off_playbook: Playbook | None = None,
         def_playbook: Playbook | None = None,
-        roster: List[Athlete] | None = None,
+        roster: Sequence[Athlete] | None = None,
         uid: str | None = None,
     ) -> None:
         # Keep uid stable across reloads (use provided UID when available)
@@ -61,7 +113,12 @@ class Team:
         self.name = name
         self._off_playbook = off_playbook
         self._def_playbook = def_playbook
-        self._roster: List[Athlete] = roster or []
+        self._roster: List[Athlete] = list(roster) if roster is not None else []
+        # Bumped on every roster change; lets caches tell rosters apart.
+        self._roster_version = 0
+        # Derived indices, rebuilt lazily after the roster changes.
+        self._athletes_by_uid: Dict[str, Athlete] | None = None
+        self._depth_chart: DepthChart | None = None
 
     # ==============================
     # Setters
@@ -69,6 +126,9 @@ class Team:
     def add_athlete(self, athlete: Athlete) -> None:
         logger.debug(f"Adding {athlete} to {self.name} roster")
         self._roster.append(athlete)
+        self._roster_version += 1
+        self._athletes_by_uid = None
+        self._depth_chart = None
 
     def add_play_template(self, play: PlayCall) -> None:
         logger.debug(f"Adding {play} to {self.name} playbook")
@@ -91,8 +151,9 @@ class Team:
     # Getters
     # ==============================
     @property
-    def roster(self) -> List[Athlete]:
-        return self._roster
+    def roster(self) -> Tuple[Athlete, ...]:
+        """Read-only snapshot of the roster; use add_athlete to change it."""
+        return tuple(self._roster)
 
     @property
     def off_playbook(self) -> Playbook | None:
@@ -106,23 +167,48 @@ class Team:
     def uid(self) -> str:
         return self._uid
 
+    @property
+    def roster_version(self) -> int:
+        return self._roster_version
+
+    @property
+    def depth_chart(self) -> DepthChart:
+        if self._depth_chart is None:
+            self._depth_chart = DepthChart(self._roster)
+        return self._depth_chart
+
     def has_offensive_playbook(self) -> bool:
         return self._off_playbook is not None
 
     def has_defensive_playbook(self) -> bool:
         return self._def_playbook is not None
 
+    def _uid_index(self) -> Dict[str, Athlete]:
+        if self._athletes_by_uid is None:
+            index: Dict[str, Athlete] = {}
+            for athlete in self._roster:
+                # Keep the first athlete for a UID, matching a roster scan.
+                index.setdefault(athlete.uid, athlete)
+            self._athletes_by_uid = index
+        return self._athletes_by_uid
+
+    def has_athlete(self, athlete: Athlete) -> bool:
+        """Whether this exact athlete is on the roster."""
+        indexed = self._uid_index().get(athlete.uid)
+        if indexed is athlete:
+            return True
+        # Only a roster reusing a UID across athletes needs the full scan.
+        return indexed is not None and athlete in self._roster
+
     def get_athlete_by_uid(self, athlete_uid: str) -> Athlete | None:
-        for athlete in self._roster:
-            if athlete.uid == athlete_uid:
-                return athlete
+        athlete = self._uid_index().get(athlete_uid)
+        if athlete is not None:
+            return athlete
         logger.warning(f"Athlete with UID {athlete_uid} not found in team {self.name}")
         return None
 
     def get_athletes_by_position(self, position: AthletePositionEnum) -> List[Athlete]:
-        athletes_at_position = [
-            athlete for athlete in self._roster if athlete.position == position
-        ]
+        athletes_at_position = list(self.depth_chart.at(position))
         if not athletes_at_position:
             logger.warning(
                 f"No athletes found at position {position} in team {self.name}"
@@ -5,6 +5,8 @@ Provides core simulation components including:
 - GameEngine: Main game simulator
 - SimulationRunner: Multi-replication orchestrator
 - Specialized engines: Drive, Play, Pass, Run, Kickoff, Punt, FieldGoal
+- EnginePlan/EngineStreams: per-play models and RNG streams compiled once
+- ValidationLevel: basic, strict, sampled or disabled per-play validation
 
 Note: Type stubs provided for IDE support. Lazy imports used at runtime
 to avoid circular dependencies.
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
     from .kickoff_engine import KickoffPlayEngine
     from .punt_engine import PuntPlayEngine
     from .field_goal_engine import FieldGoalPlayEngine
+    from .plan import EnginePlan, EngineStreams
+    from .validation import ValidationLevel
 
 
 def __getattr__(name: str):
@@ -62,6 +66,18 @@ def __getattr__(name: str):
         from .field_goal_engine import FieldGoalPlayEngine
 
         return FieldGoalPlayEngine
+    elif name == "EnginePlan":
+        from .plan import EnginePlan
+
+        return EnginePlan
+    elif name == "EngineStreams":
+        from .plan import EngineStreams
+
+        return EngineStreams
+    elif name == "ValidationLevel":
+        from .validation import ValidationLevel
+
+        return ValidationLevel
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -75,4 +91,7 @@ __all__ = [
     "KickoffPlayEngine",
     "PuntPlayEngine",
     "FieldGoalPlayEngine",
+    "EnginePlan",
+    "EngineStreams",
+    "ValidationLevel",
 ]
@@ -21,7 +21,12 @@ class DriveExecutionError(Exception):
 
 
 class DriveEngine:
-    """Engine to simulate a single drive within a game."""
+    """
+    Engine to simulate a single drive within a game.
+
+    ``GameEngine`` passes its game-long ``play_engine`` so drives reuse the
+    compiled plan; a standalone DriveEngine builds its own.
+    """
 
     def __init__(
         self,
@@ -29,13 +34,18 @@ class DriveEngine:
         models: ModelRegistry,
         rng: RNG,
         rules: LeagueRules,
+        play_engine: PlayEngine | None = None,
     ) -> None:
         self.game_state = game_state
         self.models = models
         self.rng = rng
         self.rules = rules
         self.drive_record = DriveRecord(self.game_state)
-        self.play_engine = PlayEngine(game_state, models, rng, self.rules)
+        self.play_engine = (
+            play_engine
+            if play_engine is not None
+            else PlayEngine(game_state, models, rng, self.rules)
+        )
 
     def run(self) -> DriveRecord:
         last_play: PlayRecord | None = None
@@ -44,10 +54,8 @@ class DriveEngine:
 
         while not self.is_drive_over(play_count) and play_count < max_plays:
             # create snapshots of the current game state before the play
-            # Calculate total play number: completed drives + current drive's plays so far + 1
-            current_play_number: int = (
-                self.game_state.total_plays() + len(self.drive_record.plays) + 1
-            )
+            # The play log holds every play run so far, this drive's included.
+            current_play_number: int = len(self.game_state.play_log) + 1
             play_record = PlayRecord(self.game_state, current_play_number)
             # execute the play
             play_data = self.play_engine.run()
@@ -57,10 +65,16 @@ class DriveEngine:
             # Assign execution data to the play record before updating game state
             play_record.set_execution_data(play_data)
 
-            GameStateUpdater.apply_play_data(self.game_state, play_data, self.rules)
+            GameStateUpdater.apply_play_data(
+                self.game_state,
+                play_data,
+                self.rules,
+                validate=self.play_engine.validate_play,
+            )
 
             play_record.set_end_state(self.game_state)
             self.drive_record.add_play(play_record)
+            GameStateUpdater.record_play(self.game_state, play_record)
             last_play = play_record
 
             self.run_post_play_hooks()
@@ -2,39 +2,38 @@
 
 import logging
 
-from sim.rng import RNG
 from ..state.game_state import GameState
-from ..models.registry import ModelRegistry
+from .plan import EnginePlan, EngineStreams
 from ..state.play_record import PlayExecutionData, PlayParticipantType
 from ..domain.athlete import Athlete
 from ..domain.playbook import PlayTypeEnum
 from ..models.personnel import (
     KickerSelectionContext,
-    KickerSelectionModel,
-    OffensivePlayerAssignmentModel,
-    DefensivePlayerAssignmentModel,
     PlayerAssignmentContext,
 )
-from ..models.specialteams import FieldGoalContext, FieldGoalModel
+from ..models.specialteams import FieldGoalContext
 
 
 logger = logging.getLogger(__name__)
 
 
 class FieldGoalPlayEngine:
+    """
+    Handler for field goal attempts; ``PlayEngine`` builds one per game and calls
+    ``run(play_data)`` for every play of this type.
+    """
+
+    play_data: PlayExecutionData
+
     def __init__(
-        self,
-        game_state: GameState,
-        models: ModelRegistry,
-        rng: RNG,
-        play_data: PlayExecutionData,
+        self, game_state: GameState, plan: EnginePlan, streams: EngineStreams
     ) -> None:
         self.game_state = game_state
-        self.models = models
-        self.rng = rng
-        self.play_data = play_data
+        self.plan = plan
+        self.streams = streams
 
-    def run(self) -> None:
+    def run(self, play_data: PlayExecutionData) -> None:
+        self.play_data = play_data
         assert self.play_data.play_type == PlayTypeEnum.FIELD_GOAL
         self.play_data.set_is_fg_attempt(True)
 
@@ -68,28 +67,20 @@ class FieldGoalPlayEngine:
 
     def assign_personnel(self) -> None:
         """Assign offensive (FG unit) and defensive (FG block) personnel."""
-        off_personnel_model = self.models.get_typed(
-            "offensive_play_personnel_assignment",
-            OffensivePlayerAssignmentModel,  # type: ignore
-        )
-        off_personnel = off_personnel_model.execute(
+        off_personnel = self.plan.offensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.offensive_play_personnel_assignment,
                 self.play_data.off_play_call,
                 play_type=self.play_data.play_type,
             )
         )
         self.play_data.set_off_personnel_assignments(off_personnel)
 
-        def_personnel_model = self.models.get_typed(
-            "defensive_play_personnel_assignment",
-            DefensivePlayerAssignmentModel,  # type: ignore
-        )
-        def_personnel = def_personnel_model.execute(
+        def_personnel = self.plan.defensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.defensive_play_personnel_assignment,
                 self.play_data.def_play_call,
                 play_type=self.play_data.play_type,
             )
@@ -97,27 +88,21 @@ class FieldGoalPlayEngine:
         self.play_data.set_def_personnel_assignments(def_personnel)
 
     def get_kicker(self) -> Athlete:
-        kicker_select_model = self.models.get_typed(
-            "kicker_selection",
-            KickerSelectionModel,  # type: ignore
-        )
-        kicker = kicker_select_model.execute(
+        kicker = self.plan.kicker_selection.execute(
             KickerSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.kicker_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Kicker selected: {kicker.first_name} {kicker.last_name}")
         return kicker
 
     def is_fg_good(self, kicker: Athlete) -> bool:
-        fg_model = self.models.get_typed(
-            "field_goal_success",
-            FieldGoalModel,  # type: ignore
-        )
-        is_fg_good = fg_model.execute(
+        is_fg_good = self.plan.field_goal_success.execute(
             FieldGoalContext(
                 self.game_state,
-                self.rng,
+                self.streams.field_goal_success,
                 self.play_data.off_personnel_assignments,
                 kicker,
             )
@@ -3,8 +3,16 @@ from typing import Any, List
 
 from sim.rng import RNG
 from .drive_engine import DriveEngine
+from .play_engine import PlayEngine
+from .plan import EnginePlan, EngineStreams
+from .validation import (
+    DEFAULT_VALIDATION_SAMPLE_EVERY,
+    PlayValidationSchedule,
+    ValidationLevel,
+)
 from ..state.game_state import GameState
 from ..models.registry import ModelRegistry, TypedModel
+from ..models.personnel import PersonnelAssignmentCache
 from ..domain.rules.base import LeagueRules
 from ..domain.rules.nfl import NFLRules
 from ..domain.team import Team
@@ -81,6 +89,14 @@ class GameEngine:
         # normally be None, but can be set for testing purposes If getting
         # an infinite loop.
         max_drives: int | None = None,
+        # Optional cache shared across games for deterministic personnel
+        # assignment models (see PersonnelAssignmentCache).
+        assignment_cache: PersonnelAssignmentCache | None = None,
+        # Per-play validation: BASIC checks every play, STRICT also checks
+        # model return types, SAMPLED every `validation_sample_every`-th
+        # play, OFF none.
+        validation: ValidationLevel = ValidationLevel.BASIC,
+        validation_sample_every: int = DEFAULT_VALIDATION_SAMPLE_EVERY,
     ) -> None:
         self.models = ModelRegistry()
         self.rng = rng
@@ -99,6 +115,26 @@ class GameEngine:
         self._register_default_models()
         self._override_default_models(self.user_models)
 
+        self.validation = PlayValidationSchedule(validation, validation_sample_every)
+
+        # Resolve every per-play model and RNG stream once; drives share a
+        # single PlayEngine and its play-type handlers for the whole game.
+        self.plan = EnginePlan.compile(
+            self.models,
+            assignment_cache,
+            check_return_types=self.validation.check_return_types,
+        )
+        self.streams = EngineStreams.bind(self.rng)
+        self.play_engine = PlayEngine(
+            self.game_state,
+            self.models,
+            self.rng,
+            self.rules,
+            plan=self.plan,
+            streams=self.streams,
+            validation=self.validation,
+        )
+
     def run(self) -> None:
         self._game_loop()
 
@@ -111,7 +147,11 @@ class GameEngine:
         drive_count = 0
         while not self.rules.is_game_over(self.game_state):
             drive_record = DriveEngine(
-                self.game_state, self.models, self.rng, self.rules
+                self.game_state,
+                self.models,
+                self.rng,
+                self.rules,
+                play_engine=self.play_engine,
             ).run()
             drive_count += 1
             if self.max_drives is not None and drive_count >= self.max_drives:
@@ -2,24 +2,18 @@
 
 import logging
 
-from sim.rng import RNG
 from ..state.game_state import GameState
-from ..models.registry import ModelRegistry
+from .plan import EnginePlan, EngineStreams
 from ..state.play_record import PlayParticipantType, PlayExecutionData
 from ..domain.athlete import Athlete
 from ..domain.rules.base import LeagueRules
 from ..models.personnel import (
-    PlaceKickerSelectionModel,
     PlaceKickerSelectionContext,
     KickoffReturnerSelectionContext,
-    KickoffReturnerSelectionModel,
 )
 from ..models.specialteams import (
-    KickoffReturnDistanceModel,
     KickoffReturnDistanceContext,
-    KickoffDistanceModel,
     KickoffDistanceContext,
-    KickoffTouchbackDecisionModel,
     KickoffTouchbackDecisionContext,
 )
 
@@ -28,21 +22,27 @@ logger = logging.getLogger(__name__)
 
 
 class KickoffPlayEngine:
+    """
+    Handler for kickoffs; ``PlayEngine`` builds one per game and calls
+    ``run(play_data)`` for every kickoff.
+    """
+
+    play_data: PlayExecutionData
+
     def __init__(
         self,
         game_state: GameState,
-        models: ModelRegistry,
-        rng: RNG,
-        play_execution_data: PlayExecutionData,
+        plan: EnginePlan,
+        streams: EngineStreams,
         rules: LeagueRules,
     ) -> None:
         self.game_state = game_state
-        self.models = models
-        self.rng = rng
-        self.play_data = play_execution_data
+        self.plan = plan
+        self.streams = streams
         self.rules = rules
 
-    def run(self) -> None:
+    def run(self, play_data: PlayExecutionData) -> None:
+        self.play_data = play_data
         # Kickoff play call may be None in playbook-optional mode.
 
         kicker = self.get_kicker()
@@ -121,36 +121,28 @@ class KickoffPlayEngine:
         self.play_data.set_is_fg_attempt(False)
 
     def get_kicker(self) -> Athlete:
-        kicker_select_model = self.models.get_typed(
-            "place_kicker_selection",
-            PlaceKickerSelectionModel,  # type: ignore
-        )
-        kicker = kicker_select_model.execute(
-            PlaceKickerSelectionContext(self.game_state, self.rng)
+        kicker = self.plan.place_kicker_selection.execute(
+            PlaceKickerSelectionContext(
+                self.game_state, self.streams.place_kicker_selection
+            )
         )
         logger.debug(f"Kicker selected: {kicker.first_name} {kicker.last_name}")
         return kicker
 
     def get_returner(self) -> Athlete:
-        returner_select_model = self.models.get_typed(
-            "kickoff_returner_selection",
-            KickoffReturnerSelectionModel,  # type: ignore
-        )
-        returner = returner_select_model.execute(
-            KickoffReturnerSelectionContext(self.game_state, self.rng)
+        returner = self.plan.kickoff_returner_selection.execute(
+            KickoffReturnerSelectionContext(
+                self.game_state, self.streams.kickoff_returner_selection
+            )
         )
         logger.debug(f"Returner selected: {returner.first_name} {returner.last_name}")
         return returner
 
     def get_return_distance(self, returner: Athlete) -> int:
-        kickoff_return_distance_model = self.models.get_typed(
-            "kickoff_return_distance",
-            KickoffReturnDistanceModel,  # type: ignore
-        )
-        distance = kickoff_return_distance_model.execute(
+        distance = self.plan.kickoff_return_distance.execute(
             KickoffReturnDistanceContext(
                 game_state=self.game_state,
-                rng=self.rng,
+                rng=self.streams.kickoff_return_distance,
                 returner=returner,
             )
         )
@@ -158,14 +150,10 @@ class KickoffPlayEngine:
 
     def get_kickoff_distance(self, kicker: Athlete) -> int:
         """Get how far the kickoff travels."""
-        kickoff_distance_model = self.models.get_typed(
-            "kickoff_distance",
-            KickoffDistanceModel,  # type: ignore
-        )
-        distance = kickoff_distance_model.execute(
+        distance = self.plan.kickoff_distance.execute(
             KickoffDistanceContext(
                 game_state=self.game_state,
-                rng=self.rng,
+                rng=self.streams.kickoff_distance,
                 kicker=kicker,
             )
         )
@@ -173,14 +161,10 @@ class KickoffPlayEngine:
 
     def get_touchback_decision(self, returner: Athlete, landing_spot: int) -> bool:
         """Determine if returner takes touchback or attempts return."""
-        touchback_decision_model = self.models.get_typed(
-            "kickoff_touchback_decision",
-            KickoffTouchbackDecisionModel,  # type: ignore
-        )
-        take_touchback = touchback_decision_model.execute(
+        take_touchback = self.plan.kickoff_touchback_decision.execute(
             KickoffTouchbackDecisionContext(
                 game_state=self.game_state,
-                rng=self.rng,
+                rng=self.streams.kickoff_touchback_decision,
                 returner=returner,
                 landing_spot=landing_spot,
             )
@@ -2,49 +2,33 @@
 
 import logging
 
-from sim.rng import RNG
 from ..domain.athlete import Athlete
 from ..domain.team import Team
 from ..domain.playbook import PlayTypeEnum
 from ..state.game_state import GameState
 from ..state.play_record import PlayExecutionData, PlayParticipantType
-from ..models.registry import ModelRegistry
+from .plan import EnginePlan, EngineStreams
 from ..models.personnel import (
     PasserSelectionContext,
     TargettedSelectionContext,
-    PasserSelectionModel,
-    TargettedSelectionModel,
-    OffensivePlayerAssignmentModel,
-    DefensivePlayerAssignmentModel,
     PlayerAssignmentContext,
     SackerSelectionContext,
-    SackerSelectionModel,
     InterceptorSelectionContext,
-    InterceptorSelectionModel,
 )
 from ..models.offense import (
     AirYardsContext,
     CompletionContext,
     YardsAfterCatchContext,
-    AirYardsModel,
-    CompletionModel,
-    YardsAfterCatchModel,
 )
 from ..models.defense import (
     SackContext,
-    SackModel,
     SackYardsContext,
-    SackYardsModel,
     InterceptionContext,
-    InterceptionModel,
     InterceptionReturnYardsContext,
-    InterceptionReturnYardsModel,
 )
 from ..models.possession import (
     FumbleContext,
-    FumbleModel,
     FumbleRecoveryContext,
-    FumbleRecoveryModel,
 )
 
 
@@ -52,19 +36,22 @@ logger = logging.getLogger(__name__)
 
 
 class PassPlayEngine:
+    """
+    Handler for pass plays; ``PlayEngine`` builds one per game and calls
+    ``run(play_data)`` for every play of this type.
+    """
+
+    play_data: PlayExecutionData
+
     def __init__(
-        self,
-        game_state: GameState,
-        models: ModelRegistry,
-        rng: RNG,
-        play_data: PlayExecutionData,
+        self, game_state: GameState, plan: EnginePlan, streams: EngineStreams
     ) -> None:
         self.game_state = game_state
-        self.models = models
-        self.rng = rng
-        self.play_data = play_data
+        self.plan = plan
+        self.streams = streams
 
-    def run(self) -> None:
+    def run(self, play_data: PlayExecutionData) -> None:
+        self.play_data = play_data
         assert self.play_data.play_type == PlayTypeEnum.PASS
 
         # Assign personnel for this pass play
@@ -166,28 +153,20 @@ class PassPlayEngine:
 
     def assign_personnel(self) -> None:
         """Assign offensive and defensive personnel for the pass play."""
-        off_personnel_model = self.models.get_typed(
-            "offensive_play_personnel_assignment",
-            OffensivePlayerAssignmentModel,  # type: ignore
-        )
-        off_personnel = off_personnel_model.execute(
+        off_personnel = self.plan.offensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.offensive_play_personnel_assignment,
                 self.play_data.off_play_call,
                 play_type=self.play_data.play_type,
             )
         )
         self.play_data.set_off_personnel_assignments(off_personnel)
 
-        def_personnel_model = self.models.get_typed(
-            "defensive_play_personnel_assignment",
-            DefensivePlayerAssignmentModel,  # type: ignore
-        )
-        def_personnel = def_personnel_model.execute(
+        def_personnel = self.plan.defensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.defensive_play_personnel_assignment,
                 self.play_data.def_play_call,
                 play_type=self.play_data.play_type,
             )
@@ -195,27 +174,21 @@ class PassPlayEngine:
         self.play_data.set_def_personnel_assignments(def_personnel)
 
     def get_passer(self) -> Athlete:
-        passer_select_model = self.models.get_typed(
-            "passer_selection",
-            PasserSelectionModel,  # type: ignore
-        )
-        passer = passer_select_model.execute(
+        passer = self.plan.passer_selection.execute(
             PasserSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.passer_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Passer selected: {passer.first_name} {passer.last_name}")
         return passer
 
     def get_sacker(self) -> Athlete:
-        sacker_select_model = self.models.get_typed(
-            "sacker_selection",
-            SackerSelectionModel,  # type: ignore
-        )
-        sacker = sacker_select_model.execute(
+        sacker = self.plan.sacker_selection.execute(
             SackerSelectionContext(
                 self.game_state,
-                self.rng,
+                self.streams.sacker_selection,
                 self.play_data.def_personnel_assignments,
             )
         )
@@ -223,13 +196,11 @@ class PassPlayEngine:
         return sacker
 
     def get_targetted_receiver(self) -> Athlete:
-        targetted_select_model = self.models.get_typed(
-            "targetted_selection",
-            TargettedSelectionModel,  # type: ignore
-        )
-        targetted = targetted_select_model.execute(
+        targetted = self.plan.targetted_selection.execute(
             TargettedSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.targetted_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(
@@ -238,27 +209,21 @@ class PassPlayEngine:
         return targetted
 
     def get_airyards(self) -> int:
-        airyard_model = self.models.get_typed(
-            "airyards",
-            AirYardsModel,  # type: ignore
-        )
-        airyards = airyard_model.execute(
+        airyards = self.plan.airyards.execute(
             AirYardsContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.airyards,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Air Yards: {airyards}")
         return airyards
 
     def is_completed(self, passer: Athlete, targetted: Athlete, air_yards: int) -> bool:
-        completion_model = self.models.get_typed(
-            "completion",
-            CompletionModel,  # type: ignore
-        )
-        complete = completion_model.execute(
+        complete = self.plan.completion.execute(
             CompletionContext(
                 self.game_state,
-                self.rng,
+                self.streams.completion,
                 self.play_data.off_personnel_assignments,
                 passer,
                 targetted,
@@ -272,14 +237,10 @@ class PassPlayEngine:
         return complete
 
     def get_yac(self, receiver: Athlete) -> int:
-        yac_model = self.models.get_typed(
-            "yac",
-            YardsAfterCatchModel,  # type: ignore
-        )
-        yac = yac_model.execute(
+        yac = self.plan.yac.execute(
             YardsAfterCatchContext(
                 self.game_state,
-                self.rng,
+                self.streams.yac,
                 self.play_data.off_personnel_assignments,
             )
         )
@@ -288,14 +249,10 @@ class PassPlayEngine:
 
     def is_sack(self) -> bool:
         """Determine if the defense sacks the quarterback."""
-        sack_model = self.models.get_typed(
-            "sack",
-            SackModel,  # type: ignore
-        )
-        is_sack = sack_model.execute(
+        is_sack = self.plan.sack.execute(
             SackContext(
                 self.game_state,
-                self.rng,
+                self.streams.sack,
                 self.play_data.off_personnel_assignments,
                 self.play_data.def_personnel_assignments,
             )
@@ -307,14 +264,10 @@ class PassPlayEngine:
         Calculate yards lost on a sack.
         Returns positive value representing yards lost (e.g., 7 means 7 yards lost).
         """
-        sack_yards_model = self.models.get_typed(
-            "sack_yards",
-            SackYardsModel,  # type: ignore
-        )
-        yards_lost = sack_yards_model.execute(
+        yards_lost = self.plan.sack_yards.execute(
             SackYardsContext(
                 self.game_state,
-                self.rng,
+                self.streams.sack_yards,
                 self.play_data.off_personnel_assignments,
                 self.play_data.def_personnel_assignments,
             )
@@ -327,14 +280,10 @@ class PassPlayEngine:
         """
         Determine if an incomplete pass is intercepted.
         """
-        interception_model = self.models.get_typed(
-            "interception",
-            InterceptionModel,  # type: ignore
-        )
-        is_interception = interception_model.execute(
+        is_interception = self.plan.interception.execute(
             InterceptionContext(
                 self.game_state,
-                self.rng,
+                self.streams.interception,
                 passer,
                 targetted,
                 air_yards,
@@ -346,14 +295,10 @@ class PassPlayEngine:
 
     def get_interception_return_yards(self, interceptor: Athlete) -> int:
         """Determine interception return yards (positive value)."""
-        return_yards_model = self.models.get_typed(
-            "interception_return_yards",
-            InterceptionReturnYardsModel,  # type: ignore
-        )
-        return_yards = return_yards_model.execute(
+        return_yards = self.plan.interception_return_yards.execute(
             InterceptionReturnYardsContext(
                 self.game_state,
-                self.rng,
+                self.streams.interception_return_yards,
                 interceptor,
                 self.play_data.off_personnel_assignments,
                 self.play_data.def_personnel_assignments,
@@ -363,14 +308,10 @@ class PassPlayEngine:
 
     def get_interceptor(self) -> Athlete:
         """Select a defensive player to record the interception."""
-        interceptor_select_model = self.models.get_typed(
-            "interceptor_selection",
-            InterceptorSelectionModel,  # type: ignore
-        )
-        interceptor = interceptor_select_model.execute(
+        interceptor = self.plan.interceptor_selection.execute(
             InterceptorSelectionContext(
                 self.game_state,
-                self.rng,
+                self.streams.interceptor_selection,
                 self.play_data.def_personnel_assignments,
             )
         )
@@ -381,14 +322,10 @@ class PassPlayEngine:
 
     def is_fumble(self, ball_carrier: Athlete) -> bool:
         """Determine if a ball carrier fumbles."""
-        fumble_model = self.models.get_typed(
-            "fumble",
-            FumbleModel,  # type: ignore
-        )
-        is_fumble = fumble_model.execute(
+        is_fumble = self.plan.fumble.execute(
             FumbleContext(
                 self.game_state,
-                self.rng,
+                self.streams.fumble,
                 ball_carrier,
             )
         )
@@ -398,14 +335,10 @@ class PassPlayEngine:
         """Determine which team recovers a fumble."""
         from ..domain.team import Team
 
-        recovery_model = self.models.get_typed(
-            "fumble_recovery",
-            FumbleRecoveryModel,  # type: ignore
-        )
-        recovering_team: Team = recovery_model.execute(
+        recovering_team: Team = self.plan.fumble_recovery.execute(
             FumbleRecoveryContext(
                 self.game_state,
-                self.rng,
+                self.streams.fumble_recovery,
                 fumbler,
                 self.play_data.off_personnel_assignments,
                 self.play_data.def_personnel_assignments,
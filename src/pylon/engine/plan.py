@@ -0,0 +1,210 @@
+"""
+Compiled engine plan: every per-play model and RNG stream bound up front.
+
+The play engines used to look each model up in the ``ModelRegistry`` by name
+(and ask the RNG for the model's stream) on every play. ``GameEngine``
+now compiles an ``EnginePlan`` from its registry and binds an
+``EngineStreams`` to the game's RNG once, before the first drive, so the
+per-play path reads plain attributes instead.
+
+Field names match the registered model names (and stream names), so
+``plan.rusher_selection`` is ``models.get("rusher_selection")`` and
+``streams.rusher_selection`` is ``rng.stream("rusher_selection")``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+
+from sim.rng import RNG
+from ..models.model import ReturnTypeCheckedModel, TypedModel
+from ..models.registry import ModelRegistry
+from ..models.misc import PlayTimeElapsedModel, PrePlayClockRunoffModel
+from ..models.offense import (
+    AirYardsModel,
+    CompletionModel,
+    OffensivePlayCallModel,
+    PlayTypeModel,
+    RushYardsGainedModel,
+    YardsAfterCatchModel,
+)
+from ..models.defense import (
+    DefensivePlayCallModel,
+    InterceptionModel,
+    InterceptionReturnYardsModel,
+    SackModel,
+    SackYardsModel,
+)
+from ..models.personnel import (
+    CachedDefensivePlayerAssignmentModel,
+    CachedOffensivePlayerAssignmentModel,
+    DefensivePlayerAssignmentModel,
+    InterceptorSelectionModel,
+    KickerSelectionModel,
+    KickoffReturnerSelectionModel,
+    OffensivePlayerAssignmentModel,
+    PasserSelectionModel,
+    PersonnelAssignmentCache,
+    PlaceKickerSelectionModel,
+    PuntReturnerSelectionModel,
+    PunterSelectionModel,
+    RusherSelectionModel,
+    SackerSelectionModel,
+    TargettedSelectionModel,
+)
+from ..models.specialteams import (
+    FieldGoalModel,
+    KickoffDistanceModel,
+    KickoffReturnDistanceModel,
+    KickoffTouchbackDecisionModel,
+    PuntDistanceModel,
+    PuntReturnDistanceModel,
+)
+from ..models.possession import FumbleModel, FumbleRecoveryModel
+
+
+def _declares_deterministic(model: TypedModel[Any, Any]) -> bool:
+    """
+    Whether ``model``'s own class declares ``deterministic``.
+
+    The flag is not inherited: a subclass of a deterministic model may draw
+    from ``context.rng``, so it is only cached if it opts in again.
+    """
+    return bool(type(model).__dict__.get("deterministic", False))
+
+
+@dataclass(frozen=True, slots=True)
+class EnginePlan:
+    """Models used on the per-play path, resolved once from a registry."""
+
+    # Play selection and clock
+    play_type: PlayTypeModel
+    off_play_call: OffensivePlayCallModel
+    def_play_call: DefensivePlayCallModel
+    preplay_clock_runoff: PrePlayClockRunoffModel
+    play_time_elapsed: PlayTimeElapsedModel
+
+    # Personnel
+    offensive_play_personnel_assignment: OffensivePlayerAssignmentModel
+    defensive_play_personnel_assignment: DefensivePlayerAssignmentModel
+
+    # Run plays
+    rusher_selection: RusherSelectionModel
+    rush_yards_gained: RushYardsGainedModel
+
+    # Pass plays
+    passer_selection: PasserSelectionModel
+    targetted_selection: TargettedSelectionModel
+    airyards: AirYardsModel
+    completion: CompletionModel
+    yac: YardsAfterCatchModel
+    sack: SackModel
+    sack_yards: SackYardsModel
+    sacker_selection: SackerSelectionModel
+    interception: InterceptionModel
+    interception_return_yards: InterceptionReturnYardsModel
+    interceptor_selection: InterceptorSelectionModel
+
+    # Ball security
+    fumble: FumbleModel
+    fumble_recovery: FumbleRecoveryModel
+
+    # Special teams
+    punter_selection: PunterSelectionModel
+    punt_distance: PuntDistanceModel
+    punt_returner_selection: PuntReturnerSelectionModel
+    punt_return_distance: PuntReturnDistanceModel
+    kicker_selection: KickerSelectionModel
+    field_goal_success: FieldGoalModel
+    place_kicker_selection: PlaceKickerSelectionModel
+    kickoff_distance: KickoffDistanceModel
+    kickoff_returner_selection: KickoffReturnerSelectionModel
+    kickoff_return_distance: KickoffReturnDistanceModel
+    kickoff_touchback_decision: KickoffTouchbackDecisionModel
+
+    @classmethod
+    def compile(
+        cls,
+        models: ModelRegistry,
+        assignment_cache: PersonnelAssignmentCache | None = None,
+        check_return_types: bool = False,
+    ) -> "EnginePlan":
+        """
+        Resolve every plan slot from ``models``.
+
+        With an ``assignment_cache``, personnel assignment models whose own
+        class declares ``deterministic`` are served through it. With ``check_return_types``,
+        every slot is wrapped in a ``ReturnTypeCheckedModel``.
+
+        Raises:
+            ModelNotFoundError: If a model the engines need is not registered.
+        """
+        resolved: Dict[str, Any] = {
+            slot.name: models.get(slot.name) for slot in fields(cls)
+        }
+        if assignment_cache is not None:
+            offense = resolved["offensive_play_personnel_assignment"]
+            if _declares_deterministic(offense):
+                resolved["offensive_play_personnel_assignment"] = (
+                    CachedOffensivePlayerAssignmentModel(offense, assignment_cache)
+                )
+            defense = resolved["defensive_play_personnel_assignment"]
+            if _declares_deterministic(defense):
+                resolved["defensive_play_personnel_assignment"] = (
+                    CachedDefensivePlayerAssignmentModel(defense, assignment_cache)
+                )
+        if check_return_types:
+            resolved = {
+                name: ReturnTypeCheckedModel(model) for name, model in resolved.items()
+            }
+        return cls(**resolved)
+
+
+@dataclass(frozen=True, slots=True)
+class EngineStreams:
+    """The RNG each plan model draws from, bound once to a game's RNG."""
+
+    play_type: RNG
+    off_play_call: RNG
+    def_play_call: RNG
+    preplay_clock_runoff: RNG
+    play_time_elapsed: RNG
+    offensive_play_personnel_assignment: RNG
+    defensive_play_personnel_assignment: RNG
+    rusher_selection: RNG
+    rush_yards_gained: RNG
+    passer_selection: RNG
+    targetted_selection: RNG
+    airyards: RNG
+    completion: RNG
+    yac: RNG
+    sack: RNG
+    sack_yards: RNG
+    sacker_selection: RNG
+    interception: RNG
+    interception_return_yards: RNG
+    interceptor_selection: RNG
+    fumble: RNG
+    fumble_recovery: RNG
+    punter_selection: RNG
+    punt_distance: RNG
+    punt_returner_selection: RNG
+    punt_return_distance: RNG
+    kicker_selection: RNG
+    field_goal_success: RNG
+    place_kicker_selection: RNG
+    kickoff_distance: RNG
+    kickoff_returner_selection: RNG
+    kickoff_return_distance: RNG
+    kickoff_touchback_decision: RNG
+
+    @classmethod
+    def bind(cls, rng: RNG) -> "EngineStreams":
+        """
+        Resolve ``rng.stream(name)`` for every plan model.
+
+        Substreams are cached by the RNG, so binding early hands each model
+        the same stream it would have been given on first use.
+        """
+        return cls(**{slot.name: rng.stream(slot.name) for slot in fields(cls)})
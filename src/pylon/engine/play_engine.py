@@ -1,6 +1,7 @@
 """Play-level orchestrator: selects calls, assigns personnel, and records outcomes."""
 
 import logging
+from functools import cached_property
 from typing import Dict, List
 
 from sim.rng import RNG
@@ -11,6 +12,8 @@ from .pass_engine import PassPlayEngine
 from .punt_engine import PuntPlayEngine
 from .kickoff_engine import KickoffPlayEngine
 from .field_goal_engine import FieldGoalPlayEngine
+from .plan import EnginePlan, EngineStreams
+from .validation import PlayValidationSchedule
 from ..state.game_state import GameState
 from ..state.play_record import PlayExecutionData
 from ..models.registry import ModelRegistry
@@ -21,21 +24,15 @@ from ..domain.playbook import (
 )
 from ..domain.athlete import Athlete, AthletePositionEnum
 from ..models.misc import (
-    PlayTimeElapsedModel,
     PlayTimeElapsedContext,
-    PrePlayClockRunoffModel,
     PrePlayClockRunoffContext,
 )
 from ..models.offense import (
-    PlayTypeModel,
     PlayTypeContext,
-    OffensivePlayCallModel,
     OffPlayCallContext,
 )
-from ..models.defense import DefensivePlayCallModel, DefPlayCallContext
+from ..models.defense import DefPlayCallContext
 from ..models.personnel import (
-    OffensivePlayerAssignmentModel,
-    DefensivePlayerAssignmentModel,
     PlayerAssignmentContext,
 )
 
@@ -57,6 +54,15 @@ class PlayEngine:
     is responsible for coordinating the various models to execute
     the play and generate a PlayExecutionData object that will be
     used to update the game state.
+
+    One PlayEngine serves every play of a game: models and RNG streams are
+    read from a compiled ``EnginePlan``/``EngineStreams`` and each play type
+    is executed by a long-lived handler. ``GameEngine`` passes the plan it
+    compiled at setup; otherwise it is compiled from ``models`` on first use.
+
+    ``validation`` decides which plays have their play calls and personnel
+    checked; ``validate_play`` records the decision for the current play so
+    callers can gate their own checks the same way.
     """
 
     def __init__(
@@ -65,17 +71,64 @@ class PlayEngine:
         models: ModelRegistry,
         rng: RNG,
         rules: LeagueRules,
+        plan: EnginePlan | None = None,
+        streams: EngineStreams | None = None,
+        validation: PlayValidationSchedule | None = None,
     ) -> None:
         self.game_state = game_state
         self.models = models
         self.rng = rng
         self.rules = rules
+        self._plan = plan
+        self._streams = streams
+        self.validation = (
+            validation if validation is not None else PlayValidationSchedule()
+        )
+        self.validate_play = True
+
+    # ==============================
+    # Compiled plan and handlers
+    # ==============================
+    @cached_property
+    def plan(self) -> EnginePlan:
+        if self._plan is not None:
+            return self._plan
+        return EnginePlan.compile(
+            self.models, check_return_types=self.validation.check_return_types
+        )
+
+    @cached_property
+    def streams(self) -> EngineStreams:
+        if self._streams is not None:
+            return self._streams
+        return EngineStreams.bind(self.rng)
+
+    @cached_property
+    def run_engine(self) -> RunPlayEngine:
+        return RunPlayEngine(self.game_state, self.plan, self.streams)
+
+    @cached_property
+    def pass_engine(self) -> PassPlayEngine:
+        return PassPlayEngine(self.game_state, self.plan, self.streams)
+
+    @cached_property
+    def punt_engine(self) -> PuntPlayEngine:
+        return PuntPlayEngine(self.game_state, self.plan, self.streams)
+
+    @cached_property
+    def field_goal_engine(self) -> FieldGoalPlayEngine:
+        return FieldGoalPlayEngine(self.game_state, self.plan, self.streams)
+
+    @cached_property
+    def kickoff_engine(self) -> KickoffPlayEngine:
+        return KickoffPlayEngine(self.game_state, self.plan, self.streams, self.rules)
 
     # ==============================
     # Main Execution
     # ==============================
     def run(self) -> PlayExecutionData:
         play_data = PlayExecutionData()
+        self.validate_play = self.validation.next_play()
 
         if self.game_state.has_pending_kickoff():
             self._run_kickoff(play_data)
@@ -90,6 +143,8 @@ class PlayEngine:
         # Get offensive and defensive play calls
         self.set_play_calls(play_data)
         self.execute_play_based_on_type(play_data)
+        if self.validate_play and self.validation.check_personnel:
+            self.validate_play_personnel(play_data)
         self.set_play_time_elapsed(play_data)
 
         # Set whether clock is running after the play (for now, assume it keeps running)
@@ -109,27 +164,25 @@ class PlayEngine:
         assert play_data.play_type is not None
 
         if play_data.play_type.is_run():
-            RunPlayEngine(self.game_state, self.models, self.rng, play_data).run()
+            self.run_engine.run(play_data)
 
         elif play_data.play_type.is_pass():
-            PassPlayEngine(self.game_state, self.models, self.rng, play_data).run()
+            self.pass_engine.run(play_data)
 
         elif play_data.play_type.is_punt():
-            PuntPlayEngine(self.game_state, self.models, self.rng, play_data).run()
+            self.punt_engine.run(play_data)
 
         elif play_data.play_type.is_field_goal():
-            FieldGoalPlayEngine(self.game_state, self.models, self.rng, play_data).run()
+            self.field_goal_engine.run(play_data)
 
     # ==============================
     # Setters
     # ==============================
     def set_preplay_clock_runoff(self, play_data: PlayExecutionData) -> None:
-        preplay_runoff_model = self.models.get_typed(
-            "preplay_clock_runoff",
-            PrePlayClockRunoffModel,  # type: ignore
-        )
-        preplay_runoff = preplay_runoff_model.execute(
-            PrePlayClockRunoffContext(self.game_state, self.rng)
+        preplay_runoff = self.plan.preplay_clock_runoff.execute(
+            PrePlayClockRunoffContext(
+                self.game_state, self.streams.preplay_clock_runoff
+            )
         )
         play_data.set_preplay_clock_runoff(preplay_runoff)
 
@@ -158,13 +211,9 @@ class PlayEngine:
         play_data.set_def_play_call(def_play_call)
 
     def set_play_time_elapsed(self, play_data: PlayExecutionData) -> None:
-        time_elapsed_model = self.models.get_typed(
-            "play_time_elapsed",
-            PlayTimeElapsedModel,  # type: ignore
-        )
-        time_elapsed = time_elapsed_model.execute(
+        time_elapsed = self.plan.play_time_elapsed.execute(
             PlayTimeElapsedContext(
-                self.game_state, self.rng
+                self.game_state, self.streams.play_time_elapsed
             )  # TODO: exposes more context
         )
         play_data.set_time_elapsed(time_elapsed)
@@ -173,42 +222,36 @@ class PlayEngine:
     # Getters (mainly models)
     # ==============================
     def get_play_type(self) -> PlayTypeEnum:
-        play_type_model = self.models.get_typed(
-            "play_type",
-            PlayTypeModel,  # type: ignore
+        return self.plan.play_type.execute(
+            PlayTypeContext(self.game_state, self.streams.play_type)
         )
-        return play_type_model.execute(PlayTypeContext(self.game_state, self.rng))
 
     def get_off_playcall(self, play_type: PlayTypeEnum) -> PlayCall:
-        off_play_call_model = self.models.get_typed(
-            "off_play_call",
-            OffensivePlayCallModel,  # type: ignore
-        )
-        off_play_call = off_play_call_model.execute(
-            OffPlayCallContext(self.game_state, self.rng, play_type)
+        off_play_call = self.plan.off_play_call.execute(
+            OffPlayCallContext(self.game_state, self.streams.off_play_call, play_type)
         )
 
-        self._validate_playcall(off_play_call, PlaySideEnum.OFFENSE)
+        if self.validate_play:
+            self._validate_playcall(off_play_call, PlaySideEnum.OFFENSE)
         return off_play_call
 
     def get_def_playcall(self, play_data: PlayExecutionData) -> PlayCall:
         assert play_data.play_type is not None
 
-        def_play_call_model = self.models.get_typed(
-            "def_play_call",
-            DefensivePlayCallModel,  # type: ignore
-        )
         # We pass the offensive play type to the defensive play call model so it
         # can condition its call on the offense's call. This is mainly done to
         # prevent the defense from calling a punt return (or something similarly
         # unrealistic) if the offense calls a run or pass. In the future, we may
         # want to pass more information about the offensive call. For now, just the
         # play type is sufficient.
-        def_play_call = def_play_call_model.execute(
-            DefPlayCallContext(self.game_state, self.rng, play_data.play_type)
+        def_play_call = self.plan.def_play_call.execute(
+            DefPlayCallContext(
+                self.game_state, self.streams.def_play_call, play_data.play_type
+            )
         )
 
-        self._validate_playcall(def_play_call, PlaySideEnum.DEFENSE)
+        if self.validate_play:
+            self._validate_playcall(def_play_call, PlaySideEnum.DEFENSE)
         return def_play_call
 
     def get_off_play_personnel(
@@ -216,14 +259,15 @@ class PlayEngine:
     ) -> Dict[AthletePositionEnum, List[Athlete]]:
         assert play_data.off_play_call is not None
 
-        play_personnel_model = self.models.get_typed(
-            "offensive_play_personnel_assignment",
-            OffensivePlayerAssignmentModel,  # type: ignore
-        )
-        personnel_assignments = play_personnel_model.execute(
-            PlayerAssignmentContext(self.game_state, self.rng, play_data.off_play_call)
+        personnel_assignments = self.plan.offensive_play_personnel_assignment.execute(
+            PlayerAssignmentContext(
+                self.game_state,
+                self.streams.offensive_play_personnel_assignment,
+                play_data.off_play_call,
+            )
         )
-        self.validate_off_personnel(personnel_assignments)  # ensure validity
+        if self.validate_play and self.validation.check_personnel:
+            self.validate_off_personnel(personnel_assignments)  # ensure validity
         return personnel_assignments
 
     def get_def_play_personnel(
@@ -231,14 +275,15 @@ class PlayEngine:
     ) -> Dict[AthletePositionEnum, List[Athlete]]:
         assert play_data.def_play_call is not None
 
-        play_personnel_model = self.models.get_typed(
-            "defensive_play_personnel_assignment",
-            DefensivePlayerAssignmentModel,  # type: ignore
-        )
-        personnel_assignments = play_personnel_model.execute(
-            PlayerAssignmentContext(self.game_state, self.rng, play_data.def_play_call)
+        personnel_assignments = self.plan.defensive_play_personnel_assignment.execute(
+            PlayerAssignmentContext(
+                self.game_state,
+                self.streams.defensive_play_personnel_assignment,
+                play_data.def_play_call,
+            )
         )
-        self.validate_def_personnel(personnel_assignments)  # ensure validity
+        if self.validate_play and self.validation.check_personnel:
+            self.validate_def_personnel(personnel_assignments)  # ensure validity
         return personnel_assignments
 
     # ==============================
@@ -251,6 +296,13 @@ class PlayEngine:
             raise PlayExecutionError(f"Invalid expected play side: {expected_type}")
         # other checks?
 
+    def validate_play_personnel(self, play_data: PlayExecutionData) -> None:
+        """Validate whichever personnel the play-type handler assigned."""
+        if play_data.off_personnel_assignments:
+            self.validate_off_personnel(play_data.off_personnel_assignments)
+        if play_data.def_personnel_assignments:
+            self.validate_def_personnel(play_data.def_personnel_assignments)
+
     def validate_off_personnel(
         self, personnel_assignments: Dict[AthletePositionEnum, List[Athlete]]
     ):
@@ -274,7 +326,7 @@ class PlayEngine:
         for _, players in personnel_assignments.items():
             for player in players:
                 total_players += 1
-                if player not in team.roster:
+                if not team.has_athlete(player):
                     msg = (
                         f"Player {player.first_name} {player.last_name} "
                         f"not on team {team.name} roster"
@@ -352,9 +404,7 @@ class PlayEngine:
         # Kickoffs don't have pre-play clock runoff
         play_data.set_preplay_clock_runoff(0)
 
-        KickoffPlayEngine(
-            self.game_state, self.models, self.rng, play_data, self.rules
-        ).run()
+        self.kickoff_engine.run(play_data)
 
         # Set time elapsed for the kickoff play
         self.set_play_time_elapsed(play_data)
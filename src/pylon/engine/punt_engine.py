@@ -2,26 +2,19 @@
 
 import logging
 
-from sim.rng import RNG
 from ..state.game_state import GameState
-from ..models.registry import ModelRegistry
+from .plan import EnginePlan, EngineStreams
 from ..state.play_record import PlayExecutionData, PlayParticipantType
 from ..domain.athlete import Athlete
 from ..domain.playbook import PlayTypeEnum
 from ..models.personnel import (
     PunterSelectionContext,
-    PunterSelectionModel,
     PuntReturnerSelectionContext,
-    PuntReturnerSelectionModel,
-    OffensivePlayerAssignmentModel,
-    DefensivePlayerAssignmentModel,
     PlayerAssignmentContext,
 )
 from ..models.specialteams import (
     PuntDistanceContext,
-    PuntDistanceModel,
     PuntReturnDistanceContext,
-    PuntReturnDistanceModel,
 )
 
 
@@ -29,19 +22,22 @@ logger = logging.getLogger(__name__)
 
 
 class PuntPlayEngine:
+    """
+    Handler for punts; ``PlayEngine`` builds one per game and calls
+    ``run(play_data)`` for every play of this type.
+    """
+
+    play_data: PlayExecutionData
+
     def __init__(
-        self,
-        game_state: GameState,
-        models: ModelRegistry,
-        rng: RNG,
-        play_data: PlayExecutionData,
+        self, game_state: GameState, plan: EnginePlan, streams: EngineStreams
     ) -> None:
         self.game_state = game_state
-        self.models = models
-        self.rng = rng
-        self.play_data = play_data
+        self.plan = plan
+        self.streams = streams
 
-    def run(self) -> None:
+    def run(self, play_data: PlayExecutionData) -> None:
+        self.play_data = play_data
         assert self.play_data.play_type == PlayTypeEnum.PUNT
 
         # Assign personnel for this punt play
@@ -60,28 +56,20 @@ class PuntPlayEngine:
 
     def assign_personnel(self) -> None:
         """Assign offensive (punting team) and defensive (return team) personnel."""
-        off_personnel_model = self.models.get_typed(
-            "offensive_play_personnel_assignment",
-            OffensivePlayerAssignmentModel,  # type: ignore
-        )
-        off_personnel = off_personnel_model.execute(
+        off_personnel = self.plan.offensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.offensive_play_personnel_assignment,
                 self.play_data.off_play_call,
                 play_type=self.play_data.play_type,
             )
         )
         self.play_data.set_off_personnel_assignments(off_personnel)
 
-        def_personnel_model = self.models.get_typed(
-            "defensive_play_personnel_assignment",
-            DefensivePlayerAssignmentModel,  # type: ignore
-        )
-        def_personnel = def_personnel_model.execute(
+        def_personnel = self.plan.defensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.defensive_play_personnel_assignment,
                 self.play_data.def_play_call,
                 play_type=self.play_data.play_type,
             )
@@ -89,53 +77,43 @@ class PuntPlayEngine:
         self.play_data.set_def_personnel_assignments(def_personnel)
 
     def get_punter(self) -> Athlete:
-        punter_select_model = self.models.get_typed(
-            "punter_selection",
-            PunterSelectionModel,  # type: ignore
-        )
-        punter = punter_select_model.execute(
+        punter = self.plan.punter_selection.execute(
             PunterSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.punter_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Punter selected: {punter.first_name} {punter.last_name}")
         return punter
 
     def get_returner(self) -> Athlete:
-        returner_select_model = self.models.get_typed(
-            "punt_returner_selection",
-            PuntReturnerSelectionModel,  # type: ignore
-        )
-        returner = returner_select_model.execute(
+        returner = self.plan.punt_returner_selection.execute(
             PuntReturnerSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.punt_returner_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Returner selected: {returner.first_name} {returner.last_name}")
         return returner
 
     def get_punt_distance(self) -> int:
-        punt_dist_model = self.models.get_typed(
-            "punt_distance",
-            PuntDistanceModel,  # type: ignore
-        )
-        punt_distance = punt_dist_model.execute(
+        punt_distance = self.plan.punt_distance.execute(
             PuntDistanceContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.punt_distance,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Punt Distance: {punt_distance}")
         return punt_distance
 
     def get_return_distance(self, returner: Athlete) -> int:
-        return_distance_model = self.models.get_typed(
-            "punt_return_distance",
-            PuntReturnDistanceModel,  # type: ignore
-        )
-        return_distance = return_distance_model.execute(
+        return_distance = self.plan.punt_return_distance.execute(
             PuntReturnDistanceContext(
                 self.game_state,
-                self.rng,
+                self.streams.punt_return_distance,
                 self.play_data.off_personnel_assignments,
                 returner,
             )
@@ -2,25 +2,19 @@
 
 import logging
 
-from sim.rng import RNG
 from ..state.game_state import GameState
-from ..models.registry import ModelRegistry
+from .plan import EnginePlan, EngineStreams
 from ..state.play_record import PlayExecutionData, PlayParticipantType
 from ..domain.athlete import Athlete
 from ..domain.playbook import PlayTypeEnum
 from ..models.personnel import (
     RusherSelectionContext,
-    RusherSelectionModel,
-    OffensivePlayerAssignmentModel,
-    DefensivePlayerAssignmentModel,
     PlayerAssignmentContext,
 )
-from ..models.offense import RushYardsGainedContext, RushYardsGainedModel
+from ..models.offense import RushYardsGainedContext
 from ..models.possession import (
     FumbleContext,
-    FumbleModel,
     FumbleRecoveryContext,
-    FumbleRecoveryModel,
 )
 
 
@@ -28,19 +22,22 @@ logger = logging.getLogger(__name__)
 
 
 class RunPlayEngine:
+    """
+    Handler for run plays; ``PlayEngine`` builds one per game and calls
+    ``run(play_data)`` for every play of this type.
+    """
+
+    play_data: PlayExecutionData
+
     def __init__(
-        self,
-        game_state: GameState,
-        models: ModelRegistry,
-        rng: RNG,
-        play_data: PlayExecutionData,
+        self, game_state: GameState, plan: EnginePlan, streams: EngineStreams
     ) -> None:
         self.game_state = game_state
-        self.models = models
-        self.rng = rng
-        self.play_data = play_data
+        self.plan = plan
+        self.streams = streams
 
-    def run(self) -> None:
+    def run(self, play_data: PlayExecutionData) -> None:
+        self.play_data = play_data
         assert self.play_data.play_type == PlayTypeEnum.RUN
 
         # Assign personnel for this run play
@@ -67,28 +64,20 @@ class RunPlayEngine:
 
     def assign_personnel(self) -> None:
         """Assign offensive and defensive personnel for the run play."""
-        off_personnel_model = self.models.get_typed(
-            "offensive_play_personnel_assignment",
-            OffensivePlayerAssignmentModel,  # type: ignore
-        )
-        off_personnel = off_personnel_model.execute(
+        off_personnel = self.plan.offensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.offensive_play_personnel_assignment,
                 self.play_data.off_play_call,
                 play_type=self.play_data.play_type,
             )
         )
         self.play_data.set_off_personnel_assignments(off_personnel)
 
-        def_personnel_model = self.models.get_typed(
-            "defensive_play_personnel_assignment",
-            DefensivePlayerAssignmentModel,  # type: ignore
-        )
-        def_personnel = def_personnel_model.execute(
+        def_personnel = self.plan.defensive_play_personnel_assignment.execute(
             PlayerAssignmentContext(
                 self.game_state,
-                self.rng,
+                self.streams.defensive_play_personnel_assignment,
                 self.play_data.def_play_call,
                 play_type=self.play_data.play_type,
             )
@@ -96,26 +85,23 @@ class RunPlayEngine:
         self.play_data.set_def_personnel_assignments(def_personnel)
 
     def get_rusher(self) -> Athlete:
-        rusher_select_model = self.models.get_typed(
-            "rusher_selection",
-            RusherSelectionModel,  # type: ignore
-        )
-        rusher = rusher_select_model.execute(
+        rusher = self.plan.rusher_selection.execute(
             RusherSelectionContext(
-                self.game_state, self.rng, self.play_data.off_personnel_assignments
+                self.game_state,
+                self.streams.rusher_selection,
+                self.play_data.off_personnel_assignments,
             )
         )
         logger.debug(f"Rusher selected: {rusher.first_name} {rusher.last_name}")
         return rusher
 
     def get_yds_gained(self, rusher: Athlete) -> int:
-        rush_yards_model = self.models.get_typed(
-            "rush_yards_gained",
-            RushYardsGainedModel,  # type: ignore
-        )
-        yards_gained = rush_yards_model.execute(
+        yards_gained = self.plan.rush_yards_gained.execute(
             RushYardsGainedContext(
-                self.game_state, self.rng, self.play_data.off_play_call, rusher
+                self.game_state,
+                self.streams.rush_yards_gained,
+                self.play_data.off_play_call,
+                rusher,
             )
         )
         logger.info(
@@ -125,14 +111,10 @@ class RunPlayEngine:
 
     def is_fumble(self, ball_carrier: Athlete) -> bool:
         """Determine if a ball carrier fumbles."""
-        fumble_model = self.models.get_typed(
-            "fumble",
-            FumbleModel,  # type: ignore
-        )
-        is_fumble = fumble_model.execute(
+        is_fumble = self.plan.fumble.execute(
             FumbleContext(
                 self.game_state,
-                self.rng,
+                self.streams.fumble,
                 ball_carrier,
             )
         )
@@ -142,14 +124,10 @@ class RunPlayEngine:
         """Determine which team recovers a fumble."""
         from ..domain.team import Team
 
-        recovery_model = self.models.get_typed(
-            "fumble_recovery",
-            FumbleRecoveryModel,  # type: ignore
-        )
-        recovering_team: Team = recovery_model.execute(
+        recovering_team: Team = self.plan.fumble_recovery.execute(
             FumbleRecoveryContext(
                 self.game_state,
-                self.rng,
+                self.streams.fumble_recovery,
                 fumbler,
                 self.play_data.off_personnel_assignments,
                 self.play_data.def_personnel_assignments,
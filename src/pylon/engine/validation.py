@@ -0,0 +1,71 @@
+"""
+Validation tiers for the per-play engine path.
+
+Each play normally re-checks the play calls, the personnel assignments, the
+finalized ``PlayExecutionData`` and the down and distance before the game
+state is updated. These checks catch broken models early. In large
+production runs, though, they add time to every play. ``ValidationLevel``
+lets a run keep all of them, check every Nth play, or skip them. Checking
+every model's return type as well is opt-in.
+"""
+
+from enum import Enum
+
+
+DEFAULT_VALIDATION_SAMPLE_EVERY = 100
+
+
+class ValidationLevel(Enum):
+    """How much per-play validation the engines run.
+
+    BASIC, the default, runs every per-play check on every play, as the
+    engines always have. STRICT also checks every model's return type.
+    SAMPLED runs the BASIC checks on one play in every ``sample_every``. OFF
+    skips per-play validation entirely.
+    """
+
+    STRICT = "strict"
+    BASIC = "basic"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class PlayValidationSchedule:
+    """
+    Decides, play by play, whether the engines validate.
+
+    Sampling counts plays rather than drawing random numbers, so the RNG
+    streams, and therefore game outcomes, do not depend on the level. The
+    first play of a game is always validated when sampling.
+    """
+
+    def __init__(
+        self,
+        level: ValidationLevel = ValidationLevel.BASIC,
+        sample_every: int = DEFAULT_VALIDATION_SAMPLE_EVERY,
+    ) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be greater than 0")
+        self.level = level
+        self.sample_every = sample_every
+        self._plays_seen = 0
+
+    @property
+    def check_return_types(self) -> bool:
+        """Whether model results are checked against their return types."""
+        return self.level is ValidationLevel.STRICT
+
+    @property
+    def check_personnel(self) -> bool:
+        """Whether validated plays check their assigned personnel."""
+        return self.level is not ValidationLevel.OFF
+
+    def next_play(self) -> bool:
+        """Advance to the next play and return whether it should be validated."""
+        play_index = self._plays_seen
+        self._plays_seen += 1
+        if self.level in (ValidationLevel.STRICT, ValidationLevel.BASIC):
+            return True
+        if self.level is ValidationLevel.OFF:
+            return False
+        return play_index % self.sample_every == 0
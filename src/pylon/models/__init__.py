@@ -12,6 +12,7 @@ if TYPE_CHECKING:
         ModelExecutionError,
         InvalidModelReturnType,
         ModelContext,
+        ReturnTypeCheckedModel,
     )
     from .offense import (
         PlayTypeModel,
@@ -120,6 +121,7 @@ _LAZY_IMPORTS = {
     "ModelContext": "pylon.models.model",
     "ModelExecutionError": "pylon.models.model",
     "InvalidModelReturnType": "pylon.models.model",
+    "ReturnTypeCheckedModel": "pylon.models.model",
     # Offense
     "PlayTypeModel": "pylon.models.offense",
     "DefaultPlayTypeModel": "pylon.models.offense",
@@ -229,6 +231,7 @@ __all__ = [
     "ModelContext",
     "ModelExecutionError",
     "InvalidModelReturnType",
+    "ReturnTypeCheckedModel",
     # Offense
     "PlayTypeModel",
     "DefaultPlayTypeModel",
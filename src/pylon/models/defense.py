@@ -2,6 +2,7 @@ from abc import abstractmethod
 import logging
 from typing import Dict, List
 
+from sim.distribution import Distribution
 from sim.rng import RNG
 from .model import TypedModel, ModelContext, ModelExecutionError
 from ..state.game_state import GameState
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 
 class DefPlayCallContext(ModelContext):
+    __slots__ = ("offensive_play_type",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -31,6 +34,8 @@ class DefPlayCallContext(ModelContext):
 class SackContext(ModelContext):
     """Context for determining if a pass play results in a sack."""
 
+    __slots__ = ("off_personnel_assignments", "def_personnel_assignments")
+
     def __init__(
         self,
         game_state: GameState,
@@ -46,6 +51,8 @@ class SackContext(ModelContext):
 class SackYardsContext(ModelContext):
     """Context for determining yards lost on a sack."""
 
+    __slots__ = ("off_personnel_assignments", "def_personnel_assignments")
+
     def __init__(
         self,
         game_state: GameState,
@@ -61,6 +68,12 @@ class SackYardsContext(ModelContext):
 class InterceptionReturnYardsContext(ModelContext):
     """Context for determining interception return yards (positive value)."""
 
+    __slots__ = (
+        "interceptor",
+        "off_personnel_assignments",
+        "def_personnel_assignments",
+    )
+
     def __init__(
         self,
         game_state: GameState,
@@ -128,9 +141,7 @@ class DefaultDefensivePlayCallModel(DefensivePlayCallModel):
             # For non-special teams plays, the defense can call any defensive play type
             candidate_types = [PlayTypeEnum.DEFENSIVE_PLAY]
 
-        candidates: List[PlayCall] = []
-        for play_type in candidate_types:
-            candidates.extend(playbook.get_by_type(play_type))
+        candidates = playbook.get_by_types(candidate_types)
 
         if not candidates:
             # Fallback to generic defensive plays if specific type not available
@@ -189,10 +200,12 @@ class DefaultSackYardsModel(SackYardsModel):
     Returns positive value representing yards lost (e.g., 7 means 7 yards lost).
     """
 
+    # Realistic distribution: most sacks are 5-8 yards
+    # Weights: 5 yards (25%), 6 yards (35%), 7 yards (25%), 8 yards (15%)
+    YARDS_LOST = Distribution.int_range(5, 8, weights=[0.25, 0.35, 0.25, 0.15])
+
     def execute(self, context: SackYardsContext) -> int:
-        # Realistic distribution: most sacks are 5-8 yards
-        # Weights: 5 yards (25%), 6 yards (35%), 7 yards (25%), 8 yards (15%)
-        yards_lost = context.rng.choice([5, 6, 7, 8], weights=[0.25, 0.35, 0.25, 0.15])
+        yards_lost = context.rng.choice(self.YARDS_LOST)
         logger.debug(f"Sack yards lost: {yards_lost}")
         return yards_lost
 
@@ -200,6 +213,14 @@ class DefaultSackYardsModel(SackYardsModel):
 class InterceptionContext(ModelContext):
     """Context for determining if an incomplete pass is intercepted."""
 
+    __slots__ = (
+        "passer",
+        "targetted",
+        "air_yards",
+        "off_personnel_assignments",
+        "def_personnel_assignments",
+    )
+
     def __init__(
         self,
         game_state: GameState,
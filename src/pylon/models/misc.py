@@ -26,18 +26,20 @@ class CoinTossChoice(Enum):
 
 
 class CoinTossContext(ModelContext):
-    pass
+    __slots__ = ()
 
 
 class PlayTimeElapsedContext(ModelContext):
-    pass
+    __slots__ = ()
 
 
 class PrePlayClockRunoffContext(ModelContext):
-    pass
+    __slots__ = ()
 
 
 class KickReceiveContext(ModelContext):
+    __slots__ = ("coin_tosswinner",)
+
     def __init__(self, game_state: GameState, rng: RNG) -> None:
         super().__init__(game_state, rng)
         self.coin_tosswinner = game_state.coin_toss_winner
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from functools import cache
 import logging
-from typing import Generic, TypeVar, Type, TYPE_CHECKING
+from typing import Any, Generic, TypeVar, Type, TYPE_CHECKING, get_args, get_origin
 
 if TYPE_CHECKING:
     from sim.rng import RNG
@@ -26,9 +27,13 @@ class ModelContext:
     """Base context carrying common simulation inputs.
 
     Most model contexts require a `GameState` and `RNG`. Subclasses can add
-    additional fields while inheriting these common attributes.
+    additional fields while inheriting these common attributes. Contexts are
+    built for every model call, so subclasses list their fields in
+    `__slots__` rather than carrying a per-instance `__dict__`.
     """
 
+    __slots__ = ("game_state", "rng")
+
     def __init__(self, game_state: "GameState", rng: "RNG") -> None:
         self.game_state = game_state
         self.rng = rng
@@ -40,8 +45,17 @@ class TypedModel(ABC, Generic[C, R]):
     Subclasses must implement the `execute` method. The `execute` method
     is called by the `_execute` method, which also checks that the
     return type matches the expected type if provided.
+
+    Subclasses may declare `deterministic = True` when `execute` draws no
+    random numbers and its result depends only on the inputs its caller keys
+    on (e.g. team roster and play call for personnel assignments). The
+    engine may then serve repeated calls from a cache. The engine only
+    honours the flag on the class that declares it, so subclasses of a
+    deterministic model must declare it again.
     """
 
+    deterministic: bool = False
+
     def __init__(
         self,
         name: str | None = None,
@@ -50,6 +64,17 @@ class TypedModel(ABC, Generic[C, R]):
         self.name = name or self.__class__.__name__
         self._return_type = return_type
 
+    @property
+    def return_type(self) -> type | None:
+        """The type `_execute` checks results against.
+
+        Defaults to the return type declared in the model's `TypedModel[C, R]`
+        base (the origin for generics, e.g. `dict` for `Dict[K, V]`).
+        """
+        if self._return_type is not None:
+            return self._return_type
+        return _declared_return_type(type(self))
+
     def _execute(self, context: C) -> R:
         """Executes the model with the given context and checks the return type.
 
@@ -59,12 +84,13 @@ class TypedModel(ABC, Generic[C, R]):
         """
         result = self.execute(context)
 
-        if self._return_type and not isinstance(result, self._return_type):
+        return_type = self.return_type
+        if return_type is not None and not isinstance(result, return_type):
             logger.error(
                 f"Model '{self.name}' returned invalid type: {type(result).__name__}"
             )
             raise InvalidModelReturnType(
-                f"{self.name}.execute() must return {self._return_type.__name__}, "
+                f"{self.name}.execute() must return {return_type.__name__}, "
                 f"got {type(result).__name__}"
             )
 
@@ -72,3 +98,34 @@ class TypedModel(ABC, Generic[C, R]):
 
     @abstractmethod
     def execute(self, context: C) -> R: ...
+
+
+class ReturnTypeCheckedModel(TypedModel[C, R]):
+    """Runs another model through `TypedModel._execute` so every result is
+    checked against its return type.
+
+    The engine plan wraps its models in this under ``ValidationLevel.STRICT``.
+    """
+
+    def __init__(self, model: TypedModel[C, R]) -> None:
+        super().__init__(name=model.name)
+        self.model = model
+        self.deterministic = model.deterministic
+
+    def execute(self, context: C) -> R:
+        return self.model._execute(context)
+
+
+@cache
+def _declared_return_type(model_cls: type) -> type | None:
+    """Resolve `R` from the first `TypedModel[C, R]` base in the MRO."""
+    for klass in model_cls.__mro__:
+        for base in getattr(klass, "__orig_bases__", ()):
+            if get_origin(base) is not TypedModel:
+                continue
+            declared = get_args(base)[1]
+            origin = get_origin(declared) or declared
+            if origin is Any or not isinstance(origin, type):
+                return None
+            return origin
+    return None
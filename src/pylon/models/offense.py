@@ -2,6 +2,7 @@ from abc import abstractmethod
 import logging
 from typing import Dict, List
 
+from sim.distribution import Distribution
 from sim.rng import RNG
 from .model import TypedModel, ModelContext, ModelExecutionError
 from ..state.game_state import GameState
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 
 class AirYardsContext(ModelContext):
+    __slots__ = ("personnel_assignments",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -29,6 +32,8 @@ class AirYardsContext(ModelContext):
 
 
 class CompletionContext(ModelContext):
+    __slots__ = ("personnel_assignments", "passer", "targetted", "air_yards")
+
     def __init__(
         self,
         game_state: GameState,
@@ -46,6 +51,8 @@ class CompletionContext(ModelContext):
 
 
 class YardsAfterCatchContext(ModelContext):
+    __slots__ = ("personnel_assignments",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -57,11 +64,15 @@ class YardsAfterCatchContext(ModelContext):
 
 
 class PlayTypeContext(ModelContext):
+    __slots__ = ()
+
     def __init__(self, game_state: GameState, rng: RNG) -> None:
         super().__init__(game_state, rng)
 
 
 class OffPlayCallContext(ModelContext):
+    __slots__ = ("requested_play_type",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -73,6 +84,8 @@ class OffPlayCallContext(ModelContext):
 
 
 class RushYardsGainedContext(ModelContext):
+    __slots__ = ("play_call", "rusher")
+
     def __init__(
         self,
         game_state: GameState,
@@ -103,14 +116,21 @@ class PlayTypeModel(TypedModel[PlayTypeContext, PlayTypeEnum]):
 class DefaultPlayTypeModel(PlayTypeModel):
     """Baseline play type model with simple down-based tendencies."""
 
+    EARLY_DOWN_PLAY_TYPES = Distribution(
+        [PlayTypeEnum.RUN, PlayTypeEnum.PASS], [0.6, 0.4]
+    )
+    LATE_DOWN_PLAY_TYPES = Distribution(
+        [PlayTypeEnum.RUN, PlayTypeEnum.PASS], [0.3, 0.7]
+    )
+
     def execute(self, context: PlayTypeContext) -> PlayTypeEnum:
         down = context.game_state.possession.down
         if down is None:
             down = 1
         # Heavier run tendency on early downs, heavier pass tendency later.
         if down <= 2:
-            return context.rng.choice([PlayTypeEnum.RUN, PlayTypeEnum.PASS], [0.6, 0.4])
-        return context.rng.choice([PlayTypeEnum.RUN, PlayTypeEnum.PASS], [0.3, 0.7])
+            return context.rng.choice(self.EARLY_DOWN_PLAY_TYPES)
+        return context.rng.choice(self.LATE_DOWN_PLAY_TYPES)
 
 
 class OffensivePlayCallModel(TypedModel[OffPlayCallContext, PlayCall]):
@@ -133,6 +153,9 @@ class OffensivePlayCallModel(TypedModel[OffPlayCallContext, PlayCall]):
 class DefaultOffensivePlayCallModel(OffensivePlayCallModel):
     """Baseline offense play call: choose from requested play type in playbook."""
 
+    # Play types called instead when the playbook lacks the requested type.
+    FALLBACK_PLAY_TYPES = (PlayTypeEnum.RUN, PlayTypeEnum.PASS)
+
     def execute(self, context: OffPlayCallContext) -> PlayCall:
         # TODO: Implement a more sophisticated play-calling logic.
         playbook = context.game_state.pos_team.off_playbook
@@ -148,9 +171,7 @@ class DefaultOffensivePlayCallModel(OffensivePlayCallModel):
         candidates = playbook.get_by_type(context.requested_play_type)
         if not candidates:
             # Fallback for sparse playbooks
-            candidates = playbook.get_by_type(PlayTypeEnum.RUN) + playbook.get_by_type(
-                PlayTypeEnum.PASS
-            )
+            candidates = playbook.get_by_types(self.FALLBACK_PLAY_TYPES)
         return context.rng.choice(candidates)
 
 
@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import Dict, List
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Dict, List, Set, Tuple
 import logging
 
 from sim.rng import RNG
@@ -33,6 +35,8 @@ class PlayerSelectionContext(ModelContext):
     already assigned to the field (e.g. passer, rusher, target).
     """
 
+    __slots__ = ("personnel_assignments",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -44,46 +48,48 @@ class PlayerSelectionContext(ModelContext):
 
 
 class PlaceKickerSelectionContext(ModelContext):
-    pass
+    __slots__ = ()
 
 
 class KickoffReturnerSelectionContext(ModelContext):
-    pass
+    __slots__ = ()
 
 
 class KickerSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class PasserSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class SackerSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class PunterSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class PuntReturnerSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class TargettedSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class InterceptorSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class RusherSelectionContext(PlayerSelectionContext):
-    pass
+    __slots__ = ()
 
 
 class PlayerAssignmentContext(ModelContext):
+    __slots__ = ("play_call", "play_type")
+
     def __init__(
         self,
         game_state: GameState,
@@ -131,6 +137,8 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
     Formation is used ONLY for alignment, never for player selection.
     """
 
+    deterministic = True
+
     BASE_OFFENSE: Dict[AthletePositionEnum, int] = {
         AthletePositionEnum.QB: 1,
         AthletePositionEnum.LT: 1,
@@ -161,7 +169,9 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
             logger.error(msg)
             raise ModelExecutionError(msg)
 
+        depth_chart = team.depth_chart
         selected: List[Athlete] = []
+        taken: Set[Athlete] = set()
 
         # pick players using PositionTree
         def pick(position: AthletePositionEnum, count: int) -> List[Athlete]:
@@ -174,22 +184,17 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
             if node is None:
                 raise ModelExecutionError(f"Unknown offensive position: {position}")
 
-            # Walk upward until enough players are found (e.g. RT->T-->OLINE)
-            while node is not None and len(chosen) < count:
-                valid_positions = node.all_positions()
-
-                candidates = [
-                    p
-                    for p in team.roster
-                    if p.position in valid_positions
-                    and p not in selected
-                    and p not in chosen
-                ]
-
-                needed = count - len(chosen)
-                chosen.extend(candidates[:needed])
-
-                node = node.parent
+            # Walk upward until enough players are found (e.g. RT->T-->OLINE),
+            # taking untaken athletes from each node's depth in roster order.
+            for fallback in node.fallback_chain:
+                if len(chosen) == count:
+                    break
+                for p in depth_chart.under(fallback.position):
+                    if len(chosen) == count:
+                        break
+                    if p not in taken:
+                        chosen.append(p)
+                        taken.add(p)
 
             if len(chosen) < count:
                 raise ModelExecutionError(
@@ -243,15 +248,16 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
 
                 # walk up the tree until we find a match
                 filled = False
-                while node is not None and not filled:
-                    valid_positions = node.all_positions()
+                for fallback in node.fallback_chain:
+                    valid_positions = fallback.leaf_positions
                     for p in unused:
                         if p.position in valid_positions:
                             assignments[pos].append(p)
                             unused.remove(p)
                             filled = True
                             break
-                    node = node.parent
+                    if filled:
+                        break
 
                 if not filled:
                     msg = (
@@ -310,7 +316,9 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
             }
 
         assignments: Dict[AthletePositionEnum, List[Athlete]] = {}
+        depth_chart = team.depth_chart
         selected: List[Athlete] = []
+        taken: Set[Athlete] = set()
 
         def pick(position: AthletePositionEnum, count: int) -> List[Athlete]:
             chosen: List[Athlete] = []
@@ -318,18 +326,15 @@ class DefaultOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
             if node is None:
                 raise ModelExecutionError(f"Unknown offensive position: {position}")
 
-            while node is not None and len(chosen) < count:
-                valid_positions = node.all_positions()
-                candidates = [
-                    p
-                    for p in team.roster
-                    if p.position in valid_positions
-                    and p not in selected
-                    and p not in chosen
-                ]
-                needed = count - len(chosen)
-                chosen.extend(candidates[:needed])
-                node = node.parent
+            for fallback in node.fallback_chain:
+                if len(chosen) == count:
+                    break
+                for p in depth_chart.under(fallback.position):
+                    if len(chosen) == count:
+                        break
+                    if p not in taken:
+                        chosen.append(p)
+                        taken.add(p)
 
             if len(chosen) < count:
                 raise ModelExecutionError(
@@ -368,6 +373,8 @@ class DefensivePlayerAssignmentModel(
 class DefaultDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
     """Baseline defensive assignment model using the PositionTree and play personnel."""
 
+    deterministic = True
+
     def execute(
         self, context: PlayerAssignmentContext
     ) -> Dict[AthletePositionEnum, List[Athlete]]:
@@ -379,28 +386,26 @@ class DefaultDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
         play = context.play_call
 
         assignments: Dict[AthletePositionEnum, List[Athlete]] = {}
+        depth_chart = team.depth_chart
 
         for position, count in play.personnel_package.counts.items():
             selected: List[Athlete] = []
+            taken: Set[Athlete] = set()
 
             node = POSITION_TREE.find_node(position)
             if node is None:
                 raise ModelExecutionError(f"Unknown position in tree: {position}")
 
             # Walk upward until we find enough players
-            while node is not None and len(selected) < count:
-                valid_positions = node.all_positions()
-
-                candidates = [
-                    p
-                    for p in team.roster
-                    if p.position in valid_positions and p not in selected
-                ]
-
-                needed = count - len(selected)
-                selected.extend(candidates[:needed])
-
-                node = node.parent
+            for fallback in node.fallback_chain:
+                if len(selected) == count:
+                    break
+                for p in depth_chart.under(fallback.position):
+                    if len(selected) == count:
+                        break
+                    if p not in taken:
+                        selected.append(p)
+                        taken.add(p)
 
             # If we still don't have enough players, error
             if len(selected) < count:
@@ -428,7 +433,8 @@ class DefaultDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
         }
 
         assignments: Dict[AthletePositionEnum, List[Athlete]] = {}
-        selected_all: List[Athlete] = []
+        depth_chart = team.depth_chart
+        taken: Set[Athlete] = set()
 
         for position, count in fallback_counts.items():
             selected: List[Athlete] = []
@@ -437,18 +443,15 @@ class DefaultDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
             if node is None:
                 raise ModelExecutionError(f"Unknown position in tree: {position}")
 
-            while node is not None and len(selected) < count:
-                valid_positions = node.all_positions()
-                candidates = [
-                    p
-                    for p in team.roster
-                    if p.position in valid_positions
-                    and p not in selected
-                    and p not in selected_all
-                ]
-                needed = count - len(selected)
-                selected.extend(candidates[:needed])
-                node = node.parent
+            for fallback in node.fallback_chain:
+                if len(selected) == count:
+                    break
+                for p in depth_chart.under(fallback.position):
+                    if len(selected) == count:
+                        break
+                    if p not in taken:
+                        selected.append(p)
+                        taken.add(p)
 
             if len(selected) < count:
                 raise ModelExecutionError(
@@ -457,11 +460,142 @@ class DefaultDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
                 )
 
             assignments[position] = selected
-            selected_all.extend(selected)
 
         return assignments
 
 
+# ==============================
+# Personnel Assignment Cache
+# ==============================
+
+AssignmentKey = Tuple[str, Team, int, str | None, PlayTypeEnum | None]
+
+
+class PersonnelAssignmentCache:
+    """
+    LRU cache of personnel assignments from deterministic assignment models.
+
+    Entries are keyed by side, team, ``Team.roster_version``, play call UID
+    and play type, so adding an athlete to a roster invalidates that team's
+    entries. Each hit returns fresh lists, so callers may mutate them. The
+    cache is thread-safe; pickling it (e.g. to ship a factory to worker
+    processes) yields an empty cache of the same size.
+
+    Attributes:
+        maxsize: Maximum number of assignments kept before evicting the least
+            recently used one.
+        hits: Assignments served from the cache.
+        misses: Assignments computed by the wrapped model.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            AssignmentKey, Dict[AthletePositionEnum, Tuple[Athlete, ...]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["maxsize"])  # type: ignore[misc]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_or_assign(
+        self,
+        side: str,
+        team: Team,
+        context: PlayerAssignmentContext,
+        assign: Callable[
+            [PlayerAssignmentContext], Dict[AthletePositionEnum, List[Athlete]]
+        ],
+    ) -> Dict[AthletePositionEnum, List[Athlete]]:
+        """Return the cached assignment for ``context``, computing it on a miss."""
+        play_call = context.play_call
+        key: AssignmentKey = (
+            side,
+            team,
+            team.roster_version,
+            play_call.uid if play_call is not None else None,
+            context.play_type,
+        )
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return {pos: list(athletes) for pos, athletes in cached.items()}
+            self.misses += 1
+
+        assignments = assign(context)
+        with self._lock:
+            self._entries[key] = {
+                pos: tuple(athletes) for pos, athletes in assignments.items()
+            }
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return assignments
+
+
+class CachedOffensivePlayerAssignmentModel(OffensivePlayerAssignmentModel):
+    """Serves a deterministic offensive assignment model through a cache."""
+
+    def __init__(
+        self, model: OffensivePlayerAssignmentModel, cache: PersonnelAssignmentCache
+    ) -> None:
+        super().__init__()
+        self.name = model.name
+        self.model = model
+        self.cache = cache
+
+    def execute(
+        self, context: PlayerAssignmentContext
+    ) -> Dict[AthletePositionEnum, List[Athlete]]:
+        return self.cache.get_or_assign(
+            "offense", context.game_state.pos_team, context, self.model.execute
+        )
+
+
+class CachedDefensivePlayerAssignmentModel(DefensivePlayerAssignmentModel):
+    """Serves a deterministic defensive assignment model through a cache."""
+
+    def __init__(
+        self, model: DefensivePlayerAssignmentModel, cache: PersonnelAssignmentCache
+    ) -> None:
+        super().__init__()
+        self.name = model.name
+        self.model = model
+        self.cache = cache
+
+    def execute(
+        self, context: PlayerAssignmentContext
+    ) -> Dict[AthletePositionEnum, List[Athlete]]:
+        return self.cache.get_or_assign(
+            "defense", context.game_state.def_team, context, self.model.execute
+        )
+
+
 class RusherSelectionModel(TypedModel[RusherSelectionContext, Athlete]):
     """Selects the rusher for a run play."""
 
@@ -657,17 +791,13 @@ class DefaultPlaceKickerSelectionModel(PlaceKickerSelectionModel):
 
     def execute(self, context: PlaceKickerSelectionContext) -> Athlete:
         # For kickoffs, select from the kicking team's roster (def_team)
-        kickers = [
-            k
-            for k in context.game_state.def_team.roster
-            if k.position == AthletePositionEnum.K
-        ]
-        if len(kickers) < 1:
+        kicker = context.game_state.def_team.depth_chart.starter(AthletePositionEnum.K)
+        if kicker is None:
             msg = "No Athletes assigned to Place Kicker."
             logger.error(msg)
             raise InvalidPersonnelError(msg)
 
-        return kickers[0]
+        return kicker
 
 
 class KickoffReturnerSelectionModel(
@@ -694,12 +824,11 @@ class DefaultKickoffReturnerSelectionModel(KickoffReturnerSelectionModel):
             AthletePositionEnum.RB,
         ]
 
+        depth_chart = context.game_state.pos_team.depth_chart
         for position in preferred_positions:
-            returners = [
-                a for a in context.game_state.pos_team.roster if a.position == position
-            ]
-            if returners:
-                return returners[0]
+            returner = depth_chart.starter(position)
+            if returner is not None:
+                return returner
 
         msg = "No Athletes available for Kick Returner (tried KR, WR, RB)."
         logger.error(msg)
@@ -22,6 +22,8 @@ logger = logging.getLogger(__name__)
 class FumbleContext(ModelContext):
     """Context for determining if a ball carrier fumbles."""
 
+    __slots__ = ("ball_carrier",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -35,6 +37,8 @@ class FumbleContext(ModelContext):
 class FumbleRecoveryContext(ModelContext):
     """Context for determining which team recovers a fumble."""
 
+    __slots__ = ("fumbler", "off_personnel_assignments", "def_personnel_assignments")
+
     def __init__(
         self,
         game_state: GameState,
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 
 
 class FieldGoalContext(ModelContext):
+    __slots__ = ("personnel_assignments", "kicker")
+
     def __init__(
         self,
         game_state: GameState,
@@ -30,6 +32,8 @@ class FieldGoalContext(ModelContext):
 
 
 class PuntDistanceContext(ModelContext):
+    __slots__ = ("personnel_assignments",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -41,6 +45,8 @@ class PuntDistanceContext(ModelContext):
 
 
 class PuntReturnDistanceContext(ModelContext):
+    __slots__ = ("personnel_assignments", "returner")
+
     def __init__(
         self,
         game_state: GameState,
@@ -54,6 +60,8 @@ class PuntReturnDistanceContext(ModelContext):
 
 
 class KickoffReturnDistanceContext(ModelContext):
+    __slots__ = ("returner",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -67,6 +75,8 @@ class KickoffReturnDistanceContext(ModelContext):
 class KickoffDistanceContext(ModelContext):
     """Context for determining how far a kickoff travels."""
 
+    __slots__ = ("kicker",)
+
     def __init__(
         self,
         game_state: GameState,
@@ -80,6 +90,8 @@ class KickoffDistanceContext(ModelContext):
 class KickoffTouchbackDecisionContext(ModelContext):
     """Context for deciding whether to take a touchback or return."""
 
+    __slots__ = ("returner", "landing_spot")
+
     def __init__(
         self,
         game_state: GameState,
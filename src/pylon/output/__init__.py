@@ -3,32 +3,64 @@
 from .types import (
     ExperimentOutputPayload,
     GameStateOutputPayload,
+    JsonCompression,
+    JsonFormat,
     OUTPUT_SCHEMA_VERSION,
     OutputMode,
+    RetentionLevel,
     SimulationResultsPayload,
     SimulationOutputPayload,
     TeamOutputPayload,
     validate_output_config,
     wants_db_output,
+    wants_game_details,
     wants_json_output,
 )
+from .columnar import (
+    ColumnarExportError,
+    ColumnarFormat,
+    PlayColumnBuilder,
+    export_play_columns,
+)
 from .json_writer import JsonOutputWriter
-from .db_writer import DBOutputWriter
+from .ndjson_writer import (
+    NdjsonOutputError,
+    NdjsonOutputWriter,
+    iter_ndjson_games,
+    iter_ndjson_records,
+    read_ndjson_results,
+)
+from .db_writer import BackgroundDBWriter, DBOutputWriter, DBWriterError
 from .serializers import serialize_game_state, serialize_team
 
 __all__ = [
     "ExperimentOutputPayload",
     "GameStateOutputPayload",
+    "JsonCompression",
+    "JsonFormat",
     "OUTPUT_SCHEMA_VERSION",
     "OutputMode",
+    "RetentionLevel",
     "SimulationResultsPayload",
     "SimulationOutputPayload",
     "TeamOutputPayload",
     "validate_output_config",
     "wants_db_output",
+    "wants_game_details",
     "wants_json_output",
+    "ColumnarExportError",
+    "ColumnarFormat",
+    "PlayColumnBuilder",
+    "export_play_columns",
     "JsonOutputWriter",
+    "NdjsonOutputError",
+    "NdjsonOutputWriter",
+    "iter_ndjson_games",
+    "iter_ndjson_records",
+    "read_ndjson_results",
+    "BackgroundDBWriter",
     "DBOutputWriter",
+    "DBWriterError",
     "serialize_game_state",
     "serialize_team",
 ]
@@ -0,0 +1,400 @@
+"""Columnar play-by-play export.
+
+Flattens PlayRecord start/end snapshots and PlayExecutionData into typed column
+buffers with one row per play, keyed by rep/game/drive. Tables are written as
+Arrow IPC or Parquet when ``pyarrow`` is installed, and fall back to a NumPy
+``.npz`` archive otherwise. Team, play-call, and athlete uid columns are
+dictionary encoded.
+
+Both ``pyarrow`` and ``numpy`` are optional dependencies. They are imported on
+first export rather than at module load, so importing ``pylon`` does not pull
+in pyarrow (and its thread pools) for runs that never write columns.
+"""
+
+from array import array
+from enum import Enum
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..state.game_state import GameState
+from ..state.play_record import PlayParticipantType, PlayRecord, PlaySnapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+def _import_pyarrow() -> Any:
+    """Return the ``pyarrow`` module, or None when it is not installed."""
+    try:
+        import pyarrow  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - exercised only without pyarrow
+        return None
+    return pyarrow
+
+
+def _import_numpy() -> Any:
+    """Return the ``numpy`` module, or None when it is not installed."""
+    try:
+        import numpy  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - exercised only without numpy
+        return None
+    return numpy
+
+
+class ColumnarExportError(Exception):
+    """Raised when a columnar export cannot be produced."""
+
+    pass
+
+
+class ColumnarFormat(Enum):
+    """Supported columnar file formats."""
+
+    ARROW_IPC = "arrow"
+    PARQUET = "parquet"
+    NPZ = "npz"
+
+
+_SUFFIX_FORMATS = {
+    ".arrow": ColumnarFormat.ARROW_IPC,
+    ".feather": ColumnarFormat.ARROW_IPC,
+    ".ipc": ColumnarFormat.ARROW_IPC,
+    ".parquet": ColumnarFormat.PARQUET,
+    ".npz": ColumnarFormat.NPZ,
+}
+
+
+# Column name -> extractor, grouped by physical type. Extractors read from a
+# (PlayRecord, start snapshot, end snapshot) triple and may return None.
+_Extractor = Callable[[PlayRecord, PlaySnapshot, PlaySnapshot], Any]
+
+_INT_COLUMNS: Dict[str, _Extractor] = {
+    "start_quarter": lambda p, s, e: s.clock_snapshot.quarter,
+    "start_time_remaining": lambda p, s, e: s.clock_snapshot.time_remaining,
+    "start_down": lambda p, s, e: s.possession_snapshot.down,
+    "start_distance": lambda p, s, e: s.possession_snapshot.distance,
+    "start_yardline": lambda p, s, e: s.possession_snapshot.yardline,
+    "start_pos_team_score": lambda p, s, e: s.scoreboard_snapshot.pos_team_score,
+    "start_def_team_score": lambda p, s, e: s.scoreboard_snapshot.def_team_score,
+    "end_quarter": lambda p, s, e: e.clock_snapshot.quarter,
+    "end_time_remaining": lambda p, s, e: e.clock_snapshot.time_remaining,
+    "end_down": lambda p, s, e: e.possession_snapshot.down,
+    "end_distance": lambda p, s, e: e.possession_snapshot.distance,
+    "end_yardline": lambda p, s, e: e.possession_snapshot.yardline,
+    "end_pos_team_score": lambda p, s, e: e.scoreboard_snapshot.pos_team_score,
+    "end_def_team_score": lambda p, s, e: e.scoreboard_snapshot.def_team_score,
+    "time_elapsed": lambda p, s, e: p.execution_data.time_elapsed,
+    "preplay_clock_runoff": lambda p, s, e: p.execution_data.preplay_clock_runoff,
+    "yards_gained": lambda p, s, e: p.execution_data.yards_gained,
+    "air_yards": lambda p, s, e: p.execution_data.air_yards,
+    "yards_after_catch": lambda p, s, e: p.execution_data.yards_after_catch,
+    "penalty_yards": lambda p, s, e: p.execution_data.penalty_yards,
+}
+
+_BOOL_COLUMNS: Dict[str, _Extractor] = {
+    "start_clock_running": lambda p, s, e: s.clock_snapshot.clock_is_running,
+    "is_possession_change": lambda p, s, e: p.execution_data.is_possession_change,
+    "is_turnover": lambda p, s, e: p.execution_data.is_turnover,
+    "is_fg_attempt": lambda p, s, e: p.execution_data.is_fg_attempt,
+    "fg_good": lambda p, s, e: p.execution_data.fg_good,
+    "is_clock_running": lambda p, s, e: p.execution_data.is_clock_running,
+    "is_complete": lambda p, s, e: p.execution_data.is_complete,
+    "is_interception": lambda p, s, e: p.execution_data.is_interception,
+    "is_sack": lambda p, s, e: p.execution_data.is_sack,
+    "is_fumble": lambda p, s, e: p.execution_data.is_fumble,
+    "penalty_occurred": lambda p, s, e: p.execution_data.penalty_occurred,
+}
+
+
+def _uid(obj: Any) -> str | None:
+    return obj.uid if obj is not None else None
+
+
+def _enum_value(obj: Any) -> str | None:
+    return obj.value if obj is not None else None
+
+
+_DICT_COLUMNS: Dict[str, _Extractor] = {
+    "play_type": lambda p, s, e: _enum_value(p.execution_data.play_type),
+    "pos_team_uid": lambda p, s, e: _uid(s.pos_team),
+    "def_team_uid": lambda p, s, e: _uid(s.def_team),
+    "end_pos_team_uid": lambda p, s, e: _uid(e.pos_team),
+    "off_play_call_uid": lambda p, s, e: _uid(p.execution_data.off_play_call),
+    "def_play_call_uid": lambda p, s, e: _uid(p.execution_data.def_play_call),
+    "fumble_recovered_by_team_uid": lambda p, s, e: _uid(
+        p.execution_data.fumble_recovered_by_team
+    ),
+    "penalty_team_uid": lambda p, s, e: _uid(p.execution_data.penalty_team),
+    "penalty_type": lambda p, s, e: p.execution_data.penalty_type,
+    "run_gap": lambda p, s, e: p.execution_data.run_gap,
+}
+
+# One athlete uid column per participant role (first athlete in that role).
+_PARTICIPANT_COLUMNS: Dict[PlayParticipantType, str] = {
+    participant_type: f"{participant_type.value}_uid"
+    for participant_type in PlayParticipantType
+}
+
+
+class _DictionaryColumn:
+    """Dictionary-encoded string column: int32 codes plus a value dictionary."""
+
+    def __init__(self) -> None:
+        self.codes: array[int] = array("i")
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: str | None) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self._index[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class _NullableColumn:
+    """Typed value buffer with a validity mask."""
+
+    def __init__(self, typecode: str) -> None:
+        self.data: array[int] = array(typecode)
+        self.valid: array[int] = array("b")
+
+    def append(self, value: int | bool | None) -> None:
+        if value is None:
+            self.data.append(0)
+            self.valid.append(0)
+        else:
+            self.data.append(int(value))
+            self.valid.append(1)
+
+
+class PlayColumnBuilder:
+    """
+    Accumulates one row per play across games into typed column buffers.
+
+    Usage:
+        builder = PlayColumnBuilder()
+        builder.add_game(game_state, rep_number=1, seed=43)
+        path = builder.write("plays.parquet")
+    """
+
+    KEY_COLUMNS: Tuple[str, ...] = ("rep_number", "seed", "game_id", "drive_number")
+
+    def __init__(self) -> None:
+        self._num_rows: int = 0
+        self._rep_number: array[int] = array("i")
+        self._seed: array[int] = array("q")
+        self._game_id = _DictionaryColumn()
+        self._drive_number: array[int] = array("i")
+        self._play_number: array[int] = array("i")
+        self._ints: Dict[str, _NullableColumn] = {
+            name: _NullableColumn("i") for name in _INT_COLUMNS
+        }
+        self._bools: Dict[str, _NullableColumn] = {
+            name: _NullableColumn("b") for name in _BOOL_COLUMNS
+        }
+        self._dicts: Dict[str, _DictionaryColumn] = {
+            name: _DictionaryColumn()
+            for name in (*_DICT_COLUMNS, *_PARTICIPANT_COLUMNS.values())
+        }
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def column_names(self) -> List[str]:
+        return [
+            "rep_number",
+            "seed",
+            "game_id",
+            "drive_number",
+            "play_number",
+            *self._ints,
+            *self._bools,
+            *self._dicts,
+        ]
+
+    def add_game(self, game_state: GameState, rep_number: int, seed: int) -> None:
+        """Append every play of a finished game."""
+        game_id = game_state.game_data.game_id
+        for drive in game_state.drives:
+            drive_number = int(drive.uid)
+            for play in drive.plays:
+                self._add_play(play, rep_number, seed, game_id, drive_number)
+
+    def _add_play(
+        self,
+        play: PlayRecord,
+        rep_number: int,
+        seed: int,
+        game_id: str,
+        drive_number: int,
+    ) -> None:
+        start = play.start
+        end = play.end
+        self._rep_number.append(rep_number)
+        self._seed.append(seed)
+        self._game_id.append(game_id)
+        self._drive_number.append(drive_number)
+        self._play_number.append(int(play.uid))
+
+        for name, extract in _INT_COLUMNS.items():
+            self._ints[name].append(extract(play, start, end))
+        for name, extract in _BOOL_COLUMNS.items():
+            self._bools[name].append(extract(play, start, end))
+        for name, extract in _DICT_COLUMNS.items():
+            self._dicts[name].append(extract(play, start, end))
+
+        first_by_role: Dict[PlayParticipantType, str] = {}
+        for athlete_uid, participant_type in play.participants.items():
+            first_by_role.setdefault(participant_type, athlete_uid)
+        for participant_type, column in _PARTICIPANT_COLUMNS.items():
+            self._dicts[column].append(first_by_role.get(participant_type))
+
+        self._num_rows += 1
+
+    # ==============================
+    # Materialization
+    # ==============================
+    def to_arrow(self) -> Any:
+        """Build a ``pyarrow.Table`` with dictionary-encoded uid columns."""
+        pa = _import_pyarrow()
+        if pa is None:
+            raise ColumnarExportError("pyarrow is required for Arrow/Parquet export.")
+
+        def nullable(column: _NullableColumn, arrow_type: Any) -> Any:
+            mask = pa.array([not v for v in column.valid], type=pa.bool_())
+            values = (
+                [bool(v) for v in column.data]
+                if arrow_type == pa.bool_()
+                else column.data
+            )
+            return pa.array(values, type=arrow_type, mask=mask)
+
+        def dictionary(column: _DictionaryColumn) -> Any:
+            indices = pa.array(
+                column.codes,
+                type=pa.int32(),
+                mask=pa.array([c < 0 for c in column.codes], type=pa.bool_()),
+            )
+            return pa.DictionaryArray.from_arrays(
+                indices, pa.array(column.values, type=pa.string())
+            )
+
+        arrays: Dict[str, Any] = {
+            "rep_number": pa.array(self._rep_number, type=pa.int32()),
+            "seed": pa.array(self._seed, type=pa.int64()),
+            "game_id": dictionary(self._game_id),
+            "drive_number": pa.array(self._drive_number, type=pa.int32()),
+            "play_number": pa.array(self._play_number, type=pa.int32()),
+        }
+        for name, int_column in self._ints.items():
+            arrays[name] = nullable(int_column, pa.int32())
+        for name, bool_column in self._bools.items():
+            arrays[name] = nullable(bool_column, pa.bool_())
+        for name, dict_column in self._dicts.items():
+            arrays[name] = dictionary(dict_column)
+        return pa.table(arrays)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Build a mapping of NumPy arrays suitable for ``numpy.savez``.
+
+        Nullable columns carry a ``<name>__valid`` boolean mask; dictionary
+        columns are int32 codes (``-1`` for null) with ``<name>__dictionary``.
+        """
+        np = _import_numpy()
+        if np is None:
+            raise ColumnarExportError("numpy is required for .npz export.")
+
+        arrays: Dict[str, Any] = {
+            "rep_number": np.frombuffer(self._rep_number, dtype=np.int32).copy(),
+            "seed": np.frombuffer(self._seed, dtype=np.int64).copy(),
+            "drive_number": np.frombuffer(self._drive_number, dtype=np.int32).copy(),
+            "play_number": np.frombuffer(self._play_number, dtype=np.int32).copy(),
+        }
+        dict_columns = {"game_id": self._game_id, **self._dicts}
+        for name, int_column in self._ints.items():
+            arrays[name] = np.frombuffer(int_column.data, dtype=np.int32).copy()
+            arrays[f"{name}__valid"] = np.frombuffer(
+                int_column.valid, dtype=np.int8
+            ).astype(bool)
+        for name, bool_column in self._bools.items():
+            arrays[name] = np.frombuffer(bool_column.data, dtype=np.int8).astype(bool)
+            arrays[f"{name}__valid"] = np.frombuffer(
+                bool_column.valid, dtype=np.int8
+            ).astype(bool)
+        for name, dict_column in dict_columns.items():
+            arrays[name] = np.frombuffer(dict_column.codes, dtype=np.int32).copy()
+            arrays[f"{name}__dictionary"] = np.array(dict_column.values, dtype=str)
+        return arrays
+
+    def write(self, output_path: Path | str, fmt: ColumnarFormat | None = None) -> Path:
+        """
+        Write the accumulated plays and return the path actually written.
+
+        The format is inferred from the file suffix when ``fmt`` is None. If
+        pyarrow is unavailable, Arrow/Parquet requests fall back to ``.npz``.
+        """
+        path = Path(output_path)
+        resolved = fmt if fmt is not None else _SUFFIX_FORMATS.get(path.suffix.lower())
+        if resolved is None:
+            raise ColumnarExportError(
+                f"Cannot infer columnar format from suffix '{path.suffix}'."
+            )
+        if resolved != ColumnarFormat.NPZ and _import_pyarrow() is None:
+            logger.warning(
+                f"pyarrow is not installed; falling back to .npz export for {path}"
+            )
+            resolved = ColumnarFormat.NPZ
+            path = path.with_suffix(".npz")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resolved == ColumnarFormat.ARROW_IPC:
+            import pyarrow.ipc as pa_ipc  # type: ignore[import-not-found]
+
+            table = self.to_arrow()
+            with pa_ipc.new_file(str(path), table.schema) as writer:
+                writer.write_table(table)
+        elif resolved == ColumnarFormat.PARQUET:
+            import pyarrow.parquet as pa_parquet  # type: ignore[import-not-found]
+
+            pa_parquet.write_table(self.to_arrow(), str(path))
+        else:
+            np = _import_numpy()
+            if np is None:
+                raise ColumnarExportError(
+                    "Columnar export requires pyarrow or numpy to be installed."
+                )
+            np.savez_compressed(path, **self.to_numpy())
+
+        logger.info(f"Wrote {self._num_rows} play rows to {path}")
+        return path
+
+
+def export_play_columns(
+    games: List[Tuple[GameState, int, int]],
+    output_path: Path | str,
+    fmt: ColumnarFormat | None = None,
+) -> Path:
+    """
+    Export play-by-play for several games to one columnar file.
+
+    Args:
+        games: ``(game_state, rep_number, seed)`` triples.
+        output_path: Destination file; the suffix selects the format.
+        fmt: Explicit format overriding suffix inference.
+
+    Returns:
+        The path actually written (``.npz`` when falling back from pyarrow).
+    """
+    builder = PlayColumnBuilder()
+    for game_state, rep_number, seed in games:
+        builder.add_game(game_state, rep_number=rep_number, seed=seed)
+    return builder.write(output_path, fmt=fmt)
@@ -1,16 +1,51 @@
-"""Database output writer for simulation results."""
+"""Database output writers for simulation results."""
 
-from typing import Any, Dict, Mapping
+from dataclasses import dataclass
+import logging
+import queue
+import threading
+from typing import Any, Dict, List, Mapping, Sequence
+
+from sqlalchemy import Integer, cast, func
 
 from ..db.database import DatabaseManager
 from ..db.repositories import (
+    GAME_ID_SEQUENCE,
     DimensionRepository,
     ExperimentRepository,
     FactRepository,
     GameRepository,
+    IdSequenceRepository,
+    RollupRepository,
 )
+from ..db.schema import Game as OrmGame
 from ..state.game_state import GameState
-from .types import SimulationOutputPayload, TeamOutputPayload
+from .types import (
+    ExperimentOutputPayload,
+    SimulationOutputPayload,
+    TeamOutputPayload,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class DBWriterError(Exception):
+    """Raised when the background database writer fails."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class PendingGameWrite:
+    """One finished game waiting to be persisted."""
+
+    game_id: str
+    game_result: Dict[str, Any]
+    game_state: GameState
+    experiment_id: str
+    home_team_id: str
+    away_team_id: str
 
 
 class DBOutputWriter:
@@ -27,10 +62,9 @@ class DBOutputWriter:
         dim_repo.persist_game_dimensions(home_team, away_team)
 
     def _persist_experiment_metadata(
-        self, output_payload: SimulationOutputPayload
+        self, experiment: ExperimentOutputPayload | Mapping[str, Any]
     ) -> None:
-        """Persist experiment metadata from canonical output payload."""
-        experiment: Mapping[str, Any] = output_payload["experiment"]
+        """Persist experiment metadata from canonical experiment payload."""
         exp_repo = ExperimentRepository(self.db_manager)
         exp_repo.create(
             name=experiment["name"],
@@ -40,39 +74,90 @@ class DBOutputWriter:
             experiment_id=experiment["id"],
         )
 
-    def _persist_game_result(
-        self,
-        game_result: Dict[str, Any],
-        game_id: str,
-        output_payload: SimulationOutputPayload,
-    ) -> None:
-        """Persist individual game result metadata using canonical payload context."""
-        home_team_id = output_payload["teams"]["home"]["uid"]
-        away_team_id = output_payload["teams"]["away"]["uid"]
-        experiment_id = output_payload["experiment"]["id"]
-
-        game_repo = GameRepository(self.db_manager)
-        game_repo.create(
+    def _build_game_row(self, pending: PendingGameWrite) -> Any:
+        """Build an unsaved ORM game row for a pending game."""
+        game_result = pending.game_result
+        return GameRepository(self.db_manager).build(
             seed=game_result["seed"],
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
+            home_team_id=pending.home_team_id,
+            away_team_id=pending.away_team_id,
             home_score=game_result["home_score"],
             away_score=game_result["away_score"],
             winner_id=game_result["winner_id"],
             total_plays=game_result["total_plays"],
             total_drives=game_result["total_drives"],
             final_quarter=game_result["final_quarter"],
-            experiment_id=experiment_id,
+            experiment_id=pending.experiment_id,
             rep_number=game_result["rep_number"],
             duration_seconds=game_result["duration_seconds"],
             status=game_result["status"],
-            game_id=game_id,
+            game_id=pending.game_id,
         )
 
-    def _persist_game_facts(self, game_id: str, game_state: GameState) -> None:
-        """Persist drives, plays, and participant facts to database."""
-        fact_repo = FactRepository(self.db_manager)
-        fact_repo.persist_game_facts(game_id, game_state)
+    def write_run_metadata(
+        self,
+        experiment: ExperimentOutputPayload,
+        teams: Mapping[str, TeamOutputPayload],
+    ) -> None:
+        """Persist dimensions and experiment metadata ahead of any game facts."""
+        self._persist_dimension_data(teams["home"], teams["away"])
+        self._persist_experiment_metadata(experiment)
+
+    def write_game(
+        self,
+        game_id: str,
+        game_result: Dict[str, Any],
+        game_state: GameState,
+        experiment_id: str,
+        home_team_id: str,
+        away_team_id: str,
+    ) -> None:
+        """
+        Persist one game's result row and facts.
+
+        Called as each replication completes so the caller can release the
+        game state immediately afterwards. ``write_run_metadata`` must have been
+        called first.
+        """
+        self.write_games(
+            [
+                PendingGameWrite(
+                    game_id=game_id,
+                    game_result=game_result,
+                    game_state=game_state,
+                    experiment_id=experiment_id,
+                    home_team_id=home_team_id,
+                    away_team_id=away_team_id,
+                )
+            ]
+        )
+
+    def write_games(self, games: Sequence[PendingGameWrite]) -> None:
+        """
+        Persist a batch of games' result rows and facts.
+
+        Game rows, their team score rollup and all of the batch's facts are
+        written in one transaction. A failure leaves none of them committed,
+        so the rollups never drift from the game table.
+        """
+        if not games:
+            return
+        orm_games = [self._build_game_row(pending) for pending in games]
+        session = self.db_manager.get_session()
+        try:
+            with session.begin():
+                GameRepository(self.db_manager).add_batch(session, orm_games)
+                RollupRepository(self.db_manager).add_team_scores(session, orm_games)
+                FactRepository(self.db_manager).add_facts_bulk(
+                    session,
+                    [(pending.game_id, pending.game_state) for pending in games],
+                )
+        except Exception as e:
+            logger.error(f"Failed to persist batch of {len(games)} game(s): {e}")
+            raise
+        finally:
+            session.close()
+        logger.info(f"Persisted {len(games)} game(s).")
 
     def write_results(
         self,
@@ -80,25 +165,181 @@ class DBOutputWriter:
         pending_games: list[tuple[str, Dict[str, Any], GameState]],
     ) -> None:
         """Persist all DB output from one post-run payload handoff."""
-        home_team = output_payload["teams"]["home"]
-        away_team = output_payload["teams"]["away"]
-        self._persist_dimension_data(home_team, away_team)
-        self._persist_experiment_metadata(output_payload)
+        teams = output_payload["teams"]
+        experiment = output_payload["experiment"]
+        self.write_run_metadata(experiment, teams)
 
         for game_id, game_result, game_state in pending_games:
-            self._persist_game_result(game_result, game_id, output_payload)
-            self._persist_game_facts(game_id, game_state)
+            self.write_game(
+                game_id=game_id,
+                game_result=game_result,
+                game_state=game_state,
+                experiment_id=experiment["id"],
+                home_team_id=teams["home"]["uid"],
+                away_team_id=teams["away"]["uid"],
+            )
+
+    def update_experiment_num_reps(self, experiment_id: str, num_reps: int) -> None:
+        """Record how many replications an experiment actually ran."""
+        ExperimentRepository(self.db_manager).update_num_reps(experiment_id, num_reps)
+
+    def reserve_game_ids(self, count: int) -> int:
+        """
+        Atomically reserve ``count`` consecutive numeric game ids.
+
+        Returns:
+            First game id of the reserved block.
+        """
+        return GameRepository(self.db_manager).reserve_ids(count)
 
     def get_next_game_id(self) -> str:
-        """Get the next sequential game ID by querying persisted games."""
-        from ..db.schema import Game as OrmGame
+        """Peek at the next game ID without reserving it."""
+        next_value = IdSequenceRepository(self.db_manager).peek(GAME_ID_SEQUENCE)
+        if next_value is not None:
+            return str(next_value)
 
         session = self.db_manager.get_session()
         try:
-            games = session.query(OrmGame.id).all()
-            if not games:
-                return "1"
-            max_id = max(int(game.id) for game in games)
-            return str(max_id + 1)
+            max_id = session.query(func.max(cast(OrmGame.id, Integer))).scalar()
+            return str((max_id or 0) + 1)
         finally:
             session.close()
+
+
+class BackgroundDBWriter:
+    """
+    Persists finished games on a dedicated writer thread.
+
+    Games are handed over through a bounded queue and committed in batches
+    via ``DBOutputWriter.write_games``, so database I/O overlaps with
+    simulation. When the queue is full, ``write_game`` blocks until the writer
+    catches up, which caps the number of GameStates held in memory at roughly
+    ``max_queue_size + batch_size``.
+
+    The first write failure is re-raised (as DBWriterError) on the next
+    ``write_game`` call or on ``close``; later games are discarded. After the
+    run itself has failed, ``close(flush=False)`` discards queued games and
+    swallows write failures so the original error propagates.
+
+    Usage:
+        with BackgroundDBWriter(DBOutputWriter(db)) as writer:
+            for game in games:
+                writer.write_game(...)
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        db_writer: DBOutputWriter,
+        max_queue_size: int = 64,
+        batch_size: int = 16,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        self._db_writer = db_writer
+        self._batch_size = batch_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._discard = False
+        self._games_written: int = 0
+
+    def __enter__(self) -> "BackgroundDBWriter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close(flush=exc_type is None)
+
+    @property
+    def games_written(self) -> int:
+        return self._games_written
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="pylon-db-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write_game(
+        self,
+        game_id: str,
+        game_result: Dict[str, Any],
+        game_state: GameState,
+        experiment_id: str,
+        home_team_id: str,
+        away_team_id: str,
+    ) -> None:
+        """Queue one game for persistence, blocking while the queue is full."""
+        if self._thread is None:
+            raise DBWriterError("BackgroundDBWriter is not running.")
+        self._raise_if_failed()
+        self._queue.put(
+            PendingGameWrite(
+                game_id=game_id,
+                game_result=game_result,
+                game_state=game_state,
+                experiment_id=experiment_id,
+                home_team_id=home_team_id,
+                away_team_id=away_team_id,
+            )
+        )
+
+    def close(self, flush: bool = True) -> None:
+        """
+        Stop the writer thread.
+
+        With ``flush`` (the default), queued games are written first and any
+        write failure is re-raised. Without it, queued games are discarded and
+        write failures are only logged.
+        """
+        if not flush:
+            self._discard = True
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self._raise_if_failed()
+        elif self._error is not None:
+            logger.warning(f"Ignoring background database write failure: {self._error}")
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise DBWriterError(
+                f"Background database write failed: {self._error}"
+            ) from self._error
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[PendingGameWrite] = []
+            item = self._queue.get()
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            # After a failure keep draining so producers never block forever.
+            if not batch or self._error is not None or self._discard:
+                continue
+            try:
+                self._db_writer.write_games(batch)
+                self._games_written += len(batch)
+                logger.debug(f"Persisted batch of {len(batch)} game(s).")
+            except BaseException as e:
+                logger.error(f"Background database write failed: {e}")
+                self._error = e
@@ -0,0 +1,269 @@
+"""Streaming JSON Lines (NDJSON) writer and reader for simulation results.
+
+The stream is a sequence of compact, newline-delimited JSON records:
+
+- one ``header`` record with schema version, experiment and team metadata,
+- one ``game`` record per replication, written as each replication completes,
+- one ``trailer`` record with aggregate statistics, elapsed time and the
+  number of replications actually run.
+
+The header is written before the run starts, so its ``num_reps`` is the
+replication budget; a stopping rule may end the run earlier.
+
+Files may optionally be gzip or zstd compressed. Compression is inferred from
+the file suffix (``.gz`` / ``.zst``) unless given explicitly. zstd requires the
+standard-library ``compression.zstd`` module (Python 3.14+) or the optional
+``zstandard`` package.
+"""
+
+import gzip
+import io
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Mapping
+
+from .types import (
+    ExperimentOutputPayload,
+    GameStateOutputPayload,
+    JsonCompression,
+    SimulationOutputPayload,
+    TeamOutputPayload,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+HEADER_RECORD = "header"
+GAME_RECORD = "game"
+TRAILER_RECORD = "trailer"
+
+
+class NdjsonOutputError(Exception):
+    """Raised for malformed NDJSON streams or unsupported compression."""
+
+    pass
+
+
+def infer_compression(path: Path | str) -> JsonCompression:
+    """Infer stream compression from the file suffix."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return JsonCompression.GZIP
+    if suffix in (".zst", ".zstd"):
+        return JsonCompression.ZSTD
+    return JsonCompression.NONE
+
+
+def _open_text(path: Path, mode: str, compression: JsonCompression) -> IO[str]:
+    """Open a (possibly compressed) text stream for NDJSON I/O."""
+    if compression == JsonCompression.NONE:
+        return open(path, mode, encoding="utf-8", newline="\n")
+    if compression == JsonCompression.GZIP:
+        return io.TextIOWrapper(
+            gzip.GzipFile(path, mode + "b"), encoding="utf-8", newline="\n"
+        )
+
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.open(path, mode + "t", encoding="utf-8", newline="\n")  # type: ignore[no-any-return]
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise NdjsonOutputError(
+            "zstd compression requires Python 3.14+ or the 'zstandard' package."
+        ) from exc
+    return zstandard.open(path, mode + "t", encoding="utf-8", newline="\n")  # type: ignore[no-any-return]
+
+
+class NdjsonOutputWriter:
+    """
+    Streams simulation results to a JSON Lines file, one record per game.
+
+    Usage:
+        with NdjsonOutputWriter("results.ndjson.gz") as writer:
+            writer.write_header(schema_version, experiment, teams)
+            for game_result, details in games:
+                writer.write_game(game_result, details)
+            writer.write_trailer(aggregate, elapsed_time, num_reps)
+    """
+
+    def __init__(
+        self,
+        output_path: Path | str,
+        compression: JsonCompression | None = None,
+    ) -> None:
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.compression = (
+            compression
+            if compression is not None
+            else infer_compression(self.output_path)
+        )
+        self._handle: IO[str] | None = None
+        self._games_written: int = 0
+
+    def __enter__(self) -> "NdjsonOutputWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+    @property
+    def games_written(self) -> int:
+        return self._games_written
+
+    def open(self) -> None:
+        """Open the output stream, truncating any existing file."""
+        if self._handle is None:
+            self._handle = _open_text(self.output_path, "w", self.compression)
+            self._games_written = 0
+
+    def close(self) -> None:
+        """Flush and close the output stream."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _write_record(self, record: Mapping[str, Any]) -> None:
+        if self._handle is None:
+            raise NdjsonOutputError("NdjsonOutputWriter is not open.")
+        self._handle.write(json.dumps(record, separators=(",", ":")))
+        self._handle.write("\n")
+
+    def write_header(
+        self,
+        schema_version: str,
+        experiment: ExperimentOutputPayload,
+        teams: Mapping[str, TeamOutputPayload],
+    ) -> None:
+        """Write the leading metadata record."""
+        self._write_record(
+            {
+                "record_type": HEADER_RECORD,
+                "schema_version": schema_version,
+                "experiment": experiment,
+                "teams": teams,
+            }
+        )
+
+    def write_game(
+        self,
+        game_result: Mapping[str, Any],
+        game_details: GameStateOutputPayload | None = None,
+    ) -> None:
+        """Write one game record with its summary row and optional details."""
+        self._write_record(
+            {
+                "record_type": GAME_RECORD,
+                "game": game_result,
+                "details": game_details,
+            }
+        )
+        self._games_written += 1
+
+    def write_trailer(
+        self, aggregate: Mapping[str, Any], elapsed_time: float, num_reps: int
+    ) -> None:
+        """Write the closing aggregate record with the replications run."""
+        self._write_record(
+            {
+                "record_type": TRAILER_RECORD,
+                "num_games": self._games_written,
+                "num_reps": num_reps,
+                "elapsed_time": elapsed_time,
+                "aggregate": aggregate,
+            }
+        )
+
+
+def iter_ndjson_records(
+    input_path: Path | str,
+    compression: JsonCompression | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield every record in an NDJSON results stream.
+
+    Args:
+        input_path: Path to the NDJSON file.
+        compression: Stream compression; inferred from the suffix when None.
+
+    Yields:
+        Decoded record dictionaries in file order.
+    """
+    path = Path(input_path)
+    resolved = compression if compression is not None else infer_compression(path)
+    with _open_text(path, "r", resolved) as file_handle:
+        for line_number, line in enumerate(file_handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise NdjsonOutputError(
+                    f"Invalid JSON on line {line_number} of {path}"
+                ) from exc
+            yield record
+
+
+def iter_ndjson_games(
+    input_path: Path | str,
+    compression: JsonCompression | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield only the game records from an NDJSON results stream."""
+    for record in iter_ndjson_records(input_path, compression):
+        if record.get("record_type") == GAME_RECORD:
+            yield record
+
+
+def read_ndjson_results(
+    input_path: Path | str,
+    compression: JsonCompression | None = None,
+) -> SimulationOutputPayload:
+    """
+    Reassemble a full SimulationOutputPayload from an NDJSON results stream.
+
+    Loads every game into memory; prefer ``iter_ndjson_games`` for large runs.
+    """
+    header: Dict[str, Any] | None = None
+    trailer: Dict[str, Any] | None = None
+    games: List[Dict[str, Any]] = []
+    game_details: List[GameStateOutputPayload] = []
+
+    for record in iter_ndjson_records(input_path, compression):
+        record_type = record.get("record_type")
+        if record_type == HEADER_RECORD:
+            header = record
+        elif record_type == GAME_RECORD:
+            games.append(record["game"])
+            if record.get("details") is not None:
+                game_details.append(record["details"])
+        elif record_type == TRAILER_RECORD:
+            trailer = record
+        else:
+            logger.warning(f"Skipping unknown NDJSON record type: {record_type}")
+
+    if header is None or trailer is None:
+        raise NdjsonOutputError(
+            f"NDJSON stream {input_path} is missing its header or trailer record."
+        )
+
+    experiment: ExperimentOutputPayload = header["experiment"]
+    experiment["elapsed_time"] = trailer["elapsed_time"]
+    # Streams written before the trailer carried num_reps only have the budget.
+    experiment["num_reps"] = trailer.get("num_reps", experiment["num_reps"])
+    return {
+        "schema_version": header["schema_version"],
+        "experiment": experiment,
+        "teams": header["teams"],
+        "results": {
+            "games": games,
+            "aggregate": trailer["aggregate"],
+            "game_details": game_details,
+        },
+    }
@@ -26,6 +26,7 @@ from .types import (
     PlaybookOutputPayload,
     PlayCallOutputPayload,
     PlayRecordOutputPayload,
+    RetentionLevel,
     SnapshotOutputPayload,
     TeamOutputPayload,
 )
@@ -264,8 +265,10 @@ def serialize_play_record(play_record: PlayRecord) -> PlayRecordOutputPayload:
     }
 
 
-def serialize_drive_record(drive_record: DriveRecord) -> DriveRecordOutputPayload:
-    """Serialize one finalized drive record including nested play records."""
+def serialize_drive_record(
+    drive_record: DriveRecord, include_plays: bool = True
+) -> DriveRecordOutputPayload:
+    """Serialize one finalized drive record, optionally with nested play records."""
     return {
         "drive_id": drive_record.uid,
         "start": _serialize_snapshot(drive_record.start),
@@ -287,7 +290,11 @@ def serialize_drive_record(drive_record: DriveRecord) -> DriveRecordOutputPayloa
                 else None
             ),
         },
-        "plays": [serialize_play_record(play) for play in drive_record.plays],
+        "plays": (
+            [serialize_play_record(play) for play in drive_record.plays]
+            if include_plays
+            else []
+        ),
     }
 
 
@@ -295,8 +302,14 @@ def serialize_game_state(
     game_state: GameState,
     rep_number: int,
     seed: int,
+    retention: RetentionLevel = RetentionLevel.FULL,
 ) -> GameStateOutputPayload:
-    """Serialize full game execution details from GameState/GameExecutionData."""
+    """
+    Serialize game execution details from GameState/GameExecutionData.
+
+    ``retention`` controls depth: SUMMARY omits drives, DRIVE omits nested
+    plays, and FULL includes the complete play-by-play.
+    """
     return {
         "game_id": game_state.game_data.game_id,
         "rep_number": rep_number,
@@ -314,5 +327,14 @@ def serialize_game_state(
                 else None
             ),
         },
-        "drives": [serialize_drive_record(drive) for drive in game_state.drives],
+        "drives": (
+            [
+                serialize_drive_record(
+                    drive, include_plays=retention == RetentionLevel.FULL
+                )
+                for drive in game_state.drives
+            ]
+            if retention != RetentionLevel.SUMMARY
+            else []
+        ),
     }
@@ -23,6 +23,37 @@ class OutputMode(Enum):
     NONE = "none"
 
 
+class JsonFormat(Enum):
+    """Layout of JSON output files.
+
+    DOCUMENT writes one indented JSON document after all reps finish; NDJSON
+    streams a header, one compact record per game, and an aggregate trailer.
+    """
+
+    DOCUMENT = "document"
+    NDJSON = "ndjson"
+
+
+class JsonCompression(Enum):
+    """Compression applied to streamed NDJSON output."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+class RetentionLevel(Enum):
+    """How much per-game execution detail is retained in the output payload.
+
+    SUMMARY keeps only per-game result rows, DRIVE adds drive records without
+    nested plays, and FULL keeps the complete play-by-play.
+    """
+
+    SUMMARY = "summary"
+    DRIVE = "drive"
+    FULL = "full"
+
+
 class AthleteOutputPayload(TypedDict):
     """Canonical serialized athlete payload."""
 
@@ -250,6 +281,11 @@ def wants_db_output(output_mode: OutputMode) -> bool:
     return output_mode in (OutputMode.DB, OutputMode.BOTH)
 
 
+def wants_game_details(output_mode: OutputMode, retention: RetentionLevel) -> bool:
+    """Return True when serialized game details have a JSON consumer."""
+    return wants_json_output(output_mode) and retention != RetentionLevel.SUMMARY
+
+
 def validate_output_config(
     output_mode: OutputMode,
     has_db_manager: bool,
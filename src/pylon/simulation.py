@@ -6,11 +6,14 @@ higher-level batch orchestration can later move to ``sim.SimulationRunner``.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 import time
 from dataclasses import dataclass
 from enum import Enum
 import logging
-from typing import Any, List
+from pathlib import Path
+import threading
+from typing import Any, Iterator, List
 
 from sim.base import Simulation
 from sim.rng import RNG
@@ -19,12 +22,22 @@ from .domain.rules.base import LeagueRules
 from .domain.rules.nfl import NFLRules
 from .domain.team import Team
 from .engine.game_engine import GameEngine
+from .engine.validation import DEFAULT_VALIDATION_SAMPLE_EVERY, ValidationLevel
+from .models.personnel import PersonnelAssignmentCache
 from .models.registry import TypedModel
 from .state.game_state import GameState
 
 
 logger = logging.getLogger(__name__)
 
+REPLICATION_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Root logger level is lowered while any replication log is open and restored
+# when the last one closes; reps may run concurrently on a thread pool.
+_replication_log_lock = threading.Lock()
+_open_replication_logs = 0
+_root_level_before_replication_logs = logging.NOTSET
+
 
 @dataclass(frozen=True)
 class PylonSimulationResult:
@@ -41,6 +54,52 @@ class PylonSimulationResult:
     total_plays: int
     total_drives: int
     game_state: GameState
+    rep_number: int | None = None
+
+
+class _CurrentThreadFilter(logging.Filter):
+    """Pass only records emitted by the thread that created the filter."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._thread_id = threading.get_ident()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.thread == self._thread_id
+
+
+@contextmanager
+def _replication_log(log_path: Path, log_level: int) -> Iterator[None]:
+    """
+    Write this thread's log records to ``log_path`` while the block runs.
+
+    The handler is installed wherever the replication executes (the calling
+    thread, a pool thread or a worker process) and filtered to that thread, so
+    concurrent replications never write into each other's files.
+    """
+    global _open_replication_logs, _root_level_before_replication_logs
+
+    handler = logging.FileHandler(log_path, mode="w")
+    handler.setLevel(log_level)
+    handler.setFormatter(logging.Formatter(REPLICATION_LOG_FORMAT))
+    handler.addFilter(_CurrentThreadFilter())
+
+    root_logger = logging.getLogger()
+    with _replication_log_lock:
+        if _open_replication_logs == 0:
+            _root_level_before_replication_logs = root_logger.level
+        _open_replication_logs += 1
+        root_logger.setLevel(min(root_logger.level, log_level))
+        root_logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        with _replication_log_lock:
+            root_logger.removeHandler(handler)
+            _open_replication_logs -= 1
+            if _open_replication_logs == 0:
+                root_logger.setLevel(_root_level_before_replication_logs)
+        handler.close()
 
 
 class SimulationStatus(Enum):
@@ -62,6 +121,12 @@ class PylonSimulation(Simulation[PylonSimulationResult]):
         user_models: List[TypedModel[Any, Any]] | None = None,
         rules: LeagueRules = NFLRules(),  # type: ignore
         max_drives: int | None = None,
+        rep_number: int | None = None,
+        assignment_cache: PersonnelAssignmentCache | None = None,
+        validation: ValidationLevel = ValidationLevel.BASIC,
+        validation_sample_every: int = DEFAULT_VALIDATION_SAMPLE_EVERY,
+        log_path: Path | None = None,
+        log_level: int = logging.INFO,
     ) -> None:
         self.home_team = home_team
         self.away_team = away_team
@@ -70,9 +135,22 @@ class PylonSimulation(Simulation[PylonSimulationResult]):
         self.user_models = user_models
         self.rules = rules
         self.max_drives = max_drives
+        self.rep_number = rep_number
+        self.assignment_cache = assignment_cache
+        self.validation = validation
+        self.validation_sample_every = validation_sample_every
+        self.log_path = log_path
+        self.log_level = log_level
 
     def run(self) -> PylonSimulationResult:
         """Execute one game and return canonical pylon simulation result."""
+        if self.log_path is None:
+            return self._run_game()
+        with _replication_log(self.log_path, self.log_level):
+            return self._run_game()
+
+    def _run_game(self) -> PylonSimulationResult:
+        """Run the game engine and build the result (see ``run``)."""
         logger.debug(
             "Starting pylon simulation game_id=%s seed=%s home=%s away=%s",
             self.game_id,
@@ -123,6 +201,9 @@ class PylonSimulation(Simulation[PylonSimulationResult]):
             rng=self.rng,
             rules=self.rules,
             max_drives=self.max_drives,
+            assignment_cache=self.assignment_cache,
+            validation=self.validation,
+            validation_sample_every=self.validation_sample_every,
         )
 
     def _resolve_winner_id(self, home_score: int, away_score: int) -> str | None:
@@ -161,4 +242,5 @@ class PylonSimulation(Simulation[PylonSimulationResult]):
             total_plays=game_state.total_plays(),
             total_drives=game_state.total_drives(),
             game_state=game_state,
+            rep_number=self.rep_number,
         )
@@ -13,28 +13,38 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from sim.base import Simulation
+from sim.executor import ReplicationExecutor
 from sim.factory import SimulationFactory
-from sim.observer import SimulationObserver
+from sim.output import ReplicationSink
 from sim.runner import SimulationRunner
 from sim.runner import SimulationRunnerConfig
 from sim.rng import RNG
+from .aggregation import GameResultAggregator
 from .domain.team import Team
 from .domain.rules.base import LeagueRules
 from .domain.rules.nfl import NFLRules
+from .engine.validation import DEFAULT_VALIDATION_SAMPLE_EVERY, ValidationLevel
+from .models.personnel import PersonnelAssignmentCache
 from .models.registry import TypedModel
 from .db.database import DatabaseManager
-from .state.game_state import GameState
 from .simulation import PylonSimulation, PylonSimulationResult
 from .output import (
+    BackgroundDBWriter,
     DBOutputWriter,
     ExperimentOutputPayload,
+    JsonCompression,
+    JsonFormat,
     JsonOutputWriter,
+    NdjsonOutputWriter,
+    PlayColumnBuilder,
     OutputMode,
+    RetentionLevel,
     SimulationOutputPayload,
     TeamOutputPayload,
     serialize_team,
     validate_output_config,
     wants_db_output,
+    wants_game_details,
     wants_json_output,
 )
 from .output.serializers import serialize_game_state
@@ -44,6 +54,13 @@ from .output.types import GameStateOutputPayload, SimulationResultsPayload
 logger = logging.getLogger(__name__)
 
 
+COIN_TOSS_STRATA: Dict[str, int] = {"coin_toss_winner": 2, "kick_receive_choice": 2}
+"""
+Strata for a ``sim.design.StratifiedDesign`` over the opening coin toss: which
+team wins it and whether the winner kicks or receives.
+"""
+
+
 @dataclass(frozen=True, kw_only=True)
 class PylonSimulationRunnerConfig(SimulationRunnerConfig):
     """Pylon-specific runner configuration built on generic simulation config."""
@@ -56,67 +73,180 @@ class PylonSimulationRunnerConfig(SimulationRunnerConfig):
     db_manager: DatabaseManager | None = None
     output_mode: OutputMode = OutputMode.JSON
     json_output_path: Path | str | None = None
+    json_format: JsonFormat = JsonFormat.DOCUMENT
+    json_compression: JsonCompression | None = None
+    columnar_output_path: Path | str | None = None
     experiment_name: str | None = None
     experiment_description: str | None = None
     log_dir: Path | str | None = None
     log_level: int = logging.INFO
+    executor: ReplicationExecutor | None = None
+    retention: RetentionLevel = RetentionLevel.FULL
+    db_write_queue_size: int = 64
+    db_write_batch_size: int = 16
+    db_bulk_load: bool = False
+    # LRU size of the personnel assignment cache shared by the run's games;
+    # None disables caching.
+    personnel_cache_size: int | None = 1024
+    # Per-play validation tier (see pylon.engine.validation); SAMPLED checks
+    # one play in every `validation_sample_every`, STRICT adds model
+    # return-type checks. The default BASIC runs every play-call, personnel
+    # and play-data check on every play.
+    validation: ValidationLevel = ValidationLevel.BASIC
+    validation_sample_every: int = DEFAULT_VALIDATION_SAMPLE_EVERY
+
+
+@dataclass(frozen=True)
+class PylonSimulationFactory(SimulationFactory[PylonSimulationResult]):
+    """
+    Picklable per-replication simulation factory.
+
+    Holds only immutable run inputs so it can be shipped to worker processes.
+    Game ids are derived from the replication number rather than a shared
+    counter, which keeps them stable under concurrent execution.
+
+    Attributes:
+        game_id_base: First game id of a reserved DB block; rep N maps to
+            ``game_id_base + N - 1``. When None, the rep number is the game id.
+        assignment_cache: Personnel assignment cache shared by this factory's
+            games. Worker processes receive an empty cache of the same size.
+        validation: Per-play validation tier for every game.
+        validation_sample_every: Play interval validated under SAMPLED.
+        log_dir: Directory for one ``pylon.<rep>.log`` file per replication,
+            written by whichever thread or process runs the rep. When None,
+            no per-replication log files are written.
+        log_level: Level of the per-replication log files.
+    """
 
+    home_team: Team
+    away_team: Team
+    num_reps: int
+    user_models: List[TypedModel[Any, Any]] | None = None
+    rules: LeagueRules = field(default_factory=NFLRules)
+    max_drives: int | None = None
+    game_id_base: int | None = None
+    assignment_cache: PersonnelAssignmentCache | None = None
+    validation: ValidationLevel = ValidationLevel.BASIC
+    validation_sample_every: int = DEFAULT_VALIDATION_SAMPLE_EVERY
+    log_dir: Path | None = None
+    log_level: int = logging.INFO
 
-class _PerReplicationLogObserver(
-    SimulationObserver[PylonSimulationResult, Dict[str, Any]]
-):
-    """Observer that writes one log file per replication."""
-
-    def __init__(self, log_dir: Path, log_level: int) -> None:
-        self._log_dir = log_dir
-        self._log_level = log_level
-        self._active_handlers: Dict[int, tuple[logging.FileHandler, int]] = {}
-
-    def on_run_start(self, config: SimulationRunnerConfig) -> None:
-        self._log_dir.mkdir(parents=True, exist_ok=True)
+    def game_id_for(self, rep_number: int) -> str:
+        """Return the game id assigned to a replication."""
+        if self.game_id_base is None:
+            return str(rep_number)
+        return str(self.game_id_base + rep_number - 1)
 
-    def on_replication_start(self, rep_number: int, seed: int) -> None:
-        rep_log_path = self._log_dir / f"pylon.{rep_number}.log"
-        rep_handler = logging.FileHandler(rep_log_path, mode="w")
-        rep_handler.setLevel(self._log_level)
-        rep_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    def __call__(self, rep_number: int, rng: RNG) -> Simulation[PylonSimulationResult]:
+        logger.info(f"Running rep {rep_number}/{self.num_reps} (seed={rng.seed})...")
+        return PylonSimulation(
+            home_team=self.home_team,
+            away_team=self.away_team,
+            game_id=self.game_id_for(rep_number),
+            rng=rng,
+            user_models=self.user_models,
+            rules=self.rules,
+            max_drives=self.max_drives,
+            rep_number=rep_number,
+            assignment_cache=self.assignment_cache,
+            validation=self.validation,
+            validation_sample_every=self.validation_sample_every,
+            log_path=(
+                self.log_dir / f"pylon.{rep_number}.log"
+                if self.log_dir is not None
+                else None
+            ),
+            log_level=self.log_level,
         )
 
-        root_logger = logging.getLogger()
-        previous_level = root_logger.level
-        root_logger.addHandler(rep_handler)
-        root_logger.setLevel(min(previous_level, self._log_level))
-        self._active_handlers[rep_number] = (rep_handler, previous_level)
 
-    def on_replication_success(
+class _ReplicationOutputSink(ReplicationSink[PylonSimulationResult]):
+    """
+    Per-replication sink that projects each game as soon as it completes.
+
+    Builds the summary row, serializes game details only when a JSON consumer
+    wants them (at the configured retention depth), and hands DB facts to the
+    database writer immediately so the game's GameState can be released once
+    it has been persisted. When an
+    NDJSON writer is attached, game records are streamed to it instead of
+    being kept in memory. When a column builder is attached, each game's plays
+    are appended to typed column buffers for a columnar export.
+    """
+
+    def __init__(
         self,
-        rep_number: int,
-        seed: int,
-        duration_seconds: float,
-        result: PylonSimulationResult,
+        retention: RetentionLevel,
+        keep_details: bool,
+        db_writer: DBOutputWriter | BackgroundDBWriter | None,
+        ndjson_writer: NdjsonOutputWriter | None,
+        column_builder: PlayColumnBuilder | None,
+        experiment_id: str,
+        home_team_id: str,
+        away_team_id: str,
     ) -> None:
-        self._teardown_replication_logger(rep_number)
+        self._retention = retention
+        self._keep_details = keep_details
+        self._db_writer = db_writer
+        self._ndjson_writer = ndjson_writer
+        self.column_builder = column_builder
+        self._experiment_id = experiment_id
+        self._home_team_id = home_team_id
+        self._away_team_id = away_team_id
+        self.game_results: List[Dict[str, Any]] = []
+        self.game_details: List[GameStateOutputPayload] = []
 
-    def on_replication_failure(
-        self, rep_number: int, seed: int, error: Exception
+    def write_replication(
+        self, rep_number: int, seed: int, result: PylonSimulationResult
     ) -> None:
-        self._teardown_replication_logger(rep_number)
-
-    def on_run_complete(self, output: object) -> None:
-        for rep_number in list(self._active_handlers.keys()):
-            self._teardown_replication_logger(rep_number)
+        game_result: Dict[str, Any] = {
+            "rep_number": rep_number,
+            "seed": result.seed,
+            "home_score": result.home_score,
+            "away_score": result.away_score,
+            "winner_id": result.winner_id,
+            "final_quarter": result.final_quarter,
+            "duration_seconds": result.duration_seconds,
+            "status": result.status,
+            "total_plays": result.total_plays,
+            "total_drives": result.total_drives,
+        }
+        self.game_results.append(game_result)
+
+        game_details = (
+            serialize_game_state(
+                game_state=result.game_state,
+                rep_number=rep_number,
+                seed=result.seed,
+                retention=self._retention,
+            )
+            if self._keep_details
+            else None
+        )
+        if self._ndjson_writer is not None:
+            self._ndjson_writer.write_game(game_result, game_details)
+        elif game_details is not None:
+            self.game_details.append(game_details)
+
+        if self.column_builder is not None:
+            self.column_builder.add_game(
+                result.game_state, rep_number=rep_number, seed=result.seed
+            )
 
-    def _teardown_replication_logger(self, rep_number: int) -> None:
-        logger_state = self._active_handlers.pop(rep_number, None)
-        if logger_state is None:
-            return
+        if self._db_writer is not None:
+            self._db_writer.write_game(
+                game_id=result.game_id,
+                game_result=game_result,
+                game_state=result.game_state,
+                experiment_id=self._experiment_id,
+                home_team_id=self._home_team_id,
+                away_team_id=self._away_team_id,
+            )
 
-        rep_handler, previous_level = logger_state
-        root_logger = logging.getLogger()
-        root_logger.removeHandler(rep_handler)
-        rep_handler.close()
-        root_logger.setLevel(previous_level)
+        logger.info(
+            f"Rep {rep_number} complete [{result.status}]: "
+            f"{result.home_score}-{result.away_score} "
+            f"(Q{result.final_quarter}, {result.duration_seconds:.2f}s)"
+        )
 
 
 class PylonSimulationRunner:
@@ -128,6 +258,8 @@ class PylonSimulationRunner:
     - Tracking experiment metadata and results
     - Writing simulation output to JSON, DB, or both
     - Collecting aggregate statistics across reps
+    - Releasing per-game state as soon as each rep has been projected, keeping
+      only what the configured ``RetentionLevel`` asks for
 
     Usage:
         runner = PylonSimulationRunner(
@@ -154,6 +286,10 @@ class PylonSimulationRunner:
         self.away_team = config.away_team
         self.num_reps = config.num_reps
         self.base_seed = config.base_seed
+        self.rng_backend = config.rng_backend
+        self.rng_named_streams = config.rng_named_streams
+        self.design = config.design
+        self.stopping_rule = config.stopping_rule
         self.schema_version = config.schema_version
         self.user_models = config.user_models
         self.rules = config.rules
@@ -168,8 +304,27 @@ class PylonSimulationRunner:
             if config.json_output_path is not None
             else self.log_dir / "simulation_results.json"
         )
+        self.json_format = config.json_format
+        self.json_compression = config.json_compression
         self.json_writer = JsonOutputWriter(self.json_output_path)
+        self.columnar_output_path = (
+            Path(config.columnar_output_path)
+            if config.columnar_output_path is not None
+            else None
+        )
         self.log_level = config.log_level
+        self.executor = config.executor
+        self.retention = config.retention
+        self.db_write_queue_size = config.db_write_queue_size
+        self.db_write_batch_size = config.db_write_batch_size
+        self.db_bulk_load = config.db_bulk_load
+        self.assignment_cache = (
+            PersonnelAssignmentCache(config.personnel_cache_size)
+            if config.personnel_cache_size is not None
+            else None
+        )
+        self.validation = config.validation
+        self.validation_sample_every = config.validation_sample_every
 
         # Experiment metadata
         self.experiment_id = str(uuid.uuid4())
@@ -186,10 +341,9 @@ class PylonSimulationRunner:
         )
 
         # Result tracking
+        self.reps_used: int | None = None
         self.game_results: List[Dict[str, Any]] = []
         self.game_details: List[GameStateOutputPayload] = []
-        self._pending_db_games: List[tuple[str, Dict[str, Any], GameState]] = []
-        self._next_db_game_id: int | None = None
 
     def run(self) -> SimulationOutputPayload:
         """
@@ -213,22 +367,78 @@ class PylonSimulationRunner:
             json_output_path=self.json_output_path,
         )
 
-        # Initialize DB game-id sequence for this run if DB output is requested.
+        if self.db_bulk_load and wants_db_output(self.output_mode):
+            assert self.db_manager is not None
+            with self.db_manager.bulk_load():
+                return self._run_experiment()
+        return self._run_experiment()
+
+    def _run_experiment(self) -> SimulationOutputPayload:
+        """Run all replications and project their output (see ``run``)."""
+        # Reserve a contiguous DB game-id block for this run if DB output is
+        # requested; each rep derives its id from the block start.
+        game_id_base: int | None = None
         if wants_db_output(self.output_mode):
-            self._next_db_game_id = int(self._get_next_game_id())
+            game_id_base = self._reserve_game_ids()
 
-        # Reset per-run mutable state in case the runner instance is reused.
-        self.game_results = []
-        self.game_details = []
-        self._pending_db_games = []
+        # Dimensions and experiment metadata go first so each game's facts can
+        # be persisted (and its state released) as soon as the rep finishes.
+        if wants_db_output(self.output_mode):
+            assert self.db_writer is not None
+            self.db_writer.write_run_metadata(
+                experiment=self._build_experiment_payload(elapsed_time=0.0),
+                teams=self._build_teams_payload(),
+            )
 
-        rep_logger_observer = _PerReplicationLogObserver(
-            log_dir=self.log_dir,
-            log_level=self.log_level,
-        )
-        simulation_factory: SimulationFactory[PylonSimulationResult] = (
-            self._simulation_factory
+        # NDJSON output streams one record per game as reps complete, so the
+        # header goes out before the first replication.
+        ndjson_writer: NdjsonOutputWriter | None = None
+        if (
+            wants_json_output(self.output_mode)
+            and self.json_format == JsonFormat.NDJSON
+        ):
+            ndjson_writer = NdjsonOutputWriter(
+                self.json_output_path, compression=self.json_compression
+            )
+            ndjson_writer.open()
+            ndjson_writer.write_header(
+                schema_version=self.schema_version,
+                experiment=self._build_experiment_payload(elapsed_time=0.0),
+                teams=self._build_teams_payload(),
+            )
+
+        # Game facts are persisted on a writer thread fed through a bounded
+        # queue, so DB I/O overlaps with simulation and backpressures it when
+        # the database falls behind. A queue size of 0 writes inline.
+        background_db_writer: BackgroundDBWriter | None = None
+        if wants_db_output(self.output_mode) and self.db_write_queue_size > 0:
+            assert self.db_writer is not None
+            background_db_writer = BackgroundDBWriter(
+                self.db_writer,
+                max_queue_size=self.db_write_queue_size,
+                batch_size=self.db_write_batch_size,
+            )
+
+        output_sink = _ReplicationOutputSink(
+            retention=self.retention,
+            keep_details=wants_game_details(self.output_mode, self.retention),
+            db_writer=(
+                background_db_writer or self.db_writer
+                if wants_db_output(self.output_mode)
+                else None
+            ),
+            ndjson_writer=ndjson_writer,
+            column_builder=(
+                PlayColumnBuilder() if self.columnar_output_path is not None else None
+            ),
+            experiment_id=self.experiment_id,
+            home_team_id=self.home_team.uid,
+            away_team_id=self.away_team.uid,
         )
+        # Each replication writes its own log file from the thread or worker
+        # process that runs it (see PylonSimulation).
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        simulation_factory = self._build_simulation_factory(game_id_base)
 
         # Use the generic SimulationRunner to execute all replications with the
         # provided simulation factory and aggregate function.
@@ -237,162 +447,136 @@ class PylonSimulationRunner:
                 num_reps=self.num_reps,
                 base_seed=self.base_seed,
                 schema_version=self.schema_version,
+                rng_backend=self.rng_backend,
+                rng_named_streams=self.rng_named_streams,
+                design=self.design,
+                stopping_rule=self.stopping_rule,
+                # Results are projected by the replication sink; retaining
+                # them would keep every GameState alive until the end.
+                retain_runs=False,
             ),
             simulation_factory=simulation_factory,
-            aggregate_fn=self._aggregate_from_simulation_runs,
-            observers=[rep_logger_observer],
+            aggregator=GameResultAggregator(
+                home_team_id=self.home_team.uid,
+                away_team_id=self.away_team.uid,
+                design=self.design,
+            ),
+            executor=self.executor,
+            replication_sinks=[output_sink],
         )
-        base_output = base_runner.run()
+        if background_db_writer is not None:
+            background_db_writer.start()
+        succeeded = False
+        try:
+            base_output = base_runner.run()
+            self.reps_used = base_output.num_reps
+            aggregate_stats = base_output.aggregate
+            if base_output.stopping is not None:
+                aggregate_stats = {
+                    **aggregate_stats,
+                    "stopping": base_output.stopping.to_dict(),
+                }
+            if ndjson_writer is not None:
+                ndjson_writer.write_trailer(
+                    aggregate=aggregate_stats,
+                    elapsed_time=base_output.elapsed_time,
+                    num_reps=base_output.num_reps,
+                )
+            succeeded = True
+        finally:
+            if ndjson_writer is not None:
+                ndjson_writer.close()
+            if background_db_writer is not None:
+                # On success, flush queued games and re-raise any write
+                # failure; after a failed run, drop them so the original
+                # error propagates.
+                background_db_writer.close(flush=succeeded)
 
         elapsed_time = base_output.elapsed_time
         logger.info(
-            f"Experiment complete: {self.num_reps} reps in {elapsed_time:.2f}s "
-            f"({elapsed_time / self.num_reps:.2f}s per game)"
+            f"Experiment complete: {self.reps_used} reps in {elapsed_time:.2f}s "
+            f"({elapsed_time / self.reps_used:.2f}s per game)"
         )
+        if self.assignment_cache is not None:
+            # Counts cover in-process games only; worker processes keep their own.
+            cache_stats = self.assignment_cache.stats()
+            logger.info(
+                f"Personnel assignment cache: {cache_stats['hits']} hits, "
+                f"{cache_stats['misses']} misses, "
+                f"{cache_stats['size']}/{cache_stats['maxsize']} entries"
+            )
 
-        aggregate_stats = base_output.aggregate
+        # A stopping rule may end the run early; record the reps actually used.
+        if wants_db_output(self.output_mode) and self.reps_used != self.num_reps:
+            assert self.db_writer is not None
+            self.db_writer.update_experiment_num_reps(
+                self.experiment_id, self.reps_used
+            )
+
+        self.game_results = output_sink.game_results
+        self.game_details = output_sink.game_details
 
         results = self._build_output_payload(
             elapsed_time=elapsed_time,
             aggregate_stats=aggregate_stats,
         )
 
-        if wants_json_output(self.output_mode):
+        if ndjson_writer is not None:
+            logger.info(f"Results streamed to NDJSON: {ndjson_writer.output_path}")
+        elif wants_json_output(self.output_mode):
             json_path = self.json_writer.write_results(results)
             logger.info(f"Results written to JSON: {json_path}")
 
         if wants_db_output(self.output_mode):
-            self._persist_db_output(results)
             logger.info("Results persisted to database.")
 
-        return results
+        if output_sink.column_builder is not None:
+            assert self.columnar_output_path is not None
+            columnar_path = output_sink.column_builder.write(self.columnar_output_path)
+            logger.info(f"Play-by-play columns written to: {columnar_path}")
 
-    def _simulation_factory(
-        self,
-        rep_number: int,
-        rng: RNG,
-    ) -> Simulation[PylonSimulationResult]:
-        """Create one per-rep pylon simulation for the generic sim runner."""
-        if wants_db_output(self.output_mode):
-            assert self._next_db_game_id is not None
-            game_id = str(self._next_db_game_id)
-            self._next_db_game_id += 1
-        else:
-            game_id = str(rep_number)
+        return results
 
-        logger.info(f"Running rep {rep_number}/{self.num_reps} (seed={rng.seed})...")
-        simulation = PylonSimulation(
+    def _build_simulation_factory(
+        self, game_id_base: int | None
+    ) -> PylonSimulationFactory:
+        """Create the picklable per-rep factory for the generic sim runner."""
+        return PylonSimulationFactory(
             home_team=self.home_team,
             away_team=self.away_team,
-            game_id=game_id,
-            rng=rng,
+            num_reps=self.num_reps,
             user_models=self.user_models,
             rules=self.rules,
             max_drives=self.max_drives,
+            game_id_base=game_id_base,
+            assignment_cache=self.assignment_cache,
+            validation=self.validation,
+            validation_sample_every=self.validation_sample_every,
+            # Absolute, so worker processes resolve it like the parent does.
+            log_dir=self.log_dir.resolve(),
+            log_level=self.log_level,
         )
-        return simulation
-
-    def _aggregate_from_simulation_runs(
-        self,
-        run_results: List[PylonSimulationResult],
-    ) -> Dict[str, Any]:
-        """Build pylon-specific game outputs and aggregate stats from sim runs."""
-        self.game_results = []
-        self.game_details = []
-        self._pending_db_games = []
-
-        for rep_number, run_result in enumerate(run_results, start=1):
-            game_result: Dict[str, Any] = {
-                "rep_number": rep_number,
-                "seed": run_result.seed,
-                "home_score": run_result.home_score,
-                "away_score": run_result.away_score,
-                "winner_id": run_result.winner_id,
-                "final_quarter": run_result.final_quarter,
-                "duration_seconds": run_result.duration_seconds,
-                "status": run_result.status,
-                "total_plays": run_result.total_plays,
-                "total_drives": run_result.total_drives,
-            }
-            self.game_results.append(game_result)
-            self.game_details.append(
-                serialize_game_state(
-                    game_state=run_result.game_state,
-                    rep_number=rep_number,
-                    seed=run_result.seed,
-                )
-            )
-
-            if wants_db_output(self.output_mode):
-                self._pending_db_games.append(
-                    (run_result.game_id, game_result, run_result.game_state)
-                )
 
-            logger.info(
-                f"Rep {rep_number} complete [{run_result.status}]: "
-                f"{run_result.home_score}-{run_result.away_score} "
-                f"(Q{run_result.final_quarter}, {run_result.duration_seconds:.2f}s)"
-            )
-
-        return self._compute_aggregate_stats()
-
-    def _get_next_game_id(self) -> str:
+    def _reserve_game_ids(self) -> int:
         """
-        Get the next sequential game ID by querying the database.
+        Atomically reserve one DB game id per replication.
+
+        The whole ``num_reps`` budget is reserved up front, so when a stopping
+        rule ends the run early the ids of the skipped replications are left
+        unused and later experiments' game ids skip over them.
 
         Returns:
-            Sequential game ID as a string (e.g., "1", "2", "3"...)
+            First game id of the reserved block; rep N uses ``first + N - 1``.
         """
         assert self.db_writer is not None
-        return self.db_writer.get_next_game_id()
-
-    def _compute_aggregate_stats(self) -> Dict[str, Any]:
-        """Compute aggregate statistics across all replications."""
-        if not self.game_results:
-            return {}
-
-        completed_games = [g for g in self.game_results if g.get("status") != "failed"]
-        failed_reps = sum(1 for g in self.game_results if g.get("status") == "failed")
-
-        if not completed_games:
-            return {"failed_reps": failed_reps}
-
-        home_wins = sum(
-            1 for g in completed_games if g["winner_id"] == self.home_team.uid
-        )
-        away_wins = sum(
-            1 for g in completed_games if g["winner_id"] == self.away_team.uid
-        )
-        ties = sum(1 for g in completed_games if g["winner_id"] is None)
-
-        avg_home_score = sum(g["home_score"] for g in completed_games) / len(
-            completed_games
-        )
-        avg_away_score = sum(g["away_score"] for g in completed_games) / len(
-            completed_games
-        )
-        avg_duration = sum(g["duration_seconds"] for g in completed_games) / len(
-            completed_games
-        )
-
-        return {
-            "home_wins": home_wins,
-            "away_wins": away_wins,
-            "ties": ties,
-            "home_win_pct": home_wins / len(completed_games),
-            "away_win_pct": away_wins / len(completed_games),
-            "avg_home_score": avg_home_score,
-            "avg_away_score": avg_away_score,
-            "avg_duration_seconds": avg_duration,
-            "failed_reps": failed_reps,
-        }
+        return self.db_writer.reserve_game_ids(self.num_reps)
 
     def _build_experiment_payload(self, elapsed_time: float) -> ExperimentOutputPayload:
         """Build canonical experiment metadata payload."""
         return {
             "id": self.experiment_id,
             "name": self.experiment_name,
-            "num_reps": self.num_reps,
+            "num_reps": self.reps_used if self.reps_used is not None else self.num_reps,
             "base_seed": self.base_seed,
             "elapsed_time": elapsed_time,
             "description": self.experiment_description,
@@ -423,15 +607,3 @@ class PylonSimulationRunner:
             "teams": teams,
             "results": results,
         }
-
-    def _persist_db_output(self, output_payload: SimulationOutputPayload) -> None:
-        """Persist DB output after simulations complete and payload is assembled."""
-        assert self.db_writer is not None
-
-        logger.info("Persisting DB output from canonical payload...")
-        self.db_writer.write_results(
-            output_payload=output_payload,
-            pending_games=self._pending_db_games,
-        )
-
-        self._pending_db_games.clear()
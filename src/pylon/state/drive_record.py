@@ -39,6 +39,14 @@ class DriveStatus(Enum):
 
 
 class DriveSnapshot:
+    __slots__ = (
+        "pos_team",
+        "def_team",
+        "clock_snapshot",
+        "possession_snapshot",
+        "scoreboard_snapshot",
+    )
+
     def __init__(self, game_state: GameState | None = None) -> None:
         self.pos_team: Team | None = game_state.pos_team if game_state else None
         self.def_team: Team | None = game_state.def_team if game_state else None
@@ -74,6 +82,18 @@ class DriveSnapshot:
 
 
 class DriveExecutionData:
+    __slots__ = (
+        "_status",
+        "_time_elapsed",
+        "_yards_gained",
+        "_is_scoring_drive",
+        "_scoring_type",
+        "_scoring_team",
+        "_result",
+        "_plays",
+        "_plays_yards",
+    )
+
     def __init__(self) -> None:
         self._status: DriveStatus = DriveStatus.IN_PROGRESS
         self._time_elapsed: int = 0
@@ -87,6 +107,8 @@ class DriveExecutionData:
         # and defensive formations, etc. This data is contained in the
         # PlayExecutionData class.
         self._plays: List[PlayRecord] = []
+        # Running sum of the plays' yards_gained, kept by add_play.
+        self._plays_yards: int = 0
 
     # ==============================
     # Setters
@@ -130,6 +152,8 @@ class DriveExecutionData:
         # current game state to the end state of the last drive.
         # self._assert_consistency()  # raise if inconsistent
         self._plays.append(play)
+        if play.yards_gained is not None:
+            self._plays_yards += play.yards_gained
         logger.debug(f"Added PlayRecord {play.uid} to DriveRecord.")
 
     # ==============================
@@ -178,7 +202,7 @@ class DriveExecutionData:
         return len(self._plays)
 
     def total_yards(self) -> int:
-        return sum(p.yards_gained for p in self._plays if p.yards_gained is not None)
+        return self._plays_yards
 
     # ==============================
     # Validators
@@ -192,6 +216,8 @@ class DriveExecutionData:
 
 
 class DriveRecord:
+    __slots__ = ("uid", "_start_snapshot", "_end_snapshot", "_execution_data")
+
     def __init__(self, start_game_state: GameState) -> None:
         self.uid: str = str(start_game_state.total_drives() + 1)
         # initialize start snapshot from provided game state
@@ -2,13 +2,13 @@
 
 GameState owns the single source of truth for in-game mutable state while engines
 and models read/update it. It wires together the clock, scoreboard, possession,
-pending kickoffs/extra points, and drive/play records.
+pending kickoffs/extra points, drive/play records, and the columnar play log.
 """
 
 from __future__ import annotations
 from enum import auto, Enum
 import logging
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List
 import uuid
 
 from .game_clock import GameClock
@@ -20,6 +20,7 @@ from ..engine.timeout import TimeoutManager
 from ..models.misc import CoinTossChoice
 from .snapshot import ClockSnapshot, PossessionSnapshot, ScoreSnapshot
 from .play_record import ScoringTypeEnum
+from .play_log import PlayLog
 
 if TYPE_CHECKING:
     from .drive_record import DriveRecord
@@ -64,6 +65,14 @@ class PlayOutcome:
 
 
 class GameSnapshot:
+    __slots__ = (
+        "pos_team",
+        "def_team",
+        "clock_snapshot",
+        "possession_snapshot",
+        "scoreboard_snapshot",
+    )
+
     def __init__(self, game_state: GameState | None = None) -> None:
         self.pos_team: Team | None = game_state.pos_team if game_state else None
         self.def_team: Team | None = game_state.def_team if game_state else None
@@ -105,6 +114,11 @@ class GameExecutionData:
         self._coin_toss_winner: Team | None = None
         self._coin_toss_winner_choice: CoinTossChoice | None = None
         self.drives: List["DriveRecord"] = []
+        # Totals over committed drives, kept by add_drive.
+        self._total_plays: int = 0
+        self._total_yards: int = 0
+        self._plays: List["PlayRecord"] = []
+        self._drives_by_team: Dict[Team, List["DriveRecord"]] = {}
 
     # ==============================
     # Setters
@@ -132,6 +146,12 @@ class GameExecutionData:
         # self._assert_consistency(drive_record, game_state)
 
         self.drives.append(drive_record)
+        self._total_plays += drive_record.total_plays()
+        self._total_yards += drive_record.total_yards()
+        self._plays.extend(drive_record.plays)
+        offense = drive_record.start.pos_team
+        if offense is not None:
+            self._drives_by_team.setdefault(offense, []).append(drive_record)
         logger.debug(f"Drive {drive_record.uid} added to game state.")
 
     def start_game(self) -> None:
@@ -163,6 +183,22 @@ class GameExecutionData:
     def coin_toss_winner_choice(self) -> CoinTossChoice | None:
         return self._coin_toss_winner_choice
 
+    @property
+    def total_plays(self) -> int:
+        return self._total_plays
+
+    @property
+    def total_yards(self) -> int:
+        return self._total_yards
+
+    @property
+    def plays(self) -> List["PlayRecord"]:
+        """Plays of every committed drive, in order."""
+        return self._plays
+
+    def drives_by_team(self, team: Team) -> List["DriveRecord"]:
+        return self._drives_by_team.get(team, [])
+
     @property
     def last_drive(self) -> DriveRecord | None:
         if not self.drives:
@@ -270,8 +306,9 @@ class GameState:
         self._home_team: Team = home_team
         self._away_team: Team = away_team
         self._seconds_elapsed: int = 0
+        # Bound method rather than a lambda so GameState stays picklable.
         self._clock: GameClock = GameClock(
-            lambda: self._seconds_elapsed, minutes_per_quarter, quarters_per_half * 2
+            self._get_seconds_elapsed, minutes_per_quarter, quarters_per_half * 2
         )
         self._scoreboard: Scoreboard = Scoreboard(home_team, away_team)
         self._timeout_mgr: TimeoutManager = TimeoutManager(
@@ -292,6 +329,8 @@ class GameState:
         self._coin_toss_winner_choice: CoinTossChoice | None = None
         # Execution data (set by GameEngine)
         self._game_data: GameExecutionData = GameExecutionData(game_id)
+        # Columnar log of every play run, appended by GameStateUpdater.
+        self._play_log: PlayLog = PlayLog(home_team, away_team)
 
     # ===============================
     # Getters
@@ -300,6 +339,9 @@ class GameState:
     def seconds_elapsed(self) -> int:
         return self._seconds_elapsed
 
+    def _get_seconds_elapsed(self) -> int:
+        return self._seconds_elapsed
+
     @property
     def home_team(self) -> Team:
         return self._home_team
@@ -361,23 +403,26 @@ class GameState:
     def total_drives(self) -> int:
         return len(self.drives)
 
+    @property
+    def play_log(self) -> PlayLog:
+        """Columnar log of every play run so far, including the current drive."""
+        return self._play_log
+
     def total_plays(self) -> int:
-        return sum(len(drive.plays) for drive in self.drives)
+        """Return the number of plays in completed drives."""
+        return self.game_data.total_plays
 
     def total_yards(self) -> int:
         """Return total yards gained across all drives (offensive perspective)."""
-        return sum(drive.total_yards() for drive in self.drives)
+        return self.game_data.total_yards
 
     def drives_by_team(self, team: Team) -> List["DriveRecord"]:
         """Return all drives where the given team was on offense."""
-        return [d for d in self.drives if d.start.pos_team == team]
+        return list(self.game_data.drives_by_team(team))
 
     def all_plays(self) -> List["PlayRecord"]:
         """Return a flattened list of all plays from all drives."""
-        plays: List["PlayRecord"] = []
-        for drive in self.drives:
-            plays.extend(drive.plays)
-        return plays
+        return list(self.game_data.plays)
 
     # ===============================
     # Setters
@@ -462,16 +507,24 @@ class GameStateUpdater:
     # ==============================
     @staticmethod
     def apply_play_data(
-        game_state: GameState, play_data: PlayExecutionData, league_rules: LeagueRules
+        game_state: GameState,
+        play_data: PlayExecutionData,
+        league_rules: LeagueRules,
+        validate: bool = True,
     ) -> None:
-        """Apply the results of a play execution to the game state."""
-        # For kickoffs and punts, down/distance may not be set yet (they're special teams plays)
-        # They'll be set after possession change via reset_down_and_distance()
+        """
+        Apply the results of a play execution to the game state.
+
+        With ``validate=False`` the down/distance and finalized-play checks
+        are skipped; the engine passes its per-play validation decision.
+        """
         assert play_data.play_type is not None
-        is_special_teams = play_data.play_type.is_kick()
-        if not is_special_teams:
-            game_state.possession.assert_down_and_distance_set()
-        play_data.assert_is_finalized()
+        if validate:
+            # For kickoffs and punts, down/distance may not be set yet (they're special teams plays)
+            # They'll be set after possession change via reset_down_and_distance()
+            if not play_data.play_type.is_kick():
+                game_state.possession.assert_down_and_distance_set()
+            play_data.assert_is_finalized()
 
         GameStateUpdater._update_clock(game_state, play_data)
 
@@ -496,6 +549,11 @@ class GameStateUpdater:
 
         logger.debug("Play updated the game state.")
 
+    @staticmethod
+    def record_play(game_state: GameState, play_record: PlayRecord) -> None:
+        """Append a finished play to the game's columnar play log."""
+        game_state.play_log.append(play_record)
+
     @staticmethod
     def _update_clock(game_state: GameState, play_data: PlayExecutionData) -> None:
         """Advance the game clock based on play execution data."""
@@ -0,0 +1,222 @@
+"""Append-only columnar log of the plays run in one game.
+
+``GameState`` owns one ``PlayLog``. ``GameStateUpdater.record_play`` appends a
+row for every play as it is committed to its drive. Each column is a typed
+``array`` buffer holding the situation the play was run from and its outcome.
+Running totals are kept as rows are appended, so play counts and yardage are
+O(1). ``PlayRecord`` objects remain the full record of a play; ``row(i)``
+gives a lightweight read-only view of one row without touching them.
+
+``numpy`` is an optional dependency, needed only for ``to_numpy``.
+"""
+
+from __future__ import annotations
+
+from array import array
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple
+
+from ..domain.playbook import PlayTypeEnum
+from ..domain.team import Team
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+if TYPE_CHECKING:
+    from .play_record import PlayRecord, PlaySnapshot
+
+
+logger = logging.getLogger(__name__)
+
+MISSING = -1
+"""Stored for a value the play did not have, e.g. down and distance on kicks."""
+
+# Bits of the ``flags`` column.
+FLAG_SCORE = 1
+FLAG_TURNOVER = 2
+FLAG_POSSESSION_CHANGE = 4
+
+PLAY_TYPE_CODES: Dict[PlayTypeEnum, int] = {
+    play_type: code for code, play_type in enumerate(PlayTypeEnum)
+}
+"""Stable ``play_type`` column code for each play type (declaration order)."""
+
+_PLAY_TYPES: List[PlayTypeEnum] = list(PlayTypeEnum)
+
+
+class PlayLogError(Exception):
+    pass
+
+
+class PlayRow(NamedTuple):
+    """Read-only view of one ``PlayLog`` row."""
+
+    play_number: int
+    quarter: int
+    time_remaining: int
+    down: int | None
+    distance: int | None
+    yardline: int
+    yards_gained: int
+    play_type: PlayTypeEnum | None
+    offense: Team
+    points: int
+    is_turnover: bool
+    is_possession_change: bool
+
+
+class PlayLog:
+    """
+    Columnar, append-only play log for a single game.
+
+    ``offense`` holds ``0`` for the home team and ``1`` for the away team.
+    Situation columns (quarter, time remaining, down, distance, yardline)
+    describe the start of the play. ``points`` is the total scored by both
+    teams during the play.
+    """
+
+    COLUMNS = (
+        "quarter",
+        "time_remaining",
+        "down",
+        "distance",
+        "yardline",
+        "yards_gained",
+        "play_type",
+        "offense",
+        "points",
+        "flags",
+    )
+
+    def __init__(self, home_team: Team, away_team: Team) -> None:
+        self._teams = (home_team, away_team)
+        self.quarter: array[int] = array("b")
+        self.time_remaining: array[int] = array("i")
+        self.down: array[int] = array("b")
+        self.distance: array[int] = array("h")
+        self.yardline: array[int] = array("h")
+        self.yards_gained: array[int] = array("h")
+        self.play_type: array[int] = array("b")
+        self.offense: array[int] = array("b")
+        self.points: array[int] = array("b")
+        self.flags: array[int] = array("B")
+        self._total_yards: int = 0
+        self._plays_by_offense: List[int] = [0, 0]
+
+    # ==============================
+    # Recording
+    # ==============================
+    def append(self, play: PlayRecord) -> None:
+        """Append one finalized play."""
+        start = play.start
+        clock = start.clock_snapshot
+        possession = start.possession_snapshot
+        if (
+            start.pos_team is None
+            or clock.quarter is None
+            or possession.yardline is None
+        ):
+            msg = f"Cannot log play {play.uid}: its start snapshot is not finalized."
+            logger.error(msg)
+            raise PlayLogError(msg)
+
+        offense = self._team_index(start.pos_team)
+        yards = play.yards_gained or 0
+        points = _total_score(play.end) - _total_score(start)
+        flags = 0
+        if points > 0:
+            flags |= FLAG_SCORE
+        if play.is_turnover:
+            flags |= FLAG_TURNOVER
+        if play.is_possession_change:
+            flags |= FLAG_POSSESSION_CHANGE
+        play_type = play.execution_data.play_type
+
+        self.quarter.append(clock.quarter)
+        self.time_remaining.append(
+            clock.time_remaining if clock.time_remaining is not None else MISSING
+        )
+        self.down.append(possession.down if possession.down is not None else MISSING)
+        self.distance.append(
+            possession.distance if possession.distance is not None else MISSING
+        )
+        self.yardline.append(possession.yardline)
+        self.yards_gained.append(yards)
+        self.play_type.append(
+            PLAY_TYPE_CODES[play_type] if play_type is not None else MISSING
+        )
+        self.offense.append(offense)
+        self.points.append(points)
+        self.flags.append(flags)
+
+        self._total_yards += yards
+        self._plays_by_offense[offense] += 1
+
+    def _team_index(self, team: Team) -> int:
+        if team is self._teams[0]:
+            return 0
+        if team is self._teams[1]:
+            return 1
+        msg = f"Team {team.name} is not part of this game."
+        logger.error(msg)
+        raise PlayLogError(msg)
+
+    # ==============================
+    # Counters
+    # ==============================
+    def __len__(self) -> int:
+        return len(self.quarter)
+
+    @property
+    def total_yards(self) -> int:
+        return self._total_yards
+
+    def plays_by_offense(self, team: Team) -> int:
+        """Number of logged plays with ``team`` on offense."""
+        return self._plays_by_offense[self._team_index(team)]
+
+    # ==============================
+    # Views
+    # ==============================
+    def row(self, index: int) -> PlayRow:
+        """Return a read-only view of row ``index`` (negative indexes allowed)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("play log index out of range")
+
+        down = self.down[index]
+        distance = self.distance[index]
+        play_type = self.play_type[index]
+        flags = self.flags[index]
+        return PlayRow(
+            play_number=index + 1,
+            quarter=self.quarter[index],
+            time_remaining=self.time_remaining[index],
+            down=down if down != MISSING else None,
+            distance=distance if distance != MISSING else None,
+            yardline=self.yardline[index],
+            yards_gained=self.yards_gained[index],
+            play_type=_PLAY_TYPES[play_type] if play_type != MISSING else None,
+            offense=self._teams[self.offense[index]],
+            points=self.points[index],
+            is_turnover=bool(flags & FLAG_TURNOVER),
+            is_possession_change=bool(flags & FLAG_POSSESSION_CHANGE),
+        )
+
+    def rows(self) -> Iterator[PlayRow]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Copy every column into a NumPy array keyed by column name."""
+        if np is None:
+            raise PlayLogError("numpy is required for PlayLog.to_numpy().")
+        return {name: np.array(getattr(self, name)) for name in self.COLUMNS}
+
+
+def _total_score(snapshot: PlaySnapshot) -> int:
+    scores = snapshot.scoreboard_snapshot
+    return (scores.pos_team_score or 0) + (scores.def_team_score or 0)
@@ -59,6 +59,14 @@ class PlaySnapshot:
     all attributes to None.
     """
 
+    __slots__ = (
+        "pos_team",
+        "def_team",
+        "clock_snapshot",
+        "possession_snapshot",
+        "scoreboard_snapshot",
+    )
+
     def __init__(self, game_state: GameState | None = None) -> None:
         self.pos_team: Team | None = game_state.pos_team if game_state else None
         self.def_team: Team | None = game_state.def_team if game_state else None
@@ -103,6 +111,35 @@ class PlayExecutionData:
     the GameEngine.
     """
 
+    __slots__ = (
+        "_play_type",
+        "_off_play_call",
+        "_def_play_call",
+        "_time_elapsed",
+        "_preplay_clock_runoff",
+        "_is_clock_running",
+        "_yards_gained",
+        "_is_fg_attempt",
+        "_fg_good",
+        "_is_possession_change",
+        "_is_turnover",
+        "_off_personnel_assignments",
+        "_def_personnel_assignments",
+        "_participants",
+        "_air_yards",
+        "_yards_after_catch",
+        "_is_complete",
+        "_is_interception",
+        "_is_sack",
+        "_run_gap",
+        "_is_fumble",
+        "_fumble_recovered_by_team",
+        "_penalty_occurred",
+        "_penalty_yards",
+        "_penalty_team",
+        "_penalty_type",
+    )
+
     def __init__(self) -> None:
         self._play_type: PlayTypeEnum | None = None
         self._off_play_call: PlayCall | None = None
@@ -479,11 +516,11 @@ class PlayRecord:
     of what happened during the play for later application to the game state.
     """
 
+    __slots__ = ("uid", "_start_snapshot", "_end_snapshot", "_execution_data")
+
     def __init__(self, start_game_state: GameState, play_number: int) -> None:
-        # Use the provided play_number which accounts for:
-        # - All plays from completed drives (game_state.total_plays())
-        # - Plus plays from the current in-progress drive
-        # - Plus 1 for this new play being created
+        # Use the provided play_number: every play already in the game's
+        # play log (completed drives and the current one) plus 1.
         self.uid: str = str(play_number)
         self._start_snapshot = PlaySnapshot(start_game_state)
         # this will be filled in later during finalization
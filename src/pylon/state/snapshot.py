@@ -18,6 +18,8 @@ class ClockSnapshot:
     all attributes to None.
     """
 
+    __slots__ = ("clock_is_running", "quarter", "time_remaining")
+
     def __init__(self, clock: GameClock | None = None) -> None:
         self.clock_is_running = clock.clock_is_running if clock else None
         self.quarter = clock.current_quarter if clock else None
@@ -50,6 +52,8 @@ class PossessionSnapshot:
     all attributes to None.
     """
 
+    __slots__ = ("yardline", "down", "distance")
+
     def __init__(self, possession_state: PossessionState | None = None) -> None:
         self.yardline = possession_state.ball_position if possession_state else None
         self.down = possession_state.down if possession_state else None
@@ -79,6 +83,8 @@ class ScoreSnapshot:
     all attributes to None.
     """
 
+    __slots__ = ("pos_team_score", "def_team_score")
+
     def __init__(
         self,
         scoreboard: Scoreboard | None = None,
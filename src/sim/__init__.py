@@ -1,17 +1,43 @@
 """Domain-agnostic simulation abstraction package."""
 
+from .aggregator import Aggregator, ListAggregator, RunningStats
 from .base import Simulation
+from .design import (
+    AntitheticDesign,
+    DesignEstimator,
+    DesignPoint,
+    IndependentDesign,
+    ReplicationDesign,
+    StratifiedDesign,
+)
+from .distribution import Distribution
 from .exceptions import (
     OutputSinkError,
     SimulationConfigurationError,
     SimulationError,
     SimulationExecutionError,
 )
+from .executor import (
+    ProcessPoolReplicationExecutor,
+    ReplicationExecutor,
+    ReplicationOutcome,
+    ReplicationSession,
+    SerialExecutor,
+    ThreadPoolReplicationExecutor,
+)
 from .factory import SimulationFactory
 from .observer import SimulationObserver
-from .output import OutputSink, SimulationOutput
-from .rng import RNG
+from .output import OutputSink, ReplicationSink, SimulationOutput
+from .rng import (
+    RNG,
+    NumpyBlockBackend,
+    PythonRandomBackend,
+    RNGBackend,
+    RNGConfig,
+    derive_seed,
+)
 from .runner import SimulationRunner, SimulationRunnerConfig
+from .stopping import StoppingReason, StoppingReport, StoppingRule
 
 __all__ = [
     "Simulation",
@@ -19,11 +45,36 @@ __all__ = [
     "SimulationFactory",
     "SimulationObserver",
     "OutputSink",
+    "ReplicationSink",
     "RNG",
+    "Distribution",
+    "RNGBackend",
+    "RNGConfig",
+    "derive_seed",
+    "PythonRandomBackend",
+    "NumpyBlockBackend",
     "SimulationError",
     "SimulationConfigurationError",
     "SimulationExecutionError",
     "OutputSinkError",
     "SimulationRunner",
     "SimulationRunnerConfig",
+    "ReplicationExecutor",
+    "ReplicationOutcome",
+    "ReplicationSession",
+    "SerialExecutor",
+    "ThreadPoolReplicationExecutor",
+    "ProcessPoolReplicationExecutor",
+    "Aggregator",
+    "ListAggregator",
+    "RunningStats",
+    "ReplicationDesign",
+    "IndependentDesign",
+    "AntitheticDesign",
+    "StratifiedDesign",
+    "DesignPoint",
+    "DesignEstimator",
+    "StoppingRule",
+    "StoppingReport",
+    "StoppingReason",
 ]
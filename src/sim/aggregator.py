@@ -0,0 +1,136 @@
+"""Incremental aggregation contracts for simulation runners.
+
+Aggregators consume replication results one at a time so memory stays constant
+regardless of the number of replications. Partial aggregators can be merged,
+which lets independently aggregated batches (e.g. per worker) be combined.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Generic, List, Protocol, TypeVar
+
+
+# Invariant: ``merge`` takes another aggregator of the same type, which puts
+# both parameters in argument position.
+TResult = TypeVar("TResult")
+TAggregate = TypeVar("TAggregate")
+TItem = TypeVar("TItem")
+TSummary = TypeVar("TSummary")
+
+
+class Aggregator(Protocol[TResult, TAggregate]):
+    """Streaming aggregation contract used by ``SimulationRunner``."""
+
+    def update(self, result: TResult) -> None:
+        """Fold one replication result into the running aggregate."""
+        ...
+
+    def merge(self, other: Aggregator[TResult, TAggregate]) -> None:
+        """Fold another partial aggregate of the same type into this one."""
+        ...
+
+    def finalize(self) -> TAggregate:
+        """Return the aggregate summary for all results seen so far."""
+        ...
+
+
+class RunningStats:
+    """
+    Numerically stable running mean/variance (Welford's algorithm).
+
+    ``merge`` uses the parallel combination formula of Chan et al., so stats
+    accumulated on separate partitions combine exactly as if they had been
+    accumulated serially.
+    """
+
+    def __init__(self) -> None:
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._min: float = math.inf
+        self._max: float = -math.inf
+
+    # ==============================
+    # Getters
+    # ==============================
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (``n - 1`` denominator); 0.0 for fewer than 2 values."""
+        return self._m2 / (self._count - 1) if self._count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """Standard error of the mean."""
+        return self.stddev / math.sqrt(self._count) if self._count else 0.0
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max if self._count else 0.0
+
+    # ==============================
+    # Updates
+    # ==============================
+    def push(self, value: float) -> None:
+        """Add one observation."""
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def merge(self, other: RunningStats) -> None:
+        """Combine another partition's stats into this one."""
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._count = other._count
+            self._mean = other._mean
+            self._m2 = other._m2
+            self._min = other._min
+            self._max = other._max
+            return
+
+        total = self._count + other._count
+        delta = other._mean - self._mean
+        self._mean += delta * other._count / total
+        self._m2 += other._m2 + delta * delta * self._count * other._count / total
+        self._count = total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+
+class ListAggregator(Generic[TItem, TSummary]):
+    """Adapter that buffers results for a list-based ``aggregate_fn``."""
+
+    def __init__(self, aggregate_fn: Callable[[List[TItem]], TSummary]) -> None:
+        self._aggregate_fn = aggregate_fn
+        self._results: List[TItem] = []
+
+    def update(self, result: TItem) -> None:
+        self._results.append(result)
+
+    def merge(self, other: Aggregator[TItem, TSummary]) -> None:
+        if not isinstance(other, ListAggregator):
+            raise TypeError("ListAggregator can only merge with ListAggregator")
+        self._results.extend(other._results)
+
+    def finalize(self) -> TSummary:
+        return self._aggregate_fn(list(self._results))
@@ -0,0 +1,250 @@
+"""Replication designs for variance reduction.
+
+A design decides how replications relate to each other: which seed each one
+uses and how its uniform draws are transformed. ``SimulationRunner`` asks the
+configured design for a ``DesignPoint`` per replication, and
+``DesignEstimator`` turns per-replication values back into a correctly
+weighted estimate with a standard error that reflects the design.
+
+- ``IndependentDesign``: the default; every replication has its own seed.
+- ``AntitheticDesign``: replications come in pairs sharing a seed, the second
+  drawing ``1 - u`` for every uniform ``u`` of the first. The estimator
+  averages each pair before computing the standard error.
+- ``StratifiedDesign``: the first draw of selected named RNG streams (e.g. the
+  coin toss) is confined to one of ``k`` equal-probability strata, cycling
+  through every combination of strata. The estimator weights stratum means by
+  stratum probability and pools within-stratum variances.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Dict, Mapping, Protocol, Tuple
+
+from .aggregator import RunningStats
+from .exceptions import SimulationConfigurationError
+
+StratumAssignment = Tuple[str, int, int]
+"""A ``(stream_name, stratum_index, num_strata)`` triple."""
+
+
+@dataclass(frozen=True)
+class DesignPoint:
+    """
+    How one replication draws its random numbers.
+
+    Attributes:
+        group: Replications sharing a group share a seed (``base_seed + group``).
+        antithetic: Mirror every uniform draw as ``1 - u``.
+        strata: Stratum assignment for the first draw of each listed stream.
+    """
+
+    group: int
+    antithetic: bool = False
+    strata: Tuple[StratumAssignment, ...] = ()
+
+    def stratum_for(self, stream_name: str) -> Tuple[int, int] | None:
+        """Return ``(stratum_index, num_strata)`` for a named stream, if any."""
+        for name, index, num_strata in self.strata:
+            if name == stream_name:
+                return index, num_strata
+        return None
+
+    @property
+    def stratum_key(self) -> Tuple[int, ...]:
+        return tuple(index for _, index, _ in self.strata)
+
+
+class ReplicationDesign(Protocol):
+    """Maps replication numbers to design points."""
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def transforms_draws(self) -> bool:
+        """Whether replications need uniform-derived (mirrorable) draws."""
+        ...
+
+    @property
+    def requires_named_streams(self) -> bool: ...
+
+    def validate(self, num_reps: int) -> None:
+        """Raise SimulationConfigurationError if ``num_reps`` does not fit."""
+        ...
+
+    def point(self, rep_number: int) -> DesignPoint: ...
+
+
+@dataclass(frozen=True)
+class IndependentDesign:
+    """Independent replications, one seed each."""
+
+    name: str = field(default="independent", init=False)
+    transforms_draws: bool = field(default=False, init=False)
+    requires_named_streams: bool = field(default=False, init=False)
+
+    def validate(self, num_reps: int) -> None:
+        pass
+
+    def point(self, rep_number: int) -> DesignPoint:
+        return DesignPoint(group=rep_number)
+
+
+@dataclass(frozen=True)
+class AntitheticDesign:
+    """Antithetic pairs: reps ``2k - 1`` and ``2k`` share a seed, mirrored."""
+
+    name: str = field(default="antithetic", init=False)
+    transforms_draws: bool = field(default=True, init=False)
+    requires_named_streams: bool = field(default=False, init=False)
+
+    def validate(self, num_reps: int) -> None:
+        if num_reps % 2:
+            raise SimulationConfigurationError(
+                "antithetic designs need an even num_reps"
+            )
+
+    def point(self, rep_number: int) -> DesignPoint:
+        return DesignPoint(group=(rep_number + 1) // 2, antithetic=rep_number % 2 == 0)
+
+
+@dataclass(frozen=True)
+class StratifiedDesign:
+    """
+    Stratify the first draw of named RNG streams into equal-probability strata.
+
+    Replications cycle through every combination of strata, so a ``num_reps``
+    that is a multiple of ``num_cells`` gives proportional allocation. Every
+    stratum needs two replications for a within-stratum variance, so runs (and
+    stopping-rule chunks) need at least ``2 * num_cells`` replications.
+
+    Attributes:
+        strata: Stream name -> number of strata for its first draw.
+    """
+
+    strata: Mapping[str, int]
+    name: str = field(default="stratified", init=False)
+    transforms_draws: bool = field(default=True, init=False)
+    requires_named_streams: bool = field(default=True, init=False)
+
+    def __post_init__(self) -> None:
+        if not self.strata:
+            raise SimulationConfigurationError("stratified designs need strata")
+        if any(count < 1 for count in self.strata.values()):
+            raise SimulationConfigurationError(
+                "each stratified stream needs at least one stratum"
+            )
+
+    @property
+    def num_cells(self) -> int:
+        return math.prod(self.strata.values())
+
+    def validate(self, num_reps: int) -> None:
+        if num_reps < 2 * self.num_cells:
+            raise SimulationConfigurationError(
+                f"stratified design needs at least {2 * self.num_cells} reps "
+                "to observe every stratum twice"
+            )
+
+    def point(self, rep_number: int) -> DesignPoint:
+        cell = (rep_number - 1) % self.num_cells
+        assignments = []
+        for stream_name, num_strata in self.strata.items():
+            cell, index = divmod(cell, num_strata)
+            assignments.append((stream_name, index, num_strata))
+        return DesignPoint(group=rep_number, strata=tuple(assignments))
+
+
+class DesignEstimator:
+    """
+    Streaming estimator of a metric's mean under a replication design.
+
+    Feed it ``push(rep_number, value)`` for each finished replication.
+    Antithetic pairs with a missing partner (e.g. a failed replication) and
+    unobserved strata are left out of the estimate. Until every observed
+    stratum has two values its variance is unknown, so ``stderr`` is ``inf``.
+    """
+
+    def __init__(self, design: ReplicationDesign) -> None:
+        self._design = design
+        self._stats = RunningStats()
+        self._pending: Dict[int, float] = {}
+        self._strata: Dict[Tuple[int, ...], RunningStats] = {}
+
+    # ==============================
+    # Getters
+    # ==============================
+    @property
+    def count(self) -> int:
+        """Number of replications contributing to the estimate."""
+        if isinstance(self._design, StratifiedDesign):
+            return sum(stats.count for stats in self._strata.values())
+        if isinstance(self._design, AntitheticDesign):
+            return 2 * self._stats.count
+        return self._stats.count
+
+    @property
+    def estimate(self) -> float:
+        if isinstance(self._design, StratifiedDesign):
+            if not self._strata:
+                return 0.0
+            weight = 1.0 / len(self._strata)
+            return sum(weight * stats.mean for stats in self._strata.values())
+        return self._stats.mean
+
+    @property
+    def stderr(self) -> float:
+        if isinstance(self._design, StratifiedDesign):
+            if not self._strata:
+                return 0.0
+            if any(stats.count < 2 for stats in self._strata.values()):
+                return math.inf
+            weight = 1.0 / len(self._strata)
+            return math.sqrt(
+                sum(
+                    weight * weight * stats.variance / stats.count
+                    for stats in self._strata.values()
+                )
+            )
+        return self._stats.stderr
+
+    # ==============================
+    # Accumulation
+    # ==============================
+    def push(self, rep_number: int, value: float) -> None:
+        point = self._design.point(rep_number)
+        if isinstance(self._design, StratifiedDesign):
+            key = point.stratum_key
+            if key not in self._strata:
+                self._strata[key] = RunningStats()
+            self._strata[key].push(value)
+        elif isinstance(self._design, AntitheticDesign):
+            partner = self._pending.pop(point.group, None)
+            if partner is None:
+                self._pending[point.group] = value
+            else:
+                self._stats.push((partner + value) / 2.0)
+        else:
+            self._stats.push(value)
+
+    def merge(self, other: "DesignEstimator") -> None:
+        self._stats.merge(other._stats)
+        for group, value in other._pending.items():
+            partner = self._pending.pop(group, None)
+            if partner is None:
+                self._pending[group] = value
+            else:
+                self._stats.push((partner + value) / 2.0)
+        for key, stats in other._strata.items():
+            if key not in self._strata:
+                self._strata[key] = RunningStats()
+            self._strata[key].merge(stats)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "estimate": self.estimate,
+            "stderr": self.stderr,
+            "num_reps": self.count,
+        }
@@ -0,0 +1,133 @@
+"""Prebuilt discrete distributions for constant-time weighted sampling.
+
+Models that draw from the same weighted outcomes on every call should build a
+``Distribution`` once and pass it to ``RNG.choice`` instead of re-sending the
+weight vector, which makes the RNG recompute cumulative sums on every draw.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, List, Mapping, Sequence, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Distribution(Generic[T]):
+    """
+    Immutable discrete distribution sampled in O(1) with Vose's alias method.
+
+    Building the table is O(n); every sample then costs one uniform draw, one
+    index and one comparison regardless of the number of outcomes.
+
+    Usage:
+        play_types = Distribution([PlayTypeEnum.RUN, PlayTypeEnum.PASS], [0.6, 0.4])
+        play_type = rng.choice(play_types)
+
+        yards = Distribution.int_range(-2, 12, weights=empirical_counts)
+        gained = rng.choice(yards)
+    """
+
+    def __init__(self, outcomes: Sequence[T], weights: Sequence[float]) -> None:
+        if not outcomes:
+            raise ValueError("A distribution needs at least one outcome")
+        if len(outcomes) != len(weights):
+            raise ValueError("The number of weights does not match the outcomes")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Distribution weights must be non-negative")
+        total = float(sum(weights))
+        if total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+
+        self._outcomes: Tuple[T, ...] = tuple(outcomes)
+        self._probabilities: Tuple[float, ...] = tuple(w / total for w in weights)
+        self._size = len(self._outcomes)
+        self._prob, self._alias = self._build_alias_table(self._probabilities)
+
+    @classmethod
+    def int_range(
+        cls, low: int, high: int, weights: Sequence[float] | None = None
+    ) -> "Distribution[int]":
+        """
+        Build a distribution over the integers ``low..high`` inclusive.
+
+        Args:
+            low: Smallest outcome.
+            high: Largest outcome.
+            weights: One weight per integer in the range; uniform when None.
+        """
+        if high < low:
+            raise ValueError(f"empty integer range {low}..{high}")
+        outcomes = list(range(low, high + 1))
+        if weights is None:
+            weights = [1.0] * len(outcomes)
+        return Distribution(outcomes, weights)
+
+    @classmethod
+    def from_histogram(cls, histogram: Mapping[T, float]) -> "Distribution[T]":
+        """Build a distribution from an outcome -> weight (or count) mapping."""
+        return cls(list(histogram.keys()), list(histogram.values()))
+
+    @staticmethod
+    def _build_alias_table(
+        probabilities: Sequence[float],
+    ) -> Tuple[List[float], List[int]]:
+        size = len(probabilities)
+        scaled = [p * size for p in probabilities]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever remains is 1.0 up to floating-point error; prob stays 1.0.
+        return prob, alias
+
+    # ==============================
+    # Getters
+    # ==============================
+    @property
+    def outcomes(self) -> Tuple[T, ...]:
+        return self._outcomes
+
+    @property
+    def probabilities(self) -> Tuple[float, ...]:
+        """Normalized probability of each outcome, in outcome order."""
+        return self._probabilities
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        pairs = ", ".join(
+            f"{outcome!r}: {p:.4g}"
+            for outcome, p in zip(self._outcomes, self._probabilities)
+        )
+        return f"Distribution({{{pairs}}})"
+
+    # ==============================
+    # Sampling
+    # ==============================
+    def sample(self, uniform: float) -> T:
+        """
+        Map one uniform draw in ``[0, 1)`` to an outcome.
+
+        The integer part of ``uniform * n`` picks the alias-table column and the
+        fractional part decides between the column and its alias.
+        """
+        scaled = uniform * self._size
+        column = int(scaled)
+        if column >= self._size:
+            column = self._size - 1
+        if scaled - column < self._prob[column]:
+            return self._outcomes[column]
+        return self._outcomes[self._alias[column]]
@@ -0,0 +1,366 @@
+"""Pluggable replication executors for the generic simulation runner.
+
+Executors decide *where* replications run (inline, on a thread pool, or on a
+process pool) while the runner keeps ownership of seeding, result ordering and
+observer notifications. Every executor yields outcomes in submission order so
+that aggregated results are identical regardless of the execution backend.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+import logging
+import multiprocessing
+from multiprocessing.context import BaseContext
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Generator,
+    Generic,
+    Iterator,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+from .exceptions import SimulationConfigurationError
+from .factory import SimulationFactory
+from .rng import RNGConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+TResult = TypeVar("TResult")
+
+ReplicationTask = tuple[int, int]
+"""A ``(rep_number, seed)`` pair describing one replication."""
+
+SubmitCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class ReplicationOutcome(Generic[TResult]):
+    """Result envelope for one executed replication.
+
+    Exactly one of ``result`` or ``error`` is populated. Errors are carried back
+    to the caller instead of being raised so the runner can notify observers in
+    the parent process before failing the batch.
+    """
+
+    rep_number: int
+    seed: int
+    duration_seconds: float
+    result: TResult | None = None
+    error: Exception | None = None
+
+
+OutcomeStream = Generator[ReplicationOutcome[TResult], None, None]
+"""Outcomes of one batch, yielded in task order."""
+
+BatchRunner = Callable[
+    [Sequence[ReplicationTask], SubmitCallback | None, RNGConfig | None],
+    OutcomeStream[TResult],
+]
+
+
+def run_replication(
+    simulation_factory: SimulationFactory[TResult],
+    rep_number: int,
+    seed: int,
+    rng_config: RNGConfig | None = None,
+) -> ReplicationOutcome[TResult]:
+    """Build and run one replication with an explicit seed and RNG config."""
+    logger.debug("Running replication %s with seed=%s", rep_number, seed)
+    rep_start = time.time()
+    try:
+        rng = (rng_config or RNGConfig()).create(seed, rep_number)
+        simulation = simulation_factory(rep_number, rng)
+        result = simulation.run()
+    except Exception as exc:
+        logger.exception("Replication %s failed with seed=%s", rep_number, seed)
+        return ReplicationOutcome(
+            rep_number=rep_number,
+            seed=seed,
+            duration_seconds=time.time() - rep_start,
+            error=exc,
+        )
+
+    rep_elapsed = time.time() - rep_start
+    logger.debug("Replication %s complete in %.3fs", rep_number, rep_elapsed)
+    return ReplicationOutcome(
+        rep_number=rep_number,
+        seed=seed,
+        duration_seconds=rep_elapsed,
+        result=result,
+    )
+
+
+class ReplicationSession(Generic[TResult]):
+    """
+    Executes batches of replications for one factory on a shared backend.
+
+    Opened with ``ReplicationExecutor.session``. Pool-backed executors keep
+    one pool (and, for processes, one copy of the factory per worker) for
+    the whole session, so a runner that submits replications in several
+    chunks pays the worker start-up cost once.
+    """
+
+    def __init__(self, run_batch: BatchRunner[TResult]) -> None:
+        self._run_batch = run_batch
+
+    def execute(
+        self,
+        tasks: Sequence[ReplicationTask],
+        on_submit: SubmitCallback | None = None,
+        rng_config: RNGConfig | None = None,
+    ) -> OutcomeStream[TResult]:
+        """Execute ``tasks`` and yield outcomes in task order."""
+        return self._run_batch(tasks, on_submit, rng_config)
+
+
+class ReplicationExecutor(Protocol):
+    """Strategy for executing a sequence of replications."""
+
+    def session(
+        self, simulation_factory: SimulationFactory[TResult]
+    ) -> ContextManager[ReplicationSession[TResult]]:
+        """Open a session that runs any number of batches for one factory."""
+        ...
+
+    def execute(
+        self,
+        simulation_factory: SimulationFactory[TResult],
+        tasks: Sequence[ReplicationTask],
+        on_submit: SubmitCallback | None = None,
+        rng_config: RNGConfig | None = None,
+    ) -> Generator[ReplicationOutcome[TResult], None, None]:
+        """
+        Execute ``tasks`` and yield outcomes in task order.
+
+        Args:
+            simulation_factory: Factory used to build each replication.
+            tasks: ``(rep_number, seed)`` pairs to execute.
+            on_submit: Called in the calling process right before a task is
+                started or handed to a worker.
+            rng_config: How each replication's root RNG is built; defaults
+                to ``RNGConfig()``.
+        """
+        ...
+
+
+class SerialExecutor:
+    """Run replications one after another in the calling thread."""
+
+    def execute(
+        self,
+        simulation_factory: SimulationFactory[TResult],
+        tasks: Sequence[ReplicationTask],
+        on_submit: SubmitCallback | None = None,
+        rng_config: RNGConfig | None = None,
+    ) -> Generator[ReplicationOutcome[TResult], None, None]:
+        for rep_number, seed in tasks:
+            if on_submit is not None:
+                on_submit(rep_number, seed)
+            yield run_replication(simulation_factory, rep_number, seed, rng_config)
+
+    @contextmanager
+    def session(
+        self, simulation_factory: SimulationFactory[TResult]
+    ) -> Iterator[ReplicationSession[TResult]]:
+        def run_batch(
+            tasks: Sequence[ReplicationTask],
+            on_submit: SubmitCallback | None,
+            rng_config: RNGConfig | None,
+        ) -> OutcomeStream[TResult]:
+            return self.execute(simulation_factory, tasks, on_submit, rng_config)
+
+        yield ReplicationSession(run_batch)
+
+
+# Factory installed once per worker process by the pool initializer so it is
+# pickled once per worker rather than once per replication.
+_worker_factory: SimulationFactory[Any] | None = None
+
+
+def _init_process_worker(simulation_factory: SimulationFactory[Any]) -> None:
+    global _worker_factory
+    _worker_factory = simulation_factory
+
+
+def _run_in_process_worker(
+    rep_number: int, seed: int, rng_config: RNGConfig | None
+) -> ReplicationOutcome[Any]:
+    assert _worker_factory is not None, "process worker was not initialized"
+    return run_replication(_worker_factory, rep_number, seed, rng_config)
+
+
+class _PoolExecutor(ABC):
+    """Shared windowed-submission logic for concurrent.futures backends."""
+
+    def __init__(self, workers: int | None = None, max_in_flight: int | None = None):
+        if workers is not None and workers < 1:
+            raise SimulationConfigurationError("workers must be greater than 0")
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        # Bound outstanding submissions so observers see a rolling window of
+        # active replications instead of every replication starting at once.
+        self.max_in_flight = (
+            max_in_flight if max_in_flight is not None else self.workers * 2
+        )
+        if self.max_in_flight < 1:
+            raise SimulationConfigurationError("max_in_flight must be greater than 0")
+
+    @abstractmethod
+    def _create_pool(self, simulation_factory: SimulationFactory[TResult]) -> Executor:
+        """Create the pool shared by every batch of one session."""
+        ...
+
+    @abstractmethod
+    def _submit(
+        self,
+        pool: Executor,
+        simulation_factory: SimulationFactory[TResult],
+        rep_number: int,
+        seed: int,
+        rng_config: RNGConfig | None,
+    ) -> Future[ReplicationOutcome[TResult]]:
+        """Submit one replication to ``pool``."""
+        ...
+
+    def execute(
+        self,
+        simulation_factory: SimulationFactory[TResult],
+        tasks: Sequence[ReplicationTask],
+        on_submit: SubmitCallback | None = None,
+        rng_config: RNGConfig | None = None,
+    ) -> Generator[ReplicationOutcome[TResult], None, None]:
+        with self.session(simulation_factory) as session:
+            yield from session.execute(tasks, on_submit, rng_config)
+
+    @contextmanager
+    def session(
+        self, simulation_factory: SimulationFactory[TResult]
+    ) -> Iterator[ReplicationSession[TResult]]:
+        pool = self._create_pool(simulation_factory)
+        try:
+
+            def run_batch(
+                tasks: Sequence[ReplicationTask],
+                on_submit: SubmitCallback | None,
+                rng_config: RNGConfig | None,
+            ) -> OutcomeStream[TResult]:
+                return self._run_batch(
+                    pool, simulation_factory, tasks, on_submit, rng_config
+                )
+
+            yield ReplicationSession(run_batch)
+        finally:
+            # Cancel queued work if the consumer stops early (e.g. on failure).
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run_batch(
+        self,
+        pool: Executor,
+        simulation_factory: SimulationFactory[TResult],
+        tasks: Sequence[ReplicationTask],
+        on_submit: SubmitCallback | None,
+        rng_config: RNGConfig | None,
+    ) -> OutcomeStream[TResult]:
+        pending: Deque[Future[ReplicationOutcome[TResult]]] = deque()
+        task_iter = iter(tasks)
+
+        def submit_next() -> bool:
+            task = next(task_iter, None)
+            if task is None:
+                return False
+            rep_number, seed = task
+            if on_submit is not None:
+                on_submit(rep_number, seed)
+            pending.append(
+                self._submit(pool, simulation_factory, rep_number, seed, rng_config)
+            )
+            return True
+
+        try:
+            while len(pending) < self.max_in_flight and submit_next():
+                pass
+
+            while pending:
+                outcome = pending.popleft().result()
+                submit_next()
+                yield outcome
+        finally:
+            # The pool outlives this batch; drop work the consumer abandoned.
+            for future in pending:
+                future.cancel()
+
+
+class ThreadPoolReplicationExecutor(_PoolExecutor):
+    """Run replications on a thread pool.
+
+    Useful when simulations release the GIL or are I/O bound; CPU-bound pure
+    Python simulations should prefer :class:`ProcessPoolReplicationExecutor`.
+    """
+
+    def _create_pool(self, simulation_factory: SimulationFactory[TResult]) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _submit(
+        self,
+        pool: Executor,
+        simulation_factory: SimulationFactory[TResult],
+        rep_number: int,
+        seed: int,
+        rng_config: RNGConfig | None,
+    ) -> Future[ReplicationOutcome[TResult]]:
+        return pool.submit(
+            run_replication, simulation_factory, rep_number, seed, rng_config
+        )
+
+
+class ProcessPoolReplicationExecutor(_PoolExecutor):
+    """Run replications on a process pool.
+
+    The simulation factory and each replication result must be picklable. The
+    factory is shipped to each worker once via the pool initializer.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        super().__init__(workers=workers, max_in_flight=max_in_flight)
+        self.mp_context = mp_context
+
+    def _create_pool(self, simulation_factory: SimulationFactory[TResult]) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self.mp_context or multiprocessing.get_context(),
+            initializer=_init_process_worker,
+            initargs=(simulation_factory,),
+        )
+
+    def _submit(
+        self,
+        pool: Executor,
+        simulation_factory: SimulationFactory[TResult],
+        rep_number: int,
+        seed: int,
+        rng_config: RNGConfig | None,
+    ) -> Future[ReplicationOutcome[TResult]]:
+        return pool.submit(_run_in_process_worker, rep_number, seed, rng_config)
@@ -5,15 +5,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, Protocol, Sequence, TypeVar, runtime_checkable
 
+from .stopping import StoppingReport
+
 
 TRunResult = TypeVar("TRunResult")
 TAggregate = TypeVar("TAggregate")
 TOutput = TypeVar("TOutput", contravariant=True)
+TReplicationResult = TypeVar("TReplicationResult", contravariant=True)
 
 
 @dataclass(frozen=True)
 class SimulationOutput(Generic[TRunResult, TAggregate]):
-    """Canonical batch output for repeated simulation runs."""
+    """Canonical batch output for repeated simulation runs.
+
+    ``num_reps`` is the number of replications actually run; ``stopping`` is
+    set when a stopping rule ended the batch.
+    """
 
     schema_version: str
     num_reps: int
@@ -21,6 +28,7 @@ class SimulationOutput(Generic[TRunResult, TAggregate]):
     elapsed_time: float
     runs: Sequence[TRunResult]
     aggregate: TAggregate
+    stopping: StoppingReport | None = None
 
 
 @runtime_checkable
@@ -30,3 +38,18 @@ class OutputSink(Protocol[TOutput]):
     def write(self, output: TOutput) -> None:
         """Persist or emit the given output payload."""
         ...
+
+
+@runtime_checkable
+class ReplicationSink(Protocol[TReplicationResult]):
+    """Per-replication sink invoked as each replication completes.
+
+    Lets consumers persist or project results incrementally so the runner does
+    not have to retain every result until the batch finishes.
+    """
+
+    def write_replication(
+        self, rep_number: int, seed: int, result: TReplicationResult
+    ) -> None:
+        """Persist or emit one replication result."""
+        ...
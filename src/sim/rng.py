@@ -1,8 +1,22 @@
-from typing import Sequence, TypeVar
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass
+import hashlib
+from itertools import accumulate
+from typing import Any, Callable, Dict, Protocol, Sequence, Tuple, TypeVar
 import random
 import logging
 import time
 
+from .design import DesignPoint, IndependentDesign, ReplicationDesign
+from .distribution import Distribution
+from .exceptions import SimulationConfigurationError
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -10,19 +24,215 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class RNGBackend(Protocol):
+    """Source of random draws behind the RNG interface."""
+
+    def random(self) -> float: ...
+
+    def randint(self, a: int, b: int) -> int: ...
+
+    def choice(self, seq: Sequence[T], weights: Sequence[float] | None = None) -> T: ...
+
+
+class PythonRandomBackend:
+    """Default backend built on Python's ``random.Random`` (Mersenne Twister)."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+
+    def random(self) -> float:
+        return self._rng.random()
+
+    def randint(self, a: int, b: int) -> int:
+        return self._rng.randint(a, b)
+
+    def choice(self, seq: Sequence[T], weights: Sequence[float] | None = None) -> T:
+        if weights is not None:
+            return self._rng.choices(seq, weights=weights, k=1)[0]
+        return self._rng.choice(seq)
+
+
+class _UniformDrawMixin(ABC):
+    """``randint`` and ``choice`` that each consume exactly one ``random()``."""
+
+    @abstractmethod
+    def random(self) -> float: ...
+
+    def randint(self, a: int, b: int) -> int:
+        if b < a:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq: Sequence[T], weights: Sequence[float] | None = None) -> T:
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        if weights is None:
+            return seq[int(self.random() * len(seq))]
+
+        cum_weights = list(accumulate(weights))
+        if len(cum_weights) != len(seq):
+            raise ValueError("The number of weights does not match the population")
+        total = cum_weights[-1]
+        if total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        index = bisect_right(cum_weights, self.random() * total)
+        return seq[min(index, len(seq) - 1)]
+
+
+class NumpyBlockBackend(_UniformDrawMixin):
+    """
+    Backend that serves every draw from pre-drawn blocks of NumPy uniforms.
+
+    Uniforms are generated ``block_size`` at a time by a NumPy ``Generator``
+    (PCG64 or Philox) and converted to a Python list, so each ``random()`` is a
+    list iterator step rather than a generator call. ``randint`` and ``choice`` each
+    consume exactly one uniform, so a seed fully determines every draw
+    regardless of which methods are called. Sequences differ from the
+    ``python`` backend for the same seed.
+    """
+
+    BIT_GENERATORS = ("pcg64", "philox")
+
+    def __init__(
+        self, seed: int, block_size: int = 4096, bit_generator: str = "pcg64"
+    ) -> None:
+        if np is None:
+            raise SimulationConfigurationError(
+                "The 'numpy' RNG backend requires numpy to be installed."
+            )
+        if block_size < 1:
+            raise SimulationConfigurationError("block_size must be greater than 0")
+        if bit_generator == "pcg64":
+            bit_gen: Any = np.random.PCG64(seed)
+        elif bit_generator == "philox":
+            bit_gen = np.random.Philox(seed)
+        else:
+            raise SimulationConfigurationError(
+                f"Unknown bit generator '{bit_generator}'; "
+                f"expected one of {self.BIT_GENERATORS}"
+            )
+        self._generator = np.random.Generator(bit_gen)
+        self._block_size = block_size
+        self._next_uniform: Callable[[], float] = iter(()).__next__
+
+    def _refill(self) -> float:
+        block = self._generator.random(self._block_size).tolist()
+        self._next_uniform = iter(block).__next__
+        return self._next_uniform()
+
+    def random(self) -> float:
+        # Iterating a list is cheaper than indexing it with a tracked cursor.
+        try:
+            return self._next_uniform()
+        except StopIteration:
+            return self._refill()
+
+
+RNG_BACKENDS: Dict[str, Callable[[int], RNGBackend]] = {
+    "python": PythonRandomBackend,
+    "numpy": NumpyBlockBackend,
+}
+
+
+# Largest float below 1.0, so mirrored draws stay in [0, 1).
+_BELOW_ONE = 1.0 - 2.0**-53
+
+
+class UniformTransformBackend(_UniformDrawMixin):
+    """
+    Wrap a backend so every draw is derived from its uniforms, transformed.
+
+    Used by replication designs (see ``sim.design``): ``antithetic`` mirrors
+    each uniform as ``1 - u``, and ``stratum=(k, n)`` confines the first
+    uniform to ``[k / n, (k + 1) / n)``. ``randint`` and ``choice`` map one
+    uniform each, so a plain and an antithetic replication sharing a seed see
+    mirrored outcomes.
+    """
+
+    def __init__(
+        self,
+        inner: RNGBackend,
+        antithetic: bool = False,
+        stratum: Tuple[int, int] | None = None,
+    ) -> None:
+        self._inner = inner
+        self._antithetic = antithetic
+        self._stratum = stratum
+
+    def random(self) -> float:
+        u = self._inner.random()
+        if self._stratum is not None:
+            index, num_strata = self._stratum
+            u = (index + u) / num_strata
+            self._stratum = None
+        if self._antithetic:
+            u = 1.0 - u
+            if u >= 1.0:
+                u = _BELOW_ONE
+        return u
+
+
+def derive_seed(parent_seed: int, name: str) -> int:
+    """
+    Derive a child seed from a parent seed and a stream name.
+
+    The derivation hashes the pair, so children are stable across processes
+    and Python versions and statistically independent of their siblings.
+    """
+    digest = hashlib.blake2b(
+        f"{parent_seed}/{name}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big")
+
+
 class RNG:
     """
     Random Number Generator wrapper class. Uses Python's built-in random module
     to generate random numbers with an optional seed for reproducibility.
+
+    Pass ``backend="numpy"`` to serve draws from a block-buffered NumPy
+    generator instead (see NumpyBlockBackend); both are deterministic per seed.
+
+    With ``named_streams=True``, ``stream(name)`` hands each model or decision
+    point its own child RNG derived from this seed and the name, so a model
+    that draws more (or fewer) numbers no longer shifts every other model's
+    draws. Experiment arms that share a seed then share the noise of every
+    unchanged model (common random numbers).
+
+    A ``design_point`` (see ``sim.design``) derives every draw from the
+    backend's uniforms, mirrored for antithetic replications; ``stratum``
+    confines this RNG's first draw to one stratum. Substreams inherit the
+    design point and pick up the stratum assigned to their name.
     """
 
-    def __init__(self, seed: int | None = None) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        backend: str = "python",
+        named_streams: bool = False,
+        design_point: DesignPoint | None = None,
+        stratum: Tuple[int, int] | None = None,
+    ) -> None:
         if seed is None:
             seed = int(time.time_ns() & 0xFFFFFFFF)
             logger.debug(f"RNG initialized with generated seed={seed}")
 
+        backend_factory = RNG_BACKENDS.get(backend)
+        if backend_factory is None:
+            raise SimulationConfigurationError(
+                f"Unknown RNG backend '{backend}'; expected one of {sorted(RNG_BACKENDS)}"
+            )
+
         self._seed = seed
-        self._rng = random.Random(seed)
+        self._backend_name = backend
+        self._named_streams = named_streams
+        self._design_point = design_point
+        self._streams: Dict[str, "RNG"] = {}
+        self._rng: RNGBackend = backend_factory(seed)
+        if design_point is not None:
+            self._rng = UniformTransformBackend(
+                self._rng, antithetic=design_point.antithetic, stratum=stratum
+            )
 
     # ===============================
     # Getters
@@ -31,6 +241,56 @@ class RNG:
     def seed(self) -> int:
         return self._seed
 
+    @property
+    def backend(self) -> str:
+        return self._backend_name
+
+    @property
+    def named_streams(self) -> bool:
+        return self._named_streams
+
+    @property
+    def design_point(self) -> DesignPoint | None:
+        return self._design_point
+
+    # ===============================
+    # Substreams
+    # ===============================
+    def substream(self, name: str) -> "RNG":
+        """
+        Return the independent child RNG for ``name``, creating it on first use.
+
+        Children are cached, seeded with ``derive_seed(self.seed, name)`` and
+        share this RNG's backend, so ``rng.substream("a").substream("b")``
+        forms a reproducible hierarchy.
+        """
+        child = self._streams.get(name)
+        if child is None:
+            child = RNG(
+                derive_seed(self._seed, name),
+                backend=self._backend_name,
+                named_streams=self._named_streams,
+                design_point=self._design_point,
+                stratum=(
+                    self._design_point.stratum_for(name)
+                    if self._design_point is not None
+                    else None
+                ),
+            )
+            self._streams[name] = child
+        return child
+
+    def stream(self, name: str) -> "RNG":
+        """
+        Return the RNG a named model or decision point should draw from.
+
+        This is ``substream(name)`` when named streams are enabled and this
+        shared RNG otherwise, so callers can always ask for their stream.
+        """
+        if self._named_streams:
+            return self.substream(name)
+        return self
+
     # ===============================
     # Random Methods
     # ===============================
@@ -40,7 +300,56 @@ class RNG:
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
 
-    def choice(self, seq: Sequence[T], weights: Sequence[float] | None = None) -> T:
-        if weights is not None:
-            return self._rng.choices(seq, weights=weights, k=1)[0]
-        return self._rng.choice(seq)
+    def choice(
+        self,
+        seq: Sequence[T] | Distribution[T],
+        weights: Sequence[float] | None = None,
+    ) -> T:
+        """
+        Choose one element of ``seq``, optionally weighted.
+
+        ``seq`` may also be a prebuilt ``Distribution``, which is sampled in
+        constant time from a single ``random()`` draw; ``weights`` must then
+        be omitted.
+        """
+        if isinstance(seq, Distribution):
+            if weights is not None:
+                raise ValueError("weights cannot be combined with a Distribution")
+            return seq.sample(self._rng.random())
+        return self._rng.choice(seq, weights)
+
+
+@dataclass(frozen=True)
+class RNGConfig:
+    """
+    How each replication's root RNG is built from its seed.
+
+    Attributes:
+        backend: Name of the RNG backend (see ``RNG_BACKENDS``).
+        named_streams: Give each named model/decision point its own substream.
+        design: Replication design supplying each replication's design point.
+    """
+
+    backend: str = "python"
+    named_streams: bool = False
+    design: ReplicationDesign = IndependentDesign()
+
+    def __post_init__(self) -> None:
+        if self.backend not in RNG_BACKENDS:
+            raise SimulationConfigurationError(
+                f"Unknown RNG backend '{self.backend}'; "
+                f"expected one of {sorted(RNG_BACKENDS)}"
+            )
+
+    def create(self, seed: int, rep_number: int | None = None) -> RNG:
+        design_point = (
+            self.design.point(rep_number)
+            if rep_number is not None and self.design.transforms_draws
+            else None
+        )
+        return RNG(
+            seed,
+            backend=self.backend,
+            named_streams=self.named_streams,
+            design_point=design_point,
+        )
@@ -6,20 +6,30 @@ progression while delegating domain behavior to user-provided callables.
 
 from __future__ import annotations
 
+from contextlib import closing
 from dataclasses import dataclass
 import logging
 import time
-from typing import Callable, Generic, List, Sequence, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Mapping, Sequence, TypeVar
 
+from .aggregator import Aggregator, ListAggregator
 from .exceptions import (
     OutputSinkError,
     SimulationConfigurationError,
     SimulationExecutionError,
 )
+from .executor import (
+    ReplicationExecutor,
+    ReplicationOutcome,
+    ReplicationSession,
+    SerialExecutor,
+)
 from .factory import SimulationFactory
 from .observer import SimulationObserver
-from .output import OutputSink, SimulationOutput
-from .rng import RNG
+from .output import OutputSink, ReplicationSink, SimulationOutput
+from .design import IndependentDesign, ReplicationDesign
+from .rng import RNGConfig
+from .stopping import StoppingReason, StoppingReport, StoppingRule
 
 
 logger = logging.getLogger(__name__)
@@ -31,11 +41,32 @@ TAggregate = TypeVar("TAggregate")
 
 @dataclass(frozen=True)
 class SimulationRunnerConfig:
-    """Configuration for batch simulation execution."""
+    """Configuration for batch simulation execution.
+
+    Attributes:
+        retain_runs: Keep every replication result in ``SimulationOutput.runs``.
+            Disable for very large batches that only need the aggregate.
+        rng_backend: Name of the ``sim.rng.RNG`` backend every replication
+            draws from (``"python"`` or the block-buffered ``"numpy"``).
+        rng_named_streams: Derive an independent named substream per model or
+            decision point (``RNG.stream``) so unchanged models see identical
+            draws across experiment arms sharing a base seed.
+        design: Replication design (independent, antithetic or stratified).
+            Designs decide each replication's seed and how its draws are
+            transformed; see ``sim.design``.
+        stopping_rule: Run replications in chunks and stop once every
+            precision target is met; ``num_reps`` becomes the replication
+            budget. See ``sim.stopping``.
+    """
 
     num_reps: int
     base_seed: int = 42
     schema_version: str = "1.0"
+    retain_runs: bool = True
+    rng_backend: str = "python"
+    rng_named_streams: bool = False
+    design: ReplicationDesign = IndependentDesign()
+    stopping_rule: StoppingRule | None = None
 
 
 class SimulationRunner(Generic[TResult, TAggregate]):
@@ -45,59 +76,103 @@ class SimulationRunner(Generic[TResult, TAggregate]):
         self,
         config: SimulationRunnerConfig,
         simulation_factory: SimulationFactory[TResult],
-        aggregate_fn: Callable[[List[TResult]], TAggregate],
-        sinks: Sequence[OutputSink[SimulationOutput[TResult, TAggregate]]]
-        | None = None,
+        aggregate_fn: Callable[[List[TResult]], TAggregate] | None = None,
+        sinks: (
+            Sequence[OutputSink[SimulationOutput[TResult, TAggregate]]] | None
+        ) = None,
         observers: Sequence[SimulationObserver[TResult, TAggregate]] | None = None,
+        executor: ReplicationExecutor | None = None,
+        aggregator: Aggregator[TResult, TAggregate] | None = None,
+        replication_sinks: Sequence[ReplicationSink[TResult]] | None = None,
     ) -> None:
         if config.num_reps < 1:
             raise SimulationConfigurationError("num_reps must be greater than 0")
+        if (aggregate_fn is None) == (aggregator is None):
+            raise SimulationConfigurationError(
+                "exactly one of aggregate_fn or aggregator must be provided"
+            )
+
+        config.design.validate(config.num_reps)
+        if config.stopping_rule is not None:
+            # Chunks must keep antithetic pairs/strata whole between checks.
+            config.design.validate(config.stopping_rule.chunk_size)
 
         self.config = config
+        self.rng_config = RNGConfig(
+            backend=config.rng_backend,
+            named_streams=(
+                config.rng_named_streams or config.design.requires_named_streams
+            ),
+            design=config.design,
+        )
         self.simulation_factory = simulation_factory
         self.aggregate_fn = aggregate_fn
+        self.aggregator = aggregator
+        self.replication_sinks = (
+            list(replication_sinks) if replication_sinks is not None else []
+        )
         self.sinks = list(sinks) if sinks is not None else []
         self.observers = list(observers) if observers is not None else []
+        self.executor = executor if executor is not None else SerialExecutor()
 
     def run(self) -> SimulationOutput[TResult, TAggregate]:
         """Run all configured replications and return canonical output."""
         logger.info(
-            "Starting simulation batch: reps=%s base_seed=%s sinks=%s",
+            "Starting simulation batch: reps=%s base_seed=%s sinks=%s executor=%s",
             self.config.num_reps,
             self.config.base_seed,
             len(self.sinks),
+            self.executor.__class__.__name__,
         )
         self._notify_observers("on_run_start", self.config)
         started_at = time.time()
         run_results: List[TResult] = []
+        # A list-based aggregate_fn is adapted to the streaming interface; a
+        # fresh adapter per run keeps repeated run() calls independent.
+        aggregator: Aggregator[TResult, TAggregate] = (
+            self.aggregator
+            if self.aggregator is not None
+            else ListAggregator(self.aggregate_fn)  # type: ignore[arg-type]
+        )
 
-        # Run each replication with a deterministic seed progression
-        # (base_seed + rep_number) to ensure reproducibility and independence
-        # across runs
-        for rep_number in range(1, self.config.num_reps + 1):
-            seed = self.config.base_seed + rep_number
-            run_results.append(self._run_single(rep_number=rep_number, seed=seed))
+        stopping_report: StoppingReport | None = None
+        # One session for the whole batch: stopping-rule chunks reuse the
+        # executor's pool instead of starting new workers per chunk.
+        with self.executor.session(self.simulation_factory) as session:
+            if self.config.stopping_rule is None:
+                self._run_reps(
+                    session, 1, self.config.num_reps, aggregator, run_results
+                )
+                reps_used = self.config.num_reps
+            else:
+                stopping_report = self._run_until_precise(
+                    session,
+                    self.config.stopping_rule,
+                    started_at,
+                    aggregator,
+                    run_results,
+                )
+                reps_used = stopping_report.reps_used
 
         elapsed_time = time.time() - started_at
-        avg_per_rep = (
-            elapsed_time / self.config.num_reps if self.config.num_reps else 0.0
-        )
+        avg_per_rep = elapsed_time / reps_used if reps_used else 0.0
         logger.info(
             "Simulation batch complete in %.3fs (avg %.3fs/rep)",
             elapsed_time,
             avg_per_rep,
         )
 
-        aggregate = self.aggregate_fn(run_results)
+        aggregate = aggregator.finalize()
 
         # Create canonical output object with run results and aggregate summaries
         output = SimulationOutput(
             schema_version=self.config.schema_version,
-            num_reps=self.config.num_reps,
+            num_reps=reps_used,
             base_seed=self.config.base_seed,
             elapsed_time=elapsed_time,
             runs=run_results,
             aggregate=aggregate,
+            stopping=stopping_report,
         )
 
         # Emit output to all configured sinks (DB, JSON, etc.)
@@ -106,33 +181,139 @@ class SimulationRunner(Generic[TResult, TAggregate]):
 
         return output
 
-    def _run_single(self, rep_number: int, seed: int) -> TResult:
-        """Run one replication with an explicit seed."""
-        logger.debug("Running replication %s with seed=%s", rep_number, seed)
+    def _run_reps(
+        self,
+        session: ReplicationSession[TResult],
+        first_rep: int,
+        last_rep: int,
+        aggregator: Aggregator[TResult, TAggregate],
+        run_results: List[TResult],
+    ) -> None:
+        """Execute reps ``first_rep..last_rep`` and fold them into the aggregate."""
+        # Run each replication with a deterministic seed progression
+        # (base_seed + design group; the group is the rep number unless the
+        # design pairs replications) to ensure reproducibility across runs.
+        # Executors yield outcomes in rep order, so results are identical
+        # whether replications run serially or concurrently.
+        tasks = [
+            (
+                rep_number,
+                self.config.base_seed + self.config.design.point(rep_number).group,
+            )
+            for rep_number in range(first_rep, last_rep + 1)
+        ]
+        outcomes = session.execute(
+            tasks,
+            on_submit=self._on_replication_submitted,
+            rng_config=self.rng_config,
+        )
+        with closing(outcomes):
+            for outcome in outcomes:
+                result = self._handle_outcome(outcome)
+                self._emit_replication(outcome.rep_number, outcome.seed, result)
+                aggregator.update(result)
+                if self.config.retain_runs:
+                    run_results.append(result)
+
+    def _run_until_precise(
+        self,
+        session: ReplicationSession[TResult],
+        rule: StoppingRule,
+        started_at: float,
+        aggregator: Aggregator[TResult, TAggregate],
+        run_results: List[TResult],
+    ) -> StoppingReport:
+        """Run chunks of reps until the stopping rule or a budget ends the batch."""
+        max_reps = self.config.num_reps
+        reps_used = 0
+        reason = StoppingReason.MAX_REPS
+        half_widths: Dict[str, float] = {}
+        while reps_used < max_reps:
+            last_rep = min(reps_used + rule.chunk_size, max_reps)
+            self._run_reps(session, reps_used + 1, last_rep, aggregator, run_results)
+            reps_used = last_rep
+
+            if reps_used >= rule.min_reps:
+                half_widths = rule.half_widths(self._metrics(aggregator))
+                logger.debug("Precision after %s reps: %s", reps_used, half_widths)
+                if rule.is_satisfied(half_widths):
+                    reason = StoppingReason.PRECISION
+                    break
+            if (
+                rule.max_seconds is not None
+                and time.time() - started_at >= rule.max_seconds
+            ):
+                reason = StoppingReason.TIME_BUDGET
+                break
+
+        if not half_widths:
+            half_widths = rule.half_widths(self._metrics(aggregator))
+        logger.info(
+            "Stopped after %s/%s reps (%s): half-widths=%s",
+            reps_used,
+            max_reps,
+            reason.value,
+            half_widths,
+        )
+        return StoppingReport(
+            reason=reason,
+            reps_used=reps_used,
+            max_reps=max_reps,
+            confidence=rule.confidence,
+            targets=dict(rule.targets),
+            half_widths=half_widths,
+        )
+
+    @staticmethod
+    def _metrics(aggregator: Aggregator[TResult, TAggregate]) -> Mapping[str, Any]:
+        """Return the current aggregate as the metric mapping stopping rules read."""
+        aggregate = aggregator.finalize()
+        if not isinstance(aggregate, Mapping):
+            raise SimulationConfigurationError(
+                "stopping rules need an aggregate mapping metric names to values, "
+                f"got {type(aggregate).__name__}"
+            )
+        return aggregate
+
+    def _on_replication_submitted(self, rep_number: int, seed: int) -> None:
+        """Notify observers that a replication is about to execute."""
         self._notify_observers("on_replication_start", rep_number, seed)
-        rep_start = time.time()
-
-        try:
-            rng = RNG(seed)
-            simulation = self.simulation_factory(rep_number, rng)
-            result = simulation.run()
-        except Exception as exc:
-            logger.exception("Replication %s failed with seed=%s", rep_number, seed)
-            self._notify_observers("on_replication_failure", rep_number, seed, exc)
+
+    def _handle_outcome(self, outcome: ReplicationOutcome[TResult]) -> TResult:
+        """Notify observers of a finished replication and unwrap its result."""
+        if outcome.error is not None:
+            self._notify_observers(
+                "on_replication_failure",
+                outcome.rep_number,
+                outcome.seed,
+                outcome.error,
+            )
             raise SimulationExecutionError(
-                f"Replication {rep_number} failed for seed={seed}"
-            ) from exc
+                f"Replication {outcome.rep_number} failed for seed={outcome.seed}"
+            ) from outcome.error
 
-        rep_elapsed = time.time() - rep_start
-        logger.debug("Replication %s complete in %.3fs", rep_number, rep_elapsed)
         self._notify_observers(
             "on_replication_success",
-            rep_number,
-            seed,
-            rep_elapsed,
-            result,
+            outcome.rep_number,
+            outcome.seed,
+            outcome.duration_seconds,
+            outcome.result,
         )
-        return result
+        return outcome.result  # type: ignore[return-value]
+
+    def _emit_replication(self, rep_number: int, seed: int, result: TResult) -> None:
+        """Helper to hand one replication result to all replication sinks."""
+        for sink in self.replication_sinks:
+            sink_name = sink.__class__.__name__
+            try:
+                sink.write_replication(rep_number, seed, result)
+            except Exception as exc:
+                logger.exception(
+                    "Failed writing replication %s to sink=%s", rep_number, sink_name
+                )
+                raise OutputSinkError(
+                    f"Failed writing replication {rep_number} to sink={sink_name}"
+                ) from exc
 
     def _emit_to_sinks(self, output: SimulationOutput[TResult, TAggregate]) -> None:
         """Helper to emit output to all configured sinks."""
@@ -0,0 +1,111 @@
+"""Sequential stopping rules for simulation batches.
+
+A ``StoppingRule`` lets ``SimulationRunner`` run replications in chunks and
+stop as soon as every target metric's confidence-interval half-width is below
+its target, instead of always running a fixed ``num_reps``. ``num_reps`` then
+acts as the replication budget, and ``max_seconds`` optionally caps wall time.
+
+Aggregates must be mappings exposing ``<metric>_stderr`` for every targeted
+metric (as pylon's ``GameResultAggregator`` does). A metric missing from the
+aggregate, e.g. because every replication so far failed, counts as not yet
+estimated and keeps the batch running.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+import math
+from statistics import NormalDist
+from typing import Any, Dict, Mapping
+
+from .exceptions import SimulationConfigurationError
+
+
+class StoppingReason(Enum):
+    """Why a sequentially stopped batch ended."""
+
+    PRECISION = "precision"
+    MAX_REPS = "max_reps"
+    TIME_BUDGET = "time_budget"
+
+
+@dataclass(frozen=True)
+class StoppingRule:
+    """
+    Run replications in chunks until every precision target is met.
+
+    Attributes:
+        targets: Metric name -> maximum confidence-interval half-width, e.g.
+            ``{"home_win_pct": 0.02, "margin": 1.0}``.
+        chunk_size: Replications run between precision checks.
+        min_reps: Replications to run before the first precision check, so a
+            handful of identical outcomes cannot stop the batch.
+        confidence: Two-sided confidence level of the interval.
+        max_seconds: Optional wall-time budget, checked after each chunk.
+    """
+
+    targets: Mapping[str, float]
+    chunk_size: int = 100
+    min_reps: int = 30
+    confidence: float = 0.95
+    max_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if not self.targets:
+            raise SimulationConfigurationError("stopping rule needs targets")
+        if any(half_width <= 0 for half_width in self.targets.values()):
+            raise SimulationConfigurationError(
+                "precision targets must be greater than 0"
+            )
+        if self.chunk_size < 1:
+            raise SimulationConfigurationError("chunk_size must be greater than 0")
+        if not 0.0 < self.confidence < 1.0:
+            raise SimulationConfigurationError("confidence must be between 0 and 1")
+        if self.max_seconds is not None and self.max_seconds <= 0:
+            raise SimulationConfigurationError("max_seconds must be greater than 0")
+
+    @property
+    def z(self) -> float:
+        """Normal critical value for the configured confidence level."""
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2.0)
+
+    def half_widths(self, aggregate: Mapping[str, Any]) -> Dict[str, float]:
+        """
+        Return the current confidence-interval half-width of each target.
+
+        Metrics without a ``<metric>_stderr`` in the aggregate get ``inf``.
+        """
+        z = self.z
+        half_widths: Dict[str, float] = {}
+        for metric in self.targets:
+            stderr = aggregate.get(f"{metric}_stderr")
+            half_widths[metric] = math.inf if stderr is None else z * float(stderr)
+        return half_widths
+
+    def is_satisfied(self, half_widths: Mapping[str, float]) -> bool:
+        return all(
+            half_widths[metric] <= target for metric, target in self.targets.items()
+        )
+
+
+@dataclass(frozen=True)
+class StoppingReport:
+    """Outcome of a sequentially stopped batch."""
+
+    reason: StoppingReason
+    reps_used: int
+    max_reps: int
+    confidence: float
+    targets: Mapping[str, float]
+    half_widths: Mapping[str, float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reason": self.reason.value,
+            "reps_used": self.reps_used,
+            "max_reps": self.max_reps,
+            "confidence": self.confidence,
+            "targets": dict(self.targets),
+            "half_widths": dict(self.half_widths),
+        }
@@ -0,0 +1,430 @@
+"""Unit tests for streaming aggregation of simulation results."""
+
+from concurrent.futures import Executor
+import dataclasses
+import math
+import statistics
+from typing import Any, List
+
+import pytest
+
+from sim.aggregator import RunningStats
+from sim.design import (
+    AntitheticDesign,
+    DesignEstimator,
+    IndependentDesign,
+    StratifiedDesign,
+)
+from sim.exceptions import SimulationConfigurationError
+from sim.executor import ReplicationExecutor, ThreadPoolReplicationExecutor
+from sim.stopping import StoppingReason, StoppingRule
+from sim.rng import RNG
+from sim.runner import SimulationRunner, SimulationRunnerConfig
+from pylon.aggregation import GameResultAggregator
+from pylon.simulation import PylonSimulationResult
+
+
+def _result(
+    home_score: int, away_score: int, status: str = "completed"
+) -> PylonSimulationResult:
+    if home_score > away_score:
+        winner_id: str | None = "home"
+    elif away_score > home_score:
+        winner_id = "away"
+    else:
+        winner_id = None
+    return PylonSimulationResult(
+        game_id="1",
+        seed=1,
+        home_score=home_score,
+        away_score=away_score,
+        winner_id=winner_id,
+        final_quarter=4,
+        duration_seconds=0.5,
+        status=status,
+        total_plays=0,
+        total_drives=0,
+        game_state=None,  # type: ignore[arg-type]
+    )
+
+
+class TestRunningStats:
+    """Tests for RunningStats."""
+
+    def test_matches_statistics_module(self) -> None:
+        """Test running mean/variance match a two-pass computation."""
+        values = [3.0, 17.0, 24.0, 10.0, 31.0, 7.0]
+        stats = RunningStats()
+        for value in values:
+            stats.push(value)
+
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
+        assert stats.min == 3.0
+        assert stats.max == 31.0
+
+    def test_merge_equals_serial(self) -> None:
+        """Test merging partitions matches accumulating serially."""
+        values = [float(v) for v in range(1, 21)]
+        serial = RunningStats()
+        left = RunningStats()
+        right = RunningStats()
+        for i, value in enumerate(values):
+            serial.push(value)
+            (left if i % 3 else right).push(value)
+
+        left.merge(right)
+        left.merge(RunningStats())
+
+        assert left.count == serial.count
+        assert left.mean == pytest.approx(serial.mean)
+        assert left.variance == pytest.approx(serial.variance)
+
+
+class TestGameResultAggregator:
+    """Tests for GameResultAggregator."""
+
+    def test_finalize_counts_and_moments(self) -> None:
+        """Test win counts and score statistics over completed games."""
+        aggregator = GameResultAggregator(home_team_id="home", away_team_id="away")
+        for result in [_result(24, 17), _result(10, 13), _result(20, 20)]:
+            aggregator.update(result)
+        aggregator.update(_result(0, 0, status="failed"))
+
+        aggregate = aggregator.finalize()
+
+        assert aggregate["home_wins"] == 1
+        assert aggregate["away_wins"] == 1
+        assert aggregate["ties"] == 1
+        assert aggregate["failed_reps"] == 1
+        assert aggregate["completed_reps"] == 3
+        assert aggregate["avg_home_score"] == pytest.approx(18.0)
+        assert aggregate["avg_margin"] == pytest.approx(4 / 3)
+        assert aggregate["std_home_score"] == pytest.approx(
+            statistics.stdev([24, 10, 20])
+        )
+
+    def test_merge_partials(self) -> None:
+        """Test merged partial aggregates equal a single aggregate."""
+        results = [_result(h, a) for h, a in [(7, 3), (14, 21), (3, 3), (28, 0)]]
+        whole = GameResultAggregator("home", "away")
+        part_a = GameResultAggregator("home", "away")
+        part_b = GameResultAggregator("home", "away")
+        for i, result in enumerate(results):
+            whole.update(result)
+            (part_a if i < 2 else part_b).update(result)
+
+        part_a.merge(part_b)
+
+        assert part_a.finalize() == pytest.approx(whole.finalize())
+
+    def test_empty_aggregate(self) -> None:
+        """Test an aggregator with no results finalizes to an empty dict."""
+        assert GameResultAggregator("home", "away").finalize() == {}
+
+    def test_antithetic_design_estimators(self) -> None:
+        """Test design estimators pair results by rep number."""
+        aggregator = GameResultAggregator("home", "away", design=AntitheticDesign())
+        scores = [(21, 14), (10, 17), (24, 3), (7, 7)]
+        for rep_number, (home, away) in enumerate(scores, start=1):
+            aggregator.update(
+                dataclasses.replace(_result(home, away), rep_number=rep_number)
+            )
+
+        aggregate = aggregator.finalize()
+        pair_margins = [(7 + -7) / 2, (21 + 0) / 2]
+
+        assert aggregate["design"] == "antithetic"
+        assert aggregate["margin_estimate"] == pytest.approx(
+            statistics.mean(pair_margins)
+        )
+        assert aggregate["margin_stderr"] == pytest.approx(
+            statistics.stdev(pair_margins) / 2**0.5
+        )
+        assert aggregate["home_win_pct_estimate"] == pytest.approx(0.5)
+
+
+class _ConstantSimulation:
+    def __init__(self, rng: RNG) -> None:
+        self.rng = rng
+
+    def run(self) -> float:
+        return self.rng.random()
+
+
+class TestRunnerAggregation:
+    """Tests for SimulationRunner aggregation modes."""
+
+    def test_retain_runs_disabled(self) -> None:
+        """Test aggregator-only runs keep no per-rep results."""
+        stats = RunningStats()
+
+        class _MeanAggregator:
+            def update(self, result: float) -> None:
+                stats.push(result)
+
+            def merge(self, other: Any) -> None:
+                raise NotImplementedError
+
+            def finalize(self) -> float:
+                return stats.mean
+
+        runner = SimulationRunner[float, float](
+            config=SimulationRunnerConfig(num_reps=5, retain_runs=False),
+            simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+            aggregator=_MeanAggregator(),
+        )
+        output = runner.run()
+
+        assert output.runs == []
+        assert stats.count == 5
+        assert output.aggregate == pytest.approx(stats.mean)
+
+    def test_aggregate_fn_still_supported(self) -> None:
+        """Test the list-based aggregate_fn receives every result in order."""
+        seen: List[List[float]] = []
+
+        def aggregate(results: List[float]) -> int:
+            seen.append(results)
+            return len(results)
+
+        runner = SimulationRunner[float, int](
+            config=SimulationRunnerConfig(num_reps=3),
+            simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+            aggregate_fn=aggregate,
+        )
+        output = runner.run()
+
+        assert output.aggregate == 3
+        assert seen[0] == list(output.runs)
+
+
+class _StreamDrawSimulation:
+    def __init__(self, rng: RNG) -> None:
+        self.rng = rng
+
+    def run(self) -> float:
+        return self.rng.stream("toss").random()
+
+
+class TestReplicationDesigns:
+    """Tests for antithetic and stratified replication designs."""
+
+    def test_design_points(self) -> None:
+        """Test designs map rep numbers to seed groups, mirrors and strata."""
+        antithetic = AntitheticDesign()
+        stratified = StratifiedDesign({"toss": 2, "choice": 3})
+
+        assert [antithetic.point(rep).group for rep in (1, 2, 3, 4)] == [1, 1, 2, 2]
+        assert [antithetic.point(rep).antithetic for rep in (1, 2)] == [False, True]
+        assert IndependentDesign().point(5).group == 5
+        assert stratified.num_cells == 6
+        assert {stratified.point(rep).stratum_key for rep in range(1, 7)} == {
+            (toss, choice) for toss in range(2) for choice in range(3)
+        }
+        assert stratified.point(7).stratum_for("choice") == (0, 3)
+
+    def test_designs_validate_num_reps(self) -> None:
+        """Test designs reject rep counts they cannot balance."""
+        with pytest.raises(SimulationConfigurationError):
+            SimulationRunner[float, float](
+                config=SimulationRunnerConfig(num_reps=3, design=AntitheticDesign()),
+                simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+                aggregate_fn=statistics.mean,
+            )
+        with pytest.raises(SimulationConfigurationError):
+            StratifiedDesign({"toss": 4}).validate(3)
+        with pytest.raises(SimulationConfigurationError, match="every stratum twice"):
+            StratifiedDesign({"toss": 4}).validate(4)
+
+    def test_antithetic_runner_mirrors_pairs(self) -> None:
+        """Test each antithetic pair shares a seed and draws u and 1 - u."""
+        runner = SimulationRunner[float, float](
+            config=SimulationRunnerConfig(num_reps=6, design=AntitheticDesign()),
+            simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+            aggregate_fn=statistics.mean,
+        )
+        runs = list(runner.run().runs)
+
+        for first, second in zip(runs[::2], runs[1::2]):
+            assert first + second == pytest.approx(1.0)
+
+    def test_stratified_runner_covers_strata(self) -> None:
+        """Test stratified reps confine the stream's first draw to its stratum."""
+        design = StratifiedDesign({"toss": 4})
+        runner = SimulationRunner[float, float](
+            config=SimulationRunnerConfig(num_reps=8, design=design),
+            simulation_factory=lambda rep, rng: _StreamDrawSimulation(rng),
+            aggregate_fn=statistics.mean,
+        )
+        runs = list(runner.run().runs)
+
+        for rep_number, value in enumerate(runs, start=1):
+            index, num_strata = design.point(rep_number).stratum_for("toss")  # type: ignore[misc]
+            assert index / num_strata <= value < (index + 1) / num_strata
+
+    def test_stratified_estimator_weights_strata(self) -> None:
+        """Test stratified estimates weight stratum means equally."""
+        design = StratifiedDesign({"toss": 2})
+        estimator = DesignEstimator(design)
+        # Stratum 0 gets reps 1, 3, 5; stratum 1 gets reps 2 and 4.
+        for rep_number, value in zip(range(1, 6), [1.0, 10.0, 3.0, 12.0, 2.0]):
+            estimator.push(rep_number, value)
+
+        assert estimator.count == 5
+        assert estimator.estimate == pytest.approx((2.0 + 11.0) / 2)
+        assert estimator.stderr == pytest.approx(
+            ((1.0 / 3) / 4 + (2.0 / 2) / 4) ** 0.5
+        )
+
+    def test_stratified_stderr_unknown_with_single_observations(self) -> None:
+        """Test a stratum with one value keeps the stderr, and stopping, open."""
+        estimator = DesignEstimator(StratifiedDesign({"toss": 2}))
+        for rep_number, value in zip(range(1, 4), [1.0, 10.0, 3.0]):
+            estimator.push(rep_number, value)
+
+        assert estimator.stderr == math.inf
+        rule = StoppingRule(targets={"toss": 100.0}, chunk_size=4, min_reps=4)
+        assert not rule.is_satisfied(
+            rule.half_widths({"toss_stderr": estimator.stderr})
+        )
+
+        estimator.push(4, 12.0)
+        assert math.isfinite(estimator.stderr)
+
+    def test_estimator_merge_completes_pairs(self) -> None:
+        """Test merging partial antithetic estimators joins split pairs."""
+        whole = DesignEstimator(AntitheticDesign())
+        left = DesignEstimator(AntitheticDesign())
+        right = DesignEstimator(AntitheticDesign())
+        for rep_number, value in enumerate([0.2, 0.6, 0.9, 0.3], start=1):
+            whole.push(rep_number, value)
+            (left if rep_number in (1, 3) else right).push(rep_number, value)
+
+        left.merge(right)
+
+        assert left.count == whole.count == 4
+        assert left.estimate == pytest.approx(whole.estimate)
+        assert left.stderr == pytest.approx(whole.stderr)
+
+
+class _MeanStderrAggregator:
+    """Aggregates floats into a mapping with ``value_estimate``/``value_stderr``."""
+
+    def __init__(self) -> None:
+        self.stats = RunningStats()
+
+    def update(self, result: float) -> None:
+        self.stats.push(result)
+
+    def merge(self, other: Any) -> None:
+        raise NotImplementedError
+
+    def finalize(self) -> dict[str, float]:
+        return {"value_estimate": self.stats.mean, "value_stderr": self.stats.stderr}
+
+
+class TestSequentialStopping:
+    """Tests for SimulationRunner stopping rules."""
+
+    def _run(
+        self,
+        rule: StoppingRule,
+        num_reps: int = 1000,
+        executor: ReplicationExecutor | None = None,
+    ) -> Any:
+        return SimulationRunner[float, dict[str, float]](
+            config=SimulationRunnerConfig(num_reps=num_reps, stopping_rule=rule),
+            simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+            aggregator=_MeanStderrAggregator(),
+            executor=executor,
+        ).run()
+
+    def test_stops_once_precision_is_met(self) -> None:
+        """Test the runner stops at the first chunk meeting every target."""
+        rule = StoppingRule(targets={"value": 0.05}, chunk_size=20, min_reps=20)
+        output = self._run(rule)
+
+        assert output.stopping is not None
+        assert output.stopping.reason == StoppingReason.PRECISION
+        assert output.num_reps == output.stopping.reps_used == len(output.runs)
+        assert output.num_reps % 20 == 0
+        assert output.num_reps < 1000
+        assert output.stopping.half_widths["value"] <= 0.05
+        # One chunk earlier the target was not yet met.
+        previous = RunningStats()
+        for value in output.runs[:-20]:
+            previous.push(value)
+        assert rule.z * previous.stderr > 0.05
+
+    def test_budget_caps_reps(self) -> None:
+        """Test an unreachable target stops at the replication budget."""
+        output = self._run(
+            StoppingRule(targets={"value": 1e-6}, chunk_size=30), num_reps=50
+        )
+
+        assert output.stopping.reason == StoppingReason.MAX_REPS
+        assert output.num_reps == 50
+        assert output.stopping.to_dict()["half_widths"]["value"] > 1e-6
+
+    def test_time_budget_stops_after_first_chunk(self) -> None:
+        """Test the wall-time budget is checked after each chunk."""
+        output = self._run(
+            StoppingRule(targets={"value": 1e-6}, chunk_size=10, max_seconds=1e-9)
+        )
+
+        assert output.stopping.reason == StoppingReason.TIME_BUDGET
+        assert output.num_reps == 10
+
+    def test_missing_metric_is_never_satisfied(self) -> None:
+        """Test a metric absent from the aggregate runs to the budget."""
+        output = self._run(
+            StoppingRule(targets={"missing": 0.1}, chunk_size=2, min_reps=1),
+            num_reps=5,
+        )
+
+        assert output.stopping.reason == StoppingReason.MAX_REPS
+        assert output.stopping.half_widths["missing"] == float("inf")
+
+    def test_chunks_share_one_pool(self) -> None:
+        """Test every chunk of a stopped batch runs on the same executor pool."""
+
+        class _CountingExecutor(ThreadPoolReplicationExecutor):
+            pools_created = 0
+
+            def _create_pool(self, simulation_factory: Any) -> Executor:
+                self.pools_created += 1
+                return super()._create_pool(simulation_factory)
+
+        executor = _CountingExecutor(workers=2)
+        serial = self._run(StoppingRule(targets={"value": 1e-6}, chunk_size=5), 20)
+        pooled = self._run(
+            StoppingRule(targets={"value": 1e-6}, chunk_size=5), 20, executor
+        )
+
+        assert pooled.num_reps == 20
+        assert pooled.runs == serial.runs
+        assert executor.pools_created == 1
+
+    def test_non_mapping_aggregate_is_rejected(self) -> None:
+        """Test stopping rules need an aggregate mapping metric names to values."""
+        runner = SimulationRunner[float, float](
+            config=SimulationRunnerConfig(
+                num_reps=10,
+                stopping_rule=StoppingRule(targets={"value": 0.1}, chunk_size=5),
+            ),
+            simulation_factory=lambda rep, rng: _ConstantSimulation(rng),
+            aggregate_fn=lambda runs: sum(runs) / len(runs),
+        )
+        with pytest.raises(SimulationConfigurationError, match="mapping"):
+            runner.run()
+
+    def test_rule_validation(self) -> None:
+        """Test invalid rules are rejected."""
+        with pytest.raises(SimulationConfigurationError):
+            StoppingRule(targets={})
+        with pytest.raises(SimulationConfigurationError):
+            StoppingRule(targets={"value": 0.0})
+        with pytest.raises(SimulationConfigurationError):
+            StoppingRule(targets={"value": 0.1}, chunk_size=0)
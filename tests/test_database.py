@@ -1,9 +1,12 @@
 """Tests for database layer: schema, repositories, and persistence."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Generator
 from pathlib import Path
 
 import pytest
+from sqlalchemy import inspect, select, text
+
 from pylon.domain.athlete import Athlete, AthletePositionEnum
 from pylon.domain.team import Team
 from pylon.domain.playbook import (
@@ -20,12 +23,16 @@ from pylon.db.repositories import (
     PlayCallRepository,
     GameRepository,
     DimensionRepository,
+    IdSequenceRepository,
 )
 from pylon.db.schema import (
     Team as OrmTeam,
     Athlete as OrmAthlete,
     PlayCall as OrmPlayCall,
+    Game as OrmGame,
+    team_roster,
 )
+from pylon.output import serialize_team
 
 
 @pytest.fixture
@@ -103,6 +110,53 @@ class TestDatabaseSetup:
         assert db_path.exists()
         db.close()
 
+    def test_bulk_load_tunes_and_restores_sqlite(self, tmp_path: Path) -> None:
+        """Test bulk_load defers fact indexes and restores safe pragmas."""
+        db = DatabaseManager(f"sqlite:///{tmp_path / 'bulk.db'}")
+        db.init_db()
+
+        def pragma(name: str) -> Any:
+            with db.engine.connect() as conn:
+                return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+        def play_indexes() -> set[str | None]:
+            return {idx["name"] for idx in inspect(db.engine).get_indexes("play")}
+
+        assert play_indexes() == {
+            "ix_play_drive_id",
+            "ix_play_game_offense_situation",
+            "ix_play_offense_situation",
+        }
+
+        with db.bulk_load():
+            assert db.bulk_load_active
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("temp_store") == 2  # MEMORY
+            assert play_indexes() == set()
+
+        assert not db.bulk_load_active
+        assert pragma("journal_mode") == "delete"
+        assert pragma("synchronous") == 2  # FULL
+        assert play_indexes() == {
+            "ix_play_drive_id",
+            "ix_play_game_offense_situation",
+            "ix_play_offense_situation",
+        }
+        db.close()
+
+    def test_bulk_load_in_memory_keeps_data(self, db_manager: DatabaseManager) -> None:
+        """Test bulk_load on in-memory SQLite only defers indexes."""
+        TeamRepository(db_manager).save(
+            {"uid": "team-1", "name": "Team 1", "athletes": [], "playbooks": {}}
+        )
+        with db_manager.bulk_load():
+            pass
+
+        session = db_manager.get_session()
+        assert session.query(OrmTeam).count() == 1
+        session.close()
+
 
 class TestTeamRepository:
     """Tests for TeamRepository."""
@@ -295,6 +349,54 @@ class TestGameRepository:
         assert game2.id == "2"
 
 
+class TestIdSequenceRepository:
+    """Tests for game id block reservation."""
+
+    def test_reserve_contiguous_blocks(self, db_manager: DatabaseManager) -> None:
+        """Test consecutive reservations hand out adjacent, disjoint blocks."""
+        repo = GameRepository(db_manager)
+
+        assert repo.reserve_ids(3) == 1
+        assert repo.reserve_ids(5) == 4
+        assert repo.reserve_ids(1) == 9
+        assert IdSequenceRepository(db_manager).peek("game") == 10
+
+    def test_reserve_seeds_from_existing_games(
+        self, db_manager: DatabaseManager
+    ) -> None:
+        """Test the first reservation starts after the largest stored game id."""
+        session = db_manager.get_session()
+        for game_id in ("7", "12"):
+            session.add(
+                OrmGame(
+                    id=game_id,
+                    seed=1,
+                    home_team_id="home",
+                    away_team_id="away",
+                    home_score=0,
+                    away_score=0,
+                    final_quarter=4,
+                )
+            )
+        session.commit()
+        session.close()
+
+        assert GameRepository(db_manager).reserve_ids(2) == 13
+
+    def test_concurrent_reservations_do_not_overlap(self, tmp_path: Path) -> None:
+        """Test threads reserving from one file database get disjoint ids."""
+        db = DatabaseManager(f"sqlite:///{tmp_path / 'ids.db'}")
+        db.init_db()
+        repo = GameRepository(db)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            starts = list(pool.map(lambda _: repo.reserve_ids(10), range(20)))
+        db.close()
+
+        reserved = [start + i for start in starts for i in range(10)]
+        assert sorted(reserved) == list(range(1, 201))
+
+
 class TestDimensionRepository:
     """Tests for DimensionRepository facade."""
 
@@ -363,3 +465,52 @@ class TestDimensionRepository:
         assert len(teams) == 2
         assert len(athletes) == 6  # 3 per team
         assert len(plays) >= 2  # At least 1 per team
+
+
+class TestDimensionFingerprints:
+    """Tests for fingerprint-based skipping of unchanged dimension data."""
+
+    @staticmethod
+    def _team(uid: str, num_athletes: int) -> Any:
+        team = Team(uid=uid, name=f"Team {uid}")
+        for i in range(num_athletes):
+            team.add_athlete(
+                Athlete(
+                    uid=f"{uid}-qb-{i}",
+                    first_name="QB",
+                    last_name=str(i),
+                    position=AthletePositionEnum.QB,
+                )
+            )
+        return serialize_team(team)
+
+    def test_unchanged_teams_are_skipped(
+        self, db_manager: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a second persist of identical teams writes nothing."""
+        repo = DimensionRepository(db_manager)
+        home, away = self._team("home", 2), self._team("away", 2)
+        repo.persist_game_dimensions(home, away)
+
+        upserted: list[list[str]] = []
+        original = repo.teams.upsert_batch
+
+        def record_upsert(teams: list[Any]) -> Any:
+            upserted.append([team["uid"] for team in teams])
+            return original(teams)
+
+        monkeypatch.setattr(repo.teams, "upsert_batch", record_upsert)
+        repo.persist_game_dimensions(home, away)
+        assert upserted == []
+
+        changed_home = self._team("home", 3)
+        repo.persist_game_dimensions(changed_home, away)
+        assert upserted == [["home"]]
+
+        session = db_manager.get_session()
+        roster = session.execute(
+            select(team_roster.c.athlete_id).where(team_roster.c.team_id == "home")
+        ).scalars()
+        assert sorted(roster) == ["home-qb-0", "home-qb-1", "home-qb-2"]
+        assert session.query(OrmTeam).count() == 2
+        session.close()
@@ -1,9 +1,16 @@
-"""Tests for domain layer: Athlete and Team classes.
+"""Tests for domain layer: Athlete, PositionTree and Team classes.
 
 Domain rules tests (Formation, PersonnelPackage, PlayCall validation) are in test_domain_rules.py.
 """
 
-from pylon.domain.athlete import Athlete, AthletePositionEnum
+from typing import Iterator
+
+from pylon.domain.athlete import (
+    Athlete,
+    AthletePositionEnum,
+    PositionTree,
+    POSITION_TREE,
+)
 from pylon.domain.team import Team
 
 
@@ -34,6 +41,64 @@ class TestAthlete:
         assert athlete.full_name == "Travis Kelce"
 
 
+def _walk(node: PositionTree) -> Iterator[PositionTree]:
+    yield node
+    for child in node.children.values():
+        yield from _walk(child)
+
+
+class TestPositionTree:
+    """Tests for the frozen PositionTree lookup tables."""
+
+    def test_position_tree_is_frozen(self) -> None:
+        assert all(node.frozen for node in _walk(POSITION_TREE))
+
+    def test_lookup_tables_match_tree(self) -> None:
+        """Test every node's tables agree with walking the tree itself."""
+        for node in _walk(POSITION_TREE):
+            subtree = list(_walk(node))
+            for position in AthletePositionEnum:
+                expected = next((n for n in subtree if n.position == position), None)
+                assert node.find_node(position) is expected
+                assert node.contains(position) == (expected is not None)
+
+            leaves = [n.position for n in subtree if n.is_leaf()]
+            assert node.all_positions() == leaves
+            assert node.leaf_positions == frozenset(leaves)
+
+            ancestors = []
+            walk: PositionTree | None = node
+            while walk is not None:
+                ancestors.append(walk)
+                walk = walk.parent
+            assert node.fallback_chain == tuple(ancestors)
+
+    def test_freeze_preserves_lookups(self) -> None:
+        """Test an unfrozen tree answers the same before and after freezing."""
+        tree = PositionTree(
+            None,
+            children={
+                AthletePositionEnum.OLINE: PositionTree(
+                    AthletePositionEnum.OLINE,
+                    children={
+                        AthletePositionEnum.C: PositionTree(AthletePositionEnum.C),
+                        AthletePositionEnum.G: PositionTree(AthletePositionEnum.G),
+                    },
+                ),
+            },
+        )
+        center = tree.find_node(AthletePositionEnum.C)
+        assert center is not None
+        before = (tree.all_positions(), center.fallback_chain)
+
+        tree.freeze()
+
+        assert tree.frozen
+        assert tree.find_node(AthletePositionEnum.C) is center
+        assert (tree.all_positions(), center.fallback_chain) == before
+        assert not tree.contains(AthletePositionEnum.QB)
+
+
 class TestTeam:
     """Tests for Team class."""
 
@@ -67,6 +132,31 @@ class TestTeam:
         assert qb in team.roster
         assert rb in team.roster
 
+    def test_roster_cannot_change_behind_the_indexes(self) -> None:
+        """Test only add_athlete changes the roster and its version."""
+        qb = Athlete(
+            uid="qb-1",
+            first_name="Patrick",
+            last_name="Mahomes",
+            position=AthletePositionEnum.QB,
+        )
+        rb = Athlete(
+            uid="rb-1",
+            first_name="Isiah",
+            last_name="Pacheco",
+            position=AthletePositionEnum.RB,
+        )
+        initial = [qb]
+        team = Team(uid="team-1", name="Chiefs", roster=initial)
+        version = team.roster_version
+
+        initial.append(rb)
+
+        assert team.roster == (qb,)
+        assert team.get_athletes_by_position(AthletePositionEnum.RB) == []
+        assert team.roster_version == version
+        assert not hasattr(team.roster, "append")
+
     def test_get_athletes_by_position(self) -> None:
         """Test filtering athletes by position."""
         team = Team(uid="team-1", name="Chiefs")
@@ -98,3 +188,66 @@ class TestTeam:
         assert qb1 in qbs
         assert qb2 in qbs
         assert wr not in qbs
+
+
+class TestTeamIndexes:
+    """Tests for Team's UID index and depth chart."""
+
+    @staticmethod
+    def _athlete(uid: str, position: AthletePositionEnum) -> Athlete:
+        return Athlete(uid=uid, first_name=uid, last_name="Test", position=position)
+
+    def test_uid_lookup_and_membership(self) -> None:
+        """Test UID lookups and roster membership use the index."""
+        team = Team(uid="team-1", name="Chiefs")
+        qb = self._athlete("qb-1", AthletePositionEnum.QB)
+        team.add_athlete(qb)
+
+        assert team.get_athlete_by_uid("qb-1") is qb
+        assert team.get_athlete_by_uid("missing") is None
+        assert team.has_athlete(qb)
+        assert not team.has_athlete(self._athlete("qb-1", AthletePositionEnum.QB))
+
+    def test_depth_chart_follows_roster_order(self) -> None:
+        """Test starters are the first athletes added at a position."""
+        team = Team(uid="team-1", name="Chiefs")
+        wr1 = self._athlete("wr-1", AthletePositionEnum.WR)
+        te = self._athlete("te-1", AthletePositionEnum.TE)
+        wr2 = self._athlete("wr-2", AthletePositionEnum.WR)
+        for athlete in (wr1, te, wr2):
+            team.add_athlete(athlete)
+
+        depth_chart = team.depth_chart
+        assert depth_chart.starter(AthletePositionEnum.WR) is wr1
+        assert depth_chart.starters(AthletePositionEnum.WR, 5) == (wr1, wr2)
+        assert depth_chart.starter(AthletePositionEnum.K) is None
+        assert list(depth_chart.under(AthletePositionEnum.SKILL)) == [wr1, te, wr2]
+        assert list(depth_chart.under(None)) == [wr1, te, wr2]
+        assert list(depth_chart.under(AthletePositionEnum.OLINE)) == []
+
+    def test_depth_chart_matches_position_tree_leaves(self) -> None:
+        """Test group nodes only pool athletes at their leaf positions."""
+        team = Team(uid="team-1", name="Chiefs")
+        lb = self._athlete("lb-1", AthletePositionEnum.LB)
+        mlb = self._athlete("mlb-1", AthletePositionEnum.MLB)
+        team.add_athlete(lb)
+        team.add_athlete(mlb)
+
+        assert list(team.depth_chart.at(AthletePositionEnum.LB)) == [lb]
+        assert list(team.depth_chart.under(AthletePositionEnum.LB)) == [mlb]
+
+    def test_add_athlete_invalidates_indexes(self) -> None:
+        """Test adding an athlete rebuilds the indexes and bumps the version."""
+        team = Team(uid="team-1", name="Chiefs")
+        team.add_athlete(self._athlete("rb-1", AthletePositionEnum.RB))
+        chart = team.depth_chart
+        assert team.get_athlete_by_uid("rb-2") is None
+        version = team.roster_version
+
+        rb2 = self._athlete("rb-2", AthletePositionEnum.RB)
+        team.add_athlete(rb2)
+
+        assert team.roster_version == version + 1
+        assert team.depth_chart is not chart
+        assert team.get_athlete_by_uid("rb-2") is rb2
+        assert team.get_athletes_by_position(AthletePositionEnum.RB)[-1] is rb2
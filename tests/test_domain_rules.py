@@ -1,5 +1,7 @@
 """Tests for domain rules: NFL rule validation and constraints."""
 
+import pickle
+
 import pytest
 
 from pylon.domain.athlete import Athlete, AthletePositionEnum
@@ -9,6 +11,7 @@ from pylon.domain.playbook import (
     PersonnelPackage,
     PlayCall,
     Playbook,
+    PlaybookFrozenError,
     PlayTypeEnum,
     PlaySideEnum,
 )
@@ -1183,3 +1186,106 @@ class TestRuleConstraints:
         assert play.personnel_package is not None
         assert play.play_type is not None
         assert play.side is not None
+
+
+class TestPlaybookIndexes:
+    """Tests for Playbook lookup indexes and freezing."""
+
+    @staticmethod
+    def _play(
+        formation: Formation,
+        uid: str,
+        play_type: PlayTypeEnum,
+        tags: list[str] | None = None,
+    ) -> PlayCall:
+        return PlayCall(
+            uid=uid,
+            name=f"Play {uid}",
+            play_type=play_type,
+            formation=formation,
+            personnel_package=PersonnelPackage(
+                name="11",
+                counts={
+                    AthletePositionEnum.RB: 1,
+                    AthletePositionEnum.WR: 3,
+                    AthletePositionEnum.TE: 1,
+                },
+            ),
+            side=PlaySideEnum.OFFENSE,
+            tags=tags,
+        )
+
+    def test_lookups_return_cached_tuples(
+        self, basic_offensive_formation: Formation
+    ) -> None:
+        """Test repeated lookups share one tuple until a play is added."""
+        run = self._play(basic_offensive_formation, "run-1", PlayTypeEnum.RUN)
+        passing = self._play(basic_offensive_formation, "pass-1", PlayTypeEnum.PASS)
+        playbook = Playbook(plays=[passing, run])
+
+        runs = playbook.get_by_type(PlayTypeEnum.RUN)
+        assert runs == (run,)
+        assert playbook.get_by_type(PlayTypeEnum.RUN) is runs
+        assert playbook.plays is playbook.plays
+        assert playbook.get_by_types([PlayTypeEnum.RUN, PlayTypeEnum.PASS]) == (
+            run,
+            passing,
+        )
+        assert playbook.get_by_type(PlayTypeEnum.PUNT) == ()
+
+        run2 = self._play(basic_offensive_formation, "run-2", PlayTypeEnum.RUN)
+        playbook.add_play(run2)
+
+        assert playbook.get_by_type(PlayTypeEnum.RUN) == (run, run2)
+        assert playbook.get_by_uid("run-2") is run2
+
+    def test_tags_added_before_freeze_are_indexed(
+        self, basic_offensive_formation: Formation
+    ) -> None:
+        """Test tag lookups see tags added to plays already in the playbook."""
+        play = self._play(
+            basic_offensive_formation, "pass-1", PlayTypeEnum.PASS, tags=["quick"]
+        )
+        playbook = Playbook(plays=[play])
+        play.add_tag("red-zone")
+
+        assert playbook.get_by_tag("red-zone") == (play,)
+        assert playbook.freeze().get_by_tag("red-zone") == (play,)
+        assert playbook.get_by_tag("quick") == (play,)
+        assert playbook.get_by_tag("missing") == ()
+
+    def test_frozen_playbook_is_read_only(
+        self, basic_offensive_formation: Formation
+    ) -> None:
+        """Test a frozen playbook rejects plays and keeps its fingerprint."""
+        playbook = Playbook(
+            plays=[self._play(basic_offensive_formation, "run-1", PlayTypeEnum.RUN)],
+            uid="pb-frozen",
+        ).freeze()
+
+        with pytest.raises(PlaybookFrozenError):
+            playbook.add_play(
+                self._play(basic_offensive_formation, "run-2", PlayTypeEnum.RUN)
+            )
+
+        restored = pickle.loads(pickle.dumps(playbook))
+        assert restored.frozen
+        assert restored.fingerprint == playbook.fingerprint
+        assert restored.get_by_uid("run-1") is restored.plays[0]
+        assert len(restored) == 1
+
+    def test_frozen_playbook_rejects_new_play_tags(
+        self, basic_offensive_formation: Formation
+    ) -> None:
+        """Test plays in a frozen playbook cannot be tagged behind the tag index."""
+        play = self._play(
+            basic_offensive_formation, "pass-1", PlayTypeEnum.PASS, tags=["quick"]
+        )
+        playbook = Playbook(plays=[play]).freeze()
+
+        with pytest.raises(PlaybookFrozenError):
+            play.add_tag("red-zone")
+
+        assert play.tags == ["quick"]
+        assert playbook.get_by_tag("red-zone") == ()
+        assert pickle.loads(pickle.dumps(playbook)).plays[0].frozen
@@ -1,5 +1,8 @@
 """Tests for specialized engine classes: Drive, Play, and core engine interactions."""
 
+import dataclasses
+import pickle
+
 import pytest
 from pylon.domain.athlete import Athlete, AthletePositionEnum
 from pylon.domain.team import Team
@@ -15,7 +18,17 @@ from pylon.state.play_record import ScoringTypeEnum
 from pylon.engine.drive_engine import DriveEngine
 from pylon.engine.play_engine import PlayEngine
 from pylon.engine.game_engine import GameEngine
-from pylon.models.registry import ModelRegistry
+from pylon.engine.plan import EnginePlan, EngineStreams
+from pylon.engine.validation import PlayValidationSchedule, ValidationLevel
+from pylon.models.model import InvalidModelReturnType, ReturnTypeCheckedModel
+from pylon.models.registry import ModelNotFoundError, ModelRegistry
+from pylon.models.personnel import (
+    CachedOffensivePlayerAssignmentModel,
+    DefaultOffensivePlayerAssignmentModel,
+    OffensivePlayerAssignmentModel,
+    PersonnelAssignmentCache,
+    PlayerAssignmentContext,
+)
 from pylon.models.offense import (
     PlayTypeModel,
     PlayTypeContext,
@@ -268,6 +281,292 @@ class TestPlayEngine:
         )
 
 
+class TestEnginePlan:
+    """Tests for the compiled per-play engine plan."""
+
+    def test_plan_resolves_registered_models(self, game_engine: GameEngine) -> None:
+        """Test every plan slot is the model registered under its name."""
+        plan = EnginePlan.compile(game_engine.models)
+
+        assert plan.play_type is game_engine.models.get("play_type")
+        assert plan.yac is game_engine.models.get("yac")
+        assert plan.kickoff_touchback_decision is game_engine.models.get(
+            "kickoff_touchback_decision"
+        )
+
+    def test_plan_uses_user_overrides(self) -> None:
+        """Test user models registered over the defaults end up in the plan."""
+
+        class AlwaysRunModel(PlayTypeModel):
+            def execute(self, context: PlayTypeContext) -> PlayTypeEnum:
+                return PlayTypeEnum.RUN
+
+        model = AlwaysRunModel()
+        engine = GameEngine(
+            home_team=create_test_team("home", "Home"),
+            away_team=create_test_team("away", "Away"),
+            game_id="plan-override",
+            rng=RNG(seed=1),
+            user_models=[model],
+            validation=ValidationLevel.OFF,
+        )
+
+        assert engine.plan.play_type is model
+        assert engine.play_engine.plan is engine.plan
+
+    def test_missing_model_fails_at_compile(self) -> None:
+        """Test an incomplete registry is rejected before any play runs."""
+        with pytest.raises(ModelNotFoundError):
+            EnginePlan.compile(ModelRegistry())
+
+    def test_streams_match_named_substreams(self) -> None:
+        """Test bound streams are the RNG's cached substreams."""
+        rng = RNG(seed=5, named_streams=True)
+        streams = EngineStreams.bind(rng)
+
+        assert streams.rusher_selection is rng.stream("rusher_selection")
+        assert EngineStreams.bind(RNG(seed=5)).play_type is not None
+
+    def test_drives_reuse_play_engine_and_handlers(
+        self, game_engine: GameEngine
+    ) -> None:
+        """Test drives share the game's PlayEngine and play-type handlers."""
+        play_engine = game_engine.play_engine
+        drive = DriveEngine(
+            game_engine.game_state,
+            game_engine.models,
+            game_engine.rng,
+            game_engine.rules,
+            play_engine=play_engine,
+        )
+
+        assert drive.play_engine is play_engine
+        assert play_engine.run_engine is play_engine.run_engine
+        assert play_engine.pass_engine.plan is game_engine.plan
+        assert play_engine.kickoff_engine.streams is game_engine.streams
+
+
+class _CountingAssignmentModel(OffensivePlayerAssignmentModel):
+    """Deterministic stub that assigns the first roster athlete as QB."""
+
+    deterministic = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def execute(
+        self, context: PlayerAssignmentContext
+    ) -> dict[AthletePositionEnum, list[Athlete]]:
+        self.calls += 1
+        return {AthletePositionEnum.QB: [context.game_state.pos_team.roster[0]]}
+
+
+class TestPersonnelAssignmentCache:
+    """Tests for memoized personnel assignments."""
+
+    @staticmethod
+    def _context(engine: GameEngine) -> PlayerAssignmentContext:
+        playbook = engine.game_state.pos_team.off_playbook
+        assert playbook is not None
+        return PlayerAssignmentContext(
+            engine.game_state,
+            engine.rng,
+            playbook.plays[0],
+            PlayTypeEnum.PASS,
+        )
+
+    def test_hits_return_equal_fresh_assignments(self, game_engine: GameEngine) -> None:
+        """Test a repeated context is served from the cache as a copy."""
+        cache = PersonnelAssignmentCache()
+        inner = _CountingAssignmentModel()
+        model = CachedOffensivePlayerAssignmentModel(inner, cache)
+        context = self._context(game_engine)
+
+        first = model.execute(context)
+        second = model.execute(context)
+
+        assert second == first
+        assert second[AthletePositionEnum.QB] is not first[AthletePositionEnum.QB]
+        assert inner.calls == 1
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    def test_roster_change_invalidates_team_entries(
+        self, game_engine: GameEngine
+    ) -> None:
+        """Test adding an athlete makes the team's next assignment a miss."""
+        cache = PersonnelAssignmentCache()
+        model = CachedOffensivePlayerAssignmentModel(_CountingAssignmentModel(), cache)
+        context = self._context(game_engine)
+        model.execute(context)
+
+        game_engine.game_state.pos_team.add_athlete(
+            Athlete(
+                uid="extra-wr",
+                first_name="Extra",
+                last_name="Test",
+                position=AthletePositionEnum.WR,
+            )
+        )
+        model.execute(context)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test the cache keeps at most maxsize assignments."""
+        cache = PersonnelAssignmentCache(maxsize=1)
+        teams = [create_test_team("a", "A"), create_test_team("b", "B")]
+        calls: list[str] = []
+
+        def assign(context: PlayerAssignmentContext) -> dict:
+            calls.append("assign")
+            return {}
+
+        context = PlayerAssignmentContext(None, RNG(seed=1), None)  # type: ignore[arg-type]
+        for team in (teams[0], teams[1], teams[0]):
+            cache.get_or_assign("offense", team, context, assign)
+
+        assert len(calls) == 3
+        assert cache.stats() == {"hits": 0, "misses": 3, "size": 1, "maxsize": 1}
+
+    def test_only_deterministic_models_are_wrapped(
+        self, game_engine: GameEngine
+    ) -> None:
+        """Test the plan caches deterministic personnel models only."""
+        plan = EnginePlan.compile(game_engine.models, PersonnelAssignmentCache())
+
+        assert isinstance(
+            plan.offensive_play_personnel_assignment,
+            CachedOffensivePlayerAssignmentModel,
+        )
+        assert plan.rusher_selection is game_engine.models.get("rusher_selection")
+
+    def test_subclass_must_redeclare_deterministic(
+        self, game_engine: GameEngine
+    ) -> None:
+        """Test a subclass of a deterministic model is not cached by default."""
+
+        class ShuffledOffense(DefaultOffensivePlayerAssignmentModel):
+            def execute(
+                self, context: PlayerAssignmentContext
+            ) -> dict[AthletePositionEnum, list[Athlete]]:
+                assignments = super().execute(context)
+                receivers = assignments.get(AthletePositionEnum.WR, [])
+                if len(receivers) > 1 and context.rng.random() < 0.5:
+                    receivers.reverse()
+                return assignments
+
+        registry = game_engine.models
+        registry.register_model(ShuffledOffense(), override=True)
+        plan = EnginePlan.compile(registry, PersonnelAssignmentCache())
+
+        assert isinstance(plan.offensive_play_personnel_assignment, ShuffledOffense)
+
+    def test_pickled_cache_is_empty(self, game_engine: GameEngine) -> None:
+        """Test pickling keeps the size but drops entries and counters."""
+        cache = PersonnelAssignmentCache(maxsize=8)
+        model = CachedOffensivePlayerAssignmentModel(_CountingAssignmentModel(), cache)
+        model.execute(self._context(game_engine))
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        assert restored.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 8}
+
+
+class TestValidationLevels:
+    """Tests for basic, strict, sampled and disabled per-play validation."""
+
+    def test_sampled_schedule_validates_every_nth_play(self) -> None:
+        """Test SAMPLED validates the first play and then every Nth."""
+        schedule = PlayValidationSchedule(ValidationLevel.SAMPLED, sample_every=3)
+
+        assert [schedule.next_play() for _ in range(7)] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert not schedule.check_return_types
+        assert schedule.check_personnel
+
+    def test_off_basic_and_strict_schedules(self) -> None:
+        """Test OFF never validates, BASIC and STRICT always do."""
+        off = PlayValidationSchedule(ValidationLevel.OFF)
+        basic = PlayValidationSchedule()
+        strict = PlayValidationSchedule(ValidationLevel.STRICT)
+
+        assert not any(off.next_play() for _ in range(5))
+        assert all(basic.next_play() for _ in range(5))
+        assert all(strict.next_play() for _ in range(5))
+        assert basic.level is ValidationLevel.BASIC
+        assert not basic.check_return_types
+        assert basic.check_personnel
+        assert strict.check_return_types
+        assert strict.check_personnel
+        assert not off.check_personnel
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [(ValidationLevel.BASIC, 1), (ValidationLevel.OFF, 0)],
+    )
+    def test_assigned_personnel_checks_follow_level(
+        self,
+        game_engine: GameEngine,
+        monkeypatch: pytest.MonkeyPatch,
+        level: ValidationLevel,
+        expected: int,
+    ) -> None:
+        """Test get_off_play_personnel only validates when the level says so."""
+        checked: list[dict[AthletePositionEnum, list[Athlete]]] = []
+        monkeypatch.setattr(PlayEngine, "validate_off_personnel", checked.append)
+        play_engine = PlayEngine(
+            game_engine.game_state,
+            game_engine.models,
+            game_engine.rng,
+            game_engine.rules,
+            plan=dataclasses.replace(
+                game_engine.plan,
+                offensive_play_personnel_assignment=_CountingAssignmentModel(),
+            ),
+            validation=PlayValidationSchedule(level),
+        )
+        play_engine.validate_play = play_engine.validation.next_play()
+        playbook = game_engine.game_state.pos_team.off_playbook
+        assert playbook is not None
+        play_data = PlayExecutionData()
+        play_data.set_off_play_call(playbook.plays[0])
+
+        play_engine.get_off_play_personnel(play_data)
+
+        assert len(checked) == expected
+
+    def test_sample_interval_must_be_positive(self) -> None:
+        """Test a zero sampling interval is rejected."""
+        with pytest.raises(ValueError):
+            PlayValidationSchedule(ValidationLevel.SAMPLED, sample_every=0)
+
+    def test_strict_plan_checks_model_return_types(
+        self, game_engine: GameEngine
+    ) -> None:
+        """Test only strict engines run models through the return-type check."""
+
+        class WrongTypePlayTypeModel(PlayTypeModel):
+            def execute(self, context: PlayTypeContext) -> PlayTypeEnum:
+                return "run"  # type: ignore[return-value]
+
+        registry = game_engine.models
+        registry.register_model(WrongTypePlayTypeModel(), override=True)
+        plan = EnginePlan.compile(registry, check_return_types=True)
+
+        assert isinstance(plan.play_type, ReturnTypeCheckedModel)
+        assert not isinstance(game_engine.plan.yac, ReturnTypeCheckedModel)
+        with pytest.raises(InvalidModelReturnType):
+            plan.play_type.execute(PlayTypeContext(game_engine.game_state, RNG(seed=1)))
+
+
 class TestNFLRulesConstants:
     """Tests for NFL rule constants."""
 
@@ -1,9 +1,17 @@
 """Integration tests for full game simulation workflow."""
 
 import json
+import logging
+import os
+import pickle
+import re
+import subprocess
+import sys
+import threading
 import pytest
 from typing import Any, Generator
 from pathlib import Path
+from sqlalchemy import func, select, text
 from pylon.domain.athlete import Athlete, AthletePositionEnum
 from pylon.domain.team import Team
 from pylon.domain.playbook import (
@@ -14,10 +22,58 @@ from pylon.domain.playbook import (
     PersonnelPackage,
 )
 from pylon.domain.rules.nfl import NFLRules
-from pylon.simulation_runner import PylonSimulationRunner, PylonSimulationRunnerConfig
+from pylon.simulation_runner import (
+    COIN_TOSS_STRATA,
+    PylonSimulationFactory,
+    PylonSimulationRunner,
+    PylonSimulationRunnerConfig,
+)
+from sim.executor import (
+    ProcessPoolReplicationExecutor,
+    ReplicationExecutor,
+    ThreadPoolReplicationExecutor,
+)
+from sim.exceptions import OutputSinkError, SimulationExecutionError
+from sim.design import AntitheticDesign, StratifiedDesign
+from sim.rng import RNG, RNGConfig
+from sim.stopping import StoppingRule
 from pylon.db.database import DatabaseManager
-from pylon.db.schema import Game as OrmGame, Drive as OrmDrive, Play as OrmPlay
-from pylon.output import OutputMode, SimulationOutputPayload
+from pylon.db.repositories import (
+    ExperimentRepository,
+    FactRepository,
+    GameRepository,
+)
+from pylon.db.schema import (
+    AthleteGameStats as OrmAthleteGameStats,
+    Experiment as OrmExperiment,
+    ExperimentTeamScore as OrmExperimentTeamScore,
+    Game as OrmGame,
+    Drive as OrmDrive,
+    Play as OrmPlay,
+    PlayParticipant as OrmPlayParticipant,
+    PlayPersonnelAssignment as OrmPlayPersonnelAssignment,
+)
+from pylon.engine.game_engine import GameEngine
+from pylon.engine.play_engine import PlayEngine
+from pylon.engine.validation import ValidationLevel
+from pylon.simulation import PylonSimulation
+from pylon.models.misc import DefaultKickReceiveChoiceModel, KickReceiveContext
+from pylon.models.personnel import PersonnelAssignmentCache
+from pylon.state.play_record import PlayExecutionData, PlayParticipantType
+from pylon.output import (
+    BackgroundDBWriter,
+    ColumnarFormat,
+    DBOutputWriter,
+    DBWriterError,
+    JsonFormat,
+    PlayColumnBuilder,
+    OutputMode,
+    RetentionLevel,
+    SimulationOutputPayload,
+    iter_ndjson_games,
+    iter_ndjson_records,
+    read_ndjson_results,
+)
 
 
 def _make_runner(**kwargs: Any) -> PylonSimulationRunner:
@@ -359,6 +415,27 @@ class TestPylonSimulationRunner:
         for play in plays:
             assert play.drive_id is not None
 
+    def test_bulk_load_run(self, test_db: DatabaseManager) -> None:
+        """Test a bulk-load run persists facts and leaves safe settings."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            rules=NFLRules(),
+            max_drives=3,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+            db_bulk_load=True,
+        )
+        runner.run()
+
+        session = test_db.get_session()
+        assert session.query(OrmGame).count() == 2
+        assert session.query(OrmPlay).count() > 0
+        session.close()
+        assert not test_db.bulk_load_active
+
     def test_aggregate_stats_calculation(self, tmp_path: Path) -> None:
         """Test that aggregate statistics are calculated correctly."""
         home = create_test_team("home", "Home Team")
@@ -445,6 +522,925 @@ class TestPylonSimulationRunner:
         assert len(games) == 1
 
 
+class TestResultRetention:
+    """Tests for retention levels and output-mode-aware payload building."""
+
+    def _run(self, tmp_path: Path, **kwargs: Any) -> SimulationOutputPayload:
+        return _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            max_drives=3,
+            json_output_path=tmp_path / "retention_results.json",
+            log_dir=tmp_path / "logs",
+            **kwargs,
+        ).run()
+
+    def test_full_retention_keeps_plays(self, tmp_path: Path) -> None:
+        """Test full retention keeps play-by-play in game details."""
+        results = self._run(tmp_path, retention=RetentionLevel.FULL)
+        drives = results["results"]["game_details"][0]["drives"]
+        assert drives
+        assert any(drive["plays"] for drive in drives)
+
+    def test_drive_retention_drops_plays(self, tmp_path: Path) -> None:
+        """Test drive retention keeps drives without nested plays."""
+        results = self._run(tmp_path, retention=RetentionLevel.DRIVE)
+        drives = results["results"]["game_details"][0]["drives"]
+        assert drives
+        assert all(drive["plays"] == [] for drive in drives)
+
+    def test_summary_retention_keeps_only_games(self, tmp_path: Path) -> None:
+        """Test summary retention skips game details entirely."""
+        results = self._run(tmp_path, retention=RetentionLevel.SUMMARY)
+        assert len(results["results"]["games"]) == 2
+        assert results["results"]["game_details"] == []
+
+    def test_db_only_skips_game_details(self, test_db: DatabaseManager) -> None:
+        """Test DB-only output does not serialize game details but persists facts."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            max_drives=3,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+        )
+        results = runner.run()
+        assert results["results"]["game_details"] == []
+
+        session = test_db.get_session()
+        plays = session.query(OrmPlay).count()
+        session.close()
+        assert plays > 0
+
+
+class TestNdjsonOutput:
+    """Tests for streaming NDJSON output."""
+
+    def _run(self, output_path: Path) -> SimulationOutputPayload:
+        return _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=3,
+            base_seed=42,
+            max_drives=3,
+            json_output_path=output_path,
+            json_format=JsonFormat.NDJSON,
+            log_dir=output_path.parent / "logs",
+        ).run()
+
+    def test_stream_layout(self, tmp_path: Path) -> None:
+        """Test the stream has a header, one record per game, and a trailer."""
+        output_path = tmp_path / "results.ndjson"
+        results = self._run(output_path)
+
+        records = list(iter_ndjson_records(output_path))
+        assert [r["record_type"] for r in records] == [
+            "header",
+            "game",
+            "game",
+            "game",
+            "trailer",
+        ]
+        assert records[0]["experiment"]["id"] == results["experiment"]["id"]
+        assert records[-1]["aggregate"] == results["results"]["aggregate"]
+        assert [r["game"]["rep_number"] for r in iter_ndjson_games(output_path)] == [
+            1,
+            2,
+            3,
+        ]
+        # Details are streamed rather than kept in the returned payload.
+        assert results["results"]["game_details"] == []
+
+    def test_gzip_round_trip(self, tmp_path: Path) -> None:
+        """Test gzip compression is inferred from the suffix and reads back."""
+        output_path = tmp_path / "results.ndjson.gz"
+        results = self._run(output_path)
+
+        with output_path.open("rb") as file_handle:
+            assert file_handle.read(2) == b"\x1f\x8b"
+        restored = read_ndjson_results(output_path)
+        assert restored["results"]["games"] == results["results"]["games"]
+        assert len(restored["results"]["game_details"]) == 3
+        assert restored["experiment"]["elapsed_time"] == pytest.approx(
+            results["experiment"]["elapsed_time"]
+        )
+
+    def test_zstd_round_trip(self, tmp_path: Path) -> None:
+        """Test zstd compression when a zstd backend is available."""
+        pytest.importorskip("zstandard")
+        output_path = tmp_path / "results.ndjson.zst"
+        results = self._run(output_path)
+
+        restored = read_ndjson_results(output_path)
+        assert restored["results"]["games"] == results["results"]["games"]
+
+
+class TestColumnarExport:
+    """Tests for columnar play-by-play export."""
+
+    @pytest.fixture
+    def builder(self) -> PlayColumnBuilder:
+        builder = PlayColumnBuilder()
+        for rep_number in (1, 2):
+            engine = GameEngine(
+                home_team=create_test_team("home", "Home Team"),
+                away_team=create_test_team("away", "Away Team"),
+                game_id=str(rep_number),
+                rng=RNG(seed=42 + rep_number),
+                rules=NFLRules(),
+                max_drives=4,
+            )
+            engine.run()
+            builder.add_game(
+                engine.game_state, rep_number=rep_number, seed=42 + rep_number
+            )
+        return builder
+
+    def test_import_does_not_load_pyarrow(self) -> None:
+        """Test pyarrow is only imported once columns are actually written."""
+        code = (
+            "import sys, pylon.simulation_runner; "
+            "print('pyarrow' in sys.modules)"
+        )
+        loaded = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert loaded.stdout.strip() == "False"
+
+    def test_arrow_round_trip(self, builder: PlayColumnBuilder, tmp_path: Path) -> None:
+        """Test Arrow IPC export keeps one row per play with dictionary uids."""
+        pa = pytest.importorskip("pyarrow")
+        pa_ipc = pytest.importorskip("pyarrow.ipc")
+
+        path = builder.write(tmp_path / "plays.arrow")
+        table = pa_ipc.open_file(str(path)).read_all()
+
+        assert table.num_rows == builder.num_rows > 0
+        assert table.column_names == builder.column_names
+        assert pa.types.is_dictionary(table.schema.field("pos_team_uid").type)
+        assert pa.types.is_dictionary(table.schema.field("off_play_call_uid").type)
+        assert pa.types.is_dictionary(table.schema.field("passer_uid").type)
+        assert set(table.column("rep_number").to_pylist()) == {1, 2}
+        assert set(table.column("pos_team_uid").to_pylist()) <= {"home", "away"}
+
+    def test_parquet_round_trip(
+        self, builder: PlayColumnBuilder, tmp_path: Path
+    ) -> None:
+        """Test Parquet export reads back with the same row count."""
+        pa_parquet = pytest.importorskip("pyarrow.parquet")
+
+        path = builder.write(tmp_path / "plays.parquet")
+        assert pa_parquet.read_table(str(path)).num_rows == builder.num_rows
+
+    def test_npz_export(self, builder: PlayColumnBuilder, tmp_path: Path) -> None:
+        """Test the NumPy fallback stores codes, dictionaries, and masks."""
+        np = pytest.importorskip("numpy")
+
+        path = builder.write(tmp_path / "plays.npz", fmt=ColumnarFormat.NPZ)
+        with np.load(path) as archive:
+            codes = archive["pos_team_uid"]
+            dictionary = archive["pos_team_uid__dictionary"]
+            assert len(codes) == builder.num_rows
+            assert set(dictionary[codes].tolist()) <= {"home", "away"}
+            assert archive["start_down__valid"].dtype == bool
+
+    def test_runner_writes_columnar_output(self, tmp_path: Path) -> None:
+        """Test the runner exports play columns alongside its normal output."""
+        pa_parquet = pytest.importorskip("pyarrow.parquet")
+
+        results = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            max_drives=3,
+            output_mode=OutputMode.NONE,
+            retention=RetentionLevel.SUMMARY,
+            columnar_output_path=tmp_path / "plays.parquet",
+            log_dir=tmp_path / "logs",
+        ).run()
+
+        table = pa_parquet.read_table(str(tmp_path / "plays.parquet"))
+        assert table.num_rows == sum(
+            g["total_plays"] for g in results["results"]["games"]
+        )
+
+    def test_falls_back_to_npz_without_pyarrow(
+        self,
+        builder: PlayColumnBuilder,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test Arrow requests write .npz when pyarrow is unavailable."""
+        pytest.importorskip("numpy")
+        from pylon.output import columnar
+
+        monkeypatch.setattr(columnar, "pa", None)
+        path = builder.write(tmp_path / "plays.parquet")
+        assert path == tmp_path / "plays.npz"
+        assert path.exists()
+
+
+class TestFactPersistence:
+    """Tests for bulk fact persistence."""
+
+    def test_bulk_persist_multiple_games(self, test_db: DatabaseManager) -> None:
+        """Test one bulk call writes every drive, play, and participant row."""
+        games = []
+        for rep_number in (1, 2):
+            engine = GameEngine(
+                home_team=create_test_team("home", "Home Team"),
+                away_team=create_test_team("away", "Away Team"),
+                game_id=str(rep_number),
+                rng=RNG(seed=42 + rep_number),
+                rules=NFLRules(),
+                max_drives=4,
+            )
+            engine.run()
+            games.append((str(rep_number), engine.game_state))
+
+        FactRepository(test_db).persist_facts_bulk(games)
+
+        expected_drives = sum(len(gs.drives) for _, gs in games)
+        expected_plays = [
+            play for _, gs in games for drive in gs.drives for play in drive.plays
+        ]
+        session = test_db.get_session()
+        drives = session.query(OrmDrive).order_by(OrmDrive.id).all()
+        plays = session.query(OrmPlay).all()
+        participant_count = session.query(OrmPlayParticipant).count()
+        assignment_count = session.query(OrmPlayPersonnelAssignment).count()
+        session.close()
+
+        assert len(drives) == expected_drives
+        assert [d.game_id for d in drives] == [
+            gid for gid, gs in games for _ in gs.drives
+        ]
+        assert len(plays) == len(expected_plays)
+        assert {p.drive_id for p in plays} <= {d.id for d in drives}
+        assert participant_count == sum(len(p.participants) for p in expected_plays)
+        assert assignment_count > 0
+
+
+class TestRollups:
+    """Tests for write-time rollup tables and analytical indexes."""
+
+    def test_rollups_match_raw_facts(self, test_db: DatabaseManager) -> None:
+        """Test rollup rows agree with aggregates over the raw fact tables."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            rules=NFLRules(),
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+        )
+        runner.run()
+
+        session = test_db.get_session()
+        score_rows = session.query(OrmExperimentTeamScore).all()
+        games = session.query(OrmGame).all()
+        stats = session.query(OrmAthleteGameStats).all()
+        assignment_count = session.query(OrmPlayPersonnelAssignment).count()
+        rushing_yards = session.execute(
+            select(func.coalesce(func.sum(OrmPlay.yards_gained), 0))
+            .join(OrmPlayParticipant, OrmPlayParticipant.play_id == OrmPlay.id)
+            .where(OrmPlayParticipant.participant_type == PlayParticipantType.RUSHER)
+        ).scalar_one()
+        plan = session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM play "
+                "WHERE offense_team_id = 'home' AND down = 3 AND distance = 2"
+            )
+        ).all()
+        session.close()
+
+        home_distribution = {
+            row.points: row.game_count for row in score_rows if row.team_id == "home"
+        }
+        expected: dict[int, int] = {}
+        for game in games:
+            if game.status == "completed":
+                expected[game.home_score] = expected.get(game.home_score, 0) + 1
+        assert expected
+        assert home_distribution == expected
+        assert sum(row.snaps for row in stats) == assignment_count
+        assert sum(row.rushing_yards for row in stats) == rushing_yards
+        assert "ix_play_offense_situation" in " ".join(str(row) for row in plan)
+
+    def test_failed_fact_write_commits_no_games_or_rollups(
+        self, test_db: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failing fact insert rolls back the batch's game and rollup rows."""
+
+        def fail_facts(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("fact insert failed")
+
+        monkeypatch.setattr(FactRepository, "add_facts_bulk", fail_facts)
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            max_drives=4,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+            db_write_queue_size=0,
+        )
+        with pytest.raises(OutputSinkError) as exc_info:
+            runner.run()
+        assert "fact insert failed" in str(exc_info.value.__cause__)
+
+        session = test_db.get_session()
+        game_count = session.query(OrmGame).count()
+        score_count = session.query(OrmExperimentTeamScore).count()
+        session.close()
+
+        assert game_count == 0
+        assert score_count == 0
+
+
+class TestAggregateQueries:
+    """Tests for SQL-side aggregate read methods."""
+
+    def test_queries_match_run_aggregate(self, test_db: DatabaseManager) -> None:
+        """Test SQL aggregates agree with the runner's in-memory aggregate."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=4,
+            base_seed=7,
+            rules=NFLRules(),
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+        )
+        aggregate = runner.run()["results"]["aggregate"]
+        experiment_ids = [runner.experiment_id]
+        games = GameRepository(test_db)
+        experiments = ExperimentRepository(test_db)
+
+        win_rows = {row["team_id"]: row for row in games.win_pct(experiment_ids)}
+        assert win_rows["home"]["wins"] == aggregate["home_wins"]
+        assert win_rows["home"]["ties"] == aggregate["ties"]
+        assert win_rows["home"]["win_pct"] == pytest.approx(aggregate["home_win_pct"])
+        assert (
+            win_rows["home"]["ci_low"]
+            <= win_rows["home"]["win_pct"]
+            <= win_rows["home"]["ci_high"]
+        )
+
+        completed = aggregate["completed_reps"]
+        margins = games.margin_histogram(experiment_ids, bin_width=7)
+        assert sum(row["games"] for row in margins) == completed
+        assert all(row["margin_bin"] % 7 == 0 for row in margins)
+
+        scores = [
+            row
+            for row in games.score_histogram(experiment_ids)
+            if row["team_id"] == "home"
+        ]
+        avg_home_score = sum(row["points"] * row["games"] for row in scores) / completed
+        assert avg_home_score == pytest.approx(aggregate["avg_home_score"])
+        assert scores[-1]["cumulative_pct"] == pytest.approx(1.0)
+
+        drive_rows = experiments.drive_result_breakdown(experiment_ids)
+        home_pct = [
+            row["pct_of_drives"] for row in drive_rows if row["team_id"] == "home"
+        ]
+        assert sum(home_pct) == pytest.approx(1.0)
+
+        session = test_db.get_session()
+        total_yards = session.execute(select(func.sum(OrmPlay.yards_gained))).scalar()
+        session.close()
+        ypp_rows = experiments.yards_per_play(experiment_ids)
+        assert sum(row["total_yards"] for row in ypp_rows) == total_yards
+
+
+class TestBackgroundDBWriter:
+    """Tests for the background database writer."""
+
+    def test_runner_persists_batched_games(self, test_db: DatabaseManager) -> None:
+        """Test queued games are all persisted once the run returns."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=5,
+            base_seed=42,
+            rules=NFLRules(),
+            max_drives=3,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+            db_write_queue_size=1,
+            db_write_batch_size=2,
+        )
+        runner.run()
+
+        session = test_db.get_session()
+        game_ids = [g.id for g in session.query(OrmGame).order_by(OrmGame.rep_number)]
+        drive_game_ids = {d.game_id for d in session.query(OrmDrive)}
+        session.close()
+
+        assert game_ids == ["1", "2", "3", "4", "5"]
+        assert drive_game_ids == set(game_ids)
+
+    def test_write_failure_is_raised(self, test_db: DatabaseManager) -> None:
+        """Test a failed batch surfaces as DBWriterError on close."""
+
+        class _FailingWriter(DBOutputWriter):
+            def write_games(self, games: Any) -> None:
+                raise RuntimeError("disk full")
+
+        writer = BackgroundDBWriter(_FailingWriter(test_db), max_queue_size=1)
+        writer.start()
+        for rep in range(1, 4):
+            try:
+                writer.write_game(str(rep), {}, None, "exp", "home", "away")  # type: ignore[arg-type]
+            except DBWriterError:
+                break
+
+        with pytest.raises(DBWriterError, match="disk full"):
+            writer.close()
+
+    def test_close_without_flush_discards_queued_games(
+        self, test_db: DatabaseManager
+    ) -> None:
+        """Test close(flush=False) drops games still waiting in the queue."""
+        written: list[str] = []
+        writing = threading.Event()
+        release = threading.Event()
+
+        class _GatedWriter(DBOutputWriter):
+            def write_games(self, games: Any) -> None:
+                writing.set()
+                release.wait(timeout=5)
+                written.extend(game.game_id for game in games)
+
+        writer = BackgroundDBWriter(
+            _GatedWriter(test_db), max_queue_size=4, batch_size=1
+        )
+        writer.start()
+        for rep in range(1, 4):
+            writer.write_game(str(rep), {}, None, "exp", "home", "away")  # type: ignore[arg-type]
+        assert writing.wait(timeout=5)
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+
+        writer.close(flush=False)
+        timer.join()
+
+        assert written == ["1"]
+
+    def test_failed_replication_is_not_masked_by_writer(
+        self, test_db: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a replication error propagates even when the writer also fails."""
+
+        def fail_write(self: DBOutputWriter, games: Any) -> None:
+            raise RuntimeError("disk full")
+
+        run_game = PylonSimulation.run
+
+        def fail_second_rep(self: PylonSimulation) -> Any:
+            if self.rep_number == 2:
+                raise RuntimeError("model blew up")
+            return run_game(self)
+
+        monkeypatch.setattr(DBOutputWriter, "write_games", fail_write)
+        monkeypatch.setattr(PylonSimulation, "run", fail_second_rep)
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=3,
+            base_seed=42,
+            rules=NFLRules(),
+            max_drives=3,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+        )
+
+        with pytest.raises(SimulationExecutionError, match="Replication 2"):
+            runner.run()
+
+
+class TestParallelReplication:
+    """Tests for running replications on pluggable executors."""
+
+    @staticmethod
+    def _scores(results: SimulationOutputPayload) -> list[tuple[Any, ...]]:
+        return [
+            (g["rep_number"], g["seed"], g["home_score"], g["away_score"])
+            for g in results["results"]["games"]
+        ]
+
+    def _run(self, tmp_path: Path, **kwargs: Any) -> SimulationOutputPayload:
+        return _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=4,
+            base_seed=42,
+            max_drives=4,
+            output_mode=OutputMode.NONE,
+            log_dir=tmp_path / "logs",
+            **kwargs,
+        ).run()
+
+    def test_factory_is_picklable(self) -> None:
+        """Test the pylon factory survives pickling and derives game ids."""
+        factory = PylonSimulationFactory(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=3,
+            game_id_base=10,
+        )
+        restored = pickle.loads(pickle.dumps(factory))
+        assert [restored.game_id_for(rep) for rep in (1, 2, 3)] == ["10", "11", "12"]
+
+    def test_thread_pool_matches_serial(self, tmp_path: Path) -> None:
+        """Test thread pool execution returns the serial results in rep order."""
+        serial = self._run(tmp_path)
+        threaded = self._run(
+            tmp_path, executor=ThreadPoolReplicationExecutor(workers=2)
+        )
+        assert self._scores(threaded) == self._scores(serial)
+
+    def test_process_pool_matches_serial(self, tmp_path: Path) -> None:
+        """Test process pool execution returns the serial results in rep order."""
+        serial = self._run(tmp_path)
+        pooled = self._run(tmp_path, executor=ProcessPoolReplicationExecutor(workers=2))
+        assert self._scores(pooled) == self._scores(serial)
+        assert len(list((tmp_path / "logs").glob("pylon.*.log"))) == 4
+
+    @pytest.mark.parametrize(
+        "executor",
+        [
+            ThreadPoolReplicationExecutor(workers=2),
+            ProcessPoolReplicationExecutor(workers=2),
+        ],
+        ids=["threads", "processes"],
+    )
+    def test_replication_logs_stay_separate(
+        self, tmp_path: Path, executor: ReplicationExecutor
+    ) -> None:
+        """Test each concurrent rep logs only its own game to its own file."""
+        self._run(tmp_path, executor=executor, log_level=logging.DEBUG)
+
+        for rep_number in range(1, 5):
+            log_text = (tmp_path / "logs" / f"pylon.{rep_number}.log").read_text()
+            logged_games = set(re.findall(r"game_id=(\d+)", log_text))
+            assert logged_games == {str(rep_number)}
+
+    def test_process_pool_assigns_sequential_db_ids(
+        self, test_db: DatabaseManager
+    ) -> None:
+        """Test concurrent replications keep sequential DB game ids."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=3,
+            base_seed=42,
+            max_drives=2,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+            executor=ProcessPoolReplicationExecutor(workers=2),
+        )
+        runner.run()
+
+        session = test_db.get_session()
+        games = session.query(OrmGame).order_by(OrmGame.id).all()
+        session.close()
+
+        assert [(g.id, g.seed) for g in games] == [("1", 43), ("2", 44), ("3", 45)]
+
+
+class TestPersonnelAssignmentCache:
+    """Tests for memoized personnel assignments in full games."""
+
+    @staticmethod
+    def _play_trace(cache: PersonnelAssignmentCache | None) -> list[tuple[Any, ...]]:
+        engine = GameEngine(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            game_id="1",
+            rng=RNG(seed=42),
+            rules=NFLRules(),
+            max_drives=6,
+            assignment_cache=cache,
+        )
+        engine.run()
+        return [
+            (play.execution_data.play_type, play.yards_gained)
+            for drive in engine.game_state.drives
+            for play in drive.plays
+        ]
+
+    def test_cached_game_matches_uncached(self) -> None:
+        """Test serving assignments from the cache leaves outcomes unchanged."""
+        cache = PersonnelAssignmentCache()
+        cached = self._play_trace(cache)
+
+        assert cached == self._play_trace(None)
+        assert cache.hits > 0
+
+    def test_runner_disables_cache_when_size_is_none(self, tmp_path: Path) -> None:
+        """Test a None cache size runs without a cache."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=1,
+            output_mode=OutputMode.NONE,
+            log_dir=tmp_path / "logs",
+            personnel_cache_size=None,
+        )
+
+        assert runner.assignment_cache is None
+
+
+class TestValidationLevels:
+    """Tests for per-play validation tiers in full games."""
+
+    @staticmethod
+    def _play_trace(validation: ValidationLevel) -> list[tuple[Any, ...]]:
+        engine = GameEngine(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            game_id="1",
+            rng=RNG(seed=42),
+            rules=NFLRules(),
+            max_drives=6,
+            validation=validation,
+            validation_sample_every=3,
+        )
+        engine.run()
+        return [
+            (play.execution_data.play_type, play.yards_gained)
+            for drive in engine.game_state.drives
+            for play in drive.plays
+        ]
+
+    @pytest.mark.parametrize(
+        "level",
+        [ValidationLevel.STRICT, ValidationLevel.SAMPLED, ValidationLevel.OFF],
+    )
+    def test_level_leaves_outcomes_unchanged(self, level: ValidationLevel) -> None:
+        """Test the validation level does not change a seeded game."""
+        assert self._play_trace(level) == self._play_trace(ValidationLevel.BASIC)
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            (ValidationLevel.BASIC, True),
+            (ValidationLevel.STRICT, True),
+            (ValidationLevel.SAMPLED, True),
+            (ValidationLevel.OFF, False),
+        ],
+    )
+    def test_personnel_checked_unless_off(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        level: ValidationLevel,
+        expected: bool,
+    ) -> None:
+        """Test the default keeps the per-play personnel scan; OFF drops it."""
+        checked: list[PlayExecutionData] = []
+        monkeypatch.setattr(PlayEngine, "validate_play_personnel", checked.append)
+        self._play_trace(level)
+
+        assert bool(checked) is expected
+
+    def test_runner_threads_validation_level(self, tmp_path: Path) -> None:
+        """Test the runner hands its validation settings to every game."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=1,
+            output_mode=OutputMode.NONE,
+            log_dir=tmp_path / "logs",
+            validation=ValidationLevel.SAMPLED,
+            validation_sample_every=10,
+        )
+        factory = runner._build_simulation_factory(game_id_base=None)
+        simulation = factory(1, RNG(seed=1))
+        assert isinstance(simulation, PylonSimulation)
+
+        engine = simulation._create_game_engine()
+        assert engine.validation.level is ValidationLevel.SAMPLED
+        assert engine.validation.sample_every == 10
+
+
+class TestPlayLog:
+    """Tests for the columnar play log kept by GameState."""
+
+    def test_log_matches_play_records(self) -> None:
+        """Test every play is logged in order with matching counters."""
+        engine = GameEngine(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            game_id="1",
+            rng=RNG(seed=42),
+            rules=NFLRules(),
+        )
+        engine.run()
+        state = engine.game_state
+        plays = state.all_plays()
+        log = state.play_log
+
+        assert len(log) == len(plays) == state.total_plays()
+        assert [int(play.uid) for play in plays] == list(range(1, len(plays) + 1))
+        assert log.total_yards == state.total_yards()
+        assert [row.yards_gained for row in log.rows()] == [
+            play.yards_gained for play in plays
+        ]
+        assert [row.play_type for row in log.rows()] == [
+            play.execution_data.play_type for play in plays
+        ]
+        assert sum(row.points for row in log.rows()) == state.scoreboard.current_score(
+            state.home_team
+        ) + state.scoreboard.current_score(state.away_team)
+        for team in (state.home_team, state.away_team):
+            drives = state.drives_by_team(team)
+            assert drives == [d for d in state.drives if d.start.pos_team is team]
+            assert log.plays_by_offense(team) == sum(d.total_plays() for d in drives)
+
+
+class _NoisyKickReceiveChoiceModel(DefaultKickReceiveChoiceModel):
+    """Makes the default choice, then burns extra draws from its stream."""
+
+    def execute(self, context: KickReceiveContext) -> Any:
+        choice = super().execute(context)
+        for _ in range(5):
+            context.rng.random()
+        return choice
+
+
+class TestNamedRngStreams:
+    """Tests for common random numbers via named RNG substreams."""
+
+    @staticmethod
+    def _play_trace(named_streams: bool, noisy: bool) -> list[tuple[Any, ...]]:
+        engine = GameEngine(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            game_id="1",
+            user_models=[_NoisyKickReceiveChoiceModel()] if noisy else None,
+            rng=RNG(seed=42, named_streams=named_streams),
+            rules=NFLRules(),
+            max_drives=6,
+        )
+        engine.run()
+        return [
+            (play.execution_data.play_type, play.yards_gained)
+            for drive in engine.game_state.drives
+            for play in drive.plays
+        ]
+
+    def test_extra_draws_do_not_shift_other_models(self) -> None:
+        """Test an arm that draws more numbers leaves other models' draws intact."""
+        baseline = self._play_trace(named_streams=True, noisy=False)
+        candidate = self._play_trace(named_streams=True, noisy=True)
+
+        assert baseline
+        assert candidate == baseline
+
+    def test_shared_stream_shifts_later_draws(self) -> None:
+        """Test the shared stream is perturbed by the same extra draws."""
+        baseline = self._play_trace(named_streams=False, noisy=False)
+        candidate = self._play_trace(named_streams=False, noisy=True)
+
+        assert candidate != baseline
+
+    def test_runner_threads_named_streams(self, tmp_path: Path) -> None:
+        """Test the runner config enables named streams for each replication."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=2,
+            base_seed=42,
+            max_drives=2,
+            output_mode=OutputMode.NONE,
+            log_dir=tmp_path / "logs",
+            rng_named_streams=True,
+        )
+        first = runner.run()["results"]["games"]
+        second = runner.run()["results"]["games"]
+
+        assert [g["home_score"] for g in first] == [g["home_score"] for g in second]
+
+
+class TestReplicationDesigns:
+    """Tests for variance-reduction designs on the pylon runner."""
+
+    def test_coin_toss_strata_balance_outcomes(self) -> None:
+        """Test the coin toss design covers every toss winner/choice pair."""
+        design = StratifiedDesign(COIN_TOSS_STRATA)
+        rng_config = RNGConfig(named_streams=True, design=design)
+        factory = PylonSimulationFactory(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=4,
+            max_drives=1,
+        )
+
+        outcomes = set()
+        for rep_number in range(1, 5):
+            result = factory(
+                rep_number, rng_config.create(42 + rep_number, rep_number)
+            ).run()
+            winner = result.game_state.coin_toss_winner
+            assert winner is not None
+            outcomes.add((winner.uid, result.game_state.coin_toss_winner_choice))
+
+        assert len(outcomes) == 4
+
+    @pytest.mark.parametrize(
+        "design", [AntitheticDesign(), StratifiedDesign(COIN_TOSS_STRATA)]
+    )
+    def test_runner_reports_design_estimators(
+        self, tmp_path: Path, design: Any
+    ) -> None:
+        """Test designed runs report weighted estimates with standard errors."""
+        results = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=8,
+            base_seed=42,
+            output_mode=OutputMode.NONE,
+            log_dir=tmp_path / "logs",
+            design=design,
+        ).run()
+        aggregate = results["results"]["aggregate"]
+        games = results["results"]["games"]
+
+        assert aggregate["design"] == design.name
+        assert aggregate["home_score_estimate"] >= 0
+        assert aggregate["margin_stderr"] >= 0
+        if isinstance(design, AntitheticDesign):
+            assert [g["seed"] for g in games] == [43, 43, 44, 44, 45, 45, 46, 46]
+
+
+class TestSequentialStopping:
+    """Tests for precision-targeted stopping on the pylon runner."""
+
+    def test_stops_early_and_records_reps_used(self, test_db: DatabaseManager) -> None:
+        """Test a loose target ends the run early and the DB records it."""
+        runner = _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=8,
+            base_seed=42,
+            db_manager=test_db,
+            output_mode=OutputMode.DB,
+            stopping_rule=StoppingRule(
+                targets={"home_win_pct": 1.0, "margin": 100.0},
+                chunk_size=2,
+                min_reps=2,
+            ),
+        )
+        results = runner.run()
+        aggregate = results["results"]["aggregate"]
+
+        assert aggregate["stopping"]["reason"] == "precision"
+        assert aggregate["stopping"]["max_reps"] == 8
+        assert results["experiment"]["num_reps"] == runner.reps_used == 2
+        assert aggregate["completed_reps"] == 2
+
+        session = test_db.get_session()
+        experiment = session.execute(select(OrmExperiment)).scalar_one()
+        games = session.execute(select(func.count(OrmGame.id))).scalar()
+        session.close()
+        assert experiment.num_reps == games == 2
+
+    def test_ndjson_trailer_records_reps_used(self, tmp_path: Path) -> None:
+        """Test a stream read back reports the reps run, not the budget."""
+        output_path = tmp_path / "results.ndjson"
+        _make_runner(
+            home_team=create_test_team("home", "Home Team"),
+            away_team=create_test_team("away", "Away Team"),
+            num_reps=8,
+            base_seed=42,
+            json_output_path=output_path,
+            json_format=JsonFormat.NDJSON,
+            log_dir=tmp_path / "logs",
+            stopping_rule=StoppingRule(
+                targets={"home_win_pct": 1.0, "margin": 100.0},
+                chunk_size=2,
+                min_reps=2,
+            ),
+        ).run()
+
+        records = list(iter_ndjson_records(output_path))
+        assert records[0]["experiment"]["num_reps"] == 8
+        assert records[-1]["num_reps"] == 2
+        assert read_ndjson_results(output_path)["experiment"]["num_reps"] == 2
+
+
 class TestEndToEndWorkflow:
     """End-to-end integration tests."""
 
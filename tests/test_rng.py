@@ -1,6 +1,10 @@
 """Unit tests for deterministic RNG behavior."""
 
-from sim.rng import RNG
+import pytest
+
+from sim.distribution import Distribution
+from sim.exceptions import SimulationConfigurationError
+from sim.rng import RNG, NumpyBlockBackend, RNGConfig, derive_seed
 
 
 class TestRNG:
@@ -44,3 +48,190 @@ class TestRNG:
 
         assert all(1 <= value <= 10 for value in results)
         assert len(set(results)) > 1
+
+    def test_rng_unknown_backend_raises(self) -> None:
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(SimulationConfigurationError):
+            RNG(seed=42, backend="missing")
+
+
+class TestRNGStreams:
+    """Tests for named RNG substreams."""
+
+    def test_substreams_are_stable_and_cached(self) -> None:
+        """Test that a name always maps to the same child stream."""
+        rng1 = RNG(seed=42, named_streams=True)
+        rng2 = RNG(seed=42, named_streams=True)
+
+        child = rng1.stream("play_type")
+
+        assert child is rng1.stream("play_type")
+        assert child.seed == derive_seed(42, "play_type")
+        assert [child.random() for _ in range(5)] == [
+            rng2.stream("play_type").random() for _ in range(5)
+        ]
+
+    def test_substreams_are_independent_of_sibling_draws(self) -> None:
+        """Test that drawing from one stream does not shift another."""
+        quiet = RNG(seed=42, named_streams=True)
+        noisy = RNG(seed=42, named_streams=True)
+
+        for _ in range(100):
+            noisy.stream("coin_toss_winner").random()
+            noisy.random()
+
+        assert [quiet.stream("play_type").random() for _ in range(10)] == [
+            noisy.stream("play_type").random() for _ in range(10)
+        ]
+        assert quiet.stream("a").seed != quiet.stream("b").seed
+
+    def test_stream_returns_shared_rng_when_disabled(self) -> None:
+        """Test that named streams are opt-in."""
+        rng = RNG(seed=42)
+
+        assert rng.stream("play_type") is rng
+        assert rng.substream("play_type") is not rng
+
+    def test_substream_hierarchy_keeps_backend(self) -> None:
+        """Test nested substreams derive from their parent and keep the backend."""
+        rng = RNG(seed=7, named_streams=True)
+
+        grandchild = rng.substream("drive").substream("play")
+
+        assert grandchild.seed == derive_seed(derive_seed(7, "drive"), "play")
+        assert grandchild.backend == rng.backend
+
+    def test_rng_config_validates_backend(self) -> None:
+        """Test RNGConfig builds configured RNGs and rejects unknown backends."""
+        rng = RNGConfig(named_streams=True).create(3)
+
+        assert rng.seed == 3
+        assert rng.named_streams
+        with pytest.raises(SimulationConfigurationError):
+            RNGConfig(backend="missing")
+
+
+class TestDistribution:
+    """Tests for alias-table Distribution sampling."""
+
+    def test_alias_table_preserves_probabilities(self) -> None:
+        """Test that the alias table encodes exactly the normalized weights."""
+        dist = Distribution(["A", "B", "C", "D"], [1.0, 2.0, 3.0, 4.0])
+        size = len(dist)
+        recovered = [0.0] * size
+        for column in range(size):
+            recovered[column] += dist._prob[column] / size
+            recovered[dist._alias[column]] += (1.0 - dist._prob[column]) / size
+
+        assert dist.probabilities == pytest.approx((0.1, 0.2, 0.3, 0.4))
+        assert recovered == pytest.approx(list(dist.probabilities))
+
+    def test_sample_frequencies_match_weights(self) -> None:
+        """Test that sampled frequencies follow the distribution."""
+        rng = RNG(seed=42)
+        dist = Distribution(["A", "B", "C"], [1.0, 0.0, 3.0])
+
+        draws = [rng.choice(dist) for _ in range(4_000)]
+
+        assert "B" not in draws
+        assert 0.2 < draws.count("A") / len(draws) < 0.3
+
+    def test_int_range_and_histogram(self) -> None:
+        """Test integer-range and histogram constructors."""
+        rng = RNG(seed=3)
+        uniform_yards = Distribution.int_range(-2, 12)
+        shaped = Distribution.from_histogram({-1: 1, 3: 6, 15: 1})
+
+        yards = [rng.choice(uniform_yards) for _ in range(2_000)]
+
+        assert set(yards) == set(range(-2, 13))
+        assert shaped.outcomes == (-1, 3, 15)
+        assert shaped.probabilities == pytest.approx((0.125, 0.75, 0.125))
+
+    def test_choice_with_distribution_is_deterministic(self) -> None:
+        """Test that distribution draws are reproducible per seed."""
+        dist = Distribution.int_range(0, 9, weights=range(1, 11))
+        rng1 = RNG(seed=5)
+        rng2 = RNG(seed=5)
+
+        assert [rng1.choice(dist) for _ in range(50)] == [
+            rng2.choice(dist) for _ in range(50)
+        ]
+        with pytest.raises(ValueError):
+            rng1.choice(dist, weights=[1.0])
+
+    def test_invalid_weights_raise(self) -> None:
+        """Test construction rejects empty, mismatched and degenerate weights."""
+        with pytest.raises(ValueError):
+            Distribution([], [])
+        with pytest.raises(ValueError):
+            Distribution(["A", "B"], [1.0])
+        with pytest.raises(ValueError):
+            Distribution(["A", "B"], [1.0, -1.0])
+        with pytest.raises(ValueError):
+            Distribution(["A", "B"], [0.0, 0.0])
+
+
+class TestNumpyBlockBackend:
+    """Tests for the block-buffered NumPy RNG backend."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self) -> None:
+        pytest.importorskip("numpy")
+
+    def test_deterministic_across_block_boundaries(self) -> None:
+        """Test that the same seed yields the same draws regardless of block size."""
+        rng1 = RNG(seed=42, backend="numpy")
+        rng2 = RNG(seed=42, backend="numpy")
+        small = NumpyBlockBackend(42, block_size=7)
+
+        results1 = [rng1.random() for _ in range(10_000)]
+        results2 = [rng2.random() for _ in range(10_000)]
+        results3 = [small.random() for _ in range(10_000)]
+
+        assert rng1.backend == "numpy"
+        assert results1 == results2 == results3
+        assert all(0.0 <= value < 1.0 for value in results1)
+
+    def test_different_seeds_and_bit_generators(self) -> None:
+        """Test that seeds and bit generators produce distinct streams."""
+        pcg = NumpyBlockBackend(42)
+        other_seed = NumpyBlockBackend(43)
+        philox = NumpyBlockBackend(42, bit_generator="philox")
+
+        draws = [[b.random() for _ in range(10)] for b in (pcg, other_seed, philox)]
+
+        assert draws[0] != draws[1]
+        assert draws[0] != draws[2]
+
+    def test_unknown_bit_generator_raises(self) -> None:
+        """Test that an unsupported bit generator is rejected."""
+        with pytest.raises(SimulationConfigurationError):
+            NumpyBlockBackend(42, bit_generator="mt19937")
+
+    def test_randint_covers_inclusive_range(self) -> None:
+        """Test randint returns every value in the inclusive range and no others."""
+        rng = RNG(seed=7, backend="numpy")
+
+        results = [rng.randint(1, 6) for _ in range(2_000)]
+
+        assert set(results) == {1, 2, 3, 4, 5, 6}
+
+    def test_weighted_choice_respects_weights(self) -> None:
+        """Test weighted choice honours zero weights and relative frequencies."""
+        rng = RNG(seed=11, backend="numpy")
+        options = ["A", "B", "C"]
+
+        choices = [rng.choice(options, weights=[1.0, 0.0, 3.0]) for _ in range(4_000)]
+
+        assert "B" not in choices
+        assert 0.2 < choices.count("A") / len(choices) < 0.3
+
+    def test_choice_validates_inputs(self) -> None:
+        """Test choice rejects empty sequences and mismatched weights."""
+        rng = RNG(seed=1, backend="numpy")
+
+        with pytest.raises(IndexError):
+            rng.choice([])
+        with pytest.raises(ValueError):
+            rng.choice(["A", "B"], weights=[1.0])
@@ -1,10 +1,20 @@
 """Tests for state layer: GameState, DriveRecord, PlayRecord, etc."""
 
+import tracemalloc
+
+import pytest
+
 from pylon.domain.team import Team
 from pylon.state.game_state import GameState, GameStatus
 from pylon.state.game_clock import GameClock
 from pylon.state.scoreboard_state import Scoreboard
 from pylon.state.possession_state import PossessionState
+from pylon.state.play_record import PlayExecutionData, PlayRecord
+from pylon.state.drive_record import DriveRecord
+from pylon.state.play_log import PlayLog, PlayLogError
+from pylon.domain.playbook import PlayTypeEnum
+from pylon.models.offense import RushYardsGainedContext
+from sim.rng import RNG
 
 
 class TestGameClock:
@@ -247,3 +257,141 @@ class TestGameState:
 
         assert game_state.total_drives() == 0
         assert game_state.total_plays() == 0
+
+
+class TestPlayLog:
+    """Tests for the columnar per-game play log."""
+
+    @staticmethod
+    def _game_state(set_down: bool = True) -> GameState:
+        game_state = GameState(
+            home_team=Team(uid="home", name="Home Team"),
+            away_team=Team(uid="away", name="Away Team"),
+            minutes_per_quarter=15,
+            quarters_per_half=2,
+            max_timeouts=3,
+            game_id="1",
+        )
+        if set_down:
+            game_state.possession.reset_down_and_distance()
+        return game_state
+
+    @staticmethod
+    def _play(
+        game_state: GameState, play_number: int, play_type: PlayTypeEnum, yards: int
+    ) -> PlayRecord:
+        play = PlayRecord(game_state, play_number)
+        data = PlayExecutionData()
+        data.set_play_type(play_type)
+        data.set_yards_gained(yards)
+        data.set_is_turnover(False)
+        data.set_is_possession_change(False)
+        play.set_execution_data(data)
+        play.set_end_state(game_state)
+        return play
+
+    def test_rows_and_counters(self):
+        """Test appended plays are readable as rows and update totals."""
+        game_state = self._game_state()
+        log = PlayLog(game_state.home_team, game_state.away_team)
+        log.append(self._play(game_state, 1, PlayTypeEnum.RUN, 4))
+        log.append(self._play(game_state, 2, PlayTypeEnum.PASS, -2))
+
+        assert len(log) == 2
+        assert log.total_yards == 2
+        assert log.plays_by_offense(game_state.home_team) == 2
+        assert log.plays_by_offense(game_state.away_team) == 0
+
+        row = log.row(-1)
+        assert row.play_number == 2
+        assert row.play_type is PlayTypeEnum.PASS
+        assert row.yards_gained == -2
+        assert row.offense is game_state.home_team
+        assert (row.quarter, row.down, row.distance) == (1, 1, 10)
+        assert row.points == 0
+        assert [r.play_number for r in log.rows()] == [1, 2]
+
+    def test_missing_down_is_none_in_row(self):
+        """Test plays without down and distance read back as None."""
+        game_state = self._game_state(set_down=False)
+        log = PlayLog(game_state.home_team, game_state.away_team)
+        log.append(self._play(game_state, 1, PlayTypeEnum.KICKOFF, 0))
+
+        assert (log.row(0).down, log.row(0).distance) == (None, None)
+
+    def test_rejects_foreign_team(self):
+        """Test a play by a team outside the game is rejected."""
+        game_state = self._game_state()
+        log = PlayLog(Team(uid="x", name="X"), Team(uid="y", name="Y"))
+
+        with pytest.raises(PlayLogError):
+            log.append(self._play(game_state, 1, PlayTypeEnum.RUN, 1))
+
+
+class TestCompactRecords:
+    """Tests for the slotted per-play record and snapshot classes."""
+
+    # Retained bytes per play for a PlayRecord with its start/end snapshots
+    # and execution data on CPython 3.13: about 1.5 KB with __dict__-backed
+    # classes and about 1.1 KB slotted.
+    MAX_BYTES_PER_PLAY = 1280
+
+    @staticmethod
+    def _game_state() -> GameState:
+        game_state = GameState(
+            home_team=Team(uid="home", name="Home Team"),
+            away_team=Team(uid="away", name="Away Team"),
+            minutes_per_quarter=15,
+            quarters_per_half=2,
+            max_timeouts=3,
+            game_id="1",
+        )
+        game_state.possession.reset_down_and_distance()
+        return game_state
+
+    @staticmethod
+    def _play(game_state: GameState, play_number: int) -> PlayRecord:
+        play = PlayRecord(game_state, play_number)
+        play.set_execution_data(PlayExecutionData())
+        play.set_end_state(game_state)
+        return play
+
+    def test_records_have_no_instance_dict(self):
+        """Test records, snapshots, drive state and model contexts are slotted."""
+        game_state = self._game_state()
+        play = self._play(game_state, 1)
+        drive = DriveRecord(game_state)
+        context = RushYardsGainedContext(
+            game_state, RNG(seed=1), None, None  # type: ignore[arg-type]
+        )
+
+        objects = [
+            play,
+            play.start,
+            play.end.clock_snapshot,
+            play.end.possession_snapshot,
+            play.end.scoreboard_snapshot,
+            play.execution_data,
+            drive,
+            drive.start,
+            drive.execution_data,
+            context,
+        ]
+        for obj in objects:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    def test_bytes_per_play_within_budget(self):
+        """Test the retained size of one play's records stays compact."""
+        game_state = self._game_state()
+        num_plays = 2000
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            plays = [self._play(game_state, n) for n in range(1, num_plays + 1)]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        bytes_per_play = (after - before) / len(plays)
+        assert bytes_per_play < self.MAX_BYTES_PER_PLAY
@@ -61,6 +61,19 @@ def test_typed_model_allows_any_return_when_no_return_type():
     assert result == "anything"
 
 
+class UndeclaredIntModel(TypedModel[DummyContext, int]):
+    def execute(self, context: DummyContext) -> int:
+        return "not an int"  # type: ignore
+
+
+def test_typed_model_checks_declared_return_type():
+    model = UndeclaredIntModel()
+
+    assert model.return_type is int
+    with pytest.raises(InvalidModelReturnType):
+        model._execute(DummyContext(value=5))  # type: ignore
+
+
 def test_typed_model_is_abstract():
     with pytest.raises(TypeError):
         TypedModel()  # type: ignore